@@ -0,0 +1,317 @@
+"""
+매출 분석 엔진.
+
+주문 라인(주문 아이템 + 차감 아이템)을 values_list 스트리밍 조회로 numpy 열 배열에 적재해 두고,
+시간 구간/음식/테이블별 집계, 환불률, 평균 객단가를 벡터 연산으로 계산합니다.
+
+- refresh()는 라인 테이블별 id 워터마크 이후의 행만 추가로 가져옵니다.
+- 결제 대기(pre_order) 주문의 상태는 refresh마다 쿼리 한 번으로 다시 확인합니다.
+- 워터마크 이하의 라인 수가 적재한 수와 다르면(주문 삭제) 처음부터 다시 적재합니다.
+
+numpy는 선택 의존성입니다. (pip install .[analytics]) 없으면 AVAILABLE이 False입니다.
+"""
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence
+
+from django.utils import timezone
+
+from .models import MinusOrderItemModel, OrderItemModel, OrderModel
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy 미설치 환경
+    np = None
+
+AVAILABLE = np is not None
+
+STATUS_CODES = {'pre_order': 0, 'completed': 1, 'refunded': 2}
+STATUS_PRE_ORDER = STATUS_CODES['pre_order']
+STATUS_COMPLETED = STATUS_CODES['completed']
+
+# 라인 종류: 주문 아이템, 환불 차감, 그 외 차감(품절 등)
+KIND_ITEM = 0
+KIND_REFUND = 1
+KIND_MINUS = 2
+
+LINE_FIELDS = ('id', 'order_id', 'order__order_date', 'order__table_id', 'order__status', 'food_id', 'quantity', 'price')
+
+
+def _unique(values):
+    """정렬된 고유값. 큰 정수 배열에서는 numpy의 unique보다 정렬 + 인접 비교가 훨씬 빠름"""
+    ordered = np.sort(values)
+    if not len(ordered):
+        return ordered
+    return ordered[np.concatenate(([True], ordered[1:] != ordered[:-1]))]
+
+
+def _group(values):
+    """(고유 키, 각 값의 키 인덱스)"""
+    if not len(values):
+        return values[:0], np.zeros(0, dtype=np.intp)
+    base = int(values.min())
+    span = int(values.max()) - base + 1
+    if span > len(values) + 65536:
+        keys = _unique(values)
+        return keys, np.searchsorted(keys, values)
+    # 음식 id, 테이블 코드, 시간 구간처럼 범위가 좁은 키는 정렬 없이 조회표로 인덱싱
+    offsets = values - base
+    present = np.flatnonzero(np.bincount(offsets, minlength=span))
+    lookup = np.zeros(span, dtype=np.intp)
+    lookup[present] = np.arange(len(present))
+    return present + base, lookup[offsets]
+
+
+def _distinct_counts(groups, order_codes, group_count: int):
+    """그룹별로 서로 다른 주문 수를 셉니다."""
+    if not len(groups):
+        return np.zeros(group_count, dtype=np.int64)
+    stride = int(order_codes.max()) + 1
+    pairs = _unique(groups.astype(np.int64) * stride + order_codes)
+    return np.bincount(pairs // stride, minlength=group_count)
+
+
+def _sum_by(inverse, values, group_count: int):
+    # 정수 금액을 float64로 더하므로 2^53 미만에서는 정확함
+    return np.rint(np.bincount(inverse, weights=values, minlength=group_count)).astype(np.int64)
+
+
+class SalesAnalytics:
+    def __init__(self, chunk_size: int = 10000, min_refresh_interval: float = 5.0):
+        if np is None:
+            raise RuntimeError('numpy가 설치되어 있지 않습니다. (pip install .[analytics])')
+        self.chunk_size = chunk_size
+        self.min_refresh_interval = min_refresh_interval
+        self._lock = threading.Lock()
+        self._refreshed_at: Optional[float] = None
+        self._reset()
+    
+    def _reset(self) -> None:
+        self._watermarks = {'item': 0, 'minus': 0}
+        self._loaded = {'item': 0, 'minus': 0}
+        # 주문/테이블 UUID -> 정수 코드
+        self._order_codes: Dict[object, int] = {}
+        self._order_ids: List[object] = []
+        self._table_codes: Dict[object, int] = {}
+        self.table_ids: List[object] = []
+        
+        # 주문 열 (주문 코드로 인덱싱)
+        self.order_status = np.zeros(0, dtype=np.int8)
+        self.order_ts = np.zeros(0, dtype=np.int64)
+        self.order_table = np.zeros(0, dtype=np.int32)
+        # 라인 열
+        self.line_order = np.zeros(0, dtype=np.int32)
+        self.line_food = np.zeros(0, dtype=np.int64)
+        self.line_quantity = np.zeros(0, dtype=np.int64)
+        self.line_amount = np.zeros(0, dtype=np.int64)
+        self.line_kind = np.zeros(0, dtype=np.int8)
+    
+    @property
+    def line_count(self) -> int:
+        return len(self.line_order)
+    
+    # ---------- 적재 ----------
+    
+    def refresh(self, force: bool = False) -> int:
+        """새 라인을 적재하고 적재한 라인 수를 반환합니다. min_refresh_interval 안에는 다시 조회하지 않습니다."""
+        with self._lock:
+            now = time.monotonic()
+            if not force and self._refreshed_at is not None and now - self._refreshed_at < self.min_refresh_interval:
+                return 0
+            if self._lines_deleted():
+                self._reset()
+            added = self._load(OrderItemModel.objects.all(), 'item')
+            added += self._load(MinusOrderItemModel.objects.all(), 'minus')
+            self._refresh_pending_orders()
+            self._refreshed_at = now
+            return added
+    
+    def _lines_deleted(self) -> bool:
+        # 워터마크 이하 라인 수는 PK 범위 COUNT 한 번으로 확인
+        return any(
+            model.objects.filter(id__lte=self._watermarks[source]).count() != self._loaded[source]
+            for source, model in (('item', OrderItemModel), ('minus', MinusOrderItemModel))
+            if self._loaded[source]
+        )
+    
+    def _load(self, queryset, source: str) -> int:
+        fields = LINE_FIELDS + (('reason',) if source == 'minus' else ())
+        rows = queryset.filter(id__gt=self._watermarks[source]).order_by('id').values_list(*fields).iterator(
+            chunk_size=self.chunk_size
+        )
+        loaded = 0
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= self.chunk_size:
+                self.append_rows(batch, source)
+                loaded += len(batch)
+                batch = []
+        if batch:
+            self.append_rows(batch, source)
+            loaded += len(batch)
+        return loaded
+    
+    def append_rows(self, rows: Sequence[tuple], source: str) -> None:
+        """values_list(LINE_FIELDS [+ reason]) 행 묶음을 열 배열 뒤에 붙입니다."""
+        columns = list(zip(*rows))
+        line_ids, order_ids, order_dates, table_ids, statuses, food_ids, quantities, prices = columns[:8]
+        
+        new_status, new_ts, new_table = [], [], []
+        order_codes = self._order_codes
+        
+        def order_code(order_id, order_date, table_id, status):
+            code = order_codes.get(order_id)
+            if code is None:
+                code = order_codes[order_id] = len(self._order_ids)
+                self._order_ids.append(order_id)
+                new_status.append(STATUS_CODES.get(status, STATUS_PRE_ORDER))
+                new_ts.append(int(order_date.timestamp()))
+                new_table.append(self._table_code(table_id))
+            return code
+        
+        line_order = np.fromiter(
+            (order_code(*values) for values in zip(order_ids, order_dates, table_ids, statuses)),
+            dtype=np.int32, count=len(rows),
+        )
+        quantity = np.fromiter(quantities, dtype=np.int64, count=len(rows))
+        amount = quantity * np.fromiter(prices, dtype=np.int64, count=len(rows))
+        if source == 'minus':
+            kind = np.where(np.array(columns[8]) == 'refund', KIND_REFUND, KIND_MINUS).astype(np.int8)
+        else:
+            kind = np.full(len(rows), KIND_ITEM, dtype=np.int8)
+        
+        self.order_status = np.concatenate([self.order_status, np.array(new_status, dtype=np.int8)])
+        self.order_ts = np.concatenate([self.order_ts, np.array(new_ts, dtype=np.int64)])
+        self.order_table = np.concatenate([self.order_table, np.array(new_table, dtype=np.int32)])
+        self.line_order = np.concatenate([self.line_order, line_order])
+        self.line_food = np.concatenate([self.line_food, np.fromiter(food_ids, dtype=np.int64, count=len(rows))])
+        self.line_quantity = np.concatenate([self.line_quantity, quantity])
+        self.line_amount = np.concatenate([self.line_amount, amount])
+        self.line_kind = np.concatenate([self.line_kind, kind])
+        
+        self._watermarks[source] = max(self._watermarks[source], max(line_ids))
+        self._loaded[source] += len(rows)
+    
+    def _table_code(self, table_id) -> int:
+        code = self._table_codes.get(table_id)
+        if code is None:
+            code = self._table_codes[table_id] = len(self.table_ids)
+            self.table_ids.append(table_id)
+        return code
+    
+    def _refresh_pending_orders(self) -> None:
+        # 결제 대기 주문만 상태가 바뀔 수 있음 (완료 처리, 환불 처리)
+        pending_codes = np.flatnonzero(self.order_status == STATUS_PRE_ORDER)
+        if not len(pending_codes):
+            return
+        pending_ids = [self._order_ids[code] for code in pending_codes]
+        for order_id, status in OrderModel.objects.filter(id__in=pending_ids).exclude(
+            status='pre_order'
+        ).values_list('id', 'status'):
+            self.order_status[self._order_codes[order_id]] = STATUS_CODES.get(status, STATUS_PRE_ORDER)
+    
+    # ---------- 집계 ----------
+    
+    def _completed_lines(self, since: Optional[datetime] = None, until: Optional[datetime] = None):
+        """완료 주문 라인의 마스크. since 이상, until 미만 주문만 포함합니다."""
+        mask = self.order_status[self.line_order] == STATUS_COMPLETED
+        if since is not None or until is not None:
+            line_ts = self.order_ts[self.line_order]
+            if since is not None:
+                mask &= line_ts >= int(since.timestamp())
+            if until is not None:
+                mask &= line_ts < int(until.timestamp())
+        return mask
+    
+    def summary(self, since: Optional[datetime] = None, until: Optional[datetime] = None) -> dict:
+        """주문 수, 총/순매출, 환불 금액과 환불률, 평균 객단가"""
+        mask = self._completed_lines(since, until)
+        amount, kind, line_order = self.line_amount[mask], self.line_kind[mask], self.line_order[mask]
+        
+        order_count = int(_unique(line_order).size)
+        gross_revenue = int(amount[kind == KIND_ITEM].sum())
+        refund_amount = int(-amount[kind == KIND_REFUND].sum())
+        net_revenue = int(amount.sum())
+        refunded_orders = int(_unique(line_order[kind == KIND_REFUND]).size)
+        return {
+            'order_count': order_count,
+            'line_count': int(mask.sum()),
+            'gross_revenue': gross_revenue,
+            'refund_amount': refund_amount,
+            'net_revenue': net_revenue,
+            'refund_rate': refund_amount / gross_revenue if gross_revenue else 0.0,
+            'refunded_order_rate': refunded_orders / order_count if order_count else 0.0,
+            'average_basket': net_revenue / order_count if order_count else 0.0,
+        }
+    
+    def time_buckets(self, minutes: int = 10, since: Optional[datetime] = None,
+                     until: Optional[datetime] = None) -> List[dict]:
+        """현재 타임존 기준 minutes분 구간별 순매출과 주문 수 (주문이 있는 구간만)"""
+        mask = self._completed_lines(since, until)
+        size = minutes * 60
+        offset = int(timezone.localtime().utcoffset().total_seconds())
+        buckets = (self.order_ts[self.line_order[mask]] + offset) // size
+        keys, inverse = _group(buckets)
+        
+        revenue = _sum_by(inverse, self.line_amount[mask], len(keys))
+        orders = _distinct_counts(inverse, self.line_order[mask], len(keys))
+        current_timezone = timezone.get_current_timezone()
+        return [
+            {
+                'start': datetime.fromtimestamp(int(key) * size - offset, tz=current_timezone).isoformat(),
+                'revenue': int(revenue[index]),
+                'orders': int(orders[index]),
+            }
+            for index, key in enumerate(keys)
+        ]
+    
+    def by_food(self, since: Optional[datetime] = None, until: Optional[datetime] = None) -> List[dict]:
+        """음식별 순판매 수량, 순매출, 주문 수. 순매출 내림차순"""
+        mask = self._completed_lines(since, until)
+        keys, inverse = _group(self.line_food[mask])
+        quantity = _sum_by(inverse, self.line_quantity[mask], len(keys))
+        revenue = _sum_by(inverse, self.line_amount[mask], len(keys))
+        item_lines = self.line_kind[mask] == KIND_ITEM
+        orders = _distinct_counts(inverse[item_lines], self.line_order[mask][item_lines], len(keys))
+        return sorted(
+            (
+                {'food_id': int(key), 'quantity': int(quantity[index]), 'revenue': int(revenue[index]),
+                 'orders': int(orders[index])}
+                for index, key in enumerate(keys)
+            ),
+            key=lambda row: row['revenue'], reverse=True,
+        )
+    
+    def by_table(self, since: Optional[datetime] = None, until: Optional[datetime] = None) -> List[dict]:
+        """테이블별 순매출, 주문 수, 평균 객단가. 순매출 내림차순"""
+        mask = self._completed_lines(since, until)
+        line_order = self.line_order[mask]
+        keys, inverse = _group(self.order_table[line_order])
+        revenue = _sum_by(inverse, self.line_amount[mask], len(keys))
+        orders = _distinct_counts(inverse, line_order, len(keys))
+        return sorted(
+            (
+                {'table_id': str(self.table_ids[key]), 'revenue': int(revenue[index]), 'orders': int(orders[index]),
+                 'average_basket': int(revenue[index]) / int(orders[index])}
+                for index, key in enumerate(keys)
+            ),
+            key=lambda row: row['revenue'], reverse=True,
+        )
+
+
+_engine: Optional[SalesAnalytics] = None
+_engine_lock = threading.Lock()
+
+
+def get_sales_analytics() -> SalesAnalytics:
+    """프로세스 공용 분석 엔진을 반환합니다. 첫 호출 때 만들고, 호출마다 필요하면 새 라인을 적재합니다."""
+    global _engine
+    from django.conf import settings
+    
+    with _engine_lock:
+        if _engine is None:
+            _engine = SalesAnalytics(min_refresh_interval=settings.ANALYTICS_REFRESH_SECONDS)
+    _engine.refresh()
+    return _engine
@@ -3,4 +3,7 @@ from django.apps import AppConfig
 
 class AdminAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'admin_app'
\ No newline at end of file
+    name = 'admin_app'
+    
+    def ready(self):
+        from . import signals  # noqa: F401
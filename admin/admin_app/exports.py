@@ -0,0 +1,186 @@
+"""
+주문, 주문 라인, 입금 내역의 CSV/JSONL 스트리밍 내보내기.
+
+MySQL 드라이버(PyMySQL)는 iterator()를 써도 결과 전체를 클라이언트로 받아 두므로,
+정렬 키 기준 키셋 조회(마지막 행 이후 LIMIT chunk_size)를 반복해 한 번에 chunk_size 행만 메모리에 둡니다.
+정렬 키는 인덱스가 있는 컬럼입니다. (orders_keyset_idx, deposits_keyset_idx, 라인 PK)
+"""
+import csv
+import datetime
+import json
+import uuid
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence
+
+from django.db.models import CharField, Q, Value
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from .models import MinusOrderItemModel, OrderItemModel, OrderModel, PaymentDepositModel
+
+DEFAULT_CHUNK_SIZE = 2000
+
+FORMATS = ('csv', 'jsonl')
+
+
+class ExportSource(NamedTuple):
+    """키셋으로 훑을 쿼리셋. keys는 (유일한) 정렬 키, fields는 내보낼 값(columns와 같은 순서)"""
+    queryset: object
+    keys: Sequence[str]
+    fields: Sequence[str]
+
+
+class Export(NamedTuple):
+    columns: List[str]
+    sources: List[ExportSource]
+
+
+def _date_range(params, field: str) -> Q:
+    """목록 화면과 같은 date_from/date_to(YYYY-MM-DD, 양 끝 포함) 필터. 형식이 틀리면 ValueError"""
+    condition = Q()
+    for name, lookup in (('date_from', 'gte'), ('date_to', 'lte')):
+        value = params.get(name)
+        if not value:
+            continue
+        try:
+            parsed = parse_date(value)
+        except ValueError:
+            parsed = None
+        if parsed is None:
+            raise ValueError(f'{name}는 YYYY-MM-DD 형식이어야 합니다.')
+        condition &= Q(**{f'{field}__date__{lookup}': parsed})
+    return condition
+
+
+def _table_id(params) -> Optional[uuid.UUID]:
+    value = params.get('table')
+    if not value:
+        return None
+    try:
+        return uuid.UUID(value)
+    except ValueError:
+        raise ValueError('table은 테이블 ID(UUID)여야 합니다.')
+
+
+def _orders(params) -> Export:
+    """주문 목록. search는 결제자명/테이블명, table은 테이블 ID"""
+    orders = OrderModel.objects.filter(_date_range(params, 'order_date'))
+    search = params.get('search')
+    if search:
+        orders = orders.filter(Q(payer_name__icontains=search) | Q(table__name__icontains=search))
+    table_id = _table_id(params)
+    if table_id:
+        orders = orders.filter(table_id=table_id)
+    if params.get('status'):
+        orders = orders.filter(status=params['status'])
+    
+    columns = ['order_id', 'order_date', 'table_id', 'table_name', 'status', 'payer_name', 'pre_order_amount',
+               'items_total', 'minus_total', 'total']
+    fields = ['id', 'order_date', 'table_id', 'table__name', 'status', 'payer_name', 'pre_order_amount',
+              'items_total', 'minus_total', 'effective_total']
+    return Export(columns, [ExportSource(orders.with_totals(), ('order_date', 'id'), fields)])
+
+
+def _order_lines(params) -> Export:
+    """주문 아이템과 차감 아이템. search는 음식명, table은 테이블 ID, 기간은 주문일시 기준"""
+    condition = _date_range(params, 'order__order_date')
+    search = params.get('search')
+    if search:
+        condition &= Q(food__name__icontains=search)
+    table_id = _table_id(params)
+    if table_id:
+        condition &= Q(order__table_id=table_id)
+    
+    columns = ['line_type', 'line_id', 'order_id', 'order_date', 'table_name', 'order_status', 'food_id',
+               'food_name', 'quantity', 'price', 'reason']
+    fields = ['line_type', 'id', 'order_id', 'order__order_date', 'order__table__name', 'order__status', 'food_id',
+              'food__name', 'quantity', 'price', 'reason']
+    items = OrderItemModel.objects.filter(condition).annotate(reason=Value('', output_field=CharField()))
+    minus_items = MinusOrderItemModel.objects.filter(condition)
+    return Export(columns, [
+        ExportSource(queryset.annotate(line_type=Value(line_type, output_field=CharField())), ('id',), fields)
+        for line_type, queryset in (('item', items), ('minus', minus_items))
+    ])
+
+
+def _deposits(params) -> Export:
+    """입금 내역. 입금 관리 화면과 같은 search(입금자명/계좌번호), date_from/date_to(거래일)"""
+    deposits = PaymentDepositModel.objects.filter(_date_range(params, 'transaction_date'))
+    search = params.get('search')
+    if search:
+        deposits = deposits.filter(
+            Q(transaction_name__icontains=search) | Q(bank_account_number__icontains=search)
+        )
+    
+    columns = ['deposit_id', 'transaction_date', 'processing_date', 'transaction_name', 'bank_code',
+               'bank_account_number', 'amount', 'balance']
+    fields = ['id', 'transaction_date', 'processing_date', 'transaction_name', 'bank_code',
+              'bank_account_number', 'amount', 'balance']
+    return Export(columns, [ExportSource(deposits, ('transaction_date', 'id'), fields)])
+
+
+DATASETS: Dict[str, Callable[..., Export]] = {
+    'orders': _orders,
+    'order-lines': _order_lines,
+    'deposits': _deposits,
+}
+
+
+def _after(keys: Sequence[str], values: Sequence) -> Q:
+    """
+    (keys) > (values) 조건. 예: a >= x AND (a > x OR (a = x AND b > y))
+    앞의 a >= x가 있어야 OR 조건에서도 인덱스 범위 스캔을 탑니다.
+    """
+    condition = Q()
+    for index in reversed(range(len(keys))):
+        step = Q(**{f'{keys[index]}__gt': values[index]})
+        condition = step if index == len(keys) - 1 else step | (Q(**{keys[index]: values[index]}) & condition)
+    if len(keys) > 1:
+        condition = Q(**{f'{keys[0]}__gte': values[0]}) & condition
+    return condition
+
+
+def iter_chunks(source: ExportSource, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List[tuple]]:
+    """source를 정렬 키 순서로 chunk_size 행씩 돌려줍니다."""
+    queryset = source.queryset.order_by(*source.keys).values_list(*source.keys, *source.fields)
+    key_count = len(source.keys)
+    after: Optional[tuple] = None
+    while True:
+        page = queryset if after is None else queryset.filter(_after(source.keys, after))
+        rows = list(page[:chunk_size])
+        if rows:
+            yield [row[key_count:] for row in rows]
+        if len(rows) < chunk_size:
+            return
+        after = rows[-1][:key_count]
+
+
+def _cell(value):
+    if isinstance(value, datetime.datetime):
+        return timezone.localtime(value).isoformat() if timezone.is_aware(value) else value.isoformat()
+    if isinstance(value, (datetime.date, uuid.UUID)):
+        return str(value)
+    return value
+
+
+class _Echo:
+    """csv.writer가 쓴 한 줄을 그대로 돌려주는 버퍼"""
+    
+    def write(self, value):
+        return value
+
+
+def stream(export: Export, fmt: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+    """내보내기 본문을 청크 단위 문자열로 생성합니다."""
+    writer = csv.writer(_Echo())
+    if fmt == 'csv':
+        # 엑셀에서 한글이 깨지지 않도록 BOM을 붙임
+        yield '\ufeff' + writer.writerow(export.columns)
+    for source in export.sources:
+        for rows in iter_chunks(source, chunk_size):
+            if fmt == 'csv':
+                yield ''.join(writer.writerow([_cell(value) for value in row]) for row in rows)
+            else:
+                yield ''.join(
+                    json.dumps(dict(zip(export.columns, map(_cell, row))), ensure_ascii=False) + '\n'
+                    for row in rows
+                )
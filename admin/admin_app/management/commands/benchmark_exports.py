@@ -0,0 +1,91 @@
+import time
+import tracemalloc
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from admin_app import exports
+from admin_app.models import FoodModel, OrderItemModel, OrderModel, PaymentDepositModel, TableModel
+
+SEED_BATCH = 5000
+
+
+class Command(BaseCommand):
+    help = (
+        'Check that export memory stays flat as row counts grow. Rows are seeded inside a transaction that is '
+        'rolled back, but run this against a development database.'
+    )
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', default='1000,10000,1000000', help='Comma separated row counts')
+        parser.add_argument('--dataset', choices=['deposits', 'order-lines'], default='deposits')
+        parser.add_argument('--format', choices=exports.FORMATS, default='csv')
+        parser.add_argument('--chunk-size', type=int, default=exports.DEFAULT_CHUNK_SIZE)
+        parser.add_argument('--max-ratio', type=float, default=2.0,
+                            help='Fail when the largest size peaks above this multiple of the smallest size '
+                                 'that fills at least one chunk')
+    
+    def handle(self, *args, **options):
+        sizes = sorted(int(size) for size in options['sizes'].split(','))
+        peaks = []
+        for size in sizes:
+            with transaction.atomic():
+                self._seed(options['dataset'], size)
+                export = exports.DATASETS[options['dataset']]({})
+                peak, rows, elapsed = self._measure(export, options['format'], options['chunk_size'])
+                transaction.set_rollback(True)
+            peaks.append(peak)
+            self.stdout.write(
+                f'{size} rows: exported {rows} lines in {elapsed:.2f}s, peak memory {peak / 1024 / 1024:.2f} MiB'
+            )
+        
+        # 한 청크보다 적은 행은 청크 하나도 다 채우지 않으므로 기준에서 제외
+        full = [(size, peak) for size, peak in zip(sizes, peaks) if size >= options['chunk_size']]
+        if len(full) > 1 and full[-1][1] > full[0][1] * options['max_ratio']:
+            raise CommandError(
+                f'Peak memory grew {full[-1][1] / full[0][1]:.1f}x from {full[0][0]} to {full[-1][0]} rows'
+            )
+        self.stdout.write(self.style.SUCCESS('Export memory stays flat'))
+    
+    @staticmethod
+    def _measure(export, fmt, chunk_size):
+        tracemalloc.start()
+        started = time.perf_counter()
+        lines = 0
+        try:
+            for chunk in exports.stream(export, fmt, chunk_size):
+                lines += chunk.count('\n')
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return peak, lines, time.perf_counter() - started
+    
+    @staticmethod
+    def _seed(dataset, size):
+        now = timezone.now()
+        if dataset == 'deposits':
+            for offset in range(0, size, SEED_BATCH):
+                PaymentDepositModel.objects.bulk_create([
+                    PaymentDepositModel(
+                        transaction_name=f'입금자{index % 500}', bank_account_number='110-000-000000',
+                        amount=10000 + index % 50 * 1000, bank_code='088', bank_account_id='benchmark',
+                        transaction_date=now + timedelta(seconds=index), processing_date=now, balance=0,
+                    )
+                    for index in range(offset, min(offset + SEED_BATCH, size))
+                ])
+            return
+        
+        # 주문 하나에 라인 두 개
+        table = TableModel.objects.create(name='benchmark')
+        food = FoodModel.objects.create(name='benchmark', price=1000, category='main')
+        for offset in range(0, size // 2, SEED_BATCH):
+            orders = OrderModel.objects.bulk_create([
+                OrderModel(table=table, order_date=now + timedelta(seconds=index))
+                for index in range(offset, min(offset + SEED_BATCH, size // 2))
+            ])
+            OrderItemModel.objects.bulk_create([
+                OrderItemModel(order=order, food=food, quantity=quantity, price=1000)
+                for order in orders for quantity in (1, 2)
+            ])
@@ -0,0 +1,92 @@
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from admin_app import analytics
+
+
+class Command(BaseCommand):
+    help = 'Benchmark the numpy sales analytics engine on synthetic order lines (no database access)'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--lines', type=int, default=1_000_000, help='Number of synthetic order lines')
+        parser.add_argument('--orders', type=int, default=200_000, help='Number of synthetic orders')
+        parser.add_argument('--repeat', type=int, default=5, help='Runs per query (median is reported)')
+        parser.add_argument('--skip-baseline', action='store_true', help='Skip the pure Python baseline')
+    
+    def handle(self, *args, **options):
+        if not analytics.AVAILABLE:
+            raise CommandError('numpy is not installed (pip install .[analytics])')
+        np = analytics.np
+        lines, orders, repeat = options['lines'], options['orders'], options['repeat']
+        
+        rng = np.random.default_rng(0)
+        start = timezone.make_aware(datetime(2025, 5, 27, 17, 0))
+        order_ids = [uuid.UUID(int=index + 1) for index in range(orders)]
+        table_ids = [uuid.UUID(int=(1 << 64) + index) for index in range(60)]
+        order_dates = [start + timedelta(seconds=int(offset)) for offset in rng.integers(0, 6 * 3600, orders)]
+        order_tables = rng.integers(0, len(table_ids), orders)
+        statuses = rng.choice(['completed', 'pre_order', 'refunded'], orders, p=[0.9, 0.07, 0.03])
+        line_orders = np.sort(rng.integers(0, orders, lines))
+        foods = rng.integers(1, 41, lines)
+        quantities = rng.integers(1, 4, lines)
+        prices = rng.integers(3, 25, lines) * 1000
+        refund_lines = rng.random(lines) < 0.02
+        
+        rows = {'item': [], 'minus': []}
+        for index in range(lines):
+            order = int(line_orders[index])
+            row = (
+                index + 1, order_ids[order], order_dates[order], table_ids[order_tables[order]], statuses[order],
+                int(foods[index]), int(quantities[index]), int(prices[index]),
+            )
+            if refund_lines[index]:
+                rows['minus'].append(row[:6] + (-row[6], row[7], 'refund'))
+            else:
+                rows['item'].append(row)
+        
+        engine = analytics.SalesAnalytics()
+        started = time.perf_counter()
+        for source, source_rows in rows.items():
+            for offset in range(0, len(source_rows), engine.chunk_size):
+                engine.append_rows(source_rows[offset:offset + engine.chunk_size], source)
+        self.stdout.write(f'load {engine.line_count} lines: {time.perf_counter() - started:.2f}s')
+        
+        since, until = start + timedelta(hours=1), start + timedelta(hours=4)
+        queries = {
+            'summary': lambda: engine.summary(),
+            'summary (3h range)': lambda: engine.summary(since, until),
+            'time_buckets (10m)': lambda: engine.time_buckets(10),
+            'by_food': lambda: engine.by_food(),
+            'by_table': lambda: engine.by_table(),
+        }
+        for name, query in queries.items():
+            self.stdout.write(f'{name}: {self._median(query, repeat) * 1000:.1f}ms')
+        
+        if not options['skip_baseline']:
+            all_rows = rows['item'] + rows['minus']
+            numpy_result = {row['food_id']: row['revenue'] for row in engine.by_food()}
+            baseline = self._median(lambda: self._python_by_food(all_rows), 1)
+            if self._python_by_food(all_rows) != numpy_result:
+                raise CommandError('by_food differs from the pure Python baseline')
+            self.stdout.write(f'by_food pure Python baseline: {baseline * 1000:.1f}ms')
+    
+    @staticmethod
+    def _median(query, repeat):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            query()
+            timings.append(time.perf_counter() - started)
+        return sorted(timings)[len(timings) // 2]
+    
+    @staticmethod
+    def _python_by_food(rows):
+        revenue = {}
+        for row in rows:
+            if row[4] == 'completed':
+                revenue[row[5]] = revenue.get(row[5], 0) + row[6] * row[7]
+        return revenue
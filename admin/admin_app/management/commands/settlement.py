@@ -0,0 +1,40 @@
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from admin_app import settlement
+from admin_app.models import SettlementSnapshotModel
+
+
+class Command(BaseCommand):
+    help = 'Compute the end-of-festival settlement in one streaming pass and store it as an immutable snapshot'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=settlement.DEFAULT_CHUNK_SIZE,
+                            help='Rows fetched per database round trip')
+        parser.add_argument('--snapshot', type=int, help='Export an existing snapshot instead of computing a new one')
+        parser.add_argument('--output', help='Directory to write settlement-<id>.json and settlement-<id>.csv into')
+        parser.add_argument('--created-by', default='manage.py', help='Recorded as the snapshot creator')
+    
+    def handle(self, *args, **options):
+        if options['snapshot']:
+            try:
+                snapshot = SettlementSnapshotModel.objects.get(pk=options['snapshot'])
+            except SettlementSnapshotModel.DoesNotExist:
+                raise CommandError(f"Settlement snapshot {options['snapshot']} does not exist")
+        else:
+            snapshot = settlement.create_snapshot(options['created_by'], options['chunk_size'])
+            self.stdout.write(self.style.SUCCESS(f'Created settlement snapshot #{snapshot.pk}'))
+        
+        for name, value in snapshot.report['totals'].items():
+            self.stdout.write(f'{name}: {value}')
+        
+        if options['output']:
+            directory = Path(options['output'])
+            directory.mkdir(parents=True, exist_ok=True)
+            json_path = directory / f'settlement-{snapshot.pk}.json'
+            csv_path = directory / f'settlement-{snapshot.pk}.csv'
+            json_path.write_text(json.dumps(snapshot.report, ensure_ascii=False, indent=2), encoding='utf-8')
+            csv_path.write_text(snapshot.csv, encoding='utf-8')
+            self.stdout.write(f'Wrote {json_path} and {csv_path}')
@@ -0,0 +1,112 @@
+"""
+미매칭 입금 처리 화면의 후보 선주문 추천.
+
+백엔드 domain/services/payment_matching.py와 같은 규칙(이름 정규화, 점수, 정렬)으로 후보를 고릅니다.
+어드민은 백엔드 코드를 가져오지 않는 별도 배포이므로 필요한 부분만 옮겨 두었습니다. 한쪽을 바꾸면 같이 바꿔야 합니다.
+"""
+import re
+import unicodedata
+from difflib import SequenceMatcher
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from .models import OrderModel
+
+SCORE_EXACT = 100
+SCORE_TRUNCATED = 80
+SCORE_SIMILAR = 60
+SCORE_NAME_ONLY = 30
+
+MIN_TRUNCATED_LENGTH = 2
+SIMILARITY_THRESHOLD = 0.6
+
+REASON_LABELS = {
+    'exact': '이름/금액 일치',
+    'truncated': '잘린 이름',
+    'similar': '비슷한 이름',
+    'name_only': '금액 다름',
+}
+
+_NON_WORD = re.compile(r'[\W_]+')
+
+
+def normalize_name(name: Optional[str]) -> str:
+    if not name:
+        return ''
+    return _NON_WORD.sub('', unicodedata.normalize('NFKC', name).casefold())
+
+
+class Candidate(NamedTuple):
+    order_id: object
+    score: int
+    reason: str
+    payer_name: str
+    amount: int
+    order_date: object
+    table_name: Optional[str]
+    
+    @property
+    def reason_label(self) -> str:
+        return REASON_LABELS[self.reason]
+
+
+class PreOrderIndex:
+    """결제 대기 선주문을 (정규화한 이름, 금액), 금액, 이름으로 색인해 입금마다 후보를 찾습니다."""
+    
+    def __init__(self, rows):
+        # rows: (주문 ID, 결제자명, 선주문 금액, 주문일시, 테이블명)
+        self._orders: Dict[object, tuple] = {}
+        self._by_key: Dict[Tuple[str, int], List[object]] = {}
+        self._by_amount: Dict[int, List[object]] = {}
+        self._by_name: Dict[str, List[object]] = {}
+        for row in rows:
+            order_id, payer_name, amount = row[:3]
+            name = normalize_name(payer_name)
+            self._orders[order_id] = row
+            self._by_key.setdefault((name, amount), []).append(order_id)
+            self._by_amount.setdefault(amount, []).append(order_id)
+            self._by_name.setdefault(name, []).append(order_id)
+    
+    def __len__(self) -> int:
+        return len(self._orders)
+    
+    def candidates(self, deposit, limit: int = 5) -> List[Candidate]:
+        """점수 내림차순, 같으면 입금 전에 가장 최근 들어온 주문부터"""
+        name = normalize_name(deposit.transaction_name)
+        if not name or deposit.amount <= 0:
+            return []
+        
+        scored: Dict[object, Tuple[int, str]] = {}
+        
+        def offer(order_id, score: int, reason: str) -> None:
+            if scored.get(order_id, (0, ''))[0] < score:
+                scored[order_id] = (score, reason)
+        
+        for order_id in self._by_key.get((name, deposit.amount), ()):
+            offer(order_id, SCORE_EXACT, 'exact')
+        for order_id in self._by_amount.get(deposit.amount, ()):
+            other = normalize_name(self._orders[order_id][1])
+            if len(name) >= MIN_TRUNCATED_LENGTH and other.startswith(name):
+                offer(order_id, SCORE_TRUNCATED, 'truncated')
+            elif SequenceMatcher(None, name, other).ratio() >= SIMILARITY_THRESHOLD:
+                offer(order_id, SCORE_SIMILAR, 'similar')
+        for order_id in self._by_name.get(name, ()):
+            offer(order_id, SCORE_NAME_ONLY, 'name_only')
+        
+        def rank(order_id):
+            order_date = self._orders[order_id][3]
+            distance = abs((deposit.transaction_date - order_date).total_seconds())
+            return -scored[order_id][0], order_date > deposit.transaction_date, distance
+        
+        return [
+            Candidate(order_id, *scored[order_id], *self._orders[order_id][1:])
+            for order_id in sorted(scored, key=rank)[:limit]
+        ]
+
+
+def pending_pre_order_index() -> PreOrderIndex:
+    """결제 대기 선주문 색인. orders_pre_order_lookup_idx의 status 범위로 한 번만 읽습니다."""
+    return PreOrderIndex(
+        OrderModel.objects.filter(
+            status='pre_order', payer_name__isnull=False, pre_order_amount__isnull=False
+        ).order_by().values_list('id', 'payer_name', 'pre_order_amount', 'order_date', 'table__name')
+    )
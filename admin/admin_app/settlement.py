@@ -0,0 +1,214 @@
+"""
+축제 마감 정산.
+
+주문, 주문 아이템, 차감 아이템, 입금 내역을 각각 정렬 키 기준 키셋 조회(exports.iter_chunks)로 한 번씩만 훑어
+음식/테이블/결제자별 합계, 사유별 차감, 결제되지 않은 선주문, 매칭 기록(payment_matches)이 없는 입금을 계산합니다.
+모델 인스턴스와 프로퍼티(total_amount 등)를 거치지 않으므로 주문 수에 비례하는 추가 쿼리가 없습니다.
+PyMySQL은 iterator()를 써도 결과 전체를 받아 두므로 키셋 조회로 한 번에 chunk_size 행만 메모리에 둡니다.
+
+결과는 SettlementSnapshotModel에 JSON과 CSV로 저장해 두고 그대로 다시 내려줍니다.
+"""
+import csv
+import hashlib
+import io
+import json
+from typing import Dict, List, Optional
+
+from django.db import transaction
+from django.utils import timezone
+
+from .exports import ExportSource, iter_chunks
+from .models import (
+    MinusOrderItemModel, OrderItemModel, OrderModel, PaymentDepositModel, SettlementSnapshotModel,
+)
+
+DEFAULT_CHUNK_SIZE = 2000
+
+# CSV 섹션별 (JSON 키, 열 목록)
+CSV_SECTIONS = [
+    ('foods', ['food_id', 'name', 'quantity', 'gross', 'minus', 'net']),
+    ('tables', ['table_id', 'name', 'orders', 'gross', 'minus', 'net']),
+    ('payers', ['payer_name', 'orders', 'gross', 'minus', 'net']),
+    ('minus_by_reason', ['reason', 'lines', 'quantity', 'amount']),
+    ('pending_pre_orders', ['order_id', 'table_name', 'payer_name', 'amount', 'order_date']),
+    ('unmatched_deposits', ['deposit_id', 'transaction_name', 'amount', 'transaction_date']),
+]
+
+
+def _new_totals() -> Dict[str, int]:
+    return {'orders': 0, 'gross': 0, 'minus': 0}
+
+
+def _with_net(key_name: str, key, values: dict, **extra) -> dict:
+    return {key_name: key, **extra, **values, 'net': values['gross'] + values['minus']}
+
+
+def _rows(queryset, keys, fields, chunk_size: int):
+    """queryset을 정렬 키(keys) 순서로 chunk_size 행씩 읽어 fields 값을 한 행씩 돌려줍니다."""
+    for rows in iter_chunks(ExportSource(queryset, keys, fields), chunk_size):
+        yield from rows
+
+
+def build_report(chunk_size: int = DEFAULT_CHUNK_SIZE) -> dict:
+    """정산 결과를 계산합니다. 네 테이블을 한 트랜잭션 안에서 읽어 같은 시점의 데이터로 집계합니다."""
+    with transaction.atomic():
+        return _build_report(chunk_size)
+
+
+def _build_report(chunk_size: int) -> dict:
+    generated_at = timezone.now()
+    
+    # ---------- 주문: 완료 주문의 테이블/결제자, 미결제 선주문 ----------
+    completed: Dict[object, tuple] = {}
+    tables: Dict[object, dict] = {}
+    table_names: Dict[object, Optional[str]] = {}
+    payers: Dict[Optional[str], dict] = {}
+    pending_pre_orders: List[dict] = []
+    refunded = {'orders': 0, 'amount': 0}
+    
+    orders = _rows(
+        OrderModel.objects.all(), ('order_date', 'id'),
+        ('id', 'status', 'table_id', 'table__name', 'payer_name', 'pre_order_amount', 'order_date'), chunk_size,
+    )
+    for order_id, status, table_id, table_name, payer_name, pre_order_amount, order_date in orders:
+        if status == 'completed':
+            completed[order_id] = (table_id, payer_name)
+            table_names[table_id] = table_name
+            tables.setdefault(table_id, _new_totals())['orders'] += 1
+            payers.setdefault(payer_name, _new_totals())['orders'] += 1
+        elif status == 'pre_order':
+            pending_pre_orders.append({
+                'order_id': str(order_id),
+                'table_name': table_name,
+                'payer_name': payer_name,
+                'amount': pre_order_amount or 0,
+                'order_date': order_date.isoformat(),
+            })
+        elif status == 'refunded':
+            refunded['orders'] += 1
+            refunded['amount'] += pre_order_amount or 0
+    
+    # ---------- 주문 아이템 / 차감 아이템: 완료 주문만 ----------
+    foods: Dict[int, dict] = {}
+    food_names: Dict[int, str] = {}
+    reasons: Dict[str, dict] = {}
+    
+    def add_line(order_id, food_id, food_name, amount, field, quantity):
+        owner = completed.get(order_id)
+        if owner is None:
+            return False
+        table_id, payer_name = owner
+        food_names[food_id] = food_name
+        food = foods.setdefault(food_id, {'quantity': 0, 'gross': 0, 'minus': 0})
+        food['quantity'] += quantity
+        food[field] += amount
+        tables[table_id][field] += amount
+        payers[payer_name][field] += amount
+        return True
+    
+    items = _rows(
+        OrderItemModel.objects.all(), ('id',), ('order_id', 'food_id', 'food__name', 'quantity', 'price'), chunk_size
+    )
+    for order_id, food_id, food_name, quantity, price in items:
+        add_line(order_id, food_id, food_name, quantity * price, 'gross', quantity)
+    
+    minus_items = _rows(
+        MinusOrderItemModel.objects.all(), ('id',),
+        ('order_id', 'food_id', 'food__name', 'quantity', 'price', 'reason'), chunk_size,
+    )
+    for order_id, food_id, food_name, quantity, price, reason in minus_items:
+        if add_line(order_id, food_id, food_name, quantity * price, 'minus', quantity):
+            by_reason = reasons.setdefault(reason, {'lines': 0, 'quantity': 0, 'amount': 0})
+            by_reason['lines'] += 1
+            by_reason['quantity'] -= quantity
+            by_reason['amount'] -= quantity * price
+    
+    # ---------- 입금: 매칭 기록(자동/수동/제외)이 없는 입금 ----------
+    deposits = {'count': 0, 'amount': 0}
+    unmatched_deposits: List[dict] = []
+    rows = _rows(
+        PaymentDepositModel.objects.all(), ('transaction_date', 'id'),
+        ('id', 'transaction_name', 'amount', 'transaction_date', 'match__id'), chunk_size,
+    )
+    for deposit_id, transaction_name, amount, transaction_date, match_id in rows:
+        deposits['count'] += 1
+        deposits['amount'] += amount
+        if match_id is not None or amount <= 0:
+            continue
+        unmatched_deposits.append({
+            'deposit_id': str(deposit_id),
+            'transaction_name': transaction_name,
+            'amount': amount,
+            'transaction_date': transaction_date.isoformat(),
+        })
+    
+    gross = sum(food['gross'] for food in foods.values())
+    minus = sum(food['minus'] for food in foods.values())
+    return {
+        'generated_at': generated_at.isoformat(),
+        'totals': {
+            'orders': len(completed),
+            'gross': gross,
+            'minus': minus,
+            'net': gross + minus,
+            'pending_pre_orders': len(pending_pre_orders),
+            'pending_pre_order_amount': sum(order['amount'] for order in pending_pre_orders),
+            'refunded_pre_orders': refunded['orders'],
+            'refunded_pre_order_amount': refunded['amount'],
+            'deposits': deposits['count'],
+            'deposit_amount': deposits['amount'],
+            'unmatched_deposits': len(unmatched_deposits),
+            'unmatched_deposit_amount': sum(deposit['amount'] for deposit in unmatched_deposits),
+        },
+        'foods': sorted(
+            (_with_net('food_id', food_id, values, name=food_names[food_id]) for food_id, values in foods.items()),
+            key=lambda row: (-row['net'], row['food_id']),
+        ),
+        'tables': sorted(
+            (
+                _with_net('table_id', str(table_id), values, name=table_names[table_id])
+                for table_id, values in tables.items()
+            ),
+            key=lambda row: (-row['net'], row['table_id']),
+        ),
+        'payers': sorted(
+            (_with_net('payer_name', payer_name, values) for payer_name, values in payers.items()),
+            key=lambda row: (-row['net'], row['payer_name'] or ''),
+        ),
+        'minus_by_reason': sorted(
+            ({'reason': reason, **values} for reason, values in reasons.items()),
+            key=lambda row: -row['amount'],
+        ),
+        'pending_pre_orders': pending_pre_orders,
+        'unmatched_deposits': unmatched_deposits,
+    }
+
+
+def report_to_csv(report: dict) -> str:
+    """정산 결과를 섹션별 표(# 섹션명, 열 이름, 행, 빈 줄)로 이어 붙인 CSV로 만듭니다."""
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(['# totals'])
+    writer.writerows(report['totals'].items())
+    for section, columns in CSV_SECTIONS:
+        writer.writerow([])
+        writer.writerow([f'# {section}'])
+        writer.writerow(columns)
+        writer.writerows([row[column] for column in columns] for row in report[section])
+    return output.getvalue()
+
+
+def report_checksum(report: dict) -> str:
+    canonical = json.dumps(report, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def create_snapshot(created_by: str = '', chunk_size: int = DEFAULT_CHUNK_SIZE) -> SettlementSnapshotModel:
+    """정산을 계산해 새 스냅샷으로 저장합니다."""
+    report = build_report(chunk_size)
+    return SettlementSnapshotModel.objects.create(
+        created_by=created_by,
+        report=report,
+        csv=report_to_csv(report),
+        checksum=report_checksum(report),
+    )
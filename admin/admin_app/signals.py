@@ -0,0 +1,11 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import FoodModel, MenuVersionModel
+
+
+@receiver(post_save, sender=FoodModel)
+@receiver(post_delete, sender=FoodModel)
+def bump_menu_version(sender, **kwargs):
+    """음식이 저장/삭제되면 메뉴 버전을 올려 백엔드 워커들의 메뉴 캐시를 무효화합니다."""
+    MenuVersionModel.bump()
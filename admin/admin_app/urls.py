@@ -25,11 +25,29 @@ urlpatterns = [
     path('orders/<str:order_id>/items/<int:item_id>/refund/', views.order_item_refund, name='order_item_refund'),
     path('orders/<str:order_id>/full-refund/', views.order_full_refund, name='order_full_refund'),
     
+    # Order board - 실시간 주문 현황판
+    path('board/', views.board, name='board'),
+    
     # Payment deposits - 입금 관리
     path('payments/', views.payment_list, name='payment_list'),
+    path('payments/unmatched/', views.payment_unmatched, name='payment_unmatched'),
     path('payments/<str:pk>/', views.payment_detail, name='payment_detail'),
+    path('payments/<str:pk>/match/', views.payment_match, name='payment_match'),
+    path('payments/<str:pk>/dismiss/', views.payment_dismiss, name='payment_dismiss'),
+    
+    # Settlement - 마감 정산
+    path('settlements/', views.settlement_list, name='settlement_list'),
+    path('settlements/<int:pk>/', views.settlement_detail, name='settlement_detail'),
+    path('settlements/<int:pk>/download.<str:fmt>', views.settlement_download, name='settlement_download'),
+    
+    # Exports - CSV/JSONL 내보내기 (orders, order-lines, deposits)
+    path('exports/<str:dataset>.<str:fmt>', views.export_data, name='export_data'),
     
     # API endpoints for AJAX
     path('api/stats/', views.api_stats, name='api_stats'),
     path('api/foods/', views.api_food_list, name='api_food_list'),
+    path('api/analytics/summary/', views.api_analytics_summary, name='api_analytics_summary'),
+    path('api/analytics/time-buckets/', views.api_analytics_time_buckets, name='api_analytics_time_buckets'),
+    path('api/analytics/foods/', views.api_analytics_foods, name='api_analytics_foods'),
+    path('api/analytics/tables/', views.api_analytics_tables, name='api_analytics_tables'),
 ]
\ No newline at end of file
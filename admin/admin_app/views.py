@@ -2,18 +2,88 @@ from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib import messages
 from django.contrib.auth import authenticate, login, logout
 from django.contrib.auth.decorators import login_required
-from django.http import JsonResponse
+from django.http import Http404, HttpResponse, JsonResponse, StreamingHttpResponse
+from django.core import signing
 from django.core.paginator import Paginator
-from django.db.models import Q, Sum, Count
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Q, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
 from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 from datetime import timedelta
+import uuid
+
+from . import analytics, exports, reconciliation, settlement
 
-from .discord import DiscordNotificationService
 from .models import (
-    FoodModel, TableModel, OrderModel, OrderItemModel,
-    MinusOrderItemModel, PaymentDepositModel
+    FoodModel, TableModel, TableSessionModel, OrderModel, OrderItemModel,
+    MinusOrderItemModel, PaymentDepositModel, PaymentMatchModel, NotificationOutboxModel, OrderEventModel,
+    SalesDailySummaryModel, SalesContribution, SalesSummary, SettlementSnapshotModel
 )
 
+# 백엔드 현황판 스트림(order_events)과 같은 salt로 토큰 서명
+ORDER_EVENTS_TOKEN_SALT = 'order-events'
+
+
+def _refund_contribution(order, lines):
+    """환불한 (음식 ID, 수량, 단가) 목록만큼 매출 요약에서 뺄 기여분을 만듭니다."""
+    contribution = SalesContribution(timezone.localdate(order.order_date))
+    for food_id, quantity, price in lines:
+        contribution.add_line(food_id, -quantity, -price * quantity, counts_order=False)
+    return contribution
+
+
+def _scalar(queryset, aggregate):
+    # 상수로 묶어 GROUP BY 없이 값 하나(행이 없으면 0)만 반환. 상관 없는 서브쿼리라 바깥 GROUP BY에도 들어가지 않음
+    return Subquery(
+        queryset.order_by().annotate(_one=Value(1)).values('_one').annotate(value=Coalesce(aggregate, 0)).values('value')
+    )
+
+
+def _dashboard_stats():
+    """
+    대시보드/통계 API 수치를 쿼리 한 번으로 조회합니다.
+    음식 수/품절 수는 음식 테이블을 상수로 묶은 집계로, 테이블 수와 주문 수/매출(매출 요약 테이블)은
+    같은 행의 스칼라 서브쿼리 컬럼으로 가져옵니다. 상수 묶음은 GROUP BY가 생략되므로 메뉴가 없어도 한 행이 나옵니다.
+    """
+    summary = SalesDailySummaryModel.objects.all()
+    return (
+        FoodModel.objects.order_by().annotate(_one=Value(1)).values('_one')
+        .annotate(
+            total_foods=Count('id'),
+            sold_out_foods=Count('id', filter=Q(sold_out=True)),
+            total_tables=_scalar(TableModel.objects.all(), Count('id')),
+            total_orders=_scalar(summary, Sum('order_count')),
+            today_orders=_scalar(summary.filter(date=timezone.localdate()), Sum('order_count')),
+            total_revenue=_scalar(summary, Sum('revenue')),
+        )
+        .values('total_foods', 'sold_out_foods', 'total_tables', 'total_orders', 'today_orders', 'total_revenue')
+        .get()
+    )
+
+
+def _record_order_event(kind, order, revenue=0, orders=0):
+    """주문 현황판에 반영할 변화량을 기록합니다. 완료된 주문만 현황판 매출/주문 수에 포함됩니다."""
+    OrderEventModel.record(
+        kind, order.table_id, session_id=order.session_id, order_id=order.id,
+        table_name=order.table.name, revenue=revenue, orders=orders
+    )
+
+
+def _complete_pre_order(order):
+    """
+    선주문을 결제 완료로 바꾸고 결제 완료 알림, 현황판 이벤트, 매출 요약을 함께 기록합니다.
+    호출하는 쪽의 트랜잭션 안에서 불러야 합니다. (알림 전송은 백엔드 디스패처가 담당)
+    """
+    order.status = 'completed'
+    order.save()
+    NotificationOutboxModel.enqueue_payment_completion(order.id)
+    # 완료된 주문의 매출은 주문 아이템 + 차감 아이템 합계
+    revenue = OrderModel.objects.with_totals().filter(pk=order.pk).values_list('effective_total', flat=True).get()
+    _record_order_event(OrderEventModel.KIND_PAYMENT_COMPLETED, order, revenue=revenue, orders=1)
+    SalesSummary.add_order(order.id)
+
 
 # ==================== 인증 관련 ====================
 
@@ -47,52 +117,24 @@ def admin_logout(request):
 
 @login_required
 def dashboard(request):
-    """대시보드 메인 페이지"""
-    # 통계 데이터 수집 (환불된 주문 제외)
-    total_orders = OrderModel.objects.exclude(status='pre_order').exclude(status='refunded').count()
-    total_foods = FoodModel.objects.count()
-    total_tables = TableModel.objects.count()
-    
-    # 오늘 주문 수 (환불된 주문 제외)
-    today = timezone.now().date()
-    today_orders = OrderModel.objects.filter(order_date__date=today).exclude(status='pre_order').exclude(status='refunded').count()
-    
-    # 총 매출 (pre-order 제외, 환불 금액 반영)
-    completed_orders = OrderModel.objects.exclude(status='pre_order').exclude(status='refunded')
-    total_revenue = 0
-    for order in completed_orders:
-        total_revenue += order.total_amount
-    
-    # 최근 주문 5개 (pre-order, refunded, 0원 주문 제외)
-    recent_orders_queryset = OrderModel.objects.select_related('table').exclude(
+    """대시보드 메인 페이지 - 주문 수와 관계없이 통계 1 + 최근 주문 1 + 인기 메뉴 1, 쿼리 3번으로 조회"""
+    # 통계 데이터 수집 (완료 주문만, 환불 금액 반영)
+    stats = _dashboard_stats()
+    
+    # 최근 주문 5개 (pre-order, refunded, 0원 주문 제외). 총액은 SQL에서 계산
+    recent_orders = OrderModel.objects.select_related('table', 'session').exclude(
         status='pre_order'
-    ).exclude(status='refunded').order_by('-order_date')
-    
-    # 0원이 아닌 주문만 필터링
-    recent_orders = []
-    for order in recent_orders_queryset:
-        if order.total_amount > 0:
-            recent_orders.append(order)
-            if len(recent_orders) >= 5:
-                break
-    
-    # 인기 메뉴 5개
-    popular_foods = FoodModel.objects.annotate(
-        order_count=Count('orderitemmodel__order', filter=~Q(orderitemmodel__order__status='pre_order'))
-    ).order_by('-order_count')[:5]
+    ).exclude(status='refunded').with_positive_total().order_by('-order_date')[:5]
     
-    # 품절된 메뉴 수
-    sold_out_foods = FoodModel.objects.filter(sold_out=True).count()
+    # 인기 메뉴 5개 (완료 주문에 포함된 횟수 기준)
+    popular_foods = FoodModel.objects.filter(sales_summary__order_count__gt=0).annotate(
+        order_count=F('sales_summary__order_count')
+    ).order_by('-order_count')[:5]
     
     context = {
-        'total_orders': total_orders,
-        'total_foods': total_foods,
-        'total_tables': total_tables,
-        'today_orders': today_orders,
-        'total_revenue': total_revenue,
+        **stats,
         'recent_orders': recent_orders,
         'popular_foods': popular_foods,
-        'sold_out_foods': sold_out_foods,
     }
     
     return render(request, 'dashboard.html', context)
@@ -181,7 +223,10 @@ def table_list(request):
     search = request.GET.get('search', '')
     
     tables = TableModel.objects.annotate(
-        active_order_count=Count('ordermodel', filter=Q(ordermodel__is_visible=True))
+        active_order_count=Count(
+            'ordermodel',
+            filter=Q(ordermodel__session__isnull=False, ordermodel__session__ended_at__isnull=True)
+        )
     )
     
     if search:
@@ -206,20 +251,17 @@ def table_orders(request, pk):
     """특정 테이블의 주문 내역"""
     table = get_object_or_404(TableModel, pk=pk)
     
-    # is_visible=True인 주문만 조회
-    orders = OrderModel.objects.filter(
-        table=table,
-        is_visible=True
-    ).select_related('table').prefetch_related('items__food', 'minus_items__food').order_by('-order_date')
+    # 현재 세션의 주문만 조회
+    orders = OrderModel.objects.visible().filter(
+        table=table
+    ).with_totals().select_related('table').prefetch_related('items__food', 'minus_items__food').order_by('-order_date')
     
     paginator = Paginator(orders, 10)
     page_number = request.GET.get('page')
     page_obj = paginator.get_page(page_number)
     
     # 총 매출 계산 (환불 금액 반영)
-    total_revenue = 0
-    for order in orders:
-        total_revenue += order.total_amount
+    total_revenue = orders.with_totals().aggregate(total=Sum('effective_total'))['total'] or 0
     
     context = {
         'table': table,
@@ -233,15 +275,20 @@ def table_orders(request, pk):
 
 @login_required
 def table_checkout(request, pk):
-    """테이블 퇴실 처리 - 모든 주문을 is_visible=False로 변경"""
+    """테이블 퇴실 처리 - 현재 세션을 종료하여 세션의 모든 주문을 숨김"""
     table = get_object_or_404(TableModel, pk=pk)
     
     if request.method == 'POST':
-        # 해당 테이블의 모든 활성 주문을 비활성화
-        updated_count = OrderModel.objects.filter(
-            table=table, 
-            is_visible=True
-        ).update(is_visible=False)
+        # 현재 세션 한 행만 종료하면 해당 세션의 주문이 모두 비활성화됨
+        session = TableSessionModel.objects.filter(table=table, ended_at__isnull=True).first()
+        updated_count = 0
+        if session:
+            updated_count = session.orders.count()
+            with transaction.atomic():
+                TableSessionModel.objects.filter(pk=session.pk).update(ended_at=timezone.now())
+                OrderEventModel.record(
+                    OrderEventModel.KIND_TABLE_CHECKOUT, table.pk, session_id=session.pk, table_name=table.name
+                )
         
         if updated_count > 0:
             messages.success(request, f'{table.name} 테이블이 퇴실 처리되었습니다. ({updated_count}개 주문 처리)')
@@ -251,13 +298,11 @@ def table_checkout(request, pk):
         return redirect('admin_app:table_list')
     
     # 활성 주문 수 확인
-    active_orders_count = OrderModel.objects.filter(table=table, is_visible=True).count()
+    active_orders_count = OrderModel.objects.visible().filter(table=table).count()
     
     # 총 금액 계산 (환불 금액 반영)
-    active_orders = OrderModel.objects.filter(table=table, is_visible=True)
-    total_amount = 0
-    for order in active_orders:
-        total_amount += order.total_amount
+    active_orders = OrderModel.objects.visible().filter(table=table).with_totals()
+    total_amount = active_orders.aggregate(total=Sum('effective_total'))['total'] or 0
     
     context = {
         'table': table,
@@ -276,7 +321,13 @@ def order_hard_delete(request, order_id):
     
     if request.method == 'POST':
         order_info = f"{str(order.id)[:8]}... (테이블: {table.name or str(table.id)[:8]}...)"
-        order.delete()  # CASCADE로 관련 OrderItem들도 함께 삭제됨
+        with transaction.atomic():
+            if order.status == 'completed':
+                # 현황판에서는 완료 주문 삭제를 전액 환불과 같이 차감
+                revenue = OrderModel.objects.with_totals().filter(pk=order.pk).values_list('effective_total', flat=True).get()
+                _record_order_event(OrderEventModel.KIND_REFUND_ISSUED, order, revenue=-revenue, orders=-1)
+                SalesSummary.remove_order(order.id)
+            order.delete()  # CASCADE로 관련 OrderItem들도 함께 삭제됨
         
         messages.success(request, f'주문 {order_info}이(가) 완전히 삭제되었습니다.')
         return redirect('admin_app:table_orders', pk=table.pk)
@@ -295,16 +346,15 @@ def order_complete(request, order_id):
     """Pre-order를 Completed로 변경"""
     order = get_object_or_404(OrderModel, pk=order_id)
     table = order.table
-    discord = DiscordNotificationService()
     
     if request.method == 'POST':
         if order.status == 'pre_order':
-            order.status = 'completed'
-            order.save()
+            # 상태 변경과 결제 완료 알림 기록을 한 트랜잭션으로 처리
+            with transaction.atomic():
+                _complete_pre_order(order)
             
             order_info = f"{str(order.id)[:8]}... (테이블: {table.name or str(table.id)[:8]}...)"
             messages.success(request, f'주문 {order_info}이(가) 완료 처리되었습니다.')
-            discord.send_payment_completion_notification(order.id, order.payer_name, order.pre_order_amount, table.name, [{'name': item.food.name, 'quantity': item.quantity, 'price': item.price} for item in order.items.all()])
         else:
             messages.warning(request, '이미 완료된 주문이거나 선주문이 아닙니다.')
         
@@ -319,6 +369,47 @@ def order_complete(request, order_id):
     return render(request, 'order_complete_confirm.html', context)
 
 
+@login_required
+def board(request):
+    """주문 현황판 - 테이블별 현재 세션의 주문 수/매출을 보여주고 백엔드 주문 이벤트 스트림으로 갱신"""
+    # 스냅샷보다 먼저 읽어 두면 그 사이 이벤트가 스트림으로 한 번 더 오더라도 빠지지는 않음
+    last_event_id = OrderEventModel.latest_id()
+    
+    open_sessions = dict(
+        TableSessionModel.objects.filter(ended_at__isnull=True).values_list('table_id', 'id')
+    )
+    totals = {
+        row['table_id']: row for row in OrderModel.objects.visible().filter(status='completed').with_totals().values(
+            'table_id'
+        ).annotate(order_count=Count('id'), revenue=Sum('effective_total'))
+    }
+    
+    rows = []
+    for table in TableModel.objects.order_by('name'):
+        total = totals.get(table.id, {})
+        rows.append({
+            'table': table,
+            'session_id': open_sessions.get(table.id),
+            'order_count': total.get('order_count', 0),
+            'revenue': total.get('revenue') or 0,
+        })
+    
+    token = ''
+    if settings.ORDER_EVENTS_URL and settings.ORDER_EVENTS_SECRET:
+        token = signing.dumps(
+            {'user': request.user.pk}, key=settings.ORDER_EVENTS_SECRET, salt=ORDER_EVENTS_TOKEN_SALT
+        )
+    
+    context = {
+        'rows': rows,
+        'last_event_id': last_event_id,
+        'events_url': settings.ORDER_EVENTS_URL if token else '',
+        'events_token': token,
+    }
+    
+    return render(request, 'board.html', context)
+
+
 # ==================== 입금 관리 ====================
 
 @login_required
@@ -342,10 +433,12 @@ def payment_list(request):
     if date_to:
         payments = payments.filter(transaction_date__date__lte=date_to)
     
-    payments = payments.order_by('-transaction_date')
+    # 목록의 매칭 상태 표시용 (입금 하나에 매칭 기록은 최대 하나)
+    payments = payments.select_related('match').order_by('-transaction_date')
     
     # 통계 계산
     total_amount = payments.aggregate(Sum('amount'))['amount__sum'] or 0
+    unmatched_count = PaymentDepositModel.objects.filter(amount__gt=0, match__isnull=True).count()
     
     paginator = Paginator(payments, 20)
     page_number = request.GET.get('page')
@@ -357,6 +450,7 @@ def payment_list(request):
         'date_from': date_from,
         'date_to': date_to,
         'total_amount': total_amount,
+        'unmatched_count': unmatched_count,
     }
     
     return render(request, 'payment_list.html', context)
@@ -365,30 +459,155 @@ def payment_list(request):
 @login_required
 def payment_detail(request, pk):
     """입금 내역 상세"""
-    payment = get_object_or_404(PaymentDepositModel, pk=pk)
-    context = {'payment': payment}
+    payment = get_object_or_404(PaymentDepositModel.objects.select_related('match__order__table'), pk=pk)
+    context = {'payment': payment, 'match': getattr(payment, 'match', None)}
     return render(request, 'payment_detail.html', context)
 
 
+@login_required
+def payment_unmatched(request):
+    """
+    매칭되지 않은 입금 목록과 입금별 후보 선주문.
+    입금은 (거래일시, ID) 인덱스 순서로 읽고 payment_matches.deposit_id 유일 인덱스로 매칭 여부를 거르며,
+    결제 대기 선주문은 요청마다 한 번만 읽어 색인한 뒤 페이지의 입금마다 후보를 찾습니다.
+    """
+    deposits = PaymentDepositModel.objects.filter(amount__gt=0, match__isnull=True).order_by('transaction_date', 'id')
+    page_obj = Paginator(deposits, 20).get_page(request.GET.get('page'))
+    
+    index = reconciliation.pending_pre_order_index()
+    rows = [(deposit, index.candidates(deposit)) for deposit in page_obj.object_list]
+    
+    context = {
+        'page_obj': page_obj,
+        'rows': rows,
+        'pending_pre_orders': len(index),
+    }
+    
+    return render(request, 'payment_unmatched.html', context)
+
+
+@login_required
+def payment_match(request, pk):
+    """미매칭 입금을 관리자가 고른 선주문과 매칭하고 주문을 결제 완료로 변경"""
+    if request.method != 'POST':
+        return redirect('admin_app:payment_unmatched')
+    
+    deposit = get_object_or_404(PaymentDepositModel, pk=pk)
+    try:
+        order_id = uuid.UUID(request.POST.get('order_id', ''))
+    except ValueError:
+        messages.error(request, '매칭할 주문을 선택해주세요.')
+        return redirect('admin_app:payment_unmatched')
+    
+    try:
+        with transaction.atomic():
+            # 웹훅/재매칭과 동시에 같은 주문을 완료하지 않도록 잠금
+            order = OrderModel.objects.select_for_update().filter(pk=order_id).first()
+            if order is None or order.status != 'pre_order':
+                messages.warning(request, '이미 결제 완료되었거나 선주문이 아닌 주문입니다.')
+                return redirect('admin_app:payment_unmatched')
+            PaymentMatchModel.objects.create(
+                deposit=deposit, order=order, method=PaymentMatchModel.METHOD_MANUAL,
+                matched_by=request.user.get_username(),
+            )
+            _complete_pre_order(order)
+    except IntegrityError:
+        messages.warning(request, '이미 매칭된 입금입니다.')
+        return redirect('admin_app:payment_unmatched')
+    
+    messages.success(
+        request, f'{deposit.transaction_name}님의 입금 ₩{deposit.amount:,}을 주문 {str(order.id)[:8]}...과 매칭했습니다.'
+    )
+    return redirect('admin_app:payment_unmatched')
+
+
+@login_required
+def payment_dismiss(request, pk):
+    """주문 결제가 아닌 입금을 미매칭 목록에서 뺌"""
+    if request.method != 'POST':
+        return redirect('admin_app:payment_unmatched')
+    
+    deposit = get_object_or_404(PaymentDepositModel, pk=pk)
+    try:
+        with transaction.atomic():
+            PaymentMatchModel.objects.create(
+                deposit=deposit, method=PaymentMatchModel.METHOD_DISMISSED, matched_by=request.user.get_username()
+            )
+    except IntegrityError:
+        messages.warning(request, '이미 매칭된 입금입니다.')
+    else:
+        messages.success(request, f'{deposit.transaction_name}님의 입금을 미매칭 목록에서 제외했습니다.')
+    return redirect('admin_app:payment_unmatched')
+
+
+@login_required
+def settlement_list(request):
+    """정산 스냅샷 목록. POST는 지금 시점으로 새 정산을 만듦"""
+    if request.method == 'POST':
+        snapshot = settlement.create_snapshot(request.user.get_username())
+        messages.success(request, f'정산 #{snapshot.pk}을 만들었습니다.')
+        return redirect('admin_app:settlement_detail', pk=snapshot.pk)
+    
+    # 목록에는 합계만 필요하므로 JSON 전체 대신 totals만 조회
+    snapshots = SettlementSnapshotModel.objects.values('id', 'created_at', 'created_by', 'checksum', 'report__totals')
+    context = {'snapshots': [
+        {**snapshot, 'totals': snapshot.pop('report__totals')} for snapshot in snapshots
+    ]}
+    return render(request, 'settlement_list.html', context)
+
+
+@login_required
+def settlement_detail(request, pk):
+    """정산 스냅샷 상세"""
+    snapshot = get_object_or_404(SettlementSnapshotModel, pk=pk)
+    context = {'snapshot': snapshot, 'report': snapshot.report}
+    return render(request, 'settlement_detail.html', context)
+
+
+@login_required
+def settlement_download(request, pk, fmt):
+    """저장된 정산 결과를 다시 계산하지 않고 JSON/CSV 파일로 내려줌"""
+    if fmt not in ('json', 'csv'):
+        raise Http404
+    snapshot = get_object_or_404(SettlementSnapshotModel, pk=pk)
+    if fmt == 'csv':
+        # 엑셀에서 한글이 깨지지 않도록 BOM을 붙임
+        response = HttpResponse('\ufeff' + snapshot.csv, content_type='text/csv; charset=utf-8')
+    else:
+        response = JsonResponse(snapshot.report, json_dumps_params={'ensure_ascii': False})
+    response['Content-Disposition'] = f'attachment; filename="settlement-{snapshot.pk}.{fmt}"'
+    return response
+
+
+@login_required
+def export_data(request, dataset, fmt):
+    """주문/주문 라인/입금 내역 스트리밍 내보내기 (CSV, JSONL). 목록 화면과 같은 검색/기간 파라미터를 받음"""
+    if dataset not in exports.DATASETS or fmt not in exports.FORMATS:
+        raise Http404
+    try:
+        export = exports.DATASETS[dataset](request.GET)
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    
+    content_type = 'text/csv; charset=utf-8' if fmt == 'csv' else 'application/x-ndjson; charset=utf-8'
+    response = StreamingHttpResponse(exports.stream(export, fmt), content_type=content_type)
+    response['Content-Disposition'] = f'attachment; filename="{dataset}-{timezone.localdate():%Y%m%d}.{fmt}"'
+    return response
+
+
 # ==================== API Views ====================
 
 @login_required
 def api_stats(request):
-    """통계 API"""
-    today = timezone.now().date()
-    
-    # 총 매출 (환불 금액 반영)
-    completed_orders = OrderModel.objects.exclude(status='pre_order').exclude(status='refunded')
-    total_revenue = 0
-    for order in completed_orders:
-        total_revenue += order.total_amount
+    """통계 API - 대시보드와 같은 집계 쿼리 한 번으로 조회"""
+    dashboard_stats = _dashboard_stats()
     
     stats = {
-        'total_orders': OrderModel.objects.exclude(status='pre_order').exclude(status='refunded').count(),
-        'today_orders': OrderModel.objects.filter(order_date__date=today).exclude(status='pre_order').exclude(status='refunded').count(),
-        'total_revenue': total_revenue,
-        'active_tables': TableModel.objects.count(),
-        'sold_out_foods': FoodModel.objects.filter(sold_out=True).count(),
+        'total_orders': dashboard_stats['total_orders'],
+        'today_orders': dashboard_stats['today_orders'],
+        'total_revenue': dashboard_stats['total_revenue'],
+        'active_tables': dashboard_stats['total_tables'],
+        'sold_out_foods': dashboard_stats['sold_out_foods'],
     }
     
     return JsonResponse(stats)
@@ -401,6 +620,83 @@ def api_food_list(request):
     return JsonResponse(list(foods), safe=False)
 
 
+# ==================== Analytics API ====================
+
+def _analytics_range(request):
+    """since/until 쿼리 파라미터(ISO 8601)를 파싱합니다. 타임존이 없으면 현재 타임존으로 봅니다."""
+    parsed = []
+    for name in ('since', 'until'):
+        value = request.GET.get(name)
+        if not value:
+            parsed.append(None)
+            continue
+        moment = parse_datetime(value)
+        if moment is None:
+            raise ValueError(f'{name}는 ISO 8601 형식이어야 합니다.')
+        if timezone.is_naive(moment):
+            moment = timezone.make_aware(moment)
+        parsed.append(moment)
+    return parsed
+
+
+def _analytics_view(build):
+    """분석 API 공통 처리: numpy 확인, 기간 파싱, 엔진 새로고침"""
+    @login_required
+    def view(request):
+        if not analytics.AVAILABLE:
+            return JsonResponse({'error': 'numpy가 설치되어 있지 않습니다. (pip install .[analytics])'}, status=503)
+        try:
+            since, until = _analytics_range(request)
+            return JsonResponse(build(request, analytics.get_sales_analytics(), since, until), safe=False)
+        except ValueError as e:
+            return JsonResponse({'error': str(e)}, status=400)
+    
+    view.__name__ = build.__name__
+    view.__doc__ = build.__doc__
+    return view
+
+
+@_analytics_view
+def api_analytics_summary(request, engine, since, until):
+    """매출 요약 API - 주문 수, 총/순매출, 환불률, 평균 객단가"""
+    return engine.summary(since, until)
+
+
+@_analytics_view
+def api_analytics_time_buckets(request, engine, since, until):
+    """시간 구간별 매출 API (?minutes=10)"""
+    try:
+        minutes = int(request.GET.get('minutes', 10))
+    except ValueError:
+        raise ValueError('minutes는 정수여야 합니다.')
+    if not 1 <= minutes <= 1440:
+        raise ValueError('minutes는 1에서 1440 사이여야 합니다.')
+    return engine.time_buckets(minutes, since, until)
+
+
+@_analytics_view
+def api_analytics_foods(request, engine, since, until):
+    """음식별 판매 API"""
+    rows = engine.by_food(since, until)
+    names = dict(FoodModel.objects.filter(id__in=[row['food_id'] for row in rows]).values_list('id', 'name'))
+    for row in rows:
+        row['name'] = names.get(row['food_id'])
+    return rows
+
+
+@_analytics_view
+def api_analytics_tables(request, engine, since, until):
+    """테이블별 매출 API"""
+    rows = engine.by_table(since, until)
+    names = {
+        str(table_id): name
+        for table_id, name in TableModel.objects.filter(id__in=[row['table_id'] for row in rows]).values_list('id', 'name')
+    }
+    for row in rows:
+        row['name'] = names.get(row['table_id'])
+    return rows
+
+
 @login_required
 def order_item_refund(request, order_id, item_id):
     """주문 아이템 환불 처리"""
@@ -430,13 +726,17 @@ def order_item_refund(request, order_id, item_id):
             return redirect('admin_app:table_orders', pk=order.table.pk)
         
         # MinusOrderItem 생성 (환불 처리)
-        MinusOrderItemModel.objects.create(
-            order=order,
-            food=order_item.food,
-            quantity=-refund_quantity,  # 음수로 저장
-            price=order_item.price,
-            reason='refund'
-        )
+        with transaction.atomic():
+            MinusOrderItemModel.objects.create(
+                order=order,
+                food=order_item.food,
+                quantity=-refund_quantity,  # 음수로 저장
+                price=order_item.price,
+                reason='refund'
+            )
+            if order.status == 'completed':
+                _record_order_event(OrderEventModel.KIND_REFUND_ISSUED, order, revenue=-order_item.price * refund_quantity)
+                SalesSummary.apply(_refund_contribution(order, [(order_item.food_id, refund_quantity, order_item.price)]))
         
         messages.success(request, f'{order_item.food.name} {refund_quantity}개가 환불 처리되었습니다.')
         return redirect('admin_app:table_orders', pk=order.table.pk)
@@ -479,8 +779,13 @@ def order_full_refund(request, order_id):
             if order.pre_order_amount and order.pre_order_amount > 0:
                 # 가상의 "선주문" 항목으로 MinusOrderItem 생성
                 # 선주문의 경우 특별한 처리가 필요하므로, 주문 상태를 변경하는 방식 사용
-                order.status = 'refunded'  # 새로운 상태 추가 필요
-                order.save()
+                with transaction.atomic():
+                    # 상태를 바꾸기 전에 완료 주문 기여분을 매출 요약에서 뺌
+                    SalesSummary.remove_order(order.id)
+                    order.status = 'refunded'  # 새로운 상태 추가 필요
+                    order.save()
+                    # 아이템 없는 완료 주문은 매출 0원으로 집계되므로 주문 수만 줄어듦
+                    _record_order_event(OrderEventModel.KIND_REFUND_ISSUED, order, orders=-1)
                 
                 messages.success(request, f'선주문 ₩{order.pre_order_amount:,}이 전체 환불 처리되었습니다.')
             else:
@@ -489,29 +794,36 @@ def order_full_refund(request, order_id):
             # 일반 주문인 경우 - 모든 아이템을 MinusOrderItem으로 생성
             refunded_count = 0
             total_refund_amount = 0
+            refunded_lines = []
             
-            for item in order.items.all():
-                # 이미 환불된 수량 확인
-                already_refunded = MinusOrderItemModel.objects.filter(
-                    order=order,
-                    food=item.food,
-                    reason='refund'
-                ).aggregate(total=Sum('quantity'))['total'] or 0
-                
-                already_refunded = abs(already_refunded)
-                available_for_refund = item.quantity - already_refunded
-                
-                if available_for_refund > 0:
-                    # 남은 수량 전체 환불
-                    MinusOrderItemModel.objects.create(
+            with transaction.atomic():
+                for item in order.items.all():
+                    # 이미 환불된 수량 확인
+                    already_refunded = MinusOrderItemModel.objects.filter(
                         order=order,
                         food=item.food,
-                        quantity=-available_for_refund,  # 음수로 저장
-                        price=item.price,
                         reason='refund'
-                    )
-                    refunded_count += available_for_refund
-                    total_refund_amount += item.price * available_for_refund
+                    ).aggregate(total=Sum('quantity'))['total'] or 0
+                    
+                    already_refunded = abs(already_refunded)
+                    available_for_refund = item.quantity - already_refunded
+                    
+                    if available_for_refund > 0:
+                        # 남은 수량 전체 환불
+                        MinusOrderItemModel.objects.create(
+                            order=order,
+                            food=item.food,
+                            quantity=-available_for_refund,  # 음수로 저장
+                            price=item.price,
+                            reason='refund'
+                        )
+                        refunded_count += available_for_refund
+                        total_refund_amount += item.price * available_for_refund
+                        refunded_lines.append((item.food_id, available_for_refund, item.price))
+                
+                if refunded_count > 0:
+                    _record_order_event(OrderEventModel.KIND_REFUND_ISSUED, order, revenue=-total_refund_amount)
+                    SalesSummary.apply(_refund_contribution(order, refunded_lines))
             
             if refunded_count > 0:
                 messages.success(request, f'주문 전체가 환불 처리되었습니다. (총 {refunded_count}개 아이템, ₩{total_refund_amount:,})')
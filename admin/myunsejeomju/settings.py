@@ -128,4 +128,11 @@ if DEBUG:
     CSRF_COOKIE_SECURE = False
     CSRF_COOKIE_SAMESITE = 'Lax'
 
-DISCORD_WEBHOOK_URL = os.getenv('DISCORD_WEBHOOK_URL')
\ No newline at end of file
+# Discord 알림은 notification_outbox에 기록되고 백엔드 디스패처가 전송합니다. (DISCORD_WEBHOOK_URL은 백엔드에 설정)
+
+# 주문 현황판 스트림 (백엔드 /api/admin/order-events/). 토큰은 백엔드와 같은 ORDER_EVENTS_SECRET으로 서명합니다.
+ORDER_EVENTS_URL = os.getenv('ORDER_EVENTS_URL', '')
+ORDER_EVENTS_SECRET = os.getenv('ORDER_EVENTS_SECRET', '')
+
+# 매출 분석 API (numpy 필요: pip install .[analytics]). 새 주문 라인을 다시 조회하는 최소 간격(초)
+ANALYTICS_REFRESH_SECONDS = float(os.getenv('ANALYTICS_REFRESH_SECONDS', '5'))
@@ -0,0 +1,15 @@
+"""
+어드민 모델은 백엔드가 스키마를 관리하는 managed=False 모델이므로 테스트 DB에 테이블이 만들어지지 않습니다.
+테스트 DB를 만든 뒤 모델 정의대로 테이블을 직접 생성합니다.
+"""
+import pytest
+from django.apps import apps
+from django.db import connection
+
+
+@pytest.fixture(scope='session')
+def django_db_setup(django_db_setup, django_db_blocker):
+    with django_db_blocker.unblock():
+        with connection.schema_editor() as editor:
+            for model in apps.get_app_config('admin_app').get_models():
+                editor.create_model(model)
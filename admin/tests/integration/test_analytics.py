@@ -0,0 +1,229 @@
+"""
+Integration tests for the numpy sales analytics engine and its API views.
+"""
+import json
+from datetime import datetime
+
+import pytest
+from django.contrib.auth.models import User
+from django.test import RequestFactory
+from django.utils import timezone
+
+from admin_app import analytics, views
+from admin_app.models import FoodModel, MinusOrderItemModel, OrderItemModel, OrderModel, TableModel
+
+requires_numpy = pytest.mark.skipif(not analytics.AVAILABLE, reason="numpy가 설치되어 있지 않음")
+
+
+def at(hour, minute):
+    return timezone.make_aware(datetime(2026, 10, 1, hour, minute))
+
+
+@pytest.fixture
+def orders():
+    """
+    완료 주문 2건(1번 테이블 12:03, 2번 테이블 12:17)과 결제 대기 선주문 1건.
+    1번 테이블 주문은 떡볶이 2 + 순대 1에서 순대 1을 환불했습니다.
+    """
+    first_table = TableModel.objects.create(name='1번')
+    second_table = TableModel.objects.create(name='2번')
+    tteokbokki = FoodModel.objects.create(name='떡볶이', price=10000, category='main')
+    sundae = FoodModel.objects.create(name='순대', price=5000, category='side')
+    
+    first = OrderModel.objects.create(table=first_table, status='completed', order_date=at(12, 3))
+    OrderItemModel.objects.create(order=first, food=tteokbokki, quantity=2, price=10000)
+    OrderItemModel.objects.create(order=first, food=sundae, quantity=1, price=5000)
+    MinusOrderItemModel.objects.create(order=first, food=sundae, quantity=-1, price=5000, reason='refund')
+    
+    second = OrderModel.objects.create(table=second_table, status='completed', order_date=at(12, 17))
+    OrderItemModel.objects.create(order=second, food=tteokbokki, quantity=1, price=10000)
+    
+    pre_order = OrderModel.objects.create(
+        table=first_table, status='pre_order', payer_name='홍길동', pre_order_amount=10000, order_date=at(12, 5)
+    )
+    OrderItemModel.objects.create(order=pre_order, food=sundae, quantity=2, price=5000)
+    return {
+        'tables': (first_table, second_table), 'foods': (tteokbokki, sundae),
+        'first': first, 'second': second, 'pre_order': pre_order,
+    }
+
+
+@pytest.fixture
+def engine():
+    sales_analytics = analytics.SalesAnalytics(chunk_size=2, min_refresh_interval=0)
+    sales_analytics.refresh()
+    return sales_analytics
+
+
+@pytest.mark.integration
+@pytest.mark.database
+@pytest.mark.django_db
+@requires_numpy
+class TestSalesAnalytics:
+    """알고 있는 주문으로 집계 결과와 증분 적재(워터마크, 선주문 완료, 삭제 후 재적재)를 검증합니다."""
+    
+    def test_summary_counts_completed_orders_and_refunds(self, orders, engine):
+        """완료 주문만 세고, 환불은 총매출에서 빼 순매출과 환불률을 계산한다."""
+        # When
+        summary = engine.summary()
+        
+        # Then
+        assert summary == {
+            'order_count': 2,
+            'line_count': 4,
+            'gross_revenue': 35000,
+            'refund_amount': 5000,
+            'net_revenue': 30000,
+            'refund_rate': 5000 / 35000,
+            'refunded_order_rate': 0.5,
+            'average_basket': 15000.0,
+        }
+    
+    def test_summary_respects_since_and_until(self, orders, engine):
+        """since 이상, until 미만의 주문만 집계한다."""
+        # When
+        summary = engine.summary(since=at(12, 10), until=at(13, 0))
+        
+        # Then
+        assert (summary['order_count'], summary['net_revenue']) == (1, 10000)
+    
+    def test_time_buckets_use_local_time(self, orders, engine):
+        """현재 타임존 기준 10분 구간별 순매출과 주문 수를 반환한다."""
+        # When
+        buckets = engine.time_buckets(10)
+        
+        # Then
+        assert buckets == [
+            {'start': at(12, 0).isoformat(), 'revenue': 20000, 'orders': 1},
+            {'start': at(12, 10).isoformat(), 'revenue': 10000, 'orders': 1},
+        ]
+    
+    def test_by_food_nets_refunds(self, orders, engine):
+        """음식별 수량/매출은 환불을 뺀 값이고, 주문 수는 그 음식을 주문한 주문 수다."""
+        # Given
+        tteokbokki, sundae = orders['foods']
+        
+        # When
+        rows = engine.by_food()
+        
+        # Then
+        assert rows == [
+            {'food_id': tteokbokki.id, 'quantity': 3, 'revenue': 30000, 'orders': 2},
+            {'food_id': sundae.id, 'quantity': 0, 'revenue': 0, 'orders': 1},
+        ]
+    
+    def test_by_table_reports_average_basket(self, orders, engine):
+        """테이블별 순매출, 주문 수, 평균 객단가를 순매출 내림차순으로 반환한다."""
+        # Given
+        first_table, second_table = orders['tables']
+        
+        # When
+        rows = engine.by_table()
+        
+        # Then
+        assert rows == [
+            {'table_id': str(first_table.id), 'revenue': 20000, 'orders': 1, 'average_basket': 20000.0},
+            {'table_id': str(second_table.id), 'revenue': 10000, 'orders': 1, 'average_basket': 10000.0},
+        ]
+    
+    def test_refresh_loads_only_lines_past_watermark(self, orders, engine):
+        """다시 적재할 때는 워터마크 이후에 추가된 라인만 가져온다."""
+        # Given
+        first_table, _ = orders['tables']
+        tteokbokki, _ = orders['foods']
+        order = OrderModel.objects.create(table=first_table, status='completed', order_date=at(12, 25))
+        OrderItemModel.objects.create(order=order, food=tteokbokki, quantity=1, price=10000)
+        
+        # When
+        added = engine.refresh()
+        
+        # Then
+        assert added == 1
+        assert engine.line_count == 6
+        assert (engine.summary()['order_count'], engine.summary()['net_revenue']) == (3, 40000)
+    
+    def test_paid_pre_order_is_counted_after_refresh(self, orders, engine):
+        """결제 대기 선주문이 완료되면 새 라인이 없어도 다음 적재부터 집계에 들어간다."""
+        # Given
+        OrderModel.objects.filter(pk=orders['pre_order'].pk).update(status='completed')
+        
+        # When
+        added = engine.refresh()
+        
+        # Then
+        assert added == 0
+        assert (engine.summary()['order_count'], engine.summary()['net_revenue']) == (3, 40000)
+    
+    def test_deleted_order_triggers_full_reload(self, orders, engine):
+        """워터마크 이하 라인이 줄면(주문 삭제) 처음부터 다시 적재한다."""
+        # Given
+        orders['second'].delete()
+        
+        # When
+        added = engine.refresh()
+        
+        # Then
+        assert added == engine.line_count == 4
+        assert (engine.summary()['order_count'], engine.summary()['net_revenue']) == (1, 20000)
+        assert [row['table_id'] for row in engine.by_table()] == [str(orders['tables'][0].id)]
+
+
+@pytest.mark.integration
+@pytest.mark.database
+@pytest.mark.django_db
+class TestAnalyticsViews:
+    """분석 API의 응답 형식과 numpy가 없을 때의 503 응답을 검증합니다."""
+    
+    @pytest.fixture(autouse=True)
+    def fresh_engine(self, monkeypatch, settings):
+        # 프로세스 공용 엔진 대신 테스트마다 새로 적재
+        monkeypatch.setattr(analytics, '_engine', None)
+        settings.ANALYTICS_REFRESH_SECONDS = 0
+    
+    def _get(self, view, path, **params):
+        request = RequestFactory().get(path, params)
+        request.user = User(username='staff', is_staff=True)
+        return view(request)
+    
+    @requires_numpy
+    def test_summary_api(self, orders):
+        """요약 API는 엔진의 요약을 JSON으로 반환한다."""
+        # When
+        response = self._get(views.api_analytics_summary, '/api/analytics/summary/', since=at(12, 10).isoformat())
+        
+        # Then
+        assert response.status_code == 200
+        assert json.loads(response.content)['net_revenue'] == 10000
+    
+    @requires_numpy
+    def test_foods_and_tables_api_include_names(self, orders):
+        """음식별/테이블별 API는 이름을 붙여 반환한다."""
+        # When
+        foods = json.loads(self._get(views.api_analytics_foods, '/api/analytics/foods/').content)
+        tables = json.loads(self._get(views.api_analytics_tables, '/api/analytics/tables/').content)
+        
+        # Then
+        assert [(row['name'], row['revenue']) for row in foods] == [('떡볶이', 30000), ('순대', 0)]
+        assert [(row['name'], row['revenue']) for row in tables] == [('1번', 20000), ('2번', 10000)]
+    
+    @requires_numpy
+    def test_time_buckets_api_rejects_invalid_minutes(self, orders):
+        """minutes가 범위를 벗어나면 400을 반환한다."""
+        # When
+        response = self._get(views.api_analytics_time_buckets, '/api/analytics/time-buckets/', minutes=0)
+        
+        # Then
+        assert response.status_code == 400
+    
+    def test_returns_503_without_numpy(self, monkeypatch):
+        """numpy가 없으면 엔진을 만들지 않고 503을 반환한다."""
+        # Given
+        monkeypatch.setattr(analytics, 'AVAILABLE', False)
+        
+        # When
+        response = self._get(views.api_analytics_summary, '/api/analytics/summary/')
+        
+        # Then
+        assert response.status_code == 503
+        assert 'numpy' in json.loads(response.content)['error']
+        assert analytics._engine is None
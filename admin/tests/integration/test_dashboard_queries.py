@@ -0,0 +1,91 @@
+"""
+Integration tests for the dashboard / api_stats query counts.
+"""
+import json
+
+import pytest
+from django.contrib.auth.models import User
+from django.test import RequestFactory
+from django.utils import timezone
+
+from admin_app import views
+from admin_app.models import (
+    FoodModel, OrderItemModel, OrderModel, SalesSummary, TableModel, TableSessionModel,
+)
+
+
+def create_orders(count):
+    table = TableModel.objects.create(name=f"{TableModel.objects.count() + 1}번")
+    session = TableSessionModel.objects.create(table=table)
+    foods = [
+        FoodModel.objects.create(name=f"메뉴{index}", price=1000 * (index + 1), category='main', sold_out=index == 0)
+        for index in range(3)
+    ]
+    for index in range(count):
+        order = OrderModel.objects.create(table=table, session=session, status='completed', order_date=timezone.now())
+        OrderItemModel.objects.create(order=order, food=foods[index % 3], quantity=2, price=foods[index % 3].price)
+        SalesSummary.add_order(order.id)
+
+
+@pytest.mark.integration
+@pytest.mark.database
+@pytest.mark.django_db
+class TestDashboardQueries:
+    """대시보드와 통계 API가 주문 수와 관계없이 정해진 횟수만 조회하는지 검증합니다."""
+    
+    def setup_method(self):
+        self.factory = RequestFactory()
+    
+    def _request(self, path):
+        request = self.factory.get(path)
+        # 인증/세션 조회를 빼고 뷰가 하는 조회만 셈
+        request.user = User(username='staff', is_staff=True)
+        return request
+    
+    @pytest.mark.parametrize('orders', [1, 12])
+    def test_dashboard_uses_three_queries(self, orders, django_assert_num_queries):
+        """대시보드는 통계 1 + 최근 주문 1 + 인기 메뉴 1, 쿼리 3번으로 그린다."""
+        # Given
+        create_orders(orders)
+        
+        # When
+        with django_assert_num_queries(3):
+            response = views.dashboard(self._request('/'))
+        
+        # Then
+        assert response.status_code == 200
+        assert "메뉴" in response.content.decode()
+    
+    @pytest.mark.parametrize('orders', [1, 12])
+    def test_api_stats_uses_one_query(self, orders, django_assert_num_queries):
+        """통계 API는 집계 쿼리 한 번으로 응답한다."""
+        # Given
+        create_orders(orders)
+        
+        # When
+        with django_assert_num_queries(1):
+            response = views.api_stats(self._request('/api/stats/'))
+        
+        # Then
+        stats = json.loads(response.content)
+        assert stats['total_orders'] == orders
+        assert stats['today_orders'] == orders
+        assert stats['active_tables'] == 1
+        assert stats['sold_out_foods'] == 1
+        assert stats['total_revenue'] == sum(2000 * ((index % 3) + 1) for index in range(orders))
+    
+    def test_api_stats_without_menu_still_returns_one_row(self, django_assert_num_queries):
+        """메뉴가 하나도 없어도 통계 한 행이 나오고 테이블 수는 그대로 센다."""
+        # Given
+        TableModel.objects.create(name='1번')
+        
+        # When
+        with django_assert_num_queries(1):
+            response = views.api_stats(self._request('/api/stats/'))
+        
+        # Then
+        stats = json.loads(response.content)
+        assert stats['total_orders'] == 0
+        assert stats['total_revenue'] == 0
+        assert stats['active_tables'] == 1
+        assert stats['sold_out_foods'] == 0
@@ -0,0 +1,74 @@
+"""
+Integration tests for the streaming exports' memory use.
+"""
+import tracemalloc
+from datetime import timedelta
+
+import pytest
+from django.http import QueryDict
+from django.utils import timezone
+
+from admin_app import exports
+from admin_app.models import FoodModel, OrderItemModel, OrderModel, PaymentDepositModel, TableModel
+
+CHUNK_SIZE = 50
+MANY_CHUNKS = 40
+
+
+def seed(dataset, start, stop):
+    now = timezone.now()
+    if dataset == 'deposits':
+        PaymentDepositModel.objects.bulk_create([
+            PaymentDepositModel(
+                transaction_name=f'입금자{index}', bank_account_number='110-000-000000', amount=10000,
+                bank_code='088', bank_account_id='test', transaction_date=now + timedelta(seconds=index),
+                processing_date=now, balance=0,
+            )
+            for index in range(start, stop)
+        ])
+        return
+    
+    table = TableModel.objects.first() or TableModel.objects.create(name='1번')
+    food = FoodModel.objects.first() or FoodModel.objects.create(name='떡볶이', price=1000, category='main')
+    orders = OrderModel.objects.bulk_create([
+        OrderModel(table=table, order_date=now + timedelta(seconds=index)) for index in range(start, stop)
+    ])
+    OrderItemModel.objects.bulk_create([OrderItemModel(order=order, food=food, quantity=1, price=1000) for order in orders])
+
+
+def measure(dataset):
+    """내보내기 본문을 끝까지 소비하는 동안의 최대 메모리와 줄 수"""
+    export = exports.DATASETS[dataset](QueryDict())
+    tracemalloc.start()
+    lines = 0
+    try:
+        for chunk in exports.stream(export, 'csv', CHUNK_SIZE):
+            lines += chunk.count('\n')
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak, lines
+
+
+@pytest.mark.integration
+@pytest.mark.database
+@pytest.mark.django_db
+class TestExportMemory:
+    """행 수가 늘어도 내보내기 메모리가 청크 하나 분량으로 일정한지 검증합니다."""
+    
+    @pytest.mark.parametrize('dataset', ['orders', 'order-lines', 'deposits'])
+    def test_peak_memory_stays_flat_as_rows_grow(self, dataset):
+        """청크 하나 분량과 청크 40개 분량의 최대 메모리가 2배 안쪽이다."""
+        # Given - 청크 하나 분량 (처음 한 번은 쿼리 컴파일/캐시 할당이 섞이므로 버림)
+        seed(dataset, 0, CHUNK_SIZE)
+        measure(dataset)
+        one_chunk_peak, lines = measure(dataset)
+        assert lines == CHUNK_SIZE + 1
+        
+        # When - 청크 40개 분량
+        seed(dataset, CHUNK_SIZE, CHUNK_SIZE * MANY_CHUNKS)
+        many_chunks_peak, lines = measure(dataset)
+        
+        # Then
+        assert lines == CHUNK_SIZE * MANY_CHUNKS + 1
+        assert many_chunks_peak < one_chunk_peak * 2
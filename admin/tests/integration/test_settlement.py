@@ -0,0 +1,52 @@
+"""
+Integration tests for the end-of-festival settlement report.
+"""
+import pytest
+from django.utils import timezone
+
+from admin_app import settlement
+from admin_app.models import (
+    FoodModel, MinusOrderItemModel, OrderItemModel, OrderModel, PaymentDepositModel, PaymentMatchModel, TableModel,
+)
+
+
+@pytest.mark.integration
+@pytest.mark.database
+@pytest.mark.django_db
+class TestSettlementReport:
+    """키셋 조회로 나눠 읽어도 정산 결과가 같은지 검증합니다."""
+    
+    def test_report_does_not_depend_on_chunk_size(self):
+        """주문 일시가 같은 행이 있어도 청크 크기와 관계없이 같은 결과를 만든다."""
+        # Given - 같은 시각의 주문들 (정렬 키의 id로 구분)
+        now = timezone.now()
+        table = TableModel.objects.create(name='1번')
+        food = FoodModel.objects.create(name='떡볶이', price=1000, category='main')
+        for index in range(7):
+            order = OrderModel.objects.create(table=table, status='completed', order_date=now)
+            OrderItemModel.objects.create(order=order, food=food, quantity=index + 1, price=1000)
+        MinusOrderItemModel.objects.create(order=order, food=food, quantity=-1, price=1000, reason='refund')
+        paid = OrderModel.objects.create(table=table, status='completed', payer_name='홍길동', pre_order_amount=2000,
+                                         order_date=now)
+        OrderModel.objects.create(table=table, status='pre_order', payer_name='김철수', pre_order_amount=3000,
+                                  order_date=now)
+        deposits = [
+            PaymentDepositModel.objects.create(
+                transaction_name=name, bank_account_number='1', amount=amount, bank_code='', bank_account_id='',
+                transaction_date=now, processing_date=now, balance=0,
+            )
+            for name, amount in (('홍길동', 2000), ('모름', 5000), ('모름2', 1000))
+        ]
+        PaymentMatchModel.objects.create(deposit=deposits[0], order=paid, method=PaymentMatchModel.METHOD_AUTO)
+        
+        # When
+        reports = [settlement.build_report(chunk_size) for chunk_size in (1, 3, 2000)]
+        
+        # Then
+        for report in reports:
+            report.pop('generated_at')
+        assert reports[0] == reports[1] == reports[2]
+        totals = reports[0]['totals']
+        assert (totals['orders'], totals['gross'], totals['minus']) == (8, 28000, -1000)
+        assert totals['pending_pre_orders'] == 1
+        assert {deposit['transaction_name'] for deposit in reports[0]['unmatched_deposits']} == {'모름', '모름2'}
@@ -0,0 +1,13 @@
+"""
+테스트 설정. 운영 설정을 그대로 쓰되 DB만 SQLite(메모리)로 바꿉니다.
+"""
+from myunsejeomju.settings import *  # noqa: F401,F403
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    }
+}
+
+PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
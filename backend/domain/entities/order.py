@@ -39,9 +39,10 @@ class Order:
     status: str = 'completed'
     minus_items: Optional[List[MinusOrderItem]] = None
     pre_order_amount: Optional[int] = None  # pre-order용 총 금액
-    is_visible: bool = True
+    is_visible: bool = True  # 주문이 속한 테이블 세션이 진행 중인지 여부
     discord_notified: bool = False
     effective_total_amount: Optional[int] = None  # Repository에서 계산된 차감 후 총액
+    session_id: Optional[str] = None  # 주문이 속한 테이블 세션 ID
     
     @property
     def total_amount(self) -> int:
@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass
+class PaymentDeposit:
+    id: str  # UUID
+    transaction_name: str  # 은행이 보내준 입금자명 (잘리거나 공백이 섞일 수 있음)
+    amount: int  # 출금이면 음수
+    transaction_date: datetime
+
+
+@dataclass
+class PendingPreOrder:
+    """입금을 기다리는 선주문"""
+    order_id: str  # UUID
+    payer_name: str
+    amount: int
+    order_date: datetime
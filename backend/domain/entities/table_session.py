@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+import uuid
+
+
+@dataclass
+class TableSession:
+    id: str  # UUID
+    table_id: str
+    started_at: datetime
+    ended_at: Optional[datetime] = None  # 퇴실 처리 시각, None이면 현재 착석 중인 세션
+    
+    @property
+    def is_active(self) -> bool:
+        return self.ended_at is None
+    
+    @classmethod
+    def create(cls, table_id: str) -> 'TableSession':
+        return cls(
+            id=str(uuid.uuid4()),
+            table_id=table_id,
+            started_at=datetime.now()
+        )
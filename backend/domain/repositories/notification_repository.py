@@ -0,0 +1,29 @@
+from abc import ABC, abstractmethod
+
+
+class NotificationRepository(ABC):
+    """
+    외부 알림(Discord)을 바로 전송하지 않고 아웃박스에 기록하는 Repository.
+    상태 변경과 같은 트랜잭션에서 호출해야 하며, 실제 전송은 디스패처가 담당합니다.
+    """
+    
+    @abstractmethod
+    def enqueue_payment_completion(self, order_id: str) -> bool:
+        """
+        결제 완료 알림을 기록합니다. 같은 주문의 알림이 이미 있으면 기록하지 않습니다.
+        
+        Returns:
+            bool: 새로 기록되었는지 여부
+        """
+        pass
+    
+    @abstractmethod
+    def enqueue_staff_call(self, table_id: str, table_name: str, message: str = '') -> int:
+        """
+        직원호출 알림을 기록합니다. 같은 테이블의 호출이 아직 전송 대기 중이면 새로 기록하지 않고
+        그 알림에 합칩니다.
+        
+        Returns:
+            int: 이 호출이 합쳐진 알림의 호출 횟수
+        """
+        pass
@@ -1,12 +1,27 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import FrozenSet, List, Optional, Tuple
 
 from ..entities.order import Order
 
 
+# 키셋 페이지네이션 커서: 마지막으로 받은 주문의 (order_date, id)
+OrderCursor = Tuple[datetime, str]
+
+# 목록 조회 시 함께 불러올 수 있는 관계. relations=None이면 모두 불러옵니다.
+# 불러오지 않은 관계는 엔티티에서 빈 값(items=[], minus_items=None)이 됩니다.
+ORDER_RELATIONS: FrozenSet[str] = frozenset({'items', 'minus_items'})
+
+
 class OrderRepository(ABC):
     @abstractmethod
-    def get_all(self) -> List[Order]:
+    def get_all(self, after: Optional[OrderCursor] = None, limit: Optional[int] = None,
+                relations: Optional[FrozenSet[str]] = None) -> List[Order]:
+        """
+        표시 중인 주문을 (order_date, id) 내림차순으로 조회합니다.
+        after가 주어지면 해당 커서 이후의 주문부터, limit개까지 조회합니다.
+        relations로 ORDER_RELATIONS 중 필요한 관계만 조회할 수 있습니다.
+        """
         pass
     
     @abstractmethod
@@ -26,7 +41,22 @@ class OrderRepository(ABC):
         pass
     
     @abstractmethod
-    def get_by_table_id(self, table_id: str) -> List[Order]:
+    def get_by_table_id(self, table_id: str, after: Optional[OrderCursor] = None, limit: Optional[int] = None,
+                        include_pre_orders: bool = True, relations: Optional[FrozenSet[str]] = None) -> List[Order]:
+        """
+        테이블의 현재 세션 주문을 (order_date, id) 내림차순으로 조회합니다.
+        after/limit/relations는 get_all과 같습니다.
+        """
+        pass
+    
+    @abstractmethod
+    def get_total_spent(self, table_id: Optional[str] = None) -> int:
+        """표시 중인 주문 중 pre-order를 제외한 총 결제 금액을 DB 집계로 계산합니다."""
+        pass
+    
+    @abstractmethod
+    def exists_by_table_id(self, table_id: str) -> bool:
+        """테이블의 현재 세션에 0원이 아닌 주문이 있는지 확인합니다. (주문을 조회하지 않음)"""
         pass
     
     @abstractmethod
@@ -39,4 +69,12 @@ class OrderRepository(ABC):
     
     @abstractmethod
     def update_discord_notification_status(self, order_id: str, notified: bool) -> bool:
+        pass
+    
+    @abstractmethod
+    def get_latest_pre_order_by_payment_info(self, payer_name: str, amount: int) -> Optional[Order]:
+        """
+        입금자 이름과 금액이 일치하는 pre-order 중 가장 최근 주문을 조회합니다.
+        숨김 처리된 주문도 포함합니다.
+        """
         pass
\ No newline at end of file
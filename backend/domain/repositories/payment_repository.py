@@ -0,0 +1,35 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional
+
+from ..entities.payment import PaymentDeposit, PendingPreOrder
+
+
+class PaymentRepository(ABC):
+    """입금 내역과 입금 -> 주문 매칭 기록"""
+    
+    @abstractmethod
+    def record_deposit(self, transaction_name: str, bank_account_number: str, amount: int, bank_code: str,
+                       bank_account_id: str, transaction_date: datetime, processing_date: datetime,
+                       balance: int) -> PaymentDeposit:
+        pass
+    
+    @abstractmethod
+    def get_pending_pre_orders(self) -> List[PendingPreOrder]:
+        """입금자명과 금액이 있는 결제 대기 선주문을 모두 조회합니다."""
+        pass
+    
+    @abstractmethod
+    def get_unmatched_deposits(self, limit: Optional[int] = None) -> List[PaymentDeposit]:
+        """매칭 기록이 없는 입금(금액 > 0)을 거래 시각 오름차순으로 조회합니다."""
+        pass
+    
+    @abstractmethod
+    def link(self, deposit_id: str, order_id: str, method: str, score: Optional[int] = None) -> bool:
+        """
+        입금과 주문의 매칭을 기록합니다. 입금이나 주문에 이미 매칭 기록이 있으면 기록하지 않습니다.
+        
+        Returns:
+            bool: 새로 기록되었는지 여부
+        """
+        pass
@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from typing import List, Optional
 
 from ..entities.table import Table
+from ..entities.table_session import TableSession
 
 
 class TableRepository(ABC):
@@ -13,10 +14,33 @@ class TableRepository(ABC):
     def get_by_id(self, table_id: str) -> Optional[Table]:
         pass
     
+    @abstractmethod
+    def count(self) -> int:
+        """전체 테이블 수를 조회합니다. (테이블을 조회하지 않음)"""
+        pass
+    
     @abstractmethod
     def create(self, table: Table) -> Table:
         pass
     
     @abstractmethod
     def delete(self, table_id: str) -> bool:
+        pass
+    
+    @abstractmethod
+    def get_current_session(self, table_id: str) -> Optional[TableSession]:
+        """테이블의 현재 착석 세션을 조회합니다. 없으면 None을 반환합니다."""
+        pass
+    
+    @abstractmethod
+    def open_session(self, table_id: str) -> TableSession:
+        """테이블의 현재 착석 세션을 반환하고, 없으면 새로 시작합니다."""
+        pass
+    
+    @abstractmethod
+    def close_session(self, table_id: str) -> bool:
+        """
+        테이블의 현재 착석 세션을 종료합니다. (퇴실 처리)
+        종료된 세션의 주문들은 더 이상 조회되지 않습니다.
+        """
         pass
\ No newline at end of file
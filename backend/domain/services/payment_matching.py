@@ -0,0 +1,129 @@
+import re
+import unicodedata
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ..entities.payment import PaymentDeposit, PendingPreOrder
+
+
+# 후보 점수. AUTO_MATCH_SCORE 이상이면서 다른 후보와 구분되면 자동으로 매칭합니다.
+SCORE_EXACT = 100  # 정규화한 이름과 금액이 같음
+SCORE_TRUNCATED = 80  # 은행이 이름 뒤를 잘라 보냄 (입금자명이 주문자명의 앞부분)
+SCORE_SIMILAR = 60  # 이름이 비슷하고 금액이 같음 (수동 확인용)
+SCORE_NAME_ONLY = 30  # 이름은 같지만 금액이 다름 (수동 확인용)
+AUTO_MATCH_SCORE = SCORE_TRUNCATED
+
+# 잘린 이름으로 보려면 입금자명이 최소 이 글자 수는 되어야 함
+MIN_TRUNCATED_LENGTH = 2
+SIMILARITY_THRESHOLD = 0.6
+
+_NON_WORD = re.compile(r'[\W_]+')
+
+
+def normalize_name(name: Optional[str]) -> str:
+    """전각/반각, 대소문자, 공백과 기호 차이를 없앤 비교용 이름"""
+    if not name:
+        return ''
+    return _NON_WORD.sub('', unicodedata.normalize('NFKC', name).casefold())
+
+
+@dataclass
+class MatchCandidate:
+    order_id: str
+    score: int
+    reason: str  # exact, truncated, similar, name_only
+    payer_name: str
+    amount: int
+    order_date: object
+
+
+class PreOrderIndex:
+    """
+    결제 대기 선주문을 (정규화한 이름, 금액)과 금액으로 색인해 두고 입금 한 건의 후보를 점수순으로 찾습니다.
+    매칭된 선주문은 remove()로 빼서 같은 배치에서 다시 후보가 되지 않게 합니다.
+    """
+    
+    def __init__(self, pre_orders: Iterable[PendingPreOrder]):
+        self._orders: Dict[str, PendingPreOrder] = {}
+        self._by_key: Dict[Tuple[str, int], Dict[str, PendingPreOrder]] = {}
+        self._by_amount: Dict[int, Dict[str, PendingPreOrder]] = {}
+        self._by_name: Dict[str, Dict[str, PendingPreOrder]] = {}
+        for pre_order in pre_orders:
+            self.add(pre_order)
+    
+    def __len__(self) -> int:
+        return len(self._orders)
+    
+    def add(self, pre_order: PendingPreOrder) -> None:
+        name = normalize_name(pre_order.payer_name)
+        self._orders[pre_order.order_id] = pre_order
+        self._by_key.setdefault((name, pre_order.amount), {})[pre_order.order_id] = pre_order
+        self._by_amount.setdefault(pre_order.amount, {})[pre_order.order_id] = pre_order
+        self._by_name.setdefault(name, {})[pre_order.order_id] = pre_order
+    
+    def remove(self, order_id: str) -> None:
+        pre_order = self._orders.pop(order_id, None)
+        if pre_order is None:
+            return
+        name = normalize_name(pre_order.payer_name)
+        for bucket in (self._by_key[(name, pre_order.amount)], self._by_amount[pre_order.amount], self._by_name[name]):
+            bucket.pop(order_id, None)
+    
+    def candidates(self, deposit: PaymentDeposit, limit: int = 5) -> List[MatchCandidate]:
+        """
+        입금 한 건의 후보 선주문을 점수 내림차순으로 반환합니다.
+        점수가 같으면 입금 시각 이전에 가장 최근 들어온 주문, 그다음 입금 이후 가장 이른 주문 순입니다.
+        """
+        name = normalize_name(deposit.transaction_name)
+        if not name or deposit.amount <= 0:
+            return []
+        
+        scored: Dict[str, Tuple[int, str]] = {}
+        
+        def offer(pre_order: PendingPreOrder, score: int, reason: str) -> None:
+            if scored.get(pre_order.order_id, (0, ''))[0] < score:
+                scored[pre_order.order_id] = (score, reason)
+        
+        for pre_order in self._by_key.get((name, deposit.amount), {}).values():
+            offer(pre_order, SCORE_EXACT, 'exact')
+        for pre_order in self._by_amount.get(deposit.amount, {}).values():
+            other = normalize_name(pre_order.payer_name)
+            if len(name) >= MIN_TRUNCATED_LENGTH and other.startswith(name):
+                offer(pre_order, SCORE_TRUNCATED, 'truncated')
+            elif SequenceMatcher(None, name, other).ratio() >= SIMILARITY_THRESHOLD:
+                offer(pre_order, SCORE_SIMILAR, 'similar')
+        for pre_order in self._by_name.get(name, {}).values():
+            offer(pre_order, SCORE_NAME_ONLY, 'name_only')
+        
+        def rank(order_id: str):
+            pre_order = self._orders[order_id]
+            placed_before = pre_order.order_date <= deposit.transaction_date
+            distance = abs((deposit.transaction_date - pre_order.order_date).total_seconds())
+            return -scored[order_id][0], not placed_before, distance
+        
+        return [
+            MatchCandidate(
+                order_id=order_id,
+                score=scored[order_id][0],
+                reason=scored[order_id][1],
+                payer_name=self._orders[order_id].payer_name,
+                amount=self._orders[order_id].amount,
+                order_date=self._orders[order_id].order_date,
+            )
+            for order_id in sorted(scored, key=rank)[:limit]
+        ]
+    
+    def best_match(self, deposit: PaymentDeposit) -> Optional[MatchCandidate]:
+        """
+        자동으로 매칭해도 되는 후보를 반환합니다.
+        이름/금액이 정확히 같은 후보끼리는 누가 받아도 같으므로 가장 앞 후보를 고르고,
+        잘린 이름 후보가 여러 개라 구분되지 않으면 수동 확인으로 남깁니다.
+        """
+        candidates = self.candidates(deposit, limit=2)
+        if not candidates or candidates[0].score < AUTO_MATCH_SCORE:
+            return None
+        best = candidates[0]
+        if best.reason != 'exact' and len(candidates) > 1 and candidates[1].score == best.score:
+            return None
+        return best
@@ -1,12 +1,13 @@
-from typing import List
+from typing import FrozenSet, List, Optional
 from datetime import datetime
 import uuid
 
 from ..entities.order import Order, OrderItem
 from ..entities.food import FoodCategory
-from ..repositories.order_repository import OrderRepository
+from ..repositories.order_repository import OrderRepository, OrderCursor
 from ..repositories.food_repository import FoodRepository
 from ..repositories.table_repository import TableRepository
+from ..repositories.notification_repository import NotificationRepository
 from ..services.order_service import TransactionManager
 
 
@@ -35,12 +36,11 @@ class CreateOrderUseCase:
             foods = self.food_repository.get_by_ids_for_update(food_ids)
             food_dict = {food.id: food for food in foods}
             
-            # 테이블의 가시 주문 수 확인
-            existing_orders = self.order_repository.get_by_table_id(table_id)
-            visible_orders_count = len(existing_orders)
+            # 테이블에 가시 주문이 있는지 확인
+            has_visible_orders = self.order_repository.exists_by_table_id(table_id)
             
             # 가시 주문이 0개인 경우, 메인 메뉴가 반드시 포함되어야 함
-            if visible_orders_count == 0:
+            if not has_visible_orders:
                 has_main_menu = False
                 for item_data in items_data:
                     food = food_dict.get(item_data['food_id'])
@@ -67,12 +67,14 @@ class CreateOrderUseCase:
                 )
                 order_items.append(order_item)
             
-            # 주문 생성
+            # 주문 생성 (테이블의 현재 세션에 연결)
+            session = self.table_repository.open_session(table_id)
             order = Order(
                 id=str(uuid.uuid4()),
                 table=table,
                 order_date=datetime.now(),
-                items=order_items
+                items=order_items,
+                session_id=session.id
             )
             
             return self.order_repository.create(order)
@@ -85,16 +87,28 @@ class GetAllOrdersUseCase:
     def __init__(self, order_repository: OrderRepository):
         self.order_repository = order_repository
     
-    def execute(self) -> List[Order]:
-        return self.order_repository.get_all()
+    def execute(self, after: Optional[OrderCursor] = None, limit: Optional[int] = None,
+                relations: Optional[FrozenSet[str]] = None) -> List[Order]:
+        return self.order_repository.get_all(after=after, limit=limit, relations=relations)
 
 
 class GetOrdersByTableUseCase:
     def __init__(self, order_repository: OrderRepository):
         self.order_repository = order_repository
     
-    def execute(self, table_id: str) -> List[Order]:
-        return self.order_repository.get_by_table_id(table_id)
+    def execute(self, table_id: str, after: Optional[OrderCursor] = None, limit: Optional[int] = None,
+                include_pre_orders: bool = True, relations: Optional[FrozenSet[str]] = None) -> List[Order]:
+        return self.order_repository.get_by_table_id(
+            table_id, after=after, limit=limit, include_pre_orders=include_pre_orders, relations=relations
+        )
+
+
+class GetTotalSpentUseCase:
+    def __init__(self, order_repository: OrderRepository):
+        self.order_repository = order_repository
+    
+    def execute(self, table_id: Optional[str] = None) -> int:
+        return self.order_repository.get_total_spent(table_id)
 
 
 class CreatePreOrderUseCase:
@@ -109,12 +123,11 @@ class CreatePreOrderUseCase:
         if not table:
             raise ValueError(f"Table with id {table_id} not found")
         
-        # 테이블의 가시 주문 수 확인
-        existing_orders = self.order_repository.get_by_table_id(table_id)
-        visible_orders_count = len(existing_orders)
+        # 테이블에 가시 주문이 있는지 확인
+        has_visible_orders = self.order_repository.exists_by_table_id(table_id)
         
         # 가시 주문이 0개인 경우, 메인 메뉴가 반드시 포함되어야 함
-        if visible_orders_count == 0:
+        if not has_visible_orders:
             has_main_menu = False
             for item_data in items_data:
                 food = self.food_repository.get_by_id(item_data['food_id'])
@@ -142,6 +155,7 @@ class CreatePreOrderUseCase:
             )
             order_items.append(order_item)
         
+        session = self.table_repository.open_session(table_id)
         order = Order(
             id=str(uuid.uuid4()),
             table=table,
@@ -149,59 +163,54 @@ class CreatePreOrderUseCase:
             items=order_items,
             payer_name=payer_name,
             status='pre_order',
-            pre_order_amount=total_amount
+            pre_order_amount=total_amount,
+            session_id=session.id
         )
         
         return self.order_repository.create(order)
 
 
 class UpdateOrderStatusUseCase:
-    def __init__(self, order_repository: OrderRepository):
+    def __init__(self, order_repository: OrderRepository, notification_repository: NotificationRepository,
+                 transaction_manager: TransactionManager):
         self.order_repository = order_repository
+        self.notification_repository = notification_repository
+        self.transaction_manager = transaction_manager
     
     def execute(self, order_id: str, status: str) -> Order:
+        # 상태 변경과 결제 완료 알림 기록을 한 트랜잭션으로 처리
+        return self.transaction_manager.execute_in_transaction(self._update_status, order_id, status)
+    
+    def _update_status(self, order_id: str, status: str) -> Order:
         order = self.order_repository.get_by_id(order_id)
         if not order:
             raise ValueError(f"Order with id {order_id} not found")
         
+        previous_status = order.status
         order.status = status
-        return self.order_repository.update(order)
+        order = self.order_repository.update(order)
+        
+        if status == 'completed' and previous_status != 'completed':
+            self.notification_repository.enqueue_payment_completion(order.id)
+        return order
 
 
 class GetPreOrderByPaymentInfoUseCase:
     def __init__(self, order_repository: OrderRepository):
         self.order_repository = order_repository
     
-    def execute(self, transaction_name: str, amount: int) -> Order:
-        orders = self.order_repository.get_all_including_hidden()
-        
-        # pre_order 상태이면서 조건에 맞는 주문들을 찾아서 가장 최근 것을 반환
-        matching_orders = []
-        for order in orders:
-            if (order.status == 'pre_order' and 
-                order.payer_name == transaction_name and 
-                order.pre_order_amount == amount):
-                matching_orders.append(order)
-        
-        if matching_orders:
-            # 가장 최근에 생성된 주문 반환 (order_date 기준 내림차순 정렬)
-            matching_orders.sort(key=lambda x: x.order_date, reverse=True)
-            return matching_orders[0]
-        
-        return None
+    def execute(self, transaction_name: str, amount: int) -> Optional[Order]:
+        # pre_order 상태이면서 입금자 이름/금액이 일치하는 주문 중 가장 최근 것을 반환
+        return self.order_repository.get_latest_pre_order_by_payment_info(transaction_name, amount)
 
 
 class ResetOrdersByTableUseCase:
-    def __init__(self, order_repository: OrderRepository):
-        self.order_repository = order_repository
+    def __init__(self, table_repository: TableRepository):
+        self.table_repository = table_repository
     
     def execute(self, table_id: str) -> bool:
         """특정 테이블의 모든 주문을 숨김 처리합니다."""
-        # is_visible=False인 주문들도 포함하여 모든 주문을 가져와야 함
-        all_orders = self.order_repository.get_all_including_hidden_by_table_id(table_id)
-        
-        for order in all_orders:
-            order.is_visible = False
-            self.order_repository.update(order)
-        
+        # 현재 세션을 종료하면 세션에 속한 주문들이 모두 숨겨지고,
+        # 다음 주문 시 새 세션이 시작됩니다.
+        self.table_repository.close_session(table_id)
         return True
\ No newline at end of file
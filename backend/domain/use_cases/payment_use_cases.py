@@ -0,0 +1,88 @@
+from typing import List, Optional
+
+from ..entities.payment import PaymentDeposit
+from ..repositories.order_repository import OrderRepository
+from ..repositories.payment_repository import PaymentRepository
+from ..services.order_service import TransactionManager
+from ..services.payment_matching import SCORE_EXACT, MatchCandidate, PreOrderIndex
+from .order_use_cases import UpdateOrderStatusUseCase
+
+
+class ReconcileDepositUseCase:
+    """입금 한 건을 결제 대기 선주문과 매칭하고, 매칭되면 매칭 기록과 함께 주문을 결제 완료로 바꿉니다."""
+    
+    def __init__(self, payment_repository: PaymentRepository, order_repository: OrderRepository,
+                 update_order_status_use_case: UpdateOrderStatusUseCase, transaction_manager: TransactionManager):
+        self.payment_repository = payment_repository
+        self.order_repository = order_repository
+        self.update_order_status_use_case = update_order_status_use_case
+        self.transaction_manager = transaction_manager
+    
+    def execute(self, deposit: PaymentDeposit, index: Optional[PreOrderIndex] = None) -> Optional[MatchCandidate]:
+        """
+        index 없이 호출하면(웹훅) 먼저 (입금자명, 금액) 복합 인덱스로 정확히 일치하는 선주문을 찾고,
+        없을 때만 결제 대기 선주문 색인을 만들어 잘린 이름 등을 찾습니다.
+        배치 재매칭은 색인을 한 번 만들어 넘깁니다.
+        """
+        if deposit.amount <= 0:
+            return None
+        
+        candidate = None
+        if index is None:
+            exact = self.order_repository.get_latest_pre_order_by_payment_info(
+                deposit.transaction_name, deposit.amount
+            )
+            if exact:
+                candidate = MatchCandidate(
+                    order_id=exact.id, score=SCORE_EXACT, reason='exact',
+                    payer_name=exact.payer_name, amount=exact.pre_order_amount, order_date=exact.order_date,
+                )
+            else:
+                index = PreOrderIndex(self.payment_repository.get_pending_pre_orders())
+        if candidate is None:
+            candidate = index.best_match(deposit)
+        if candidate is None:
+            return None
+        
+        matched = self.transaction_manager.execute_in_transaction(self._link, deposit, candidate)
+        if index is not None:
+            # 매칭에 실패했어도(이미 결제된 주문) 같은 배치에서 다시 후보가 되지 않도록 뺌
+            index.remove(candidate.order_id)
+        return candidate if matched else None
+    
+    def _link(self, deposit: PaymentDeposit, candidate: MatchCandidate) -> bool:
+        order = self.order_repository.get_by_id(candidate.order_id)
+        if order is None or order.status != 'pre_order':
+            return False
+        if not self.payment_repository.link(deposit.id, candidate.order_id, 'auto', candidate.score):
+            return False
+        self.update_order_status_use_case.execute(candidate.order_id, 'completed')
+        return True
+
+
+class RematchDepositsUseCase:
+    """매칭되지 않은 입금 전체를 오래된 것부터 다시 매칭합니다. (선주문이 입금보다 늦게 들어온 경우 등)"""
+    
+    def __init__(self, payment_repository: PaymentRepository, reconcile_deposit_use_case: ReconcileDepositUseCase):
+        self.payment_repository = payment_repository
+        self.reconcile_deposit_use_case = reconcile_deposit_use_case
+    
+    def execute(self, dry_run: bool = False) -> List[tuple]:
+        """
+        Returns:
+            List[tuple]: 매칭된 (입금, 후보) 목록. dry_run이면 기록하지 않고 매칭될 목록만 반환
+        """
+        index = PreOrderIndex(self.payment_repository.get_pending_pre_orders())
+        matches = []
+        for deposit in self.payment_repository.get_unmatched_deposits():
+            if not len(index):
+                break
+            if dry_run:
+                candidate = index.best_match(deposit)
+                if candidate:
+                    index.remove(candidate.order_id)
+            else:
+                candidate = self.reconcile_deposit_use_case.execute(deposit, index)
+            if candidate:
+                matches.append((deposit, candidate))
+        return matches
@@ -26,8 +26,7 @@ class CreateTableUseCase:
     
     def execute(self) -> Table:
         # 현재 테이블 수를 기반으로 이름 생성
-        existing_tables = self.table_repository.get_all()
-        table_number = len(existing_tables) + 1
+        table_number = self.table_repository.count() + 1
         table_name = f"테이블{table_number}"
         
         table = Table.create(name=table_name)
@@ -3,7 +3,9 @@ import multiprocessing
 # 서버 설정
 bind = "0.0.0.0:8000"
 workers = multiprocessing.cpu_count() * 2 + 1
-worker_class = "sync"
+# 결제 상태/주문 현황판 SSE 스트림은 연결을 오래 열어 두므로 sync 워커가 아닌 ASGI(uvicorn) 워커로 실행
+# (uvicorn 필요: pip install .[asgi])
+worker_class = "uvicorn.workers.UvicornWorker"
 worker_connections = 1000
 max_requests = 1000
 max_requests_jitter = 100
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import FoodModel, TableModel, OrderModel, OrderItemModel, MinusOrderItemModel
+from .models import FoodModel, TableModel, TableSessionModel, OrderModel, OrderItemModel, MinusOrderItemModel
 
 
 @admin.register(FoodModel)
@@ -18,6 +18,14 @@ class TableModelAdmin(admin.ModelAdmin):
     readonly_fields = ('id', 'created_at', 'updated_at')
 
 
+@admin.register(TableSessionModel)
+class TableSessionModelAdmin(admin.ModelAdmin):
+    list_display = ('id', 'table', 'started_at', 'ended_at')
+    list_filter = ('started_at', 'table')
+    ordering = ('-started_at',)
+    readonly_fields = ('id',)
+
+
 class OrderItemInline(admin.TabularInline):
     model = OrderItemModel
     extra = 0
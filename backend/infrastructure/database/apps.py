@@ -3,4 +3,7 @@ from django.apps import AppConfig
 
 class DatabaseConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'infrastructure.database'
\ No newline at end of file
+    name = 'infrastructure.database'
+    
+    def ready(self):
+        from . import signals  # noqa: F401
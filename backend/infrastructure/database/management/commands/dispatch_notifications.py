@@ -0,0 +1,42 @@
+import signal
+import threading
+
+from django.core.management.base import BaseCommand
+
+from infrastructure.external.notification_client import notification_client
+from infrastructure.external.notification_dispatcher import NotificationDispatcher
+
+
+class Command(BaseCommand):
+    help = 'Deliver pending Discord notifications from the notification outbox'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Deliver one batch and exit')
+        parser.add_argument('--interval', type=float, default=1.0, help='Seconds to wait when the outbox is empty')
+        parser.add_argument('--batch-size', type=int, default=50, help='Notifications claimed per batch')
+        parser.add_argument('--batch-window', type=float, default=1.0,
+                            help='Seconds the oldest notification waits so a burst is sent in fewer webhook calls')
+        parser.add_argument('--max-attempts', type=int, default=8, help='Attempts before a notification is marked failed')
+
+    def handle(self, *args, **options):
+        dispatcher = NotificationDispatcher(
+            batch_size=options['batch_size'],
+            batch_window=options['batch_window'],
+            max_attempts=options['max_attempts'],
+        )
+        
+        if options['once']:
+            processed = dispatcher.dispatch_pending()
+            self.stdout.write(self.style.SUCCESS(f'Processed {processed} notifications'))
+            self.stdout.write(f'HTTP client metrics: {notification_client.metrics.snapshot()}')
+            return
+        
+        # SIGTERM/SIGINT를 받으면 현재 묶음을 마치고 종료
+        stop_event = threading.Event()
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, lambda *_: stop_event.set())
+        
+        self.stdout.write('Dispatching notifications...')
+        dispatcher.run_forever(poll_interval=options['interval'], stop_event=stop_event)
+        self.stdout.write(self.style.SUCCESS('Notification dispatcher stopped'))
+        self.stdout.write(f'HTTP client metrics: {notification_client.metrics.snapshot()}')
@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from infrastructure.database.models import SalesSummary
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the sales summary tables from raw orders, or compare them with --verify'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--verify', action='store_true',
+                            help='Report rows that differ from raw orders without changing the summary')
+    
+    def handle(self, *args, **options):
+        if options['verify']:
+            expected_daily, expected_foods = SalesSummary.compute_from_orders()
+            stored_daily, stored_foods = SalesSummary.stored()
+            mismatches = [
+                *self._diff('date', expected_daily, stored_daily, '(order_count, revenue)'),
+                *self._diff('food', expected_foods, stored_foods, '(quantity, order_count, revenue)'),
+            ]
+            for mismatch in mismatches:
+                self.stdout.write(mismatch)
+            if mismatches:
+                raise CommandError(
+                    f'Sales summary differs from orders in {len(mismatches)} rows. Run rebuild_sales_summary to fix it.'
+                )
+            self.stdout.write(self.style.SUCCESS('Sales summary matches orders'))
+            return
+        
+        SalesSummary.rebuild()
+        daily, foods = SalesSummary.stored()
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt sales summary: {len(daily)} days, {len(foods)} foods'))
+    
+    @staticmethod
+    def _diff(label, expected, stored, columns):
+        # 0뿐인 행은 양쪽 모두 없는 것으로 봄
+        zero = (0,) * len(columns.split(','))
+        for key in sorted(set(expected) | set(stored), key=str):
+            expected_row = tuple(expected.get(key, zero))
+            stored_row = tuple(stored.get(key, zero))
+            if expected_row != stored_row:
+                yield f'{label} {key}: expected {columns}={expected_row}, stored {stored_row}'
@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+
+from domain.use_cases.order_use_cases import UpdateOrderStatusUseCase
+from domain.use_cases.payment_use_cases import ReconcileDepositUseCase, RematchDepositsUseCase
+from infrastructure.database.repositories import DjangoNotificationRepository, DjangoOrderRepository, DjangoPaymentRepository
+from infrastructure.transaction.django_transaction_manager import DjangoTransactionManager
+
+
+class Command(BaseCommand):
+    help = 'Match unmatched deposits against pending pre-orders (e.g. pre-orders created after the deposit arrived)'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true',
+                            help='Print the matches that would be made without changing anything')
+    
+    def handle(self, *args, **options):
+        order_repository = DjangoOrderRepository()
+        payment_repository = DjangoPaymentRepository()
+        transaction_manager = DjangoTransactionManager()
+        update_order_status_use_case = UpdateOrderStatusUseCase(
+            order_repository, DjangoNotificationRepository(), transaction_manager
+        )
+        reconcile_deposit_use_case = ReconcileDepositUseCase(
+            payment_repository, order_repository, update_order_status_use_case, transaction_manager
+        )
+        matches = RematchDepositsUseCase(payment_repository, reconcile_deposit_use_case).execute(
+            dry_run=options['dry_run']
+        )
+        
+        for deposit, candidate in matches:
+            self.stdout.write(
+                f'deposit {deposit.id} ({deposit.transaction_name}, {deposit.amount}) -> '
+                f'order {candidate.order_id} ({candidate.payer_name}, {candidate.reason}, score {candidate.score})'
+            )
+        verb = 'Would match' if options['dry_run'] else 'Matched'
+        self.stdout.write(self.style.SUCCESS(f'{verb} {len(matches)} deposits'))
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('database', '0009_alter_foodmodel_category_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ordermodel',
+            index=models.Index(fields=['status', 'payer_name', 'pre_order_amount', 'order_date'], name='orders_pre_order_lookup_idx'),
+        ),
+    ]
@@ -0,0 +1,62 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:58
+
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+from django.db import migrations, models
+from django.db.models import Min
+
+
+def assign_visible_orders_to_sessions(apps, schema_editor):
+    """표시 중인 주문이 있는 테이블마다 진행 중인 세션을 만들고 주문을 연결합니다."""
+    OrderModel = apps.get_model('database', 'OrderModel')
+    TableSessionModel = apps.get_model('database', 'TableSessionModel')
+    
+    visible_tables = OrderModel.objects.filter(is_visible=True).values('table_id').annotate(started_at=Min('order_date'))
+    for row in visible_tables:
+        session = TableSessionModel.objects.create(table_id=row['table_id'], started_at=row['started_at'])
+        OrderModel.objects.filter(table_id=row['table_id'], is_visible=True).update(session=session)
+
+
+def restore_is_visible_from_sessions(apps, schema_editor):
+    OrderModel = apps.get_model('database', 'OrderModel')
+    OrderModel.objects.update(is_visible=False)
+    OrderModel.objects.filter(session__isnull=False, session__ended_at__isnull=True).update(is_visible=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('database', '0010_ordermodel_pre_order_lookup_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TableSessionModel',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False, verbose_name='세션 ID')),
+                ('started_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='착석 일시')),
+                ('ended_at', models.DateTimeField(blank=True, null=True, verbose_name='퇴실 일시')),
+                ('table', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='sessions', to='database.tablemodel', verbose_name='테이블')),
+            ],
+            options={
+                'verbose_name': '테이블 세션',
+                'verbose_name_plural': '테이블 세션들',
+                'db_table': 'table_sessions',
+            },
+        ),
+        migrations.AddField(
+            model_name='ordermodel',
+            name='session',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='orders', to='database.tablesessionmodel', verbose_name='테이블 세션'),
+        ),
+        migrations.AddIndex(
+            model_name='tablesessionmodel',
+            index=models.Index(fields=['table', 'ended_at'], name='table_sessions_current_idx'),
+        ),
+        migrations.RunPython(assign_visible_orders_to_sessions, restore_is_visible_from_sessions),
+        migrations.RemoveField(
+            model_name='ordermodel',
+            name='is_visible',
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-17 03:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('database', '0011_tablesessionmodel'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ordermodel',
+            index=models.Index(fields=['order_date', 'id'], name='orders_keyset_idx'),
+        ),
+    ]
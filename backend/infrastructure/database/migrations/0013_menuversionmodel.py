@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-17 03:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('database', '0012_ordermodel_keyset_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MenuVersionModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.PositiveBigIntegerField(default=0, verbose_name='메뉴 버전')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일시')),
+            ],
+            options={
+                'verbose_name': '메뉴 버전',
+                'verbose_name_plural': '메뉴 버전',
+                'db_table': 'menu_version',
+            },
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-17 03:22
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('database', '0013_menuversionmodel'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotificationOutboxModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('payment_completed', 'Payment Completed')], max_length=30, verbose_name='알림 종류')),
+                ('payload', models.JSONField(blank=True, default=dict, verbose_name='추가 정보')),
+                ('dedup_key', models.CharField(blank=True, max_length=100, null=True, unique=True, verbose_name='중복 방지 키')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('sent', 'Sent'), ('failed', 'Failed')], default='pending', max_length=10, verbose_name='전송 상태')),
+                ('attempts', models.PositiveIntegerField(default=0, verbose_name='전송 시도 횟수')),
+                ('next_attempt_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='다음 전송 시각')),
+                ('last_error', models.TextField(blank=True, default='', verbose_name='마지막 오류')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일시')),
+                ('sent_at', models.DateTimeField(blank=True, null=True, verbose_name='전송일시')),
+                ('order', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='notifications', to='database.ordermodel', verbose_name='주문')),
+            ],
+            options={
+                'verbose_name': '알림 아웃박스',
+                'verbose_name_plural': '알림 아웃박스',
+                'db_table': 'notification_outbox',
+                'indexes': [models.Index(fields=['status', 'next_attempt_at'], name='outbox_due_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 03:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('database', '0014_notificationoutboxmodel'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='notificationoutboxmodel',
+            name='kind',
+            field=models.CharField(choices=[('payment_completed', 'Payment Completed'), ('staff_call', 'Staff Call')], max_length=30, verbose_name='알림 종류'),
+        ),
+    ]
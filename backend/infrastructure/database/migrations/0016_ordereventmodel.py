@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-17 03:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('database', '0015_notificationoutboxmodel_staff_call'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OrderEventModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('order_created', 'Order Created'), ('payment_completed', 'Payment Completed'), ('refund_issued', 'Refund Issued'), ('table_checkout', 'Table Checkout')], max_length=30, verbose_name='이벤트 종류')),
+                ('table_id', models.UUIDField(verbose_name='테이블 ID')),
+                ('order_id', models.UUIDField(blank=True, null=True, verbose_name='주문 ID')),
+                ('payload', models.JSONField(blank=True, default=dict, verbose_name='변화량')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일시')),
+            ],
+            options={
+                'verbose_name': '주문 이벤트',
+                'verbose_name_plural': '주문 이벤트',
+                'db_table': 'order_events',
+            },
+        ),
+    ]
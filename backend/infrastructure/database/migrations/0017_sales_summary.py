@@ -0,0 +1,88 @@
+# Generated by Django 5.2.18 on 2026-10-17 03:48
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, F, IntegerField, Sum
+from django.db.models.functions import TruncDate
+
+
+def fill_sales_summary(apps, schema_editor):
+    """기존 완료 주문으로 매출 요약을 채웁니다. (이후 변경은 SalesSummary가 증감)"""
+    OrderModel = apps.get_model('database', 'OrderModel')
+    OrderItemModel = apps.get_model('database', 'OrderItemModel')
+    MinusOrderItemModel = apps.get_model('database', 'MinusOrderItemModel')
+    SalesDailySummaryModel = apps.get_model('database', 'SalesDailySummaryModel')
+    SalesFoodSummaryModel = apps.get_model('database', 'SalesFoodSummaryModel')
+    
+    daily = {
+        row['day']: [row['order_count'], 0]
+        for row in OrderModel.objects.filter(status='completed').annotate(day=TruncDate('order_date')).values(
+            'day'
+        ).annotate(order_count=Count('id')).order_by()
+    }
+    foods = {}
+    for line_model in (OrderItemModel, MinusOrderItemModel):
+        lines = line_model.objects.filter(order__status='completed').annotate(
+            day=TruncDate('order__order_date')
+        ).values('day', 'food_id').annotate(
+            line_quantity=Sum('quantity'),
+            line_revenue=Sum(F('price') * F('quantity'), output_field=IntegerField()),
+            line_orders=Count('order_id', distinct=True),
+        ).order_by()
+        for line in lines:
+            daily[line['day']][1] += line['line_revenue']
+            food = foods.setdefault(line['food_id'], [0, 0, 0])
+            food[0] += line['line_quantity']
+            food[2] += line['line_revenue']
+            if line_model is OrderItemModel:
+                food[1] += line['line_orders']
+    
+    SalesDailySummaryModel.objects.bulk_create([
+        SalesDailySummaryModel(date=day, order_count=order_count, revenue=revenue)
+        for day, (order_count, revenue) in daily.items()
+    ])
+    SalesFoodSummaryModel.objects.bulk_create([
+        SalesFoodSummaryModel(food_id=food_id, quantity=quantity, order_count=order_count, revenue=revenue)
+        for food_id, (quantity, order_count, revenue) in foods.items()
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('database', '0016_ordereventmodel'),
+    ]
+    
+    operations = [
+        migrations.CreateModel(
+            name='SalesDailySummaryModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(unique=True, verbose_name='날짜')),
+                ('order_count', models.IntegerField(default=0, verbose_name='주문 수')),
+                ('revenue', models.BigIntegerField(default=0, verbose_name='매출')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일시')),
+            ],
+            options={
+                'verbose_name': '일별 매출 요약',
+                'verbose_name_plural': '일별 매출 요약',
+                'db_table': 'sales_daily_summary',
+            },
+        ),
+        migrations.CreateModel(
+            name='SalesFoodSummaryModel',
+            fields=[
+                ('food', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='sales_summary', serialize=False, to='database.foodmodel', verbose_name='음식')),
+                ('quantity', models.IntegerField(default=0, verbose_name='판매 수량')),
+                ('order_count', models.IntegerField(default=0, verbose_name='주문 수')),
+                ('revenue', models.BigIntegerField(default=0, verbose_name='매출')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일시')),
+            ],
+            options={
+                'verbose_name': '음식별 판매 요약',
+                'verbose_name_plural': '음식별 판매 요약',
+                'db_table': 'sales_food_summary',
+            },
+        ),
+        migrations.RunPython(fill_sales_summary, migrations.RunPython.noop),
+    ]
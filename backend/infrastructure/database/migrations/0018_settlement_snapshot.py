@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-17 04:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('database', '0017_sales_summary'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SettlementSnapshotModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일시')),
+                ('created_by', models.CharField(blank=True, default='', max_length=150, verbose_name='생성자')),
+                ('report', models.JSONField(verbose_name='정산 결과')),
+                ('csv', models.TextField(verbose_name='정산 결과 CSV')),
+                ('checksum', models.CharField(max_length=64, verbose_name='정산 결과 SHA-256')),
+            ],
+            options={
+                'verbose_name': '정산 스냅샷',
+                'verbose_name_plural': '정산 스냅샷',
+                'db_table': 'settlement_snapshots',
+            },
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-17 04:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('database', '0018_settlement_snapshot'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='paymentdepositmodel',
+            index=models.Index(fields=['transaction_date', 'id'], name='deposits_keyset_idx'),
+        ),
+    ]
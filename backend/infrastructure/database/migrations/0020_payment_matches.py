@@ -0,0 +1,61 @@
+# Generated by Django 5.2.18 on 2026-10-17 04:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def link_paid_pre_orders(apps, schema_editor):
+    """
+    이미 웹훅으로 결제 완료된 선주문을 입금과 이어 둡니다.
+    웹훅은 (입금자명, 금액)이 같은 선주문을 완료했으므로, 같은 키끼리 시간 순서대로 짝짓습니다.
+    """
+    OrderModel = apps.get_model('database', 'OrderModel')
+    PaymentDepositModel = apps.get_model('database', 'PaymentDepositModel')
+    PaymentMatchModel = apps.get_model('database', 'PaymentMatchModel')
+    
+    paid = {}
+    orders = OrderModel.objects.exclude(status='pre_order').filter(
+        payer_name__isnull=False, pre_order_amount__isnull=False
+    ).order_by('order_date', 'id').values_list('id', 'payer_name', 'pre_order_amount')
+    for order_id, payer_name, amount in orders.iterator(chunk_size=2000):
+        paid.setdefault((payer_name, amount), []).append(order_id)
+    for order_ids in paid.values():
+        order_ids.reverse()
+    
+    links = []
+    deposits = PaymentDepositModel.objects.filter(amount__gt=0).order_by('transaction_date', 'id').values_list(
+        'id', 'transaction_name', 'amount'
+    )
+    for deposit_id, transaction_name, amount in deposits.iterator(chunk_size=2000):
+        order_ids = paid.get((transaction_name, amount))
+        if order_ids:
+            links.append(PaymentMatchModel(deposit_id=deposit_id, order_id=order_ids.pop(), method='backfill'))
+    PaymentMatchModel.objects.bulk_create(links, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('database', '0019_paymentdepositmodel_keyset_idx'),
+    ]
+    
+    operations = [
+        migrations.CreateModel(
+            name='PaymentMatchModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('method', models.CharField(choices=[('auto', 'Auto'), ('manual', 'Manual'), ('dismissed', 'Dismissed'), ('backfill', 'Backfill')], max_length=10, verbose_name='매칭 방법')),
+                ('score', models.PositiveSmallIntegerField(blank=True, null=True, verbose_name='매칭 점수')),
+                ('matched_by', models.CharField(blank=True, default='', max_length=150, verbose_name='매칭한 관리자')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일시')),
+                ('deposit', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='match', to='database.paymentdepositmodel', verbose_name='입금')),
+                ('order', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='payment_match', to='database.ordermodel', verbose_name='주문')),
+            ],
+            options={
+                'verbose_name': '입금 매칭',
+                'verbose_name_plural': '입금 매칭',
+                'db_table': 'payment_matches',
+            },
+        ),
+        migrations.RunPython(link_paid_pre_orders, migrations.RunPython.noop),
+    ]
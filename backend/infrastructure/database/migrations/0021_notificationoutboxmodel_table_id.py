@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-17 04:47
+
+from django.db import migrations, models
+
+
+def fill_staff_call_table_ids(apps, schema_editor):
+    """기존 직원호출 알림의 payload.table_id를 table_id 컬럼으로 옮깁니다."""
+    NotificationOutboxModel = apps.get_model('database', 'NotificationOutboxModel')
+    entries = NotificationOutboxModel.objects.filter(kind='staff_call').values_list('id', 'payload')
+    for entry_id, payload in entries.iterator(chunk_size=2000):
+        table_id = (payload or {}).get('table_id')
+        if table_id:
+            NotificationOutboxModel.objects.filter(id=entry_id).update(table_id=str(table_id))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('database', '0020_payment_matches'),
+    ]
+    
+    operations = [
+        migrations.AddField(
+            model_name='notificationoutboxmodel',
+            name='table_id',
+            field=models.CharField(blank=True, max_length=64, null=True, verbose_name='테이블 ID'),
+        ),
+        migrations.RunPython(fill_staff_call_table_ids, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='notificationoutboxmodel',
+            index=models.Index(fields=['table_id', 'id'], name='outbox_table_idx'),
+        ),
+    ]
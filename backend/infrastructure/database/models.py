@@ -1,5 +1,8 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import BigIntegerField, Case, Count, F, IntegerField, OuterRef, Q, Subquery, Sum, Value, When
+from django.db.models.functions import Coalesce, TruncDate
 from django.utils import timezone
+from typing import Dict, List, Optional
 import uuid
 
 
@@ -27,6 +30,45 @@ class FoodModel(models.Model):
         return f"{self.name} ({self.get_category_display()})"
 
 
+class MenuVersionModel(models.Model):
+    """
+    메뉴(foods) 변경 버전. 백엔드와 어드민이 음식 저장/삭제 시 함께 올리며,
+    백엔드 워커는 이 값만 확인해 캐시된 메뉴 스냅샷을 재사용합니다.
+    """
+    SINGLETON_ID = 1
+    
+    version = models.PositiveBigIntegerField(default=0, verbose_name='메뉴 버전')
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='수정일시')
+    
+    class Meta:
+        db_table = 'menu_version'
+        verbose_name = '메뉴 버전'
+        verbose_name_plural = '메뉴 버전'
+    
+    @classmethod
+    def stamp(cls):
+        """
+        (version, updated_at)을 반환합니다.
+        배포 전에 메뉴를 만들어 둔 DB처럼 행이 아직 없으면 만들어 둡니다. (없으면 메뉴 캐시와 ETag가 동작하지 않음)
+        """
+        stamp = cls.objects.filter(pk=cls.SINGLETON_ID).values_list('version', 'updated_at').first()
+        if stamp is None:
+            # 여러 워커가 동시에 만들어도 get_or_create가 중복 생성을 처리함
+            cls.objects.get_or_create(pk=cls.SINGLETON_ID)
+            stamp = cls.objects.filter(pk=cls.SINGLETON_ID).values_list('version', 'updated_at').first()
+        return stamp
+    
+    @classmethod
+    def bump(cls) -> None:
+        # 행이 있으면 UPDATE 한 번으로 원자적으로 증가
+        updated = cls.objects.filter(pk=cls.SINGLETON_ID).update(version=F('version') + 1, updated_at=timezone.now())
+        if not updated:
+            _, created = cls.objects.get_or_create(pk=cls.SINGLETON_ID, defaults={'version': 1})
+            if not created:
+                # 다른 워커가 먼저 행을 만든 경우
+                cls.objects.filter(pk=cls.SINGLETON_ID).update(version=F('version') + 1, updated_at=timezone.now())
+
+
 class TableModel(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False, verbose_name='테이블 ID')
     name = models.CharField(max_length=50, null=True, blank=True, verbose_name='테이블 이름')
@@ -42,6 +84,62 @@ class TableModel(models.Model):
         return f"{self.name}"
 
 
+class TableSessionModel(models.Model):
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False, verbose_name='세션 ID')
+    table = models.ForeignKey(TableModel, related_name='sessions', on_delete=models.CASCADE, verbose_name='테이블')
+    started_at = models.DateTimeField(default=timezone.now, verbose_name='착석 일시')
+    ended_at = models.DateTimeField(null=True, blank=True, verbose_name='퇴실 일시')
+    
+    class Meta:
+        db_table = 'table_sessions'
+        verbose_name = '테이블 세션'
+        verbose_name_plural = '테이블 세션들'
+        indexes = [
+            # 테이블의 현재 세션(ended_at IS NULL) 조회용
+            models.Index(fields=['table', 'ended_at'], name='table_sessions_current_idx'),
+        ]
+    
+    def __str__(self):
+        return f"Session {self.id} - Table {self.table_id}"
+
+
+class OrderQuerySet(models.QuerySet):
+    def visible(self):
+        """현재 진행 중인 테이블 세션에 속한 주문만 조회합니다."""
+        return self.filter(session__isnull=False, session__ended_at__isnull=True)
+    
+    def with_totals(self):
+        """
+        주문별 아이템 합계, 차감 합계, 실제 총액을 SQL에서 계산해 annotate 합니다.
+        - items_total: 주문 아이템 price * quantity 합계
+        - minus_total: 차감 아이템 price * quantity 합계 (음수)
+        - effective_total: pre-order이면서 pre_order_amount가 있으면 pre_order_amount,
+          그 외에는 items_total + minus_total
+        """
+        items_total = OrderItemModel.objects.filter(order=OuterRef('pk')).values('order').annotate(
+            total=Sum(F('price') * F('quantity'), output_field=IntegerField())
+        ).values('total')
+        minus_total = MinusOrderItemModel.objects.filter(order=OuterRef('pk')).values('order').annotate(
+            total=Sum(F('price') * F('quantity'), output_field=IntegerField())
+        ).values('total')
+        
+        return self.annotate(
+            items_total=Coalesce(Subquery(items_total, output_field=IntegerField()), 0),
+            minus_total=Coalesce(Subquery(minus_total, output_field=IntegerField()), 0),
+        ).annotate(
+            effective_total=Case(
+                When(Q(status='pre_order') & Q(pre_order_amount__isnull=False), then=F('pre_order_amount')),
+                default=F('items_total') + F('minus_total'),
+                output_field=IntegerField(),
+            )
+        )
+    
+    def with_positive_total(self):
+        """총액이 0원 이하인 주문을 DB에서 제외합니다."""
+        queryset = self if 'effective_total' in self.query.annotations else self.with_totals()
+        return queryset.filter(effective_total__gt=0)
+
+
 class OrderModel(models.Model):
     STATUS_CHOICES = [
         ('pre_order', 'Pre Order'),
@@ -54,22 +152,42 @@ class OrderModel(models.Model):
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='completed', verbose_name='주문 상태')
     pre_order_amount = models.PositiveIntegerField(null=True, blank=True, verbose_name='선주문 총 금액')
     order_date = models.DateTimeField(default=timezone.now, verbose_name='주문일시')
-    is_visible = models.BooleanField(default=True, verbose_name='표시 여부')
+    session = models.ForeignKey(TableSessionModel, related_name='orders', null=True, blank=True, on_delete=models.SET_NULL, verbose_name='테이블 세션')
     discord_notified = models.BooleanField(default=False, verbose_name='Discord 알림 전송 여부')
     created_at = models.DateTimeField(auto_now_add=True, verbose_name='생성일시')
     updated_at = models.DateTimeField(auto_now=True, verbose_name='수정일시')
     
+    objects = OrderQuerySet.as_manager()
+    
     class Meta:
         db_table = 'orders'
         verbose_name = '주문'
         verbose_name_plural = '주문들'
         ordering = ['-order_date']
+        indexes = [
+            # 결제 웹훅의 pre-order 매칭 조회용
+            models.Index(
+                fields=['status', 'payer_name', 'pre_order_amount', 'order_date'],
+                name='orders_pre_order_lookup_idx'
+            ),
+            # 주문 내역 키셋 페이지네이션용
+            models.Index(fields=['order_date', 'id'], name='orders_keyset_idx'),
+        ]
     
     def __str__(self):
         return f"Order {self.id} - Table {self.table.id}"
     
+    @property
+    def is_visible(self):
+        # 현재 진행 중인 테이블 세션에 속한 주문만 표시
+        return self.session_id is not None and self.session.ended_at is None
+    
     @property
     def total_amount(self):
+        # with_totals()로 조회한 경우 SQL에서 계산된 값 사용
+        if hasattr(self, 'effective_total'):
+            return self.effective_total
+        
         # pre-order인 경우 pre_order_amount 사용
         if self.status == 'pre_order' and self.pre_order_amount is not None:
             return self.pre_order_amount
@@ -142,8 +260,354 @@ class PaymentDepositModel(models.Model):
         verbose_name = '입금 내역'
         verbose_name_plural = '입금 내역들'
         ordering = ['-transaction_date']
+        indexes = [
+            # 어드민 입금 내역 내보내기 키셋 조회용
+            models.Index(fields=['transaction_date', 'id'], name='deposits_keyset_idx'),
+        ]
     
     def __str__(self):
         return f"{self.transaction_name} - {self.amount:,}원"
 
 
+class PaymentMatchModel(models.Model):
+    """
+    입금 -> 주문 매칭 기록. 입금 하나는 주문 하나만, 주문 하나는 입금 하나로만 결제됩니다. (unique)
+    기록이 없는 입금(금액 > 0)이 어드민의 미매칭 입금 목록에 나타납니다.
+    dismissed는 주문 결제가 아닌 입금(현장 결제 차액 등)을 관리자가 목록에서 뺀 기록으로, order가 비어 있습니다.
+    """
+    METHOD_AUTO = 'auto'
+    METHOD_MANUAL = 'manual'
+    METHOD_DISMISSED = 'dismissed'
+    METHOD_BACKFILL = 'backfill'
+    METHOD_CHOICES = [
+        (METHOD_AUTO, 'Auto'),
+        (METHOD_MANUAL, 'Manual'),
+        (METHOD_DISMISSED, 'Dismissed'),
+        (METHOD_BACKFILL, 'Backfill'),
+    ]
+    
+    deposit = models.OneToOneField(
+        PaymentDepositModel, related_name='match', on_delete=models.CASCADE, verbose_name='입금'
+    )
+    # 주문을 삭제하면 매칭 기록도 지워져 입금이 다시 미매칭 목록에 나타남
+    order = models.OneToOneField(
+        OrderModel, related_name='payment_match', null=True, blank=True, on_delete=models.CASCADE, verbose_name='주문'
+    )
+    method = models.CharField(max_length=10, choices=METHOD_CHOICES, verbose_name='매칭 방법')
+    score = models.PositiveSmallIntegerField(null=True, blank=True, verbose_name='매칭 점수')
+    matched_by = models.CharField(max_length=150, blank=True, default='', verbose_name='매칭한 관리자')
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='생성일시')
+    
+    class Meta:
+        db_table = 'payment_matches'
+        verbose_name = '입금 매칭'
+        verbose_name_plural = '입금 매칭'
+    
+    def __str__(self):
+        return f"{self.deposit_id} -> {self.order_id} ({self.method})"
+
+
+class NotificationOutboxModel(models.Model):
+    """
+    Discord 알림 아웃박스. 주문 상태 변경과 같은 트랜잭션에서 기록되고,
+    dispatch_notifications 커맨드가 재시도/백오프와 함께 전송합니다.
+    """
+    KIND_PAYMENT_COMPLETED = 'payment_completed'
+    KIND_STAFF_CALL = 'staff_call'
+    KIND_CHOICES = [
+        (KIND_PAYMENT_COMPLETED, 'Payment Completed'),
+        (KIND_STAFF_CALL, 'Staff Call'),
+    ]
+    
+    STATUS_PENDING = 'pending'
+    STATUS_SENT = 'sent'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, 'Pending'),
+        (STATUS_SENT, 'Sent'),
+        (STATUS_FAILED, 'Failed'),
+    ]
+    
+    kind = models.CharField(max_length=30, choices=KIND_CHOICES, verbose_name='알림 종류')
+    order = models.ForeignKey(OrderModel, related_name='notifications', null=True, blank=True, on_delete=models.CASCADE, verbose_name='주문')
+    # 직원호출 알림의 테이블 ID. 직전 호출 조회(_next_staff_call_at)가 인덱스를 타도록 payload와 별도로 저장
+    table_id = models.CharField(max_length=64, null=True, blank=True, verbose_name='테이블 ID')
+    payload = models.JSONField(default=dict, blank=True, verbose_name='추가 정보')
+    # 같은 이벤트가 두 번 기록되지 않도록 하는 키 (예: payment_completed:<주문 ID>)
+    dedup_key = models.CharField(max_length=100, unique=True, null=True, blank=True, verbose_name='중복 방지 키')
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_PENDING, verbose_name='전송 상태')
+    attempts = models.PositiveIntegerField(default=0, verbose_name='전송 시도 횟수')
+    next_attempt_at = models.DateTimeField(default=timezone.now, verbose_name='다음 전송 시각')
+    last_error = models.TextField(blank=True, default='', verbose_name='마지막 오류')
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='생성일시')
+    sent_at = models.DateTimeField(null=True, blank=True, verbose_name='전송일시')
+    
+    class Meta:
+        db_table = 'notification_outbox'
+        verbose_name = '알림 아웃박스'
+        verbose_name_plural = '알림 아웃박스'
+        indexes = [
+            # 디스패처의 전송 대기 알림 조회용
+            models.Index(fields=['status', 'next_attempt_at'], name='outbox_due_idx'),
+            # 테이블별 직전 직원호출 조회용
+            models.Index(fields=['table_id', 'id'], name='outbox_table_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.kind} ({self.get_status_display()}) - Order {self.order_id}"
+
+
+class OrderEventModel(models.Model):
+    """
+    주문 현황판 이벤트 로그. 주문 생성/결제 완료/환불/퇴실이 일어나면 백엔드와 어드민이 함께 기록하고,
+    관리자 현황판 스트림(order_events)이 id 순서대로 전달합니다.
+    payload의 revenue/orders는 테이블 현황에 더할 매출/주문 수 변화량입니다.
+    """
+    KIND_ORDER_CREATED = 'order_created'
+    KIND_PAYMENT_COMPLETED = 'payment_completed'
+    KIND_REFUND_ISSUED = 'refund_issued'
+    KIND_TABLE_CHECKOUT = 'table_checkout'
+    KIND_CHOICES = [
+        (KIND_ORDER_CREATED, 'Order Created'),
+        (KIND_PAYMENT_COMPLETED, 'Payment Completed'),
+        (KIND_REFUND_ISSUED, 'Refund Issued'),
+        (KIND_TABLE_CHECKOUT, 'Table Checkout'),
+    ]
+    
+    kind = models.CharField(max_length=30, choices=KIND_CHOICES, verbose_name='이벤트 종류')
+    # 주문/테이블이 삭제되어도 이벤트 순서가 유지되도록 FK 대신 ID만 저장
+    table_id = models.UUIDField(verbose_name='테이블 ID')
+    order_id = models.UUIDField(null=True, blank=True, verbose_name='주문 ID')
+    payload = models.JSONField(default=dict, blank=True, verbose_name='변화량')
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='생성일시')
+    
+    class Meta:
+        db_table = 'order_events'
+        verbose_name = '주문 이벤트'
+        verbose_name_plural = '주문 이벤트'
+    
+    def __str__(self):
+        return f"{self.kind} - Table {self.table_id}"
+    
+    @classmethod
+    def record(cls, kind: str, table_id, session_id=None, order_id=None, table_name=None,
+               revenue: int = 0, orders: int = 0) -> 'OrderEventModel':
+        """테이블 현황 변화량을 이벤트로 기록합니다. 주문 변경과 같은 트랜잭션에서 호출하세요."""
+        return cls.objects.create(
+            kind=kind,
+            table_id=table_id,
+            order_id=order_id,
+            payload={
+                'session_id': str(session_id) if session_id else None,
+                'table_name': table_name,
+                'revenue': revenue,
+                'orders': orders,
+            },
+        )
+
+
+class SalesDailySummaryModel(models.Model):
+    """일별 매출 요약. 완료된 주문만 집계하며 SalesSummary가 주문 변경과 같은 트랜잭션에서 증감합니다."""
+    date = models.DateField(unique=True, verbose_name='날짜')
+    order_count = models.IntegerField(default=0, verbose_name='주문 수')
+    revenue = models.BigIntegerField(default=0, verbose_name='매출')
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='수정일시')
+    
+    class Meta:
+        db_table = 'sales_daily_summary'
+        verbose_name = '일별 매출 요약'
+        verbose_name_plural = '일별 매출 요약'
+    
+    def __str__(self):
+        return f"{self.date} - {self.order_count}건 / {self.revenue}원"
+
+
+class SalesFoodSummaryModel(models.Model):
+    """음식별 판매 요약. order_count는 해당 음식이 포함된 완료 주문 수입니다."""
+    food = models.OneToOneField(
+        FoodModel, related_name='sales_summary', primary_key=True, on_delete=models.CASCADE, verbose_name='음식'
+    )
+    quantity = models.IntegerField(default=0, verbose_name='판매 수량')
+    order_count = models.IntegerField(default=0, verbose_name='주문 수')
+    revenue = models.BigIntegerField(default=0, verbose_name='매출')
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='수정일시')
+    
+    class Meta:
+        db_table = 'sales_food_summary'
+        verbose_name = '음식별 판매 요약'
+        verbose_name_plural = '음식별 판매 요약'
+    
+    def __str__(self):
+        return f"{self.food_id} - {self.quantity}개 / {self.revenue}원"
+
+
+class SalesContribution:
+    """주문 한 건(또는 환불 한 번)이 매출 요약에 더하는 값. foods는 음식 ID -> [수량, 매출, 주문 수]"""
+    
+    def __init__(self, day, orders: int = 0):
+        self.day = day
+        self.orders = orders
+        self.revenue = 0
+        self.foods: Dict[int, List[int]] = {}
+    
+    def add_line(self, food_id: int, quantity: int, revenue: int, counts_order: bool = True) -> None:
+        """주문 아이템(counts_order=True) 또는 차감 아이템(음수 수량/금액)을 더합니다."""
+        food = self.foods.setdefault(food_id, [0, 0, 0])
+        food[0] += quantity
+        food[1] += revenue
+        if counts_order:
+            food[2] = self.orders
+        self.revenue += revenue
+
+
+class SalesSummary:
+    """
+    매출 요약(sales_daily_summary, sales_food_summary) 관리.
+    
+    완료(completed) 주문만 집계합니다. 주문이 완료 상태로 생성/변경되면 기여분을 더하고, 환불은 차감분만 빼며,
+    완료 주문이 삭제되거나 환불 처리되면 기여분 전체를 뺍니다. 어드민도 같은 방식으로 증감합니다.
+    값이 어긋나면 rebuild_sales_summary 명령으로 원본 주문에서 다시 계산합니다.
+    """
+    
+    @staticmethod
+    def contribution_of(order_id) -> Optional[SalesContribution]:
+        """DB에 저장된 완료 주문의 기여분을 계산합니다. 완료 주문이 아니면 None을 반환합니다."""
+        order_date = OrderModel.objects.filter(pk=order_id, status='completed').values_list(
+            'order_date', flat=True
+        ).first()
+        if order_date is None:
+            return None
+        
+        contribution = SalesContribution(timezone.localdate(order_date), orders=1)
+        for line_model, counts_order in ((OrderItemModel, True), (MinusOrderItemModel, False)):
+            lines = line_model.objects.filter(order_id=order_id).values('food_id').annotate(
+                line_quantity=Sum('quantity'),
+                line_revenue=Sum(F('price') * F('quantity'), output_field=IntegerField()),
+            )
+            for line in lines:
+                contribution.add_line(line['food_id'], line['line_quantity'], line['line_revenue'], counts_order)
+        return contribution
+    
+    @staticmethod
+    def apply(contribution: Optional[SalesContribution], sign: int = 1) -> None:
+        """
+        기여분을 더하거나(sign=1) 뺍니다(sign=-1). 음식 수와 관계없이 쿼리 4번으로 처리합니다.
+        요약 행이 없으면 0으로 먼저 만든 뒤 F() 증감하므로 동시에 실행되어도 값이 유실되지 않습니다.
+        """
+        if contribution is None:
+            return
+        
+        SalesDailySummaryModel.objects.bulk_create([SalesDailySummaryModel(date=contribution.day)], ignore_conflicts=True)
+        SalesDailySummaryModel.objects.filter(date=contribution.day).update(
+            order_count=F('order_count') + sign * contribution.orders,
+            revenue=F('revenue') + sign * contribution.revenue,
+            updated_at=timezone.now(),
+        )
+        if not contribution.foods:
+            return
+        
+        def increments(index):
+            return Case(
+                *[When(food_id=food_id, then=Value(sign * values[index])) for food_id, values in contribution.foods.items()],
+                default=Value(0),
+                output_field=BigIntegerField(),
+            )
+        
+        SalesFoodSummaryModel.objects.bulk_create(
+            [SalesFoodSummaryModel(food_id=food_id) for food_id in contribution.foods], ignore_conflicts=True
+        )
+        SalesFoodSummaryModel.objects.filter(food_id__in=list(contribution.foods)).update(
+            quantity=F('quantity') + increments(0),
+            revenue=F('revenue') + increments(1),
+            order_count=F('order_count') + increments(2),
+            updated_at=timezone.now(),
+        )
+    
+    @classmethod
+    def add_order(cls, order_id) -> None:
+        cls.apply(cls.contribution_of(order_id))
+    
+    @classmethod
+    def remove_order(cls, order_id) -> None:
+        cls.apply(cls.contribution_of(order_id), sign=-1)
+    
+    @staticmethod
+    def compute_from_orders():
+        """
+        원본 주문에서 요약을 다시 계산합니다.
+        (일자 -> (주문 수, 매출), 음식 ID -> (수량, 주문 수, 매출)) 를 반환합니다.
+        """
+        completed = OrderModel.objects.filter(status='completed')
+        daily = {
+            row['day']: (row['order_count'], row['revenue'] or 0)
+            for row in completed.with_totals().annotate(day=TruncDate('order_date')).values('day').annotate(
+                order_count=Count('id'), revenue=Sum('effective_total')
+            ).order_by()
+        }
+        
+        foods: Dict[int, List[int]] = {}
+        item_rows = OrderItemModel.objects.filter(order__status='completed').values('food_id').annotate(
+            line_quantity=Sum('quantity'),
+            line_revenue=Sum(F('price') * F('quantity'), output_field=IntegerField()),
+            line_orders=Count('order_id', distinct=True),
+        ).order_by()
+        minus_rows = MinusOrderItemModel.objects.filter(order__status='completed').values('food_id').annotate(
+            line_quantity=Sum('quantity'),
+            line_revenue=Sum(F('price') * F('quantity'), output_field=IntegerField()),
+            line_orders=Value(0, output_field=IntegerField()),
+        ).order_by()
+        for row in [*item_rows, *minus_rows]:
+            food = foods.setdefault(row['food_id'], [0, 0, 0])
+            food[0] += row['line_quantity']
+            food[1] += row['line_orders']
+            food[2] += row['line_revenue']
+        return daily, {food_id: tuple(values) for food_id, values in foods.items()}
+    
+    @staticmethod
+    def stored():
+        """저장된 요약을 compute_from_orders와 같은 형태로 반환합니다. 0뿐인 행은 제외합니다."""
+        daily = {
+            row.date: (row.order_count, row.revenue)
+            for row in SalesDailySummaryModel.objects.all() if row.order_count or row.revenue
+        }
+        foods = {
+            row.food_id: (row.quantity, row.order_count, row.revenue)
+            for row in SalesFoodSummaryModel.objects.all() if row.quantity or row.order_count or row.revenue
+        }
+        return daily, foods
+    
+    @classmethod
+    def rebuild(cls) -> None:
+        """요약 테이블을 비우고 원본 주문에서 다시 채웁니다. 주문이 들어오지 않는 시간에 실행하세요."""
+        with transaction.atomic():
+            daily, foods = cls.compute_from_orders()
+            SalesDailySummaryModel.objects.all().delete()
+            SalesFoodSummaryModel.objects.all().delete()
+            SalesDailySummaryModel.objects.bulk_create([
+                SalesDailySummaryModel(date=day, order_count=order_count, revenue=revenue)
+                for day, (order_count, revenue) in daily.items()
+            ])
+            SalesFoodSummaryModel.objects.bulk_create([
+                SalesFoodSummaryModel(food_id=food_id, quantity=quantity, order_count=order_count, revenue=revenue)
+                for food_id, (quantity, order_count, revenue) in foods.items()
+            ])
+
+
+class SettlementSnapshotModel(models.Model):
+    """
+    축제 마감 정산 스냅샷. 어드민의 settlement 명령/정산 화면이 주문을 한 번 훑어 만든 결과를 그대로 저장하며,
+    만든 뒤에는 수정하지 않습니다. (다시 정산하면 새 스냅샷을 만듦)
+    """
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='생성일시')
+    created_by = models.CharField(max_length=150, blank=True, default='', verbose_name='생성자')
+    report = models.JSONField(verbose_name='정산 결과')
+    csv = models.TextField(verbose_name='정산 결과 CSV')
+    checksum = models.CharField(max_length=64, verbose_name='정산 결과 SHA-256')
+    
+    class Meta:
+        db_table = 'settlement_snapshots'
+        verbose_name = '정산 스냅샷'
+        verbose_name_plural = '정산 스냅샷'
+    
+    def __str__(self):
+        return f"정산 #{self.pk} ({self.created_at:%Y-%m-%d %H:%M})"
@@ -1,13 +1,28 @@
-from typing import List, Optional
+import copy
+import threading
+from datetime import timedelta
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Prefetch, Q, Sum
+from django.utils import timezone
 
 from domain.entities.food import Food, FoodCategory
 from domain.entities.table import Table
+from domain.entities.table_session import TableSession
 from domain.entities.order import Order, OrderItem, MinusOrderItem
+from domain.entities.payment import PaymentDeposit, PendingPreOrder
 from domain.repositories.food_repository import FoodRepository
 from domain.repositories.table_repository import TableRepository
-from domain.repositories.order_repository import OrderRepository
+from domain.repositories.order_repository import OrderRepository, OrderCursor, ORDER_RELATIONS
+from domain.repositories.notification_repository import NotificationRepository
+from domain.repositories.payment_repository import PaymentRepository
 
-from .models import FoodModel, TableModel, OrderModel, OrderItemModel, MinusOrderItemModel
+from .models import (
+    FoodModel, MenuVersionModel, TableModel, TableSessionModel, OrderModel, OrderItemModel, MinusOrderItemModel,
+    NotificationOutboxModel, OrderEventModel, PaymentDepositModel, PaymentMatchModel, SalesContribution, SalesSummary,
+)
 
 
 class DjangoFoodRepository(FoodRepository):
@@ -81,6 +96,51 @@ class DjangoFoodRepository(FoodRepository):
         )
 
 
+
+class CachedDjangoFoodRepository(DjangoFoodRepository):
+    """
+    메뉴 조회를 프로세스 로컬 스냅샷으로 처리하는 음식 Repository.
+    요청마다 menu_version 한 행만 확인하고, 버전이 바뀐 경우에만 foods 테이블을 다시 읽습니다.
+    menu_version은 백엔드와 어드민의 FoodModel 저장/삭제 시그널에서 올라갑니다.
+    (QuerySet.update()는 시그널이 발생하지 않으므로 MenuVersionModel.bump()를 직접 호출해야 합니다.)
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        # (stamp, 음식 스냅샷)을 한 번에 교체해 두 값이 어긋나지 않게 함
+        self._cached: Tuple[Optional[tuple], Tuple[Food, ...]] = (None, ())
+    
+    def get_all(self) -> List[Food]:
+        return [copy.copy(food) for food in self.get_menu_snapshot()[1]]
+    
+    def get_by_id(self, food_id: int) -> Optional[Food]:
+        for food in self.get_menu_snapshot()[1]:
+            if food.id == food_id:
+                return copy.copy(food)
+        return None
+    
+    def get_by_category(self, category: FoodCategory) -> List[Food]:
+        return [copy.copy(food) for food in self.get_menu_snapshot()[1] if food.category == category]
+    
+    def get_menu_snapshot(self) -> Tuple[Optional[tuple], Tuple[Food, ...]]:
+        """
+        (메뉴 버전, 음식 스냅샷)을 반환합니다. 스냅샷의 엔티티는 공유되므로 수정하면 안 됩니다.
+        버전을 읽을 수 없으면 버전은 None이며, 이 경우 스냅샷은 캐시되지 않습니다.
+        """
+        stamp = MenuVersionModel.stamp()
+        if stamp is None:
+            return None, tuple(super().get_all())
+        cached = self._cached
+        if stamp == cached[0]:
+            return cached
+        
+        with self._lock:
+            if stamp != self._cached[0]:
+                # 버전을 먼저 읽었으므로 그 사이 변경이 있어도 다음 요청에서 다시 갱신됨
+                self._cached = (stamp, tuple(super().get_all()))
+            return self._cached
+
+
 class DjangoTableRepository(TableRepository):
     def get_all(self) -> List[Table]:
         tables = TableModel.objects.all()
@@ -93,6 +153,9 @@ class DjangoTableRepository(TableRepository):
         except TableModel.DoesNotExist:
             return None
     
+    def count(self) -> int:
+        return TableModel.objects.count()
+    
     def create(self, table: Table) -> Table:
         table_model = TableModel(id=table.id, name=table.name)
         table_model.save()
@@ -106,6 +169,41 @@ class DjangoTableRepository(TableRepository):
         except TableModel.DoesNotExist:
             return False
     
+    def get_current_session(self, table_id: str) -> Optional[TableSession]:
+        session = TableSessionModel.objects.filter(table_id=table_id, ended_at__isnull=True).first()
+        return self._session_model_to_entity(session) if session else None
+    
+    def open_session(self, table_id: str) -> TableSession:
+        session = self.get_current_session(table_id)
+        if session:
+            return session
+        
+        # 동시에 첫 주문이 들어와도 세션이 하나만 열리도록 테이블 행을 잠급니다.
+        with transaction.atomic():
+            list(TableModel.objects.select_for_update().filter(id=table_id).values_list('id', flat=True))
+            session_model = TableSessionModel.objects.filter(table_id=table_id, ended_at__isnull=True).first()
+            if session_model is None:
+                session_model = TableSessionModel.objects.create(table_id=table_id)
+        return self._session_model_to_entity(session_model)
+    
+    def close_session(self, table_id: str) -> bool:
+        # 현재 세션 한 행만 종료하면 해당 세션의 주문들이 모두 숨김 처리됩니다.
+        updated_count = TableSessionModel.objects.filter(
+            table_id=table_id,
+            ended_at__isnull=True
+        ).update(ended_at=timezone.now())
+        if updated_count:
+            OrderEventModel.record(OrderEventModel.KIND_TABLE_CHECKOUT, table_id)
+        return updated_count > 0
+    
+    def _session_model_to_entity(self, session_model: TableSessionModel) -> TableSession:
+        return TableSession(
+            id=str(session_model.id),
+            table_id=str(session_model.table_id),
+            started_at=session_model.started_at,
+            ended_at=session_model.ended_at
+        )
+    
     def _model_to_entity(self, table_model: TableModel) -> Table:
         return Table(
             id=str(table_model.id),
@@ -116,71 +214,35 @@ class DjangoTableRepository(TableRepository):
 
 
 class DjangoOrderRepository(OrderRepository):
-    def get_all(self) -> List[Order]:
-        orders = OrderModel.objects.filter(is_visible=True)
-        return [order for order in [self._model_to_entity(order_model) for order_model in orders] if order is not None]
+    def get_all(self, after: Optional[OrderCursor] = None, limit: Optional[int] = None,
+                relations: Optional[FrozenSet[str]] = None) -> List[Order]:
+        relations = ORDER_RELATIONS if relations is None else relations
+        orders = self._paginate(self._order_queryset(relations).visible(), after, limit)
+        return self._models_to_entities(orders, relations)
     
     def get_by_id(self, order_id: str) -> Optional[Order]:
         try:
-            order = OrderModel.objects.get(id=order_id)
+            order = self._order_queryset().get(id=order_id)
             return self._model_to_entity(order)
         except OrderModel.DoesNotExist:
             return None
     
     def create(self, order: Order) -> Order:
-        # Get table model
-        table_model = TableModel.objects.get(id=order.table.id)
-        
-        order_model = OrderModel(
-            id=order.id,
-            table=table_model,
-            payer_name=order.payer_name,
-            status=order.status,
-            pre_order_amount=order.pre_order_amount,
-            order_date=order.order_date,
-            is_visible=order.is_visible
-        )
-        order_model.save()
+        # 주문에 포함된 음식 존재 여부를 한 번에 확인
+        food_ids = self._collect_food_ids(order)
+        existing_food_ids = set(FoodModel.objects.filter(id__in=food_ids).values_list('id', flat=True))
         
-        # Create order items
-        for item in order.items:
-            try:
-                food_model = FoodModel.objects.get(id=item.food.id)
-                OrderItemModel.objects.create(
-                    order=order_model,
-                    food=food_model,
-                    quantity=item.quantity,
-                    price=item.price
-                )
-            except FoodModel.DoesNotExist:
-                raise ValueError(f"Food with id {item.food.id} not found")
-        
-        # Create minus order items if they exist
-        if order.minus_items:
-            for minus_item in order.minus_items:
-                try:
-                    food_model = FoodModel.objects.get(id=minus_item.food.id)
-                    MinusOrderItemModel.objects.create(
-                        order=order_model,
-                        food=food_model,
-                        quantity=minus_item.quantity,
-                        price=minus_item.price,
-                        reason=minus_item.reason
-                    )
-                except FoodModel.DoesNotExist:
-                    raise ValueError(f"Food with id {minus_item.food.id} not found")
+        for food_id in food_ids:
+            if food_id not in existing_food_ids:
+                raise ValueError(f"Food with id {food_id} not found")
         
+        self._insert_order(order)
         return order
     
     def create_with_stock_validation(self, order: Order) -> Order:
         """재고 검증과 함께 주문을 생성합니다. (트랜잭션 내에서 호출되어야 함)"""
-        # Get table model
-        table_model = TableModel.objects.get(id=order.table.id)
-        
         # 주문할 음식들의 ID 수집
-        food_ids = [item.food.id for item in order.items]
-        if order.minus_items:
-            food_ids.extend([minus_item.food.id for minus_item in order.minus_items])
+        food_ids = self._collect_food_ids(order)
         
         # select_for_update로 음식들을 락하고 조회 (동시성 제어)
         food_models = FoodModel.objects.select_for_update().filter(id__in=food_ids)
@@ -199,52 +261,115 @@ class DjangoOrderRepository(OrderRepository):
         if sold_out_foods:
             raise ValueError(f"다음 음식들이 품절되었습니다: {', '.join(sold_out_foods)}")
         
-        # 주문 생성 (기존 create 로직 재사용)
+        if order.minus_items:
+            for minus_item in order.minus_items:
+                if minus_item.food.id not in food_dict:
+                    raise ValueError(f"Food with id {minus_item.food.id} not found")
+        
+        self._insert_order(order)
+        return order
+    
+    def _collect_food_ids(self, order: Order) -> List[int]:
+        food_ids = [item.food.id for item in order.items]
+        if order.minus_items:
+            food_ids.extend(minus_item.food.id for minus_item in order.minus_items)
+        return list(dict.fromkeys(food_ids))
+    
+    def _insert_order(self, order: Order) -> None:
+        """
+        주문 1건 INSERT 후 주문 아이템/차감 아이템을 테이블별 bulk INSERT 1회로 저장합니다.
+        FK는 id로 직접 지정하므로 테이블/음식 모델을 다시 조회하지 않습니다.
+        """
         order_model = OrderModel(
             id=order.id,
-            table=table_model,
+            table_id=order.table.id,
             payer_name=order.payer_name,
             status=order.status,
             pre_order_amount=order.pre_order_amount,
             order_date=order.order_date,
-            is_visible=order.is_visible
+            session_id=order.session_id
         )
-        order_model.save()
+        order_model.save(force_insert=True)
         
-        # Create order items
-        for item in order.items:
-            food_model = food_dict[item.food.id]
-            OrderItemModel.objects.create(
-                order=order_model,
-                food=food_model,
+        OrderItemModel.objects.bulk_create([
+            OrderItemModel(
+                order_id=order_model.id,
+                food_id=item.food.id,
                 quantity=item.quantity,
                 price=item.price
             )
+            for item in order.items
+        ])
         
-        # Create minus order items if they exist
         if order.minus_items:
-            for minus_item in order.minus_items:
-                food_model = food_dict[minus_item.food.id]
-                MinusOrderItemModel.objects.create(
-                    order=order_model,
-                    food=food_model,
+            MinusOrderItemModel.objects.bulk_create([
+                MinusOrderItemModel(
+                    order_id=order_model.id,
+                    food_id=minus_item.food.id,
                     quantity=minus_item.quantity,
                     price=minus_item.price,
                     reason=minus_item.reason
                 )
+                for minus_item in order.minus_items
+            ])
         
-        return order
+        # 바로 완료된 주문만 현황판/매출 요약에 반영 (선주문은 결제 완료 시)
+        if order.status == 'completed':
+            OrderEventModel.record(
+                OrderEventModel.KIND_ORDER_CREATED, order.table.id, session_id=order.session_id,
+                order_id=order.id, table_name=order.table.name, revenue=self._line_total(order), orders=1
+            )
+            SalesSummary.apply(self._sales_contribution(order))
+    
+    def _line_total(self, order: Order) -> int:
+        """방금 저장한 새 완료 주문이 매출에 반영되는 금액 (주문 아이템 + 차감 아이템)"""
+        return (
+            sum(item.total_price for item in order.items)
+            + sum(minus_item.total_price for minus_item in (order.minus_items or []))
+        )
+    
+    def _sales_contribution(self, order: Order) -> SalesContribution:
+        """
+        방금 저장한 새 주문 엔티티로 매출 요약 기여분을 계산합니다. (추가 조회 없음)
+        DB에서 읽은 엔티티는 items 수량에서 차감분이 이미 빠져 있으므로 여기에 쓰면 차감이 두 번 반영됩니다.
+        """
+        order_date = order.order_date
+        # naive 일시는 Django가 저장할 때처럼 현재 타임존 기준으로 봄
+        day = timezone.localdate(order_date) if timezone.is_aware(order_date) else order_date.date()
+        contribution = SalesContribution(day, orders=1)
+        for item in order.items:
+            contribution.add_line(item.food.id, item.quantity, item.total_price)
+        for minus_item in order.minus_items or []:
+            contribution.add_line(minus_item.food.id, minus_item.quantity, minus_item.total_price, counts_order=False)
+        return contribution
     
     def update(self, order: Order) -> Order:
         try:
-            order_model = OrderModel.objects.get(id=order.id)
-            order_model.table_id = order.table.id
-            order_model.order_date = order.order_date
-            order_model.status = order.status
-            order_model.payer_name = order.payer_name
-            order_model.pre_order_amount = order.pre_order_amount
-            order_model.is_visible = order.is_visible
-            order_model.save()
+            # 같은 주문이 동시에 완료 처리되어도 현황판/매출 요약에 한 번만 반영되도록 행을 잠금
+            with transaction.atomic():
+                order_model = OrderModel.objects.select_for_update().get(id=order.id)
+                previous_status = order_model.status
+                if previous_status == 'completed' and order.status != 'completed':
+                    SalesSummary.remove_order(order.id)
+                order_model.table_id = order.table.id
+                order_model.order_date = order.order_date
+                order_model.status = order.status
+                order_model.payer_name = order.payer_name
+                order_model.pre_order_amount = order.pre_order_amount
+                order_model.save()
+                
+                if previous_status == 'pre_order' and order.status == 'completed':
+                    # 완료된 주문의 매출은 저장된 주문 아이템 + 차감 아이템 합계 (어드민 완료 처리와 같은 값)
+                    revenue = OrderModel.objects.with_totals().filter(pk=order.id).values_list(
+                        'effective_total', flat=True
+                    ).get()
+                    OrderEventModel.record(
+                        OrderEventModel.KIND_PAYMENT_COMPLETED, order_model.table_id, session_id=order_model.session_id,
+                        order_id=order.id, table_name=order.table.name, revenue=revenue, orders=1
+                    )
+                if previous_status != 'completed' and order.status == 'completed':
+                    # 저장된 주문/차감 아이템에서 기여분을 계산 (어드민 완료 처리와 같은 방식)
+                    SalesSummary.add_order(order.id)
             return order
         except OrderModel.DoesNotExist:
             raise ValueError(f"Order with id {order.id} not found")
@@ -252,22 +377,54 @@ class DjangoOrderRepository(OrderRepository):
     def delete(self, order_id: str) -> bool:
         try:
             order = OrderModel.objects.get(id=order_id)
-            order.delete()
+            with transaction.atomic():
+                if order.status == 'completed':
+                    SalesSummary.remove_order(order.id)
+                order.delete()
             return True
         except OrderModel.DoesNotExist:
             return False
     
-    def get_by_table_id(self, table_id: str) -> List[Order]:
-        orders = OrderModel.objects.filter(table_id=table_id, is_visible=True)
-        return [order for order in [self._model_to_entity(order_model) for order_model in orders] if order is not None]
+    def get_by_table_id(self, table_id: str, after: Optional[OrderCursor] = None, limit: Optional[int] = None,
+                        include_pre_orders: bool = True, relations: Optional[FrozenSet[str]] = None) -> List[Order]:
+        relations = ORDER_RELATIONS if relations is None else relations
+        # 테이블의 현재 세션에 속한 주문만 조회
+        orders = self._order_queryset(relations).visible().filter(session__table_id=table_id)
+        if not include_pre_orders:
+            orders = orders.exclude(status='pre_order')
+        return self._models_to_entities(self._paginate(orders, after, limit), relations)
+    
+    def get_total_spent(self, table_id: Optional[str] = None) -> int:
+        # 페이지와 무관하게 전체 합계를 SUM 한 번으로 계산
+        orders = OrderModel.objects.visible().exclude(status='pre_order')
+        if table_id is not None:
+            orders = orders.filter(session__table_id=table_id)
+        result = orders.with_positive_total().aggregate(total=Sum('effective_total'))
+        return result['total'] or 0
+    
+    def exists_by_table_id(self, table_id: str) -> bool:
+        # 주문/아이템 행을 가져오지 않고 EXISTS 한 번으로 확인
+        return OrderModel.objects.visible().filter(session__table_id=table_id).with_positive_total().exists()
     
     def get_all_including_hidden_by_table_id(self, table_id: str) -> List[Order]:
-        orders = OrderModel.objects.filter(table_id=table_id)
-        return [order for order in [self._model_to_entity(order_model) for order_model in orders] if order is not None]
+        orders = self._order_queryset().filter(table_id=table_id)
+        return self._models_to_entities(orders)
     
     def get_all_including_hidden(self) -> List[Order]:
-        orders = OrderModel.objects.all()
-        return [order for order in [self._model_to_entity(order_model) for order_model in orders] if order is not None]
+        orders = self._order_queryset()
+        return self._models_to_entities(orders)
+    
+    def get_latest_pre_order_by_payment_info(self, payer_name: str, amount: int) -> Optional[Order]:
+        """
+        (status, payer_name, pre_order_amount, order_date) 복합 인덱스를 타고
+        가장 최근 pre-order 1건만 조회합니다.
+        """
+        order = self._order_queryset().filter(
+            status='pre_order',
+            payer_name=payer_name,
+            pre_order_amount=amount
+        ).order_by('-order_date').first()
+        return self._model_to_entity(order) if order else None
     
     def update_discord_notification_status(self, order_id: str, notified: bool) -> bool:
         try:
@@ -278,75 +435,131 @@ class DjangoOrderRepository(OrderRepository):
         except OrderModel.DoesNotExist:
             return False
     
-    def _model_to_entity(self, order_model: OrderModel) -> Order:
-        # Convert table directly from model to avoid circular dependency
-        table = Table(
-            id=str(order_model.table.id),
-            name=order_model.table.name,
-            created_at=order_model.table.created_at,
-            updated_at=order_model.table.updated_at
-        )
+    def _order_queryset(self, relations: FrozenSet[str] = ORDER_RELATIONS):
+        """
+        테이블은 JOIN으로, 주문 아이템/차감 아이템은 음식과 함께 관계별 1회씩 일괄 조회합니다.
+        주문 수와 관계없이 목록 조회 쿼리 수가 3개로 고정됩니다.
+        총액은 SQL에서 계산되며, 0원 이하인 주문은 DB에서 제외됩니다.
+        relations에 없는 관계는 조회하지 않습니다. 단, 아이템 수량은 차감 아이템을 반영해
+        계산하므로 items를 조회하면 minus_items도 함께 조회합니다.
+        """
+        prefetches = []
+        if 'items' in relations:
+            prefetches.append(Prefetch('items', queryset=OrderItemModel.objects.select_related('food')))
+        if 'items' in relations or 'minus_items' in relations:
+            prefetches.append(Prefetch('minus_items', queryset=MinusOrderItemModel.objects.select_related('food')))
+        return OrderModel.objects.with_positive_total().select_related('table', 'session').prefetch_related(*prefetches)
+    
+    def _paginate(self, queryset, after: Optional[OrderCursor], limit: Optional[int]):
+        """
+        (order_date, id) 키셋 페이지네이션을 적용합니다.
+        OFFSET을 쓰지 않으므로 뒤쪽 페이지도 orders_keyset_idx 범위 스캔으로 조회됩니다.
+        """
+        queryset = queryset.order_by('-order_date', '-id')
+        if after is not None:
+            order_date, order_id = after
+            queryset = queryset.filter(
+                Q(order_date__lt=order_date) | Q(order_date=order_date, id__lt=order_id)
+            )
+        if limit is not None:
+            queryset = queryset[:limit]
+        return queryset
+    
+    def _models_to_entities(self, order_models: Iterable[OrderModel],
+                            relations: FrozenSet[str] = ORDER_RELATIONS) -> List[Order]:
+        # 같은 조회 결과 안에서는 Table/Food 엔티티를 공유합니다.
+        table_cache: Dict[str, Table] = {}
+        food_cache: Dict[int, Food] = {}
+        return [
+            self._model_to_entity(order_model, table_cache, food_cache, relations)
+            for order_model in order_models
+        ]
+    
+    def _table_to_entity(self, table_model: TableModel, table_cache: Dict[str, Table]) -> Table:
+        table_id = str(table_model.id)
+        table = table_cache.get(table_id)
+        if table is None:
+            # Convert table directly from model to avoid circular dependency
+            table = Table(
+                id=table_id,
+                name=table_model.name,
+                created_at=table_model.created_at,
+                updated_at=table_model.updated_at
+            )
+            table_cache[table_id] = table
+        return table
+    
+    def _food_to_entity(self, food_model: FoodModel, food_cache: Dict[int, Food]) -> Food:
+        food = food_cache.get(food_model.id)
+        if food is None:
+            # Convert food directly from model to avoid circular dependency
+            food = Food(
+                id=food_model.id,
+                name=food_model.name,
+                price=food_model.price,
+                category=FoodCategory(food_model.category),
+                description=food_model.description,
+                image=food_model.image,
+                sold_out=food_model.sold_out
+            )
+            food_cache[food_model.id] = food
+        return food
+    
+    def _model_to_entity(self, order_model: OrderModel, table_cache: Optional[Dict[str, Table]] = None,
+                         food_cache: Optional[Dict[int, Food]] = None,
+                         relations: FrozenSet[str] = ORDER_RELATIONS) -> Order:
+        table_cache = {} if table_cache is None else table_cache
+        food_cache = {} if food_cache is None else food_cache
+        load_items = 'items' in relations
+        load_minus_items = load_items or 'minus_items' in relations
+        
+        table = self._table_to_entity(order_model.table, table_cache)
+        minus_item_models = list(order_model.minus_items.all()) if load_minus_items else []
+        item_models = order_model.items.all() if load_items else []
         
         # Convert order items, adjusting quantities based on minus order items
         items = []
         
         # Create a mapping of food_id to total minus quantity
         minus_quantities = {}
-        for minus_item in order_model.minus_items.all():
-            food_id = minus_item.food.id
+        for minus_item in minus_item_models:
+            food_id = minus_item.food_id
             # minus_item.quantity는 음수이므로 절댓값을 사용
             minus_quantities[food_id] = minus_quantities.get(food_id, 0) + abs(minus_item.quantity)
         
-        for item_model in order_model.items.all():
+        # 같은 음식이 여러 행이면 차감 수량을 앞 행부터 한 번만 나눠 뺌 (with_totals()의 items_total + minus_total과 같은 기준)
+        # 주문 수량보다 많이 차감된 나머지는 아이템에 나타나지 않지만 총액에서는 차감 금액 그대로 빠짐
+        for item_model in item_models:
             # Calculate the effective quantity after subtracting minus items
             original_quantity = item_model.quantity
-            minus_quantity = minus_quantities.get(item_model.food.id, 0)
+            minus_quantity = min(original_quantity, minus_quantities.get(item_model.food_id, 0))
+            minus_quantities[item_model.food_id] = minus_quantities.get(item_model.food_id, 0) - minus_quantity
             effective_quantity = original_quantity - minus_quantity
             
             # Only include the item if the effective quantity is positive
             if effective_quantity > 0:
-                # Convert food directly from model to avoid circular dependency
-                food = Food(
-                    id=item_model.food.id,
-                    name=item_model.food.name,
-                    price=item_model.food.price,
-                    category=FoodCategory(item_model.food.category),
-                    description=item_model.food.description,
-                    image=item_model.food.image,
-                    sold_out=item_model.food.sold_out
-                )
                 items.append(OrderItem(
-                    food=food,
+                    food=self._food_to_entity(item_model.food, food_cache),
                     quantity=effective_quantity,
                     price=item_model.price
                 ))
         
         # Convert minus order items
         minus_items = []
-        for minus_item_model in order_model.minus_items.all():
-            # Convert food directly from model to avoid circular dependency
-            food = Food(
-                id=minus_item_model.food.id,
-                name=minus_item_model.food.name,
-                price=minus_item_model.food.price,
-                category=FoodCategory(minus_item_model.food.category),
-                description=minus_item_model.food.description,
-                image=minus_item_model.food.image,
-                sold_out=minus_item_model.food.sold_out
-            )
+        for minus_item_model in (minus_item_models if 'minus_items' in relations else []):
             minus_items.append(MinusOrderItem(
-                food=food,
+                food=self._food_to_entity(minus_item_model.food, food_cache),
                 quantity=minus_item_model.quantity,
                 price=minus_item_model.price,
                 reason=minus_item_model.reason
             ))
         
-        # Calculate effective total amount after minus items adjustment
+        # 차감 후 총액은 with_totals()에서 SQL로 계산된 값을 사용
         effective_total = None
         if order_model.status != 'pre_order' or order_model.pre_order_amount is None:
-            effective_total = sum(item.total_price for item in items)
+            effective_total = order_model.effective_total
         
-        order = Order(
+        return Order(
             id=str(order_model.id),
             table=table,
             order_date=order_model.order_date,
@@ -357,11 +570,124 @@ class DjangoOrderRepository(OrderRepository):
             minus_items=minus_items if minus_items else None,
             is_visible=order_model.is_visible,
             discord_notified=order_model.discord_notified,
-            effective_total_amount=effective_total
+            effective_total_amount=effective_total,
+            session_id=str(order_model.session_id) if order_model.session_id else None
+        )
+
+
+class DjangoNotificationRepository(NotificationRepository):
+    def enqueue_payment_completion(self, order_id: str) -> bool:
+        # dedup_key unique 제약으로 동시 요청에서도 한 번만 기록
+        _, created = NotificationOutboxModel.objects.get_or_create(
+            dedup_key=f'{NotificationOutboxModel.KIND_PAYMENT_COMPLETED}:{order_id}',
+            defaults={
+                'kind': NotificationOutboxModel.KIND_PAYMENT_COMPLETED,
+                'order_id': order_id,
+            },
+        )
+        return created
+    
+    def enqueue_staff_call(self, table_id: str, table_name: str, message: str = '') -> int:
+        # 전송 대기 중인 호출은 dedup_key로 찾음 (디스패처가 가져갈 때 키를 지움)
+        dedup_key = f'{NotificationOutboxModel.KIND_STAFF_CALL}:{table_id}'
+        while True:
+            # 먼저 INSERT. 없는 키를 SELECT ... FOR UPDATE로 잠그면 MySQL이 갭 락을 잡아
+            # 같은 테이블의 첫 호출 두 개가 동시에 들어올 때 서로의 INSERT를 막아 교착됨
+            try:
+                with transaction.atomic():
+                    NotificationOutboxModel.objects.create(
+                        kind=NotificationOutboxModel.KIND_STAFF_CALL,
+                        dedup_key=dedup_key,
+                        table_id=str(table_id),
+                        payload={'table_id': str(table_id), 'table_name': table_name, 'message': message or '', 'count': 1},
+                        next_attempt_at=self._next_staff_call_at(table_id),
+                    )
+                return 1
+            except IntegrityError:
+                # 전송 대기 중인 호출이 이미 있음 -> 있는 행만 잠가 그 알림에 합침
+                pass
+            with transaction.atomic():
+                entry = NotificationOutboxModel.objects.select_for_update().filter(dedup_key=dedup_key).first()
+                if entry is None:
+                    # 그 사이 디스패처가 가져감 -> 새 알림으로 다시 기록
+                    continue
+                count = entry.payload.get('count', 1) + 1
+                entry.payload = {
+                    **entry.payload,
+                    'table_name': table_name,
+                    'message': message or entry.payload.get('message', ''),
+                    'count': count,
+                }
+                entry.save(update_fields=['payload'])
+                return count
+    
+    def _next_staff_call_at(self, table_id: str):
+        """
+        직전 직원호출 알림을 보낸 뒤 STAFF_CALL_COALESCE_SECONDS가 지나야 다음 알림을 보냅니다.
+        그 사이의 호출은 대기 중인 알림 하나에 합쳐집니다.
+        """
+        now = timezone.now()
+        # outbox_table_idx에서 이 테이블의 가장 최근 행만 읽음 (아웃박스 전체 크기와 무관)
+        previous = NotificationOutboxModel.objects.filter(
+            table_id=str(table_id), kind=NotificationOutboxModel.KIND_STAFF_CALL
+        ).order_by('-id').only('status', 'sent_at').first()
+        if previous is None or previous.status == NotificationOutboxModel.STATUS_FAILED:
+            return now
+        # 직전 알림이 전송 중(재시도 포함)이면 지금 보내진다고 보고 간격을 둠
+        sent_at = previous.sent_at or now
+        return max(now, sent_at + timedelta(seconds=settings.STAFF_CALL_COALESCE_SECONDS))
+
+
+class DjangoPaymentRepository(PaymentRepository):
+    def record_deposit(self, transaction_name: str, bank_account_number: str, amount: int, bank_code: str,
+                       bank_account_id: str, transaction_date, processing_date, balance: int) -> PaymentDeposit:
+        # 웹훅이 타임존 없는 시각을 보내면 현재 타임존으로 봄 (후보 정렬에서 주문 시각과 비교)
+        if timezone.is_naive(transaction_date):
+            transaction_date = timezone.make_aware(transaction_date)
+        if timezone.is_naive(processing_date):
+            processing_date = timezone.make_aware(processing_date)
+        deposit = PaymentDepositModel.objects.create(
+            transaction_name=transaction_name,
+            bank_account_number=bank_account_number,
+            amount=amount,
+            bank_code=bank_code,
+            bank_account_id=bank_account_id,
+            transaction_date=transaction_date,
+            processing_date=processing_date,
+            balance=balance,
+        )
+        return self._deposit_to_entity(deposit.id, deposit.transaction_name, deposit.amount, deposit.transaction_date)
+    
+    def get_pending_pre_orders(self) -> List[PendingPreOrder]:
+        # orders_pre_order_lookup_idx의 status 범위 스캔
+        rows = OrderModel.objects.filter(
+            status='pre_order', payer_name__isnull=False, pre_order_amount__isnull=False
+        ).order_by().values_list('id', 'payer_name', 'pre_order_amount', 'order_date')
+        return [
+            PendingPreOrder(order_id=str(order_id), payer_name=payer_name, amount=amount, order_date=order_date)
+            for order_id, payer_name, amount, order_date in rows
+        ]
+    
+    def get_unmatched_deposits(self, limit: Optional[int] = None) -> List[PaymentDeposit]:
+        # deposits_keyset_idx 순서로 읽으며 payment_matches.deposit_id unique 인덱스로 anti-join
+        deposits = PaymentDepositModel.objects.filter(amount__gt=0, match__isnull=True).order_by(
+            'transaction_date', 'id'
+        ).values_list('id', 'transaction_name', 'amount', 'transaction_date')
+        if limit is not None:
+            deposits = deposits[:limit]
+        return [self._deposit_to_entity(*row) for row in deposits]
+    
+    def link(self, deposit_id: str, order_id: str, method: str, score: Optional[int] = None) -> bool:
+        # deposit/order unique 제약으로 동시 매칭에서도 한 번만 기록
+        try:
+            with transaction.atomic():
+                PaymentMatchModel.objects.create(deposit_id=deposit_id, order_id=order_id, method=method, score=score)
+            return True
+        except IntegrityError:
+            return False
+    
+    @staticmethod
+    def _deposit_to_entity(deposit_id, transaction_name, amount, transaction_date) -> PaymentDeposit:
+        return PaymentDeposit(
+            id=str(deposit_id), transaction_name=transaction_name, amount=amount, transaction_date=transaction_date
         )
-        
-        # 총액이 0원인 주문은 None 반환 (API에서 제외)
-        if order.total_amount <= 0:
-            return None
-            
-        return order
\ No newline at end of file
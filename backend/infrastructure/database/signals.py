@@ -0,0 +1,33 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import FoodModel, MenuVersionModel, OrderEventModel, OrderModel
+
+
+@receiver(post_save, sender=FoodModel)
+@receiver(post_delete, sender=FoodModel)
+def bump_menu_version(sender, **kwargs):
+    """음식이 저장/삭제되면 메뉴 버전을 올려 워커들의 메뉴 캐시를 무효화합니다."""
+    MenuVersionModel.bump()
+
+
+@receiver(post_save, sender=OrderModel)
+def publish_payment_completed(sender, instance, **kwargs):
+    """주문이 completed로 저장되면 커밋 후 결제 상태 스트림을 깨웁니다."""
+    if instance.status != 'completed':
+        return
+    from infrastructure.events.payment_events import payment_event_broker
+    
+    order_id = str(instance.id)
+    transaction.on_commit(lambda: payment_event_broker.publish(order_id))
+
+
+@receiver(post_save, sender=OrderEventModel)
+def notify_order_event(sender, created, **kwargs):
+    """주문 이벤트가 기록되면 커밋 후 이 프로세스의 현황판 스트림이 확인 주기를 기다리지 않도록 깨웁니다."""
+    if not created:
+        return
+    from infrastructure.events.order_events import order_event_feed
+    
+    transaction.on_commit(order_event_feed.notify)
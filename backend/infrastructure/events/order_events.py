@@ -0,0 +1,195 @@
+"""
+관리자 주문 현황판 이벤트 피드.
+
+OrderEventModel(order_events)에 기록된 이벤트를 피드에 들어온 순서대로 스트림(order_events SSE)에 전달합니다.
+
+- 이벤트 루프마다 하나의 태스크가 poll_interval초마다 새 이벤트를 쿼리 한 번으로 가져와 최근 이벤트 버퍼에
+  쌓고, 기다리는 스트림을 모두 깨웁니다. 스트림 수와 관계없이 주기마다 쿼리는 하나입니다.
+- 같은 프로세스에서 기록된 이벤트는 커밋 직후 notify로 확인 주기를 기다리지 않고 바로 가져옵니다.
+- id는 INSERT 때 정해지고 보이는 건 커밋 후라, 작은 id가 큰 id보다 늦게 커밋될 수 있습니다.
+  읽은 가장 큰 id 아래의 빈 id는 gap_timeout초 동안 다음 조회에서 함께 다시 읽고, 이미 받은 id는 버립니다.
+  그래서 버퍼는 id 순서가 아니라 도착 순서이며, 스트림은 마지막으로 받은 이벤트 뒤에 도착한 이벤트를 이어 받습니다.
+- 재연결한 스트림의 마지막 이벤트 ID가 버퍼보다 오래되었으면 그 스트림만 DB에서 직접 읽습니다.
+"""
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections
+from django.db.models import Q
+
+from infrastructure.database.models import OrderEventModel
+
+logger = logging.getLogger(__name__)
+
+
+def serialize_event(event: OrderEventModel) -> dict:
+    return {
+        'id': event.id,
+        'kind': event.kind,
+        'data': {
+            'table_id': str(event.table_id),
+            'order_id': str(event.order_id) if event.order_id else None,
+            **event.payload,
+            'created_at': event.created_at.isoformat(),
+        },
+    }
+
+
+class OrderEventSubscription:
+    """한 스트림의 대기 상태. 새 이벤트가 버퍼에 들어오면 구독한 이벤트 루프에서 wakeup이 설정됩니다."""
+    
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.wakeup = asyncio.Event()
+
+
+class OrderEventFeed:
+    def __init__(self, poll_interval: float = 1.0, buffer_size: int = 500, batch_size: int = 500,
+                 gap_timeout: float = 10.0):
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+        self.gap_timeout = gap_timeout
+        self._lock = threading.Lock()
+        # 도착 순서의 최근 이벤트와 이벤트 id -> 도착 순번
+        self._buffer: deque = deque(maxlen=buffer_size)
+        self._positions: Dict[int, int] = {}
+        self._next_position = 0
+        # 버퍼는 (_covered_after, _last_id] 구간에서 커밋된 이벤트를 모두 담음. 첫 조회 전에는 None
+        self._covered_after: Optional[int] = None
+        self._last_id: Optional[int] = None
+        # _last_id 아래에서 아직 보이지 않은 id -> 다시 읽기를 그만둘 시각 (커밋 전이거나 롤백된 id)
+        self._gaps: Dict[int, float] = {}
+        self._subscriptions: Set[OrderEventSubscription] = set()
+        # 이벤트 루프 -> (DB 확인 태스크, 즉시 확인 요청)
+        self._pollers: Dict[asyncio.AbstractEventLoop, tuple] = {}
+    
+    def subscribe(self) -> OrderEventSubscription:
+        loop = asyncio.get_running_loop()
+        subscription = OrderEventSubscription(loop)
+        with self._lock:
+            self._subscriptions.add(subscription)
+            # 종료된 이벤트 루프의 태스크는 정리
+            self._pollers = {
+                poller_loop: poller for poller_loop, poller in self._pollers.items() if not poller[0].done()
+            }
+            if loop not in self._pollers:
+                kick = asyncio.Event()
+                self._pollers[loop] = (loop.create_task(self._poll(loop, kick)), kick)
+        return subscription
+    
+    def unsubscribe(self, subscription: OrderEventSubscription) -> None:
+        with self._lock:
+            self._subscriptions.discard(subscription)
+    
+    def notify(self) -> None:
+        """새 이벤트가 기록되었음을 알립니다. 어느 스레드에서든 호출할 수 있습니다."""
+        with self._lock:
+            pollers = list(self._pollers.items())
+        for loop, (_, kick) in pollers:
+            try:
+                loop.call_soon_threadsafe(kick.set)
+            except RuntimeError:
+                # 이벤트 루프가 이미 종료됨
+                pass
+    
+    async def events_after(self, last_event_id: int) -> List[dict]:
+        """
+        last_event_id 이벤트 뒤에 도착한 이벤트를 도착 순서대로 반환합니다.
+        버퍼에 없는 id면 그보다 큰 id의 이벤트를 id 순서대로 반환합니다.
+        """
+        with self._lock:
+            position = self._positions.get(last_event_id)
+            if position is not None:
+                return [event for event in self._buffer if self._positions[event['id']] > position]
+            if self._covered_after is not None and last_event_id >= self._covered_after:
+                return [event for event in self._buffer if event['id'] > last_event_id]
+        return await sync_to_async(self._fetch)(last_event_id)
+    
+    async def latest_id(self) -> int:
+        with self._lock:
+            if self._last_id is not None:
+                return self._last_id
+        return await sync_to_async(self._fetch_latest_id)()
+    
+    async def _poll(self, loop: asyncio.AbstractEventLoop, kick: asyncio.Event) -> None:
+        # 이 루프에 기다리는 스트림이 남아 있는 동안만 실행. 시작하자마자 버퍼 기준점을 잡음
+        while True:
+            with self._lock:
+                subscriptions = [subscription for subscription in self._subscriptions if subscription.loop is loop]
+                if not subscriptions:
+                    self._pollers.pop(loop, None)
+                    return
+                last_id = self._last_id
+                gaps = self._open_gaps()
+            try:
+                if last_id is None:
+                    self._start_buffer(await sync_to_async(self._fetch_latest_id)())
+                else:
+                    events = await sync_to_async(self._fetch)(last_id, gaps)
+                    if events:
+                        self._append(events)
+                        for subscription in subscriptions:
+                            subscription.wakeup.set()
+            except Exception:
+                logger.exception("주문 이벤트 조회 중 오류")
+            try:
+                await asyncio.wait_for(kick.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            kick.clear()
+    
+    def _start_buffer(self, latest_id: int) -> None:
+        with self._lock:
+            if self._last_id is None:
+                self._covered_after = self._last_id = latest_id
+    
+    def _open_gaps(self) -> List[int]:
+        # 호출하는 쪽에서 _lock을 잡고 있어야 함. gap_timeout이 지난 id는 롤백 등으로 영영 없다고 봄
+        now = time.monotonic()
+        self._gaps = {event_id: until for event_id, until in self._gaps.items() if until > now}
+        return list(self._gaps)
+    
+    def _append(self, events: List[dict]) -> None:
+        until = time.monotonic() + self.gap_timeout
+        with self._lock:
+            for event in events:
+                event_id = event['id']
+                if event_id > self._last_id:
+                    # 건너뛴 id는 늦게 커밋될 수 있으므로 다시 읽을 대상으로 둠 (한 번에 batch_size개까지)
+                    for missing_id in range(max(self._last_id + 1, event_id - self.batch_size), event_id):
+                        self._gaps[missing_id] = until
+                    self._last_id = event_id
+                elif self._gaps.pop(event_id, None) is None:
+                    # 이미 받은 이벤트
+                    continue
+                if len(self._buffer) == self._buffer.maxlen:
+                    evicted_id = self._buffer.popleft()['id']
+                    del self._positions[evicted_id]
+                    self._covered_after = max(self._covered_after, evicted_id)
+                self._buffer.append(event)
+                self._positions[event_id] = self._next_position
+                self._next_position += 1
+    
+    def _fetch(self, last_event_id: int, gaps: Iterable[int] = ()) -> List[dict]:
+        # 요청 밖에서도 실행되므로 오래된 DB 연결을 직접 정리
+        close_old_connections()
+        condition = Q(id__gt=last_event_id)
+        if gaps:
+            condition |= Q(id__in=gaps)
+        events = OrderEventModel.objects.filter(condition).order_by('id')[:self.batch_size]
+        return [serialize_event(event) for event in events]
+    
+    @staticmethod
+    def _fetch_latest_id() -> int:
+        close_old_connections()
+        return OrderEventModel.objects.order_by('-id').values_list('id', flat=True).first() or 0
+
+
+# 프로세스 공용 인스턴스
+order_event_feed = OrderEventFeed(poll_interval=settings.ORDER_EVENTS_POLL_INTERVAL)
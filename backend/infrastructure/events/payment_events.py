@@ -0,0 +1,123 @@
+"""
+결제 완료 이벤트 브로커.
+
+SSE 스트림(payment_status_events)이 주문별로 결제 완료를 기다리고, 주문이 completed로 저장되면
+(infrastructure.database.signals) 커밋 직후 publish로 기다리는 스트림을 바로 깨웁니다.
+
+- 프로세스 내 pub/sub: 웹훅 요청을 처리한 프로세스에서 기다리는 스트림은 커밋 즉시 깨어납니다.
+- DB 폴백: 다른 워커/프로세스(관리자 앱 포함)에서 결제가 완료된 경우를 위해, 기다리는 스트림이 있는 동안
+  이벤트 루프마다 하나의 태스크가 poll_interval초마다 기다리는 주문 전체를 쿼리 한 번으로 확인합니다.
+  클라이언트 수와 관계없이 프로세스당 주기마다 가벼운 쿼리 하나만 실행됩니다. (MySQL에는 LISTEN/NOTIFY가 없음)
+
+publish는 어느 스레드에서 호출해도 되며, 기다리는 쪽은 asyncio 코루틴입니다.
+"""
+import asyncio
+import logging
+import threading
+from typing import Dict, Iterable, Optional, Set
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections
+
+from infrastructure.database.models import OrderModel
+
+logger = logging.getLogger(__name__)
+
+
+class PaymentSubscription:
+    """한 스트림이 기다리는 주문. future는 구독한 이벤트 루프에서 결제 완료 시 완료됩니다."""
+    
+    def __init__(self, order_id: str, loop: asyncio.AbstractEventLoop):
+        self.order_id = order_id
+        self.loop = loop
+        self.future: asyncio.Future = loop.create_future()
+    
+    def _resolve(self, status: str) -> None:
+        if not self.future.done():
+            self.future.set_result(status)
+
+
+class PaymentEventBroker:
+    def __init__(self, poll_interval: float = 1.0):
+        self.poll_interval = poll_interval
+        self._lock = threading.Lock()
+        # 주문 ID -> 기다리는 구독
+        self._subscriptions: Dict[str, Set[PaymentSubscription]] = {}
+        # 이벤트 루프 -> DB 폴백 태스크
+        self._pollers: Dict[asyncio.AbstractEventLoop, asyncio.Task] = {}
+    
+    def subscribe(self, order_id: str) -> PaymentSubscription:
+        """실행 중인 이벤트 루프에서 주문의 결제 완료를 기다리는 구독을 만듭니다."""
+        subscription = PaymentSubscription(str(order_id), asyncio.get_running_loop())
+        with self._lock:
+            self._subscriptions.setdefault(subscription.order_id, set()).add(subscription)
+            # 종료된 이벤트 루프의 태스크는 정리
+            self._pollers = {loop: poller for loop, poller in self._pollers.items() if not poller.done()}
+            if subscription.loop not in self._pollers:
+                self._pollers[subscription.loop] = subscription.loop.create_task(self._poll(subscription.loop))
+        return subscription
+    
+    def unsubscribe(self, subscription: PaymentSubscription) -> None:
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.order_id)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[subscription.order_id]
+    
+    def publish(self, order_id: str, status: str = 'completed') -> int:
+        """주문을 기다리는 구독을 모두 깨우고 그 수를 반환합니다. 어느 스레드에서든 호출할 수 있습니다."""
+        with self._lock:
+            subscriptions = self._subscriptions.pop(str(order_id), set())
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription._resolve, status)
+            except RuntimeError:
+                # 구독한 이벤트 루프가 이미 종료됨
+                pass
+        return len(subscriptions)
+    
+    @property
+    def waiting_order_ids(self) -> Set[str]:
+        with self._lock:
+            return set(self._subscriptions)
+    
+    async def _poll(self, loop: asyncio.AbstractEventLoop) -> None:
+        # 이 루프에 기다리는 구독이 남아 있는 동안만 실행
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            with self._lock:
+                order_ids = {
+                    order_id for order_id, subscriptions in self._subscriptions.items()
+                    if any(subscription.loop is loop for subscription in subscriptions)
+                }
+                if not order_ids:
+                    self._pollers.pop(loop, None)
+                    return
+            try:
+                completed_ids = await sync_to_async(self._completed_order_ids)(order_ids)
+            except Exception:
+                logger.exception("결제 완료 주문 확인 중 오류")
+                continue
+            for order_id in completed_ids:
+                self.publish(order_id)
+    
+    @staticmethod
+    def _completed_order_ids(order_ids: Iterable[str]) -> Set[str]:
+        # 요청 밖에서 실행되므로 오래된 DB 연결을 직접 정리
+        close_old_connections()
+        return {
+            str(order_id) for order_id in OrderModel.objects.filter(
+                id__in=list(order_ids), status='completed'
+            ).values_list('id', flat=True)
+        }
+
+
+# 프로세스 공용 인스턴스
+payment_event_broker = PaymentEventBroker(poll_interval=settings.PAYMENT_EVENTS_POLL_INTERVAL)
+
+
+def get_payment_status(order_id: str) -> Optional[str]:
+    """주문 상태만 조회합니다. 주문이 없으면 None을 반환합니다."""
+    return OrderModel.objects.filter(id=order_id).values_list('status', flat=True).first()
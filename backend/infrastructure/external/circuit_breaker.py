@@ -0,0 +1,71 @@
+"""
+외부 호출용 서킷 브레이커.
+
+연속으로 failure_threshold번 실패(타임아웃, 네트워크 오류, 5xx)하면 회로를 열고 reset_timeout초 동안
+호출을 시도하지 않습니다. 시간이 지나면 한 번만 시험 호출을 허용하고(half-open), 성공하면 닫고
+실패하면 다시 reset_timeout초 동안 엽니다.
+"""
+import threading
+import time
+from typing import Callable
+
+
+class CircuitBreaker:
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+    
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        # half-open 상태에서 시험 호출이 진행 중인지 여부
+        self._probing = False
+    
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._refresh()
+            return self._state
+    
+    def allow_request(self) -> bool:
+        """호출해도 되면 True를 반환합니다. half-open이면 시험 호출 하나만 허용합니다."""
+        with self._lock:
+            self._refresh()
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            return False
+    
+    def retry_after(self) -> float:
+        """회로가 열려 있으면 시험 호출이 가능해질 때까지 남은 시간(초)을 반환합니다."""
+        with self._lock:
+            if self._state != self.OPEN:
+                return 0.0
+            return max(self._opened_at + self.reset_timeout - self._clock(), 0.0)
+    
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probing = False
+    
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+                self._probing = False
+    
+    def _refresh(self) -> None:
+        if self._state == self.OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+            self._state = self.HALF_OPEN
+            self._probing = False
@@ -4,18 +4,186 @@ from datetime import datetime
 from django.conf import settings
 import logging
 
+from .notification_client import NotificationHttpClient, notification_client
+
 logger = logging.getLogger(__name__)
 
 
 class DiscordNotificationService:
     """Discord webhook을 통한 알림 서비스"""
     
-    def __init__(self):
+    PAYMENT_USERNAME = "주문알리미"
+    STAFF_CALL_USERNAME = "직원호출 알리미"
+    # Discord 웹훅 메시지 하나에 담을 수 있는 임베드 수와 임베드 전체 글자 수 제한
+    MAX_EMBEDS_PER_MESSAGE = 10
+    MAX_EMBED_CHARS_PER_MESSAGE = 6000
+    
+    def __init__(self, client: NotificationHttpClient = None):
         self.webhook_url = settings.DISCORD_WEBHOOK_URL
+        # keep-alive 커넥션 풀을 공유하는 HTTP 클라이언트
+        self.client = client or notification_client
+    
+    def build_payment_completion_embed(self, order_id: str, payer_name: str, total_amount: int, table_name: str = None, order_items: list = None, timestamp: datetime = None) -> dict:
+        """
+        결제 완료 알림 임베드를 만듭니다.
+        
+        Args:
+            order_id: 주문 ID
+            payer_name: 결제자 이름
+            total_amount: 결제 금액
+            table_name: 테이블 이름 (선택적)
+            order_items: 주문 아이템 목록 (선택적)
+            timestamp: 임베드에 표시할 시각 (기본값: 현재 시각)
+        
+        Returns:
+            dict: Discord 임베드
+        """
+        # 임베드 메시지 생성
+        embed = {
+            "title": "🎉 결제 완료 알림",
+            "description": f"새로운 주문이 결제 완료되었습니다!",
+            "color": 0x00ff00,  # 녹색
+            "fields": [
+                {
+                    "name": "주문 번호",
+                    "value": f"`{order_id}`",
+                    "inline": True
+                },
+                {
+                    "name": "결제자",
+                    "value": payer_name or "알 수 없음",
+                    "inline": True
+                },
+                {
+                    "name": "결제 금액",
+                    "value": f"{total_amount:,}원",
+                    "inline": True
+                }
+            ],
+            "timestamp": (timestamp or datetime.now()).isoformat(),
+            "footer": {
+                "text": "숭실대축제 주문 시스템"
+            }
+        }
+        
+        # 테이블 정보가 있으면 추가
+        if table_name:
+            embed["fields"].insert(2, {
+                "name": "테이블",
+                "value": table_name,
+                "inline": True
+            })
+        
+        # 주문 메뉴 정보가 있으면 추가
+        if order_items:
+            menu_text = ""
+            for item in order_items:
+                menu_text += f"• {item['name']} x{item['quantity']} ({item['price']:,}원)\n"
+            
+            embed["fields"].append({
+                "name": "주문 메뉴",
+                "value": menu_text.strip(),
+                "inline": False
+            })
+        
+        return embed
+    
+    def build_payment_completion_payload(self, order_id: str, payer_name: str, total_amount: int, table_name: str = None, order_items: list = None) -> dict:
+        """결제 완료 알림 웹훅 요청 본문을 만듭니다."""
+        embed = self.build_payment_completion_embed(order_id, payer_name, total_amount, table_name, order_items)
+        return self.build_batch_payload([embed], self.PAYMENT_USERNAME)
+    
+    def build_staff_call_embed(self, table_id: str, message: str = None, timestamp: datetime = None,
+                               call_count: int = 1) -> dict:
+        """
+        직원호출 알림 임베드를 만듭니다.
+        
+        Args:
+            table_id: 테이블 이름 또는 ID
+            message: 고객 메시지 (선택적)
+            timestamp: 임베드에 표시할 시각 (기본값: 현재 시각)
+            call_count: 하나로 합쳐진 호출 횟수
+        
+        Returns:
+            dict: Discord 임베드
+        """
+        # 기본 메시지 구성
+        if call_count > 1:
+            notification_message = f"{table_id}에서 직원을 {call_count}번 호출하였습니다!"
+        else:
+            notification_message = f"{table_id}에서 직원을 호출하였습니다!"
+        if message:
+            notification_message += f" 메시지: {message}"
+        
+        embed = {
+            "title": "🔔 직원 호출",
+            "description": notification_message,
+            "color": 0xff9900,  # 주황색
+            "fields": [
+                {
+                    "name": "테이블",
+                    "value": f"{table_id}",
+                    "inline": True
+                }
+            ],
+            "timestamp": (timestamp or datetime.now()).isoformat(),
+            "footer": {
+                "text": "숭실대축제 주문 시스템"
+            }
+        }
+        
+        if call_count > 1:
+            embed["fields"].append({
+                "name": "호출 횟수",
+                "value": f"{call_count}회",
+                "inline": True
+            })
+        
+        if message:
+            embed["fields"].append({
+                "name": "고객 메시지",
+                "value": message,
+                "inline": False
+            })
+        
+        return embed
+    
+    def build_batch_payload(self, embeds: list, username: str) -> dict:
+        """
+        여러 임베드를 웹훅 요청 하나로 묶습니다. (최대 MAX_EMBEDS_PER_MESSAGE개)
+        Discord는 임베드 순서대로 표시합니다.
+        """
+        if len(embeds) > self.MAX_EMBEDS_PER_MESSAGE:
+            raise ValueError(f"Discord 메시지 하나에는 임베드를 {self.MAX_EMBEDS_PER_MESSAGE}개까지 담을 수 있습니다.")
+        return {
+            "embeds": embeds,
+            "username": username
+        }
+    
+    @staticmethod
+    def embed_size(embed: dict) -> int:
+        """Discord 글자 수 제한에 포함되는 임베드 글자 수 (title, description, field, footer, author)"""
+        size = len(embed.get("title", "")) + len(embed.get("description", ""))
+        for field in embed.get("fields", []):
+            size += len(field.get("name", "")) + len(field.get("value", ""))
+        size += len(embed.get("footer", {}).get("text", ""))
+        size += len(embed.get("author", {}).get("name", ""))
+        return size
+    
+    def post_payload(self, webhook_url: str, payload: dict) -> requests.Response:
+        """
+        웹훅 요청 본문을 그대로 전송하고 응답을 반환합니다.
+        상태 코드 해석(429 재시도 등)은 호출자가 담당하며, 네트워크 오류는 RequestException으로 전달됩니다.
+        """
+        return self.client.post(
+            webhook_url,
+            json=payload
+        )
     
     def send_payment_completion_notification(self, order_id: str, payer_name: str, total_amount: int, table_name: str = None, order_items: list = None) -> bool:
         """
         결제 완료 알림을 Discord로 전송합니다.
+        요청 처리 중에는 호출하지 말고 아웃박스(NotificationRepository)에 기록하세요.
         
         Args:
             order_id: 주문 ID
@@ -32,64 +200,8 @@ class DiscordNotificationService:
             return False
         
         try:
-            # 임베드 메시지 생성
-            embed = {
-                "title": "🎉 결제 완료 알림",
-                "description": f"새로운 주문이 결제 완료되었습니다!",
-                "color": 0x00ff00,  # 녹색
-                "fields": [
-                    {
-                        "name": "주문 번호",
-                        "value": f"`{order_id}`",
-                        "inline": True
-                    },
-                    {
-                        "name": "결제자",
-                        "value": payer_name or "알 수 없음",
-                        "inline": True
-                    },
-                    {
-                        "name": "결제 금액",
-                        "value": f"{total_amount:,}원",
-                        "inline": True
-                    }
-                ],
-                "timestamp": datetime.now().isoformat(),
-                "footer": {
-                    "text": "숭실대축제 주문 시스템"
-                }
-            }
-            
-            # 테이블 정보가 있으면 추가
-            if table_name:
-                embed["fields"].insert(2, {
-                    "name": "테이블",
-                    "value": table_name,
-                    "inline": True
-                })
-            
-            # 주문 메뉴 정보가 있으면 추가
-            if order_items:
-                menu_text = ""
-                for item in order_items:
-                    menu_text += f"• {item['name']} x{item['quantity']} ({item['price']:,}원)\n"
-                
-                embed["fields"].append({
-                    "name": "주문 메뉴",
-                    "value": menu_text.strip(),
-                    "inline": False
-                })
-            
-            payload = {
-                "embeds": [embed],
-                "username": "주문알리미"
-            }
-            
-            response = requests.post(
-                self.webhook_url,
-                json=payload,
-                timeout=10
-            )
+            payload = self.build_payment_completion_payload(order_id, payer_name, total_amount, table_name, order_items)
+            response = self.post_payload(self.webhook_url, payload)
             
             if response.status_code == 204:
                 logger.info(f"Discord 알림 전송 성공: 주문 {order_id}")
@@ -121,44 +233,13 @@ class DiscordNotificationService:
             return False
         
         try:
-            # 기본 메시지 구성
-            notification_message = f"{table_id}에서 직원을 호출하였습니다!"
-            if message:
-                notification_message += f" 메시지: {message}"
-            
-            embed = {
-                "title": "🔔 직원 호출",
-                "description": notification_message,
-                "color": 0xff9900,  # 주황색
-                "fields": [
-                    {
-                        "name": "테이블",
-                        "value": f"{table_id}",
-                        "inline": True
-                    }
-                ],
-                "timestamp": datetime.now().isoformat(),
-                "footer": {
-                    "text": "숭실대축제 주문 시스템"
-                }
-            }
-            
-            if message:
-                embed["fields"].append({
-                    "name": "고객 메시지",
-                    "value": message,
-                    "inline": False
-                })
-            
-            payload = {
-                "embeds": [embed],
-                "username": "직원호출 알리미"
-            }
+            payload = self.build_batch_payload(
+                [self.build_staff_call_embed(table_id, message)], self.STAFF_CALL_USERNAME
+            )
             
-            response = requests.post(
+            response = self.client.post(
                 settings.DISCORD_CALL_WEBHOOK_URL,
-                json=payload,
-                timeout=10
+                json=payload
             )
             
             if response.status_code == 204:
@@ -207,10 +288,9 @@ class DiscordNotificationService:
                 "username": "축제 알림 봇"
             }
             
-            response = requests.post(
+            response = self.client.post(
                 self.webhook_url,
-                json=payload,
-                timeout=10
+                json=payload
             )
             
             if response.status_code == 204:
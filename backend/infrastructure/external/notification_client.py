@@ -0,0 +1,118 @@
+"""
+웹훅 전송용 HTTP 클라이언트.
+
+알림마다 requests.post로 새 TCP/TLS 연결을 맺지 않도록 프로세스당 하나의 requests.Session을 두고
+keep-alive 커넥션 풀을 재사용합니다. 연결 타임아웃과 응답 대기 타임아웃은 따로 설정하며,
+새로 맺은 연결 수(핸드셰이크 수)와 요청 지연 시간을 metrics로 제공합니다.
+
+커넥션은 첫 요청 때 만들어지므로 gunicorn preload_app으로 fork되기 전에 소켓이 공유되지 않습니다.
+"""
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+class HttpClientMetrics:
+    """요청 수, 네트워크 오류 수, 새 연결 수, 최근 요청 지연 시간(초)을 스레드 안전하게 집계합니다."""
+    
+    def __init__(self, latency_window: int = 1000):
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=latency_window)
+        self.requests = 0
+        self.errors = 0
+        self.connections_opened = 0
+    
+    def record_connection(self) -> None:
+        with self._lock:
+            self.connections_opened += 1
+    
+    def record_request(self, seconds: float, failed: bool = False) -> None:
+        with self._lock:
+            self.requests += 1
+            if failed:
+                self.errors += 1
+            self._latencies.append(seconds)
+    
+    def snapshot(self) -> dict:
+        """현재 지표를 dict로 반환합니다. 지연 시간은 최근 요청 기준 밀리초입니다."""
+        with self._lock:
+            latencies = sorted(self._latencies)
+            data = {
+                'requests': self.requests,
+                'errors': self.errors,
+                'connections_opened': self.connections_opened,
+            }
+        if latencies:
+            data['latency_ms'] = {
+                'avg': round(sum(latencies) / len(latencies) * 1000, 2),
+                'p50': round(latencies[len(latencies) // 2] * 1000, 2),
+                'p95': round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] * 1000, 2),
+                'max': round(latencies[-1] * 1000, 2),
+            }
+        return data
+
+
+def _metered_pool_class(base_class, metrics: HttpClientMetrics):
+    class MeteredConnectionPool(base_class):
+        def _new_conn(self):
+            # 커넥션 풀이 새 연결(TCP, HTTPS면 TLS 핸드셰이크 포함)을 만들 때만 호출됨
+            metrics.record_connection()
+            return super()._new_conn()
+    return MeteredConnectionPool
+
+
+class _MeteredHTTPAdapter(HTTPAdapter):
+    def __init__(self, metrics: HttpClientMetrics, **kwargs):
+        self.metrics = metrics
+        super().__init__(**kwargs)
+    
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _metered_pool_class(HTTPConnectionPool, self.metrics),
+            'https': _metered_pool_class(HTTPSConnectionPool, self.metrics),
+        }
+
+
+class NotificationHttpClient:
+    def __init__(self, pool_size: Optional[int] = None, connect_timeout: Optional[float] = None,
+                 read_timeout: Optional[float] = None):
+        pool_size = pool_size or settings.NOTIFICATION_HTTP_POOL_SIZE
+        self.timeout = (
+            connect_timeout or settings.NOTIFICATION_HTTP_CONNECT_TIMEOUT,
+            read_timeout or settings.NOTIFICATION_HTTP_READ_TIMEOUT,
+        )
+        self.metrics = HttpClientMetrics()
+        
+        # 재시도는 호출자(아웃박스 디스패처)가 담당하므로 어댑터 재시도는 사용하지 않음
+        adapter = _MeteredHTTPAdapter(self.metrics, pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session = requests.Session()
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+    
+    def post(self, url: str, json: Optional[dict] = None) -> requests.Response:
+        """
+        JSON 본문을 POST합니다. 응답 본문을 모두 읽은 뒤 커넥션은 풀로 돌아가 재사용됩니다.
+        네트워크 오류는 RequestException으로 전달됩니다.
+        """
+        started = time.perf_counter()
+        failed = True
+        try:
+            response = self.session.post(url, json=json, timeout=self.timeout)
+            failed = False
+            return response
+        finally:
+            self.metrics.record_request(time.perf_counter() - started, failed=failed)
+    
+    def close(self) -> None:
+        self.session.close()
+
+
+# 프로세스 공용 인스턴스
+notification_client = NotificationHttpClient()
@@ -0,0 +1,290 @@
+"""
+Discord 알림 아웃박스 디스패처.
+
+요청 처리 중에는 NotificationOutboxModel에 알림만 기록하고, 이 디스패처(dispatch_notifications 커맨드)가
+별도 프로세스에서 전송합니다.
+
+- 전송할 알림은 SELECT ... FOR UPDATE SKIP LOCKED로 가져가면서 next_attempt_at을 임대 시간만큼 미뤄 두므로
+  디스패처가 여러 개 실행되어도 같은 알림을 동시에 보내지 않습니다.
+- 가장 오래된 알림이 batch_window초 기다린 뒤에 한꺼번에 가져가, 같은 웹훅으로 가는 알림을 기록 순서대로
+  웹훅 요청 하나에 최대 10개(임베드 글자 수 6000자 이내)씩 묶어 보냅니다.
+- 2xx: 묶음의 알림을 모두 전송 완료로 표시하고 같은 트랜잭션에서 주문의 discord_notified를 True로 변경
+- 429: 응답의 retry_after(초)가 지난 뒤 다시 보내며 시도 횟수에 포함하지 않습니다.
+- 5xx, 네트워크 오류: 지수 백오프로 재시도하고 max_attempts번 실패하면 failed
+- 429나 5xx로 묶음이 실패하면 순서가 바뀌지 않도록 같은 웹훅의 다음 묶음도 그때까지 미룹니다.
+- 그 외 4xx: 묶음이면 잘못된 임베드만 실패하도록 하나씩 다시 보내고, 단건이면 바로 failed
+- 시도 횟수와 오류는 묶음과 관계없이 알림마다 기록합니다.
+- 웹훅마다 서킷 브레이커를 두어, 타임아웃·네트워크 오류·5xx가 연달아 나면 한동안 전송하지 않고 알림을
+  시도 횟수 증가 없이 대기열에 남겨 둡니다. 응답이 느린 Discord를 알림마다 기다리지 않습니다.
+- 직원호출 알림은 가져갈 때 중복 방지 키를 지워, 그 뒤의 호출은 다음 알림으로 모이게 합니다.
+"""
+import logging
+import random
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+import requests
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from infrastructure.database.models import NotificationOutboxModel, OrderModel
+from infrastructure.database.repositories import DjangoOrderRepository
+from .circuit_breaker import CircuitBreaker
+from .discord_service import DiscordNotificationService
+
+logger = logging.getLogger(__name__)
+
+
+# 알림 종류 -> (웹훅 URL 설정 이름, 웹훅 표시 이름)
+WEBHOOKS = {
+    NotificationOutboxModel.KIND_PAYMENT_COMPLETED: ('DISCORD_WEBHOOK_URL', DiscordNotificationService.PAYMENT_USERNAME),
+    NotificationOutboxModel.KIND_STAFF_CALL: ('DISCORD_CALL_WEBHOOK_URL', DiscordNotificationService.STAFF_CALL_USERNAME),
+}
+
+# 웹훅 요청 하나로 보낼 (알림, 임베드) 목록
+Batch = List[Tuple[NotificationOutboxModel, dict]]
+
+
+class NotificationDispatcher:
+    def __init__(self, notification_service: Optional[DiscordNotificationService] = None,
+                 order_repository: Optional[DjangoOrderRepository] = None, batch_size: int = 50,
+                 max_attempts: int = 8, base_backoff: float = 2.0, max_backoff: float = 300.0,
+                 lease: float = 60.0, batch_window: float = 1.0, failure_threshold: int = 5,
+                 circuit_reset_timeout: float = 30.0):
+        self.notification_service = notification_service or DiscordNotificationService()
+        self.order_repository = order_repository or DjangoOrderRepository()
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        # 전송 중인 알림을 다른 디스패처가 가져가지 않도록 미뤄 두는 시간(초)
+        self.lease = lease
+        # 몰려 들어오는 알림을 한 요청으로 묶기 위해 기다리는 시간(초)
+        self.batch_window = batch_window
+        self.failure_threshold = failure_threshold
+        self.circuit_reset_timeout = circuit_reset_timeout
+        # 웹훅 URL -> 서킷 브레이커 (디스패처 프로세스가 살아 있는 동안 유지)
+        self.circuit_breakers: Dict[str, CircuitBreaker] = {}
+    
+    def dispatch_pending(self) -> int:
+        """전송 시각이 된 알림을 묶어서 전송하고, 처리한 알림 수를 반환합니다."""
+        entries = self._claim()
+        # 웹훅 URL -> 앞 묶음이 실패해 다음 묶음도 미뤄야 하는 시각
+        blocked_until: Dict[str, datetime] = {}
+        
+        for webhook_url, username, batch in self._batches(entries):
+            self._send(webhook_url, username, batch, blocked_until)
+        return len(entries)
+    
+    def run_forever(self, poll_interval: float = 1.0, stop_event: Optional[threading.Event] = None) -> None:
+        """stop_event가 설정될 때까지 알림을 전송합니다. 보낼 알림이 없으면 poll_interval초 기다립니다."""
+        stop_event = stop_event or threading.Event()
+        while not stop_event.is_set():
+            if not self.dispatch_pending():
+                stop_event.wait(poll_interval)
+    
+    def _claim(self) -> List[NotificationOutboxModel]:
+        now = timezone.now()
+        due = NotificationOutboxModel.objects.filter(
+            status=NotificationOutboxModel.STATUS_PENDING, next_attempt_at__lte=now
+        )
+        # 가장 오래된 알림이 batch_window만큼 기다리기 전에는 가져가지 않음
+        if self.batch_window and not due.filter(next_attempt_at__lte=now - timedelta(seconds=self.batch_window)).exists():
+            return []
+        
+        with transaction.atomic():
+            # 기록 순서대로 전송
+            entries = list(due.select_for_update(skip_locked=True).order_by('id')[:self.batch_size])
+            if entries:
+                NotificationOutboxModel.objects.filter(id__in=[entry.id for entry in entries]).update(
+                    next_attempt_at=now + timedelta(seconds=self.lease)
+                )
+                # 가져간 직원호출에는 더 이상 호출을 합치지 않음
+                staff_call_ids = [entry.id for entry in entries if entry.kind == NotificationOutboxModel.KIND_STAFF_CALL]
+                if staff_call_ids:
+                    NotificationOutboxModel.objects.filter(id__in=staff_call_ids).update(dedup_key=None)
+        return entries
+    
+    def _batches(self, entries: List[NotificationOutboxModel]) -> List[Tuple[str, str, Batch]]:
+        """알림을 웹훅별로 순서를 유지하며 Discord 제한 안에서 묶습니다."""
+        max_embeds = self.notification_service.MAX_EMBEDS_PER_MESSAGE
+        max_chars = self.notification_service.MAX_EMBED_CHARS_PER_MESSAGE
+        batches: List[Tuple[str, str, Batch]] = []
+        # (웹훅 URL, 표시 이름) -> 채우는 중인 묶음과 글자 수
+        open_batches: Dict[Tuple[str, str], Tuple[Batch, int]] = {}
+        
+        for entry in entries:
+            setting_name, username = WEBHOOKS.get(entry.kind, ('', ''))
+            webhook_url = getattr(settings, setting_name, '') if setting_name else ''
+            if not webhook_url:
+                self._retry([entry], "Discord webhook URL이 설정되지 않았습니다.")
+                continue
+            try:
+                embed = self._build_embed(entry)
+            except Exception as e:
+                logger.exception(f"Discord 알림 임베드 생성 중 예상치 못한 오류: {entry.id}")
+                self._retry([entry], f"예상치 못한 오류: {str(e)}")
+                continue
+            if embed is None:
+                self._fail([entry], "알림 대상 주문을 찾을 수 없습니다.")
+                continue
+            
+            key = (webhook_url, username)
+            batch, chars = open_batches.get(key, ([], 0))
+            size = self.notification_service.embed_size(embed)
+            if batch and (len(batch) >= max_embeds or chars + size > max_chars):
+                batches.append((webhook_url, username, batch))
+                batch, chars = [], 0
+            batch.append((entry, embed))
+            open_batches[key] = (batch, chars + size)
+        
+        for (webhook_url, username), (batch, _) in open_batches.items():
+            batches.append((webhook_url, username, batch))
+        # 같은 웹훅의 묶음은 기록 순서대로
+        batches.sort(key=lambda item: item[2][0][0].id)
+        return batches
+    
+    def _build_embed(self, entry: NotificationOutboxModel) -> Optional[dict]:
+        # 임베드 시각은 알림이 기록된 시각
+        timestamp = timezone.localtime(entry.created_at) if entry.created_at else None
+        
+        if entry.kind == NotificationOutboxModel.KIND_STAFF_CALL:
+            payload = entry.payload or {}
+            return self.notification_service.build_staff_call_embed(
+                payload.get('table_name') or payload.get('table_id'), payload.get('message'), timestamp,
+                call_count=payload.get('count', 1)
+            )
+        if entry.kind != NotificationOutboxModel.KIND_PAYMENT_COMPLETED:
+            raise ValueError(f"Unknown notification kind: {entry.kind}")
+        
+        # 결제 완료 알림은 전송 시점의 주문 정보로 메시지를 만듦
+        order = self.order_repository.get_by_id(str(entry.order_id)) if entry.order_id else None
+        if order is None:
+            return None
+        table_name = order.table.name if order.table and order.table.name else f"테이블 {order.table.id}"
+        order_items = [
+            {'name': item.food.name, 'quantity': item.quantity, 'price': item.total_price}
+            for item in order.items
+        ]
+        return self.notification_service.build_payment_completion_embed(
+            order_id=order.id,
+            payer_name=order.payer_name,
+            total_amount=order.total_amount,
+            table_name=table_name,
+            order_items=order_items,
+            timestamp=timestamp
+        )
+    
+    def _send(self, webhook_url: str, username: str, batch: Batch, blocked_until: Dict[str, datetime]) -> None:
+        entries = [entry for entry, _ in batch]
+        if webhook_url in blocked_until:
+            self._reschedule(entries, blocked_until[webhook_url], "앞선 알림 전송 대기")
+            return
+        
+        circuit_breaker = self._circuit_breaker(webhook_url)
+        if not circuit_breaker.allow_request():
+            # 회로가 열려 있으면 호출하지 않고 시도 횟수도 늘리지 않은 채 대기열에 남김
+            retry_at = timezone.now() + timedelta(seconds=max(circuit_breaker.retry_after(), 1.0))
+            blocked_until[webhook_url] = retry_at
+            self._reschedule(entries, retry_at, "Discord 응답 실패가 반복되어 전송 보류 (circuit open)")
+            return
+        
+        payload = self.notification_service.build_batch_payload([embed for _, embed in batch], username)
+        try:
+            response = self.notification_service.post_payload(webhook_url, payload)
+        except requests.exceptions.RequestException as e:
+            circuit_breaker.record_failure()
+            blocked_until[webhook_url] = self._retry(entries, f"네트워크 오류: {str(e)}")
+            return
+        
+        # Discord가 응답했으면(5xx 제외) 연결은 정상
+        if response.status_code >= 500:
+            circuit_breaker.record_failure()
+        else:
+            circuit_breaker.record_success()
+        
+        if 200 <= response.status_code < 300:
+            self._mark_sent(entries)
+            logger.info(f"Discord 알림 {len(entries)}건 전송 성공")
+        elif response.status_code == 429:
+            retry_at = timezone.now() + timedelta(seconds=self._retry_after(response))
+            blocked_until[webhook_url] = retry_at
+            self._reschedule(entries, retry_at, f"429 - {response.text[:500]}")
+        elif response.status_code >= 500:
+            blocked_until[webhook_url] = self._retry(entries, f"{response.status_code} - {response.text[:500]}")
+        elif len(batch) > 1:
+            # 잘못된 임베드 하나 때문에 묶음 전체가 실패하지 않도록 하나씩 다시 전송
+            for item in batch:
+                self._send(webhook_url, username, [item], blocked_until)
+        else:
+            self._fail(entries, f"{response.status_code} - {response.text[:500]}")
+    
+    def _circuit_breaker(self, webhook_url: str) -> CircuitBreaker:
+        circuit_breaker = self.circuit_breakers.get(webhook_url)
+        if circuit_breaker is None:
+            circuit_breaker = self.circuit_breakers[webhook_url] = CircuitBreaker(
+                self.failure_threshold, self.circuit_reset_timeout
+            )
+        return circuit_breaker
+    
+    def _retry_after(self, response: requests.Response) -> float:
+        """Discord 429 응답 본문의 retry_after(초)를 읽고, 없으면 Retry-After 헤더를 사용합니다."""
+        try:
+            return max(float(response.json()['retry_after']), 0.0)
+        except (ValueError, TypeError, KeyError):
+            pass
+        try:
+            return max(float(response.headers.get('Retry-After', 1)), 0.0)
+        except (TypeError, ValueError):
+            return 1.0
+    
+    def _backoff(self, attempts: int) -> float:
+        # 지수 백오프 + 지터 (여러 알림이 같은 시각에 몰리지 않도록)
+        delay = min(self.max_backoff, self.base_backoff * (2 ** (attempts - 1)))
+        return delay * random.uniform(0.5, 1.0)
+    
+    def _mark_sent(self, entries: List[NotificationOutboxModel]) -> None:
+        order_ids = [entry.order_id for entry in entries if entry.order_id]
+        with transaction.atomic():
+            NotificationOutboxModel.objects.filter(id__in=[entry.id for entry in entries]).update(
+                status=NotificationOutboxModel.STATUS_SENT,
+                attempts=F('attempts') + 1,
+                sent_at=timezone.now(),
+                last_error='',
+            )
+            if order_ids:
+                OrderModel.objects.filter(id__in=order_ids).update(discord_notified=True)
+    
+    def _reschedule(self, entries: List[NotificationOutboxModel], next_attempt_at: datetime, error: str) -> None:
+        """시도 횟수를 늘리지 않고 다음 전송 시각만 미룹니다. (rate limit, 순서 유지)"""
+        NotificationOutboxModel.objects.filter(id__in=[entry.id for entry in entries]).update(
+            next_attempt_at=next_attempt_at, last_error=error
+        )
+    
+    def _retry(self, entries: List[NotificationOutboxModel], error: str) -> datetime:
+        """알림마다 시도 횟수를 늘리고 묶음 전체를 같은 시각에 재시도하도록 미룹니다. 재시도 시각을 반환합니다."""
+        attempts = max(entry.attempts for entry in entries) + 1
+        retry_at = timezone.now() + timedelta(seconds=self._backoff(attempts))
+        for entry in entries:
+            if entry.attempts + 1 >= self.max_attempts:
+                self._fail([entry], error)
+                continue
+            logger.warning(f"Discord 알림 전송 실패, 재시도 예정 ({entry.attempts + 1}/{self.max_attempts}): {error}")
+            NotificationOutboxModel.objects.filter(id=entry.id).update(
+                attempts=entry.attempts + 1,
+                next_attempt_at=retry_at,
+                last_error=error,
+            )
+        return retry_at
+    
+    def _fail(self, entries: List[NotificationOutboxModel], error: str) -> None:
+        for entry in entries:
+            logger.error(f"Discord 알림 전송 실패: {entry.kind} {entry.order_id or ''} - {error}")
+        NotificationOutboxModel.objects.filter(id__in=[entry.id for entry in entries]).update(
+            status=NotificationOutboxModel.STATUS_FAILED,
+            attempts=F('attempts') + 1,
+            last_error=error,
+        )
@@ -145,10 +145,13 @@ STATIC_URL = 'static/'
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# JSON 렌더러 (orjson 사용 시 'presentation.api.renderers.OrjsonRenderer')
+JSON_RENDERER = os.getenv('JSON_RENDERER', 'rest_framework.renderers.JSONRenderer')
+
 # REST Framework settings
 REST_FRAMEWORK = {
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        JSON_RENDERER,
     ],
     'DEFAULT_PARSER_CLASSES': [
         'rest_framework.parsers.JSONParser',
@@ -171,6 +174,28 @@ CORS_ALLOWED_ORIGINS = os.getenv('CORS_ALLOWED_ORIGINS', 'http://localhost:3000,
 DISCORD_WEBHOOK_URL = os.getenv('DISCORD_WEBHOOK_URL', '')
 DISCORD_CALL_WEBHOOK_URL = os.getenv('DISCORD_CALL_WEBHOOK_URL', '')
 
+# Notification HTTP client settings (keep-alive 커넥션 풀, 연결/응답 대기 타임아웃(초))
+NOTIFICATION_HTTP_POOL_SIZE = int(os.getenv('NOTIFICATION_HTTP_POOL_SIZE', '4'))
+NOTIFICATION_HTTP_CONNECT_TIMEOUT = float(os.getenv('NOTIFICATION_HTTP_CONNECT_TIMEOUT', '3.05'))
+NOTIFICATION_HTTP_READ_TIMEOUT = float(os.getenv('NOTIFICATION_HTTP_READ_TIMEOUT', '10'))
+
+# 같은 테이블의 직원호출 알림 사이 최소 간격(초). 그 사이의 호출은 알림 하나로 합쳐 호출 횟수와 함께 전송
+STAFF_CALL_COALESCE_SECONDS = float(os.getenv('STAFF_CALL_COALESCE_SECONDS', '30'))
+
+# 결제 상태 SSE 설정: DB 확인 주기, heartbeat 간격, 스트림 최대 유지 시간(초), EventSource 재연결 대기(ms)
+PAYMENT_EVENTS_POLL_INTERVAL = float(os.getenv('PAYMENT_EVENTS_POLL_INTERVAL', '1'))
+PAYMENT_EVENTS_HEARTBEAT_SECONDS = float(os.getenv('PAYMENT_EVENTS_HEARTBEAT_SECONDS', '15'))
+PAYMENT_EVENTS_STREAM_TIMEOUT = float(os.getenv('PAYMENT_EVENTS_STREAM_TIMEOUT', '300'))
+PAYMENT_EVENTS_RETRY_MS = int(os.getenv('PAYMENT_EVENTS_RETRY_MS', '3000'))
+
+# 관리자 주문 현황판 SSE 설정: 어드민과 공유하는 토큰 서명 키, 토큰 유효 시간(초), DB 확인 주기(초),
+# heartbeat 간격(초), 스트림 최대 유지 시간(초, 지나면 EventSource가 Last-Event-ID로 다시 연결)
+ORDER_EVENTS_SECRET = os.getenv('ORDER_EVENTS_SECRET', '')
+ORDER_EVENTS_TOKEN_MAX_AGE = int(os.getenv('ORDER_EVENTS_TOKEN_MAX_AGE', '43200'))
+ORDER_EVENTS_POLL_INTERVAL = float(os.getenv('ORDER_EVENTS_POLL_INTERVAL', '1'))
+ORDER_EVENTS_HEARTBEAT_SECONDS = float(os.getenv('ORDER_EVENTS_HEARTBEAT_SECONDS', '15'))
+ORDER_EVENTS_STREAM_TIMEOUT = float(os.getenv('ORDER_EVENTS_STREAM_TIMEOUT', '600'))
+
 # Bank settings
 BANK_NAME = os.getenv('BANK_NAME', '케이뱅크')
 BANK_ACCOUNT_NO = os.getenv('BANK_ACCOUNT_NO')
@@ -0,0 +1,121 @@
+"""
+조건부 GET(ETag / Last-Modified) 검증자.
+
+django.views.decorators.http.condition에 넘기는 함수들로, 엔티티를 만들거나 직렬화하지 않고
+버전 정보만 조회해 If-None-Match / If-Modified-Since가 일치하면 바로 304를 반환하게 합니다.
+검증자 조회 결과는 요청 객체에 캐시되어 ETag와 Last-Modified가 같은 쿼리를 공유합니다.
+"""
+import hashlib
+from functools import wraps
+
+from django.core.exceptions import ValidationError
+from django.db.models import Count, Max
+
+from infrastructure.database.models import MenuVersionModel, OrderModel, TableModel
+from presentation.api.menu_payload import accepts_gzip
+
+
+def _memoize_on_request(func):
+    attr = f'_conditional_{func.__name__}'
+    
+    @wraps(func)
+    def wrapper(request, *args, **kwargs):
+        if not hasattr(request, attr):
+            setattr(request, attr, func(request, *args, **kwargs))
+        return getattr(request, attr)
+    return wrapper
+
+
+def _make_etag(*parts) -> str:
+    return hashlib.sha1(repr(parts).encode()).hexdigest()
+
+
+# ==================== 메뉴 ====================
+
+@_memoize_on_request
+def _menu_validators(request, *args, **kwargs):
+    stamp = MenuVersionModel.stamp()
+    if stamp is None:
+        return None, None
+    version, updated_at = stamp
+    # 같은 메뉴 버전이라도 카테고리/음식 ID에 따라 응답이 다름
+    return _make_etag('menu', version, updated_at, request.GET.urlencode(), args, kwargs), updated_at
+
+
+def menu_etag(request, *args, **kwargs):
+    return _menu_validators(request, *args, **kwargs)[0]
+
+
+def menu_last_modified(request, *args, **kwargs):
+    return _menu_validators(request, *args, **kwargs)[1]
+
+
+def menu_list_etag(request):
+    """food_list는 gzip 압축본을 따로 내려주므로 인코딩별로 다른 ETag를 사용합니다."""
+    etag = menu_etag(request)
+    if etag is not None and accepts_gzip(request):
+        return f'{etag}-gzip'
+    return etag
+
+
+# ==================== 테이블 ====================
+
+@_memoize_on_request
+def _table_validators(request, table_id):
+    try:
+        table = TableModel.objects.filter(id=table_id).values_list('name', 'updated_at').first()
+    except ValidationError:
+        # UUID 형식이 아닌 경우 뷰에서 처리
+        return None, None
+    if table is None:
+        return None, None
+    name, updated_at = table
+    return _make_etag('table', table_id, name, updated_at), updated_at
+
+
+def table_etag(request, table_id):
+    return _table_validators(request, table_id)[0]
+
+
+def table_last_modified(request, table_id):
+    return _table_validators(request, table_id)[1]
+
+
+# ==================== 테이블 주문 내역 ====================
+
+@_memoize_on_request
+def _table_orders_validators(request, table_id):
+    """
+    테이블의 현재 세션 주문 버전을 집계 쿼리 1회로 계산합니다.
+    주문 추가/삭제(개수), 상태 변경(updated_at), 환불(차감 아이템), 테이블 정보 변경이 모두 반영되며,
+    주문에 포함되는 음식 정보를 위해 메뉴 버전도 함께 사용합니다.
+    """
+    try:
+        version = OrderModel.objects.visible().filter(session__table_id=table_id).aggregate(
+            order_count=Count('id', distinct=True),
+            orders_updated_at=Max('updated_at'),
+            minus_count=Count('minus_items', distinct=True),
+            last_minus_id=Max('minus_items__id'),
+            table_name=Max('table__name'),
+            table_updated_at=Max('table__updated_at'),
+        )
+    except ValidationError:
+        return None, None
+    menu_stamp = MenuVersionModel.stamp()
+    
+    candidates = [version['orders_updated_at'], version['table_updated_at']]
+    if menu_stamp is not None:
+        candidates.append(menu_stamp[1])
+    candidates = [candidate for candidate in candidates if candidate is not None]
+    last_modified = max(candidates) if candidates else None
+    
+    etag = _make_etag('table-orders', table_id, sorted(version.items()), menu_stamp, request.GET.urlencode())
+    return etag, last_modified
+
+
+def table_orders_etag(request, table_id):
+    return _table_orders_validators(request, table_id)[0]
+
+
+def table_orders_last_modified(request, table_id):
+    return _table_orders_validators(request, table_id)[1]
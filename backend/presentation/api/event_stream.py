@@ -0,0 +1,172 @@
+"""
+Server-Sent Events 스트림.
+
+결제 상태 (payment_status_events)
+
+결제 페이지가 payment-status를 주기적으로 조회하는 대신 이 스트림을 열어 두면, 결제가 완료되는 순간
+payment 이벤트 하나를 받고 스트림이 닫힙니다. 연결당 워커를 점유하지 않도록 ASGI(asgi.py)로 서비스해야 합니다.
+
+    retry: 3000
+    
+    event: payment
+    data: {"order_id": "...", "payment_completed": true, "order_status": "completed"}
+
+기다리는 동안 heartbeat 주석(": keep-alive")을 보내고, stream_timeout이 지나면 timeout 이벤트를 보내고 닫습니다.
+
+관리자 주문 현황판 (order_events)
+    어드민이 서명한 토큰(ORDER_EVENTS_SECRET)이 있어야 열 수 있습니다. 주문 이벤트를 id와 함께 보내므로
+    연결이 끊겨도 EventSource가 Last-Event-ID로 이어서 받습니다.
+    
+    id: 42
+    event: order_created
+    data: {"table_id": "...", "order_id": "...", "session_id": "...", "table_name": "1번", "revenue": 15000, "orders": 1, ...}
+"""
+import asyncio
+import json
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core import signing
+from django.core.exceptions import ValidationError
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import require_GET
+
+from infrastructure.events.order_events import order_event_feed
+from infrastructure.events.payment_events import get_payment_status, payment_event_broker
+
+# 어드민과 같은 salt로 현황판 토큰을 서명/검증
+ORDER_EVENTS_TOKEN_SALT = 'order-events'
+
+
+def _event(name: str, data: dict) -> str:
+    return f"event: {name}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def _payment_event(order_id: str, order_status: str) -> str:
+    return _event('payment', {
+        'order_id': order_id,
+        'payment_completed': order_status == 'completed',
+        'order_status': order_status,
+    })
+
+
+async def _payment_stream(order_id: str, order_status: str):
+    # 연결이 끊기면 EventSource가 다시 연결하기 전 기다리는 시간(ms)
+    yield f"retry: {settings.PAYMENT_EVENTS_RETRY_MS}\n\n"
+    if order_status == 'completed':
+        yield _payment_event(order_id, order_status)
+        return
+    
+    subscription = payment_event_broker.subscribe(order_id)
+    try:
+        # 구독 직전에 완료된 경우를 놓치지 않도록 한 번 더 확인
+        order_status = await sync_to_async(get_payment_status)(order_id)
+        if order_status == 'completed':
+            yield _payment_event(order_id, order_status)
+            return
+        
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + settings.PAYMENT_EVENTS_STREAM_TIMEOUT
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                yield _event('timeout', {'order_id': order_id})
+                return
+            done, _ = await asyncio.wait(
+                {subscription.future}, timeout=min(settings.PAYMENT_EVENTS_HEARTBEAT_SECONDS, remaining)
+            )
+            if done:
+                yield _payment_event(order_id, subscription.future.result())
+                return
+            yield ": keep-alive\n\n"
+    finally:
+        payment_event_broker.unsubscribe(subscription)
+
+
+@require_GET
+async def payment_status_events(request, order_id):
+    """
+    주문의 결제 완료를 Server-Sent Events로 알립니다.
+    이미 완료된 주문이면 바로 payment 이벤트를 보내고 닫습니다.
+    """
+    try:
+        order_status = await sync_to_async(get_payment_status)(order_id)
+    except ValidationError:
+        order_status = None
+    if order_status is None:
+        return JsonResponse({'error': 'Order not found'}, status=404)
+    
+    response = StreamingHttpResponse(_payment_stream(order_id, order_status), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    # nginx 등 프록시가 이벤트를 버퍼링하지 않도록
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
+def verify_order_events_token(token: str) -> bool:
+    """어드민이 서명한 현황판 토큰인지 확인합니다. ORDER_EVENTS_SECRET이 없으면 항상 거부합니다."""
+    if not settings.ORDER_EVENTS_SECRET or not token:
+        return False
+    try:
+        signing.loads(
+            token, key=settings.ORDER_EVENTS_SECRET, salt=ORDER_EVENTS_TOKEN_SALT,
+            max_age=settings.ORDER_EVENTS_TOKEN_MAX_AGE
+        )
+    except signing.BadSignature:
+        return False
+    return True
+
+
+async def _order_event_stream(last_event_id):
+    yield f"retry: {settings.PAYMENT_EVENTS_RETRY_MS}\n\n"
+    subscription = order_event_feed.subscribe()
+    try:
+        if last_event_id is None:
+            # 처음 연결하면 지금 이후의 이벤트만 전달
+            last_event_id = await order_event_feed.latest_id()
+        
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + settings.ORDER_EVENTS_STREAM_TIMEOUT
+        while True:
+            subscription.wakeup.clear()
+            events = await order_event_feed.events_after(last_event_id)
+            for event in events:
+                yield f"id: {event['id']}\n" + _event(event['kind'], event['data'])
+                last_event_id = event['id']
+            if len(events) >= order_event_feed.batch_size:
+                continue
+            
+            # 스트림을 닫으면 EventSource가 Last-Event-ID로 다시 연결해 이어서 받음
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return
+            try:
+                await asyncio.wait_for(
+                    subscription.wakeup.wait(), timeout=min(settings.ORDER_EVENTS_HEARTBEAT_SECONDS, remaining)
+                )
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+    finally:
+        order_event_feed.unsubscribe(subscription)
+
+
+@require_GET
+async def order_events(request):
+    """
+    관리자 주문 현황판용 주문 이벤트(주문 생성, 결제 완료, 환불, 퇴실)를 Server-Sent Events로 전달합니다.
+    Last-Event-ID 헤더나 last_event_id 파라미터가 있으면 그 이후의 이벤트부터 보냅니다.
+    """
+    if not verify_order_events_token(request.GET.get('token', '')):
+        return JsonResponse({'error': 'Invalid token'}, status=403)
+    
+    last_event_id = request.headers.get('Last-Event-ID') or request.GET.get('last_event_id')
+    if last_event_id is not None:
+        try:
+            last_event_id = int(last_event_id)
+        except ValueError:
+            return JsonResponse({'error': 'Invalid last_event_id'}, status=400)
+    
+    response = StreamingHttpResponse(_order_event_stream(last_event_id), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
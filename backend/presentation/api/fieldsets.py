@@ -0,0 +1,76 @@
+"""
+희소 필드셋(sparse fieldsets) 파라미터 해석.
+
+- fields=a,b            : 엔드포인트 기본 타입(주문/테이블/음식)의 필드 선택
+- fields[order]=a,b     : 주문 필드 선택 (id, table, orderDate, items, minusItems, totalAmount, status)
+- fields[table]=a,b     : 테이블 필드 선택 (id, name, createdAt, updatedAt)
+- fields[food]=a,b      : 음식 필드 선택 (id, name, price, category, description, image, soldOut)
+- include=items,...     : 주문의 기본 속성(id, orderDate, totalAmount)에 더할 관계 (table, items, minusItems)
+
+필드 순서는 요청 순서와 관계없이 기본 응답의 순서를 따릅니다.
+주문에서 선택되지 않은 items/minusItems는 Repository에서 조회하지 않습니다.
+"""
+from dataclasses import dataclass
+from typing import FrozenSet, Optional, Tuple
+
+from domain.repositories.order_repository import ORDER_RELATIONS
+
+
+ORDER_FIELDS = ('id', 'table', 'orderDate', 'items', 'minusItems', 'totalAmount', 'status')
+ORDER_INCLUDABLE = ('table', 'items', 'minusItems')
+ORDER_DEFAULT_ATTRIBUTES = ('id', 'orderDate', 'totalAmount')
+TABLE_FIELDS = ('id', 'name', 'createdAt', 'updatedAt')
+FOOD_FIELDS = ('id', 'name', 'price', 'category', 'description', 'image', 'soldOut')
+
+_FIELDS_BY_TYPE = {'order': ORDER_FIELDS, 'table': TABLE_FIELDS, 'food': FOOD_FIELDS}
+# 응답 필드 -> Repository 관계
+_ORDER_FIELD_RELATIONS = {'items': 'items', 'minusItems': 'minus_items'}
+
+
+@dataclass(frozen=True)
+class Fieldset:
+    """타입별 선택된 필드. None이면 해당 타입의 기본 필드를 모두 사용합니다."""
+    order: Optional[Tuple[str, ...]] = None
+    table: Optional[Tuple[str, ...]] = None
+    food: Optional[Tuple[str, ...]] = None
+    
+    @property
+    def order_relations(self) -> FrozenSet[str]:
+        """Repository에서 조회해야 하는 주문 관계."""
+        if self.order is None:
+            return ORDER_RELATIONS
+        return frozenset(_ORDER_FIELD_RELATIONS[field] for field in self.order if field in _ORDER_FIELD_RELATIONS)
+
+
+def _parse_names(value: str, allowed: Tuple[str, ...]) -> Tuple[str, ...]:
+    names = {name.strip() for name in value.split(',') if name.strip()}
+    unknown = names - set(allowed)
+    if unknown:
+        raise ValueError(f"Unknown field: {', '.join(sorted(unknown))}")
+    return tuple(name for name in allowed if name in names)
+
+
+def parse_fieldset(query_params, default_type: str = 'order') -> Optional[Fieldset]:
+    """
+    쿼리 파라미터에서 필드셋을 해석합니다. 관련 파라미터가 없으면 None을 반환합니다.
+    알 수 없는 필드나 타입이면 ValueError를 발생시킵니다.
+    """
+    selected = {}
+    for key, value in query_params.items():
+        if key == 'fields':
+            selected[default_type] = _parse_names(value, _FIELDS_BY_TYPE[default_type])
+        elif key.startswith('fields[') and key.endswith(']'):
+            type_name = key[len('fields['):-1]
+            if type_name not in _FIELDS_BY_TYPE:
+                raise ValueError(f"Unknown type: {type_name}")
+            selected[type_name] = _parse_names(value, _FIELDS_BY_TYPE[type_name])
+    
+    include = query_params.get('include')
+    if include is not None:
+        included = _parse_names(include, ORDER_INCLUDABLE)
+        base = selected.get('order', ORDER_DEFAULT_ATTRIBUTES)
+        selected['order'] = tuple(field for field in ORDER_FIELDS if field in base or field in included)
+    
+    if not selected:
+        return None
+    return Fieldset(**selected)
@@ -0,0 +1,81 @@
+"""
+인코딩이 끝난 메뉴 응답 캐시.
+
+메뉴 버전별로 카테고리 필터·선택 필드마다 UTF-8 JSON 바이트와 gzip 압축본을 한 번만 만들어 두고,
+food_list는 시리얼라이저/렌더러를 거치지 않고 이 바이트를 그대로 응답합니다.
+"""
+import gzip
+import re
+import threading
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+from rest_framework.settings import api_settings
+
+from domain.entities.food import FoodCategory
+from infrastructure.database.repositories import CachedDjangoFoodRepository
+from presentation.serializers.food_serializers import FoodSerializer
+
+
+# django.middleware.gzip.GZipMiddleware와 같은 Accept-Encoding 판별
+_accepts_gzip_re = re.compile(r'\bgzip\b')
+
+
+def accepts_gzip(request) -> bool:
+    return bool(_accepts_gzip_re.search(request.META.get('HTTP_ACCEPT_ENCODING', '')))
+
+
+@dataclass(frozen=True)
+class MenuPayload:
+    body: bytes
+    gzip_body: bytes
+
+
+class MenuPayloadCache:
+    def __init__(self, food_repository: CachedDjangoFoodRepository):
+        self.food_repository = food_repository
+        self._lock = threading.Lock()
+        self._version = None
+        # (카테고리, 선택 필드) -> 인코딩된 응답
+        self._payloads: Dict[Tuple[Optional[FoodCategory], Optional[Tuple[str, ...]]], MenuPayload] = {}
+    
+    def get(self, category: Optional[FoodCategory] = None, fields: Optional[Tuple[str, ...]] = None) -> MenuPayload:
+        """
+        카테고리(None이면 전체)와 선택 필드(None이면 전체)의 인코딩된 메뉴를 반환합니다.
+        메뉴 버전이 바뀐 경우에만 다시 만듭니다.
+        """
+        version, foods = self.food_repository.get_menu_snapshot()
+        if version is None:
+            return self._build(foods, category, fields)
+        
+        key = (category, fields)
+        with self._lock:
+            if version != self._version:
+                self._payloads = {}
+                self._version = version
+            payload = self._payloads.get(key)
+            if payload is None:
+                payload = self._payloads[key] = self._build(foods, category, fields)
+            return payload
+    
+    def response(self, request, category: Optional[FoodCategory] = None,
+                 fields: Optional[Tuple[str, ...]] = None) -> HttpResponse:
+        """Accept-Encoding에 따라 JSON 또는 gzip 바이트를 그대로 담은 응답을 만듭니다."""
+        payload = self.get(category, fields)
+        if accepts_gzip(request):
+            response = HttpResponse(payload.gzip_body, content_type='application/json')
+            response['Content-Encoding'] = 'gzip'
+        else:
+            response = HttpResponse(payload.body, content_type='application/json')
+        patch_vary_headers(response, ('Accept-Encoding',))
+        return response
+    
+    def _build(self, foods, category: Optional[FoodCategory], fields: Optional[Tuple[str, ...]]) -> MenuPayload:
+        if category is not None:
+            foods = [food for food in foods if food.category == category]
+        # DRF 응답과 같은 바이트가 되도록 설정된 렌더러로 한 번만 인코딩
+        renderer = api_settings.DEFAULT_RENDERER_CLASSES[0]()
+        body = renderer.render(FoodSerializer(foods, many=True, fields=fields).data)
+        return MenuPayload(body=body, gzip_body=gzip.compress(body, compresslevel=9, mtime=0))
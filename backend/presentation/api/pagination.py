@@ -0,0 +1,64 @@
+import base64
+import binascii
+import uuid
+from typing import List, Optional, Tuple
+
+from django.conf import settings
+from django.utils.dateparse import parse_datetime
+
+from domain.entities.order import Order
+from domain.repositories.order_repository import OrderCursor
+
+
+MAX_PAGE_SIZE = 100
+
+
+def encode_order_cursor(order: Order) -> str:
+    """주문의 (order_date, id)를 클라이언트에 내려줄 불투명 커서 문자열로 인코딩합니다."""
+    raw = f"{order.order_date.isoformat()}|{order.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_order_cursor(cursor: str) -> OrderCursor:
+    """커서 문자열을 (order_date, id)로 디코딩합니다. 형식이 잘못되면 ValueError를 발생시킵니다."""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        order_date_str, order_id = raw.split('|', 1)
+        order_date = parse_datetime(order_date_str)
+        uuid.UUID(order_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError("Invalid cursor")
+
+    if order_date is None:
+        raise ValueError("Invalid cursor")
+    return order_date, order_id
+
+
+def parse_page_params(query_params) -> Tuple[Optional[OrderCursor], int]:
+    """
+    cursor/limit 쿼리 파라미터를 해석합니다.
+    limit은 기본값이 REST_FRAMEWORK['PAGE_SIZE']이며 MAX_PAGE_SIZE를 넘을 수 없습니다.
+    """
+    cursor = query_params.get('cursor')
+    after = decode_order_cursor(cursor) if cursor else None
+
+    limit = query_params.get('limit')
+    if limit is None:
+        return after, settings.REST_FRAMEWORK['PAGE_SIZE']
+
+    limit = int(limit)
+    if limit < 1:
+        raise ValueError("limit must be positive")
+    return after, min(limit, MAX_PAGE_SIZE)
+
+
+def split_page(orders: List[Order], limit: int) -> Tuple[List[Order], Optional[str]]:
+    """
+    limit + 1개로 조회한 결과를 현재 페이지와 다음 페이지 커서로 나눕니다.
+    다음 페이지가 없으면 커서는 None입니다.
+    """
+    if len(orders) <= limit:
+        return orders, None
+    page = orders[:limit]
+    return page, encode_order_cursor(page[-1])
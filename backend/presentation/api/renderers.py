@@ -0,0 +1,33 @@
+"""
+settings.JSON_RENDERER로 선택할 수 있는 JSON 렌더러.
+
+OrjsonRenderer는 orjson이 설치되어 있으면 orjson으로 인코딩하고, 없으면 DRF JSONRenderer로 동작합니다.
+orjson은 항상 공백 없는(compact) 출력을 만들므로 COMPACT_JSON=False 설정과 바이트 단위로는 다르지만
+JSON 값은 같습니다.
+"""
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 선택 의존성
+    orjson = None
+
+
+class OrjsonRenderer(JSONRenderer):
+    _encoder = JSONEncoder()
+    
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None:
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b''
+        
+        # datetime 등은 DRF JSONEncoder와 같은 형식으로 변환
+        ret = orjson.dumps(
+            data,
+            default=self._encoder.default,
+            option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS,
+        )
+        # DRF JSONRenderer와 같이 JavaScript에서 문제가 되는 줄 구분 문자를 이스케이프
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
@@ -1,5 +1,6 @@
 from django.urls import path
 from . import views
+from .event_stream import order_events, payment_status_events
 
 app_name = 'api'
 
@@ -24,10 +25,14 @@ urlpatterns = [
     
     # Payment status check
     path('orders/<str:order_id>/payment-status/', views.check_payment_status, name='check-payment-status'),
+    path('orders/<str:order_id>/payment-events/', payment_status_events, name='payment-status-events'),
     
     # Reset table orders
     path('tables/<str:table_id>/orders/reset/', views.reset_table_orders, name='reset-table-orders'),
     
+    # 관리자 주문 현황판 이벤트 스트림
+    path('admin/order-events/', order_events, name='order-events'),
+    
     # Staff call
     path('tables/<str:table_id>/call-staff/', views.call_staff, name='call-staff'),
 ]
\ No newline at end of file
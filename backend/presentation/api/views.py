@@ -1,4 +1,5 @@
 from django.conf import settings
+from django.views.decorators.http import condition
 from rest_framework import status
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
@@ -6,29 +7,39 @@ from urllib.parse import quote
 
 from domain.use_cases.food_use_cases import GetAllFoodsUseCase, GetFoodByIdUseCase, GetFoodsByCategoryUseCase
 from domain.use_cases.table_use_cases import GetAllTablesUseCase, GetTableByIdUseCase, CreateTableUseCase
-from domain.use_cases.order_use_cases import CreateOrderUseCase, GetAllOrdersUseCase, GetOrdersByTableUseCase, CreatePreOrderUseCase, UpdateOrderStatusUseCase, GetPreOrderByPaymentInfoUseCase, ResetOrdersByTableUseCase
+from domain.use_cases.order_use_cases import CreateOrderUseCase, GetAllOrdersUseCase, GetOrdersByTableUseCase, CreatePreOrderUseCase, UpdateOrderStatusUseCase, GetPreOrderByPaymentInfoUseCase, ResetOrdersByTableUseCase, GetTotalSpentUseCase
+from domain.use_cases.payment_use_cases import ReconcileDepositUseCase
 from domain.entities.food import FoodCategory
-from infrastructure.database.repositories import DjangoFoodRepository, DjangoTableRepository, DjangoOrderRepository
-from infrastructure.database.models import PaymentDepositModel
+from infrastructure.database.repositories import CachedDjangoFoodRepository, DjangoTableRepository, DjangoOrderRepository, DjangoNotificationRepository, DjangoPaymentRepository
 from infrastructure.transaction.django_transaction_manager import DjangoTransactionManager
 from presentation.serializers.food_serializers import FoodSerializer
 from presentation.serializers.table_serializers import TableSerializer
-from presentation.serializers.order_serializers import OrderSerializer, CreateOrderSerializer, OrderHistorySerializer, CreatePreOrderSerializer
+from presentation.serializers.order_serializers import CreateOrderSerializer, CreatePreOrderSerializer
+from presentation.serializers.fast_order_serializers import serialize_order, serialize_order_history
+from presentation.api.pagination import parse_page_params, split_page
+from presentation.api.menu_payload import MenuPayloadCache
+from presentation.api.fieldsets import parse_fieldset
+from presentation.api.conditional import (
+    menu_etag, menu_list_etag, menu_last_modified, table_etag, table_last_modified,
+    table_orders_etag, table_orders_last_modified
+)
 from datetime import datetime
 from django.utils.dateparse import parse_datetime
-from infrastructure.external.discord_service import discord_service
 
 
 # Dependency injection
-food_repository = DjangoFoodRepository()
+food_repository = CachedDjangoFoodRepository()
 table_repository = DjangoTableRepository()
 order_repository = DjangoOrderRepository()
+notification_repository = DjangoNotificationRepository()
+payment_repository = DjangoPaymentRepository()
 transaction_manager = DjangoTransactionManager()
 
 # Food use cases
 get_all_foods_use_case = GetAllFoodsUseCase(food_repository)
 get_food_by_id_use_case = GetFoodByIdUseCase(food_repository)
 get_foods_by_category_use_case = GetFoodsByCategoryUseCase(food_repository)
+menu_payload_cache = MenuPayloadCache(food_repository)
 
 # Table use cases
 get_all_tables_use_case = GetAllTablesUseCase(table_repository)
@@ -39,41 +50,57 @@ create_table_use_case = CreateTableUseCase(table_repository)
 create_order_use_case = CreateOrderUseCase(order_repository, food_repository, table_repository, transaction_manager)
 get_all_orders_use_case = GetAllOrdersUseCase(order_repository)
 get_orders_by_table_use_case = GetOrdersByTableUseCase(order_repository)
+get_total_spent_use_case = GetTotalSpentUseCase(order_repository)
 create_pre_order_use_case = CreatePreOrderUseCase(order_repository, table_repository, food_repository)
-update_order_status_use_case = UpdateOrderStatusUseCase(order_repository)
+update_order_status_use_case = UpdateOrderStatusUseCase(order_repository, notification_repository, transaction_manager)
 get_pre_order_by_payment_info_use_case = GetPreOrderByPaymentInfoUseCase(order_repository)
-reset_orders_by_table_use_case = ResetOrdersByTableUseCase(order_repository)
+reset_orders_by_table_use_case = ResetOrdersByTableUseCase(table_repository)
+reconcile_deposit_use_case = ReconcileDepositUseCase(
+    payment_repository, order_repository, update_order_status_use_case, transaction_manager
+)
 
 
+@condition(etag_func=menu_list_etag, last_modified_func=menu_last_modified)
 @api_view(['GET'])
 def food_list(request):
     """
     음식 목록을 조회합니다.
     카테고리별 필터링을 지원합니다.
+    메뉴 버전별로 미리 인코딩해 둔 JSON(또는 gzip) 바이트를 그대로 응답합니다.
+    fields 파라미터로 음식 필드를 선택할 수 있습니다.
     """
     category = request.query_params.get('category')
+    food_category = None
     
     if category:
         try:
             food_category = FoodCategory(category)
-            foods = get_foods_by_category_use_case.execute(food_category)
         except ValueError:
             return Response(
                 {'error': 'Invalid category. Must be "main" or "side"'}, 
                 status=status.HTTP_400_BAD_REQUEST
             )
-    else:
-        foods = get_all_foods_use_case.execute()
     
-    serializer = FoodSerializer(foods, many=True)
-    return Response(serializer.data)
+    try:
+        fieldset = parse_fieldset(request.query_params, default_type='food')
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    
+    return menu_payload_cache.response(request, food_category, fieldset.food if fieldset else None)
 
 
+@condition(etag_func=menu_etag, last_modified_func=menu_last_modified)
 @api_view(['GET'])
 def food_detail(request, food_id):
     """
     특정 음식의 상세 정보를 조회합니다.
+    fields 파라미터로 음식 필드를 선택할 수 있습니다.
     """
+    try:
+        fieldset = parse_fieldset(request.query_params, default_type='food')
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    
     food = get_food_by_id_use_case.execute(food_id)
     
     if not food:
@@ -82,7 +109,7 @@ def food_detail(request, food_id):
             status=status.HTTP_404_NOT_FOUND
         )
     
-    serializer = FoodSerializer(food)
+    serializer = FoodSerializer(food, fields=fieldset.food if fieldset else None)
     return Response(serializer.data)
 
 
@@ -96,11 +123,18 @@ def table_list(request):
     return Response(serializer.data)
 
 
+@condition(etag_func=table_etag, last_modified_func=table_last_modified)
 @api_view(['GET'])
 def table_detail(request, table_id):
     """
     특정 테이블의 상세 정보를 조회합니다.
+    fields 파라미터로 테이블 필드를 선택할 수 있습니다.
     """
+    try:
+        fieldset = parse_fieldset(request.query_params, default_type='table')
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    
     table = get_table_by_id_use_case.execute(table_id)
     
     if not table:
@@ -109,7 +143,7 @@ def table_detail(request, table_id):
             status=status.HTTP_404_NOT_FOUND
         )
     
-    serializer = TableSerializer(table)
+    serializer = TableSerializer(table, fields=fieldset.table if fieldset else None)
     return Response(serializer.data)
 
 
@@ -137,20 +171,25 @@ def create_table(request):
 def create_order(request):
     """
     특정 테이블에 새 주문을 생성합니다.
+    fields/include 파라미터로 응답 필드를 선택할 수 있습니다.
     """
     serializer = CreateOrderSerializer(data=request.data)
     
     if not serializer.is_valid():
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
     
+    try:
+        fieldset = parse_fieldset(request.query_params)
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    
     try:
         table_id = serializer.validated_data['table_id']
         items_data = serializer.validated_data['items']
         order = create_order_use_case.execute(table_id, items_data)
         
-        order_serializer = OrderSerializer(order)
         return Response(
-            order_serializer.data, 
+            serialize_order(order, fieldset), 
             status=status.HTTP_201_CREATED
         )
     
@@ -166,51 +205,84 @@ def create_order(request):
         )
 
 
+def _wants_sideloaded_foods(request) -> bool:
+    # ?sideload=foods 이면 음식 정보를 foods 맵으로 한 번만 내려줌
+    return request.query_params.get('sideload') == 'foods'
+
+
 @api_view(['GET'])
 def order_history(request):
     """
     주문 내역을 조회합니다.
     table_id 파라미터로 특정 테이블의 주문만 조회할 수 있습니다.
+    cursor/limit 파라미터로 (order_date, id) 키셋 페이지네이션을 지원합니다.
+    sideload=foods 파라미터로 음식 정보를 foods 맵으로 분리해 받을 수 있습니다.
+    fields/include 파라미터로 응답 필드를 선택하면 선택되지 않은 관계는 조회하지 않습니다.
     """
     table_id = request.query_params.get('table_id')
     
-    if table_id:
-        orders = get_orders_by_table_use_case.execute(table_id)
-    else:
-        orders = get_all_orders_use_case.execute()
+    try:
+        after, limit = parse_page_params(request.query_params)
+    except ValueError:
+        return Response(
+            {'error': 'Invalid cursor or limit'}, 
+            status=status.HTTP_400_BAD_REQUEST
+        )
     
-    # pre_order 상태가 아닌 주문들만 total_spent에 포함
-    completed_orders = [order for order in orders if order.status != 'pre_order']
-    total_spent = sum(order.total_amount for order in completed_orders)
+    try:
+        fieldset = parse_fieldset(request.query_params)
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    relations = fieldset.order_relations if fieldset else None
     
-    history_data = {
-        'orders': orders,
-        'total_spent': total_spent
-    }
+    # 다음 페이지 존재 여부 확인을 위해 1개 더 조회
+    if table_id:
+        orders = get_orders_by_table_use_case.execute(table_id, after=after, limit=limit + 1, relations=relations)
+    else:
+        orders = get_all_orders_use_case.execute(after=after, limit=limit + 1, relations=relations)
+    orders, next_cursor = split_page(orders, limit)
     
-    serializer = OrderHistorySerializer(history_data)
-    return Response(serializer.data)
+    # total_spent는 페이지 합계가 아닌 전체 집계 (pre_order 제외)
+    total_spent = get_total_spent_use_case.execute(table_id or None)
+    return Response(serialize_order_history(
+        orders, total_spent, next_cursor, sideload_foods=_wants_sideloaded_foods(request), fieldset=fieldset
+    ))
 
 
+@condition(etag_func=table_orders_etag, last_modified_func=table_orders_last_modified)
 @api_view(['GET'])
 def table_orders(request, table_id):
     """
     특정 테이블의 주문 내역을 조회합니다.
+    cursor/limit 파라미터로 (order_date, id) 키셋 페이지네이션을 지원합니다.
+    sideload=foods 파라미터로 음식 정보를 foods 맵으로 분리해 받을 수 있습니다.
+    fields/include 파라미터로 응답 필드를 선택하면 선택되지 않은 관계는 조회하지 않습니다.
     """
     try:
-        orders = get_orders_by_table_use_case.execute(table_id)
-        
-        # pre_order 상태가 아닌 주문들만 total_spent에 포함
-        completed_orders = [order for order in orders if order.status != 'pre_order']
-        total_spent = sum(order.total_amount for order in completed_orders)
-        
-        history_data = {
-            'orders': completed_orders,
-            'total_spent': total_spent
-        }
+        after, limit = parse_page_params(request.query_params)
+    except ValueError:
+        return Response(
+            {'error': 'Invalid cursor or limit'}, 
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    try:
+        fieldset = parse_fieldset(request.query_params)
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        # pre_order 상태가 아닌 주문들만 조회
+        orders = get_orders_by_table_use_case.execute(
+            table_id, after=after, limit=limit + 1, include_pre_orders=False,
+            relations=fieldset.order_relations if fieldset else None
+        )
+        orders, next_cursor = split_page(orders, limit)
         
-        serializer = OrderHistorySerializer(history_data)
-        return Response(serializer.data)
+        total_spent = get_total_spent_use_case.execute(table_id)
+        return Response(serialize_order_history(
+            orders, total_spent, next_cursor, sideload_foods=_wants_sideloaded_foods(request), fieldset=fieldset
+        ))
     
     except Exception as e:
         return Response(
@@ -231,7 +303,7 @@ def create_pre_order(request, table_id):
                 {'error': 'Invalid request data'}, 
                 status=status.HTTP_400_BAD_REQUEST
             )
-            
+        
         serializer = CreatePreOrderSerializer(data=request.data)
         
         if not serializer.is_valid():
@@ -311,7 +383,7 @@ def payment_webhook(request):
         parsed_processing_date = parse_datetime(processing_date) if processing_date else datetime.now()
         
         # 입금 데이터 저장
-        PaymentDepositModel.objects.create(
+        deposit = payment_repository.record_deposit(
             transaction_name=transaction_name,
             bank_account_number=bank_account_number,
             amount=amount,
@@ -322,12 +394,9 @@ def payment_webhook(request):
             balance=balance or 0
         )
         
-        # pre-order 상태의 주문 찾기 및 상태 변경
-        pre_order = get_pre_order_by_payment_info_use_case.execute(transaction_name, amount)
-        
-        if pre_order:
-            # 주문 상태를 completed로 변경
-            update_order_status_use_case.execute(pre_order.id, 'completed')
+        # 결제 대기 선주문과 매칭해 매칭 기록을 남기고 주문을 completed로 변경
+        # (정확히 일치하는 선주문이 없으면 잘린 이름 등 후보를 찾고, 애매하면 어드민 미매칭 목록에 남김)
+        reconcile_deposit_use_case.execute(deposit)
         
         # PayAction 문서에 명시된 성공 응답 형식
         return Response({'status': 'success'}, status=status.HTTP_200_OK)
@@ -341,7 +410,8 @@ def payment_webhook(request):
 def check_payment_status(request, order_id):
     """
     주문 ID를 받아서 해당 주문의 결제 완료 상태를 확인합니다.
-    결제가 완료된 경우 Discord 알림을 전송합니다.
+    결제가 완료되었는데 아직 Discord 알림이 기록되지 않은 경우 알림 아웃박스에 기록합니다.
+    (전송은 dispatch_notifications 디스패처가 담당하므로 이 요청은 Discord 응답을 기다리지 않습니다.)
     """
     try:
         # 주문 조회
@@ -356,36 +426,9 @@ def check_payment_status(request, order_id):
         # 결제 완료 상태 확인
         is_completed = order.status == 'completed'
         
-        # 결제가 완료되고 아직 Discord 알림을 보내지 않은 경우에만 알림 전송
+        # 결제 완료 시 아웃박스에 기록되지만, 그 이전에 완료된 주문도 알림이 나가도록 보장 (중복 기록되지 않음)
         if is_completed and not order.discord_notified:
-            try:
-                # 테이블 정보 조회
-                table_name = order.table.name if order.table and order.table.name else f"테이블 {order.table.id}"
-                
-                # 주문 메뉴 정보 준비
-                order_items = []
-                for item in order.items:
-                    order_items.append({
-                        'name': item.food.name,
-                        'quantity': item.quantity,
-                        'price': item.total_price
-                    })
-                
-                # Discord 알림 전송
-                success = discord_service.send_payment_completion_notification(
-                    order_id=order_id,
-                    payer_name=order.payer_name,
-                    total_amount=order.total_amount,
-                    table_name=table_name,
-                    order_items=order_items
-                )
-                
-                # 알림 전송 성공 시 상태 업데이트
-                if success:
-                    order_repository.update_discord_notification_status(order_id, True)
-                    
-            except Exception as discord_error:
-                pass
+            notification_repository.enqueue_payment_completion(order.id)
         
         return Response({
             'order_id': order_id,
@@ -435,7 +478,7 @@ def reset_table_orders(request, table_id):
 def call_staff(request, table_id):
     """
     특정 테이블에서 직원을 호출합니다.
-    Discord 웹훅을 통해 직원호출 알림을 전송합니다.
+    직원호출 알림을 아웃박스에 기록하면 디스패처가 다른 알림과 묶어 Discord 웹훅으로 전송합니다.
     """
     try:
         # 테이블이 존재하는지 확인
@@ -446,22 +489,22 @@ def call_staff(request, table_id):
                 status=status.HTTP_404_NOT_FOUND
             )
         
-        # 요청에서 메시지 추출 (선택적)
-        message = request.data.get('message', '') if request.data else ''
-        
-        # Discord 알림 전송
-        success = discord_service.send_staff_call_notification(table.name, message)
-        
-        if success:
-            return Response(
-                {'message': f'Staff call notification sent for table {table_id}'}, 
-                status=status.HTTP_200_OK
-            )
-        else:
+        # 웹훅이 설정되지 않았으면 알림을 전달할 수 없음
+        if not settings.DISCORD_CALL_WEBHOOK_URL:
             return Response(
                 {'error': 'Failed to send staff call notification'}, 
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
+        
+        # 요청에서 메시지 추출 (선택적)
+        message = request.data.get('message', '') if request.data else ''
+        
+        # 전송을 기다리지 않으며, 전송 대기 중인 같은 테이블의 호출이 있으면 그 알림에 합쳐짐
+        call_count = notification_repository.enqueue_staff_call(table.id, table.name, message)
+        return Response(
+            {'message': f'Staff call notification queued for table {table_id}', 'callCount': call_count}, 
+            status=status.HTTP_200_OK
+        )
     
     except Exception as e:
         return Response(
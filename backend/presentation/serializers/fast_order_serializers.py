@@ -0,0 +1,133 @@
+"""
+주문 응답용 고속 직렬화 함수.
+
+OrderSerializer/OrderHistorySerializer와 같은 dict를 만들지만, 아이템·음식마다 DRF Serializer
+인스턴스를 만들지 않고 한 번의 순회로 처리합니다. Repository가 같은 조회 결과 안에서 Table/Food
+엔티티를 공유하므로, 이미 변환한 엔티티의 dict는 재사용합니다.
+반환된 dict는 응답 렌더링 전용이며, 공유되는 하위 dict가 있으므로 수정하면 안 됩니다.
+
+sideload_foods=True이면 주문 라인에는 foodId만 넣고, 음식 정보는 응답 최상위 foods 맵
+(음식 ID 문자열 -> 음식)에 한 번만 담습니다.
+fieldset이 주어지면 주문/테이블/음식별로 선택된 필드만 만듭니다.
+"""
+from datetime import timezone
+from typing import Dict, List, Optional
+
+from domain.entities.food import Food
+from domain.entities.order import Order
+from domain.entities.table import Table
+from .sparse_fields import select_fields
+
+
+class _OrderDictBuilder:
+    def __init__(self, sideload_foods: bool = False, fieldset=None):
+        self.sideload_foods = sideload_foods
+        self.order_fields = fieldset.order if fieldset else None
+        self.table_fields = fieldset.table if fieldset else None
+        self.food_fields = fieldset.food if fieldset else None
+        # 엔티티 객체 id() -> 변환된 dict (한 번의 직렬화 호출 동안만 유지)
+        self._foods: Dict[int, dict] = {}
+        self._tables: Dict[int, dict] = {}
+        # sideload_foods일 때 응답에 담을 음식 맵
+        self.foods_by_id: Dict[str, dict] = {}
+    
+    def food(self, food: Food) -> dict:
+        data = self._foods.get(id(food))
+        if data is None:
+            data = self._foods[id(food)] = select_fields({
+                'id': food.id,
+                'name': food.name,
+                'price': food.price,
+                'category': food.category.value,
+                'description': food.description,
+                'image': food.image,
+                'soldOut': food.sold_out,
+            }, self.food_fields)
+        return data
+    
+    def table(self, table: Table) -> dict:
+        data = self._tables.get(id(table))
+        if data is None:
+            data = self._tables[id(table)] = select_fields({
+                'id': table.id,
+                'name': table.name,
+                'createdAt': table.created_at.isoformat(),
+                'updatedAt': table.updated_at.isoformat(),
+            }, self.table_fields)
+        return data
+    
+    def food_ref(self, food: Food) -> dict:
+        data = self.food(food)
+        self.foods_by_id.setdefault(str(food.id), data)
+        return {'foodId': food.id}
+    
+    def line(self, item) -> dict:
+        if self.sideload_foods:
+            data = self.food_ref(item.food)
+        else:
+            data = {'food': self.food(item.food)}
+        data['quantity'] = item.quantity
+        data['price'] = item.price
+        return data
+    
+    def minus_line(self, item) -> dict:
+        data = self.line(item)
+        data['reason'] = item.reason
+        return data
+    
+    def order(self, order: Order) -> dict:
+        if self.order_fields is not None:
+            return {field: self._order_field(order, field) for field in self.order_fields}
+        return {
+            'id': order.id,
+            'table': self.table(order.table),
+            'orderDate': self._order_date(order),
+            'items': [self.line(item) for item in order.items],
+            'minusItems': [self.minus_line(item) for item in (order.minus_items or [])],
+            'totalAmount': order.total_amount,
+        }
+    
+    def _order_field(self, order: Order, field: str):
+        if field == 'id':
+            return order.id
+        if field == 'table':
+            return self.table(order.table)
+        if field == 'orderDate':
+            return self._order_date(order)
+        if field == 'items':
+            return [self.line(item) for item in order.items]
+        if field == 'minusItems':
+            return [self.minus_line(item) for item in (order.minus_items or [])]
+        if field == 'totalAmount':
+            return order.total_amount
+        if field == 'status':
+            return order.status
+        raise ValueError(f"Unknown field: {field}")
+    
+    def _order_date(self, order: Order) -> str:
+        order_date = order.order_date
+        if not order_date.tzinfo:
+            order_date = order_date.replace(tzinfo=timezone.utc)
+        return order_date.isoformat()
+
+
+def serialize_order(order: Order, fieldset=None) -> dict:
+    """OrderSerializer(order).data와 같은 dict를 반환합니다."""
+    return _OrderDictBuilder(fieldset=fieldset).order(order)
+
+
+def serialize_order_history(orders: List[Order], total_spent: int, next_cursor: Optional[str] = None,
+                            sideload_foods: bool = False, fieldset=None) -> dict:
+    """
+    OrderHistorySerializer와 같은 dict를 반환합니다. total_spent는 호출자가 집계한 값을 그대로 사용합니다.
+    sideload_foods=True이면 음식 정보를 foods 맵으로 분리합니다.
+    """
+    builder = _OrderDictBuilder(sideload_foods, fieldset)
+    data = {
+        'orders': [builder.order(order) for order in orders],
+        'totalSpent': total_spent,
+        'nextCursor': next_cursor,
+    }
+    if sideload_foods:
+        data['foods'] = builder.foods_by_id
+    return data
@@ -1,8 +1,9 @@
 from rest_framework import serializers
 from domain.entities.food import Food
+from .sparse_fields import SparseFieldsMixin
 
 
-class FoodSerializer(serializers.Serializer):
+class FoodSerializer(SparseFieldsMixin, serializers.Serializer):
     id = serializers.IntegerField(read_only=True)
     name = serializers.CharField(max_length=100)
     price = serializers.IntegerField(min_value=0)
@@ -12,7 +13,7 @@ class FoodSerializer(serializers.Serializer):
     sold_out = serializers.BooleanField(default=False, source='soldOut')
     
     def to_representation(self, instance: Food):
-        return {
+        return self.select_fields({
             'id': instance.id,
             'name': instance.name,
             'price': instance.price,
@@ -20,4 +21,4 @@ class FoodSerializer(serializers.Serializer):
             'description': instance.description,
             'image': instance.image,
             'soldOut': instance.sold_out,
-        }
\ No newline at end of file
+        })
\ No newline at end of file
@@ -70,12 +70,16 @@ class OrderHistorySerializer(serializers.Serializer):
     total_spent = serializers.SerializerMethodField(read_only=True)
     
     def get_total_spent(self, obj):
+        # 페이지네이션된 응답은 전체 집계 값을 그대로 사용
+        if 'total_spent' in obj:
+            return obj['total_spent']
         return sum(order.total_amount for order in obj['orders'])
     
     def to_representation(self, instance):
         return {
             'orders': [OrderSerializer().to_representation(order) for order in instance['orders']],
             'totalSpent': self.get_total_spent(instance),
+            'nextCursor': instance.get('next_cursor'),
         }
 
 
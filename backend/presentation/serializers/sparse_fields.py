@@ -0,0 +1,22 @@
+from typing import Optional, Sequence
+
+
+def select_fields(data: dict, fields: Optional[Sequence[str]]) -> dict:
+    """fields가 주어지면 해당 키만 남긴 dict를 반환합니다."""
+    if fields is None:
+        return data
+    return {field: data[field] for field in fields}
+
+
+class SparseFieldsMixin:
+    """
+    Serializer(..., fields=('id', 'name'))처럼 응답 키를 선택할 수 있게 합니다.
+    to_representation에서 select_fields()로 결과를 감싸 사용합니다.
+    """
+    
+    def __init__(self, *args, fields: Optional[Sequence[str]] = None, **kwargs):
+        self.selected_fields = fields
+        super().__init__(*args, **kwargs)
+    
+    def select_fields(self, data: dict) -> dict:
+        return select_fields(data, self.selected_fields)
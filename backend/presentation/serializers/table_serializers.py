@@ -1,17 +1,18 @@
 from rest_framework import serializers
 from domain.entities.table import Table
+from .sparse_fields import SparseFieldsMixin
 
 
-class TableSerializer(serializers.Serializer):
+class TableSerializer(SparseFieldsMixin, serializers.Serializer):
     id = serializers.CharField(read_only=True)
     name = serializers.CharField(read_only=True)
     created_at = serializers.DateTimeField(read_only=True)
     updated_at = serializers.DateTimeField(read_only=True)
     
     def to_representation(self, instance: Table):
-        return {
+        return self.select_fields({
             'id': instance.id,
             'name': instance.name,
             'createdAt': instance.created_at.isoformat(),
             'updatedAt': instance.updated_at.isoformat(),
-        }
\ No newline at end of file
+        })
\ No newline at end of file
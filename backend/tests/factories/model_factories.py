@@ -9,6 +9,7 @@ import uuid
 from infrastructure.database.models import (
     FoodModel, 
     TableModel, 
+    TableSessionModel,
     OrderModel, 
     OrderItemModel,
     MinusOrderItemModel,
@@ -49,19 +50,42 @@ class TableModelFactory(DjangoModelFactory):
     updated_at = factory.LazyFunction(timezone.now)
 
 
+class TableSessionModelFactory(DjangoModelFactory):
+    """Factory for creating TableSessionModel instances."""
+    
+    class Meta:
+        model = TableSessionModel
+    
+    id = factory.LazyFunction(uuid.uuid4)
+    table = factory.SubFactory(TableModelFactory)
+    started_at = factory.LazyFunction(timezone.now)
+    ended_at = None
+
+
+def _session_for(order):
+    """is_visible이면 테이블의 현재 세션, 아니면 종료된 세션에 주문을 연결합니다."""
+    if order.is_visible:
+        session = TableSessionModel.objects.filter(table=order.table, ended_at__isnull=True).first()
+        return session or TableSessionModelFactory(table=order.table)
+    return TableSessionModelFactory(table=order.table, ended_at=timezone.now())
+
+
 class OrderModelFactory(DjangoModelFactory):
     """Factory for creating OrderModel instances."""
     
     class Meta:
         model = OrderModel
     
+    class Params:
+        is_visible = True
+    
     id = factory.LazyFunction(uuid.uuid4)
     table = factory.SubFactory(TableModelFactory)
     payer_name = factory.Faker('name')
     status = 'completed'
     pre_order_amount = None
     order_date = factory.LazyFunction(timezone.now)
-    is_visible = True
+    session = factory.LazyAttribute(_session_for)
     discord_notified = False
     created_at = factory.LazyFunction(timezone.now)
     updated_at = factory.LazyFunction(timezone.now)
@@ -0,0 +1,97 @@
+"""
+Fake Discord webhook server for tests.
+
+A real HTTP server on 127.0.0.1 that records every JSON payload it receives and answers
+with scripted responses, so notification code can be exercised over the network
+(including 429 rate limits and 5xx errors) without reaching Discord.
+"""
+import json
+import threading
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class FakeDiscordWebhookServer:
+    """
+    Usage:
+        with FakeDiscordWebhookServer() as server:
+            server.enqueue_response(429, {'retry_after': 0.5, 'global': False})
+            ... post to server.url ...
+            assert server.requests[0]['embeds']
+    
+    Requests are answered with queued responses in order, then with 204 No Content.
+    Connections are kept alive (HTTP/1.1); connection_count is the number of TCP connections accepted.
+    """
+    
+    def __init__(self):
+        self.requests = []
+        self.paths = []
+        self.connection_count = 0
+        self._responses = deque()
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._make_handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+    
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address
+        return f'http://{host}:{port}/api/webhooks/test/token'
+    
+    def enqueue_response(self, status: int, body=None, headers=None) -> None:
+        """Queue the response for the next unanswered request."""
+        with self._lock:
+            self._responses.append((status, body, headers or {}))
+    
+    def start(self) -> 'FakeDiscordWebhookServer':
+        self._thread.start()
+        return self
+    
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+    
+    def __enter__(self):
+        return self.start()
+    
+    def __exit__(self, *exc_info):
+        self.stop()
+    
+    def _next_response(self):
+        with self._lock:
+            return self._responses.popleft() if self._responses else (204, None, {})
+    
+    def _make_handler(self):
+        fake = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            
+            def setup(self):
+                super().setup()
+                # One handler instance is created per accepted connection
+                with fake._lock:
+                    fake.connection_count += 1
+            
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length', 0))
+                payload = json.loads(self.rfile.read(length) or b'null')
+                with fake._lock:
+                    fake.requests.append(payload)
+                    fake.paths.append(self.path)
+                
+                status, body, headers = fake._next_response()
+                data = json.dumps(body).encode() if body is not None else b''
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                if data:
+                    self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+            
+            def log_message(self, format, *args):
+                pass
+        
+        return Handler
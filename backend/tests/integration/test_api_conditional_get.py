@@ -0,0 +1,166 @@
+"""
+Integration tests for conditional GET (ETag / Last-Modified) on API endpoints.
+"""
+import uuid
+
+import pytest
+from unittest.mock import patch
+from rest_framework.test import APIClient
+from rest_framework import status
+
+from infrastructure.database.models import FoodModel, MenuVersionModel, TableModel, TableSessionModel
+from tests.factories.model_factories import (
+    FoodModelFactory,
+    TableModelFactory,
+    OrderModelFactory,
+    OrderItemModelFactory
+)
+
+
+@pytest.mark.integration
+@pytest.mark.database
+@pytest.mark.django_db(transaction=True)
+class TestConditionalGet:
+    """If-None-Match가 일치하면 직렬화 없이 304를 반환하는지 검증합니다."""
+    
+    def setup_method(self):
+        self.client = APIClient()
+    
+    def _assert_not_modified(self, url, etag, django_assert_max_num_queries, max_queries):
+        # 엔티티 조회/직렬화 없이 검증자 조회만 수행
+        with patch('presentation.api.views.serialize_order_history') as order_serializer, \
+                patch('presentation.api.views.FoodSerializer') as food_serializer, \
+                patch('presentation.api.views.TableSerializer') as table_serializer:
+            with django_assert_max_num_queries(max_queries):
+                response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.content == b''
+        order_serializer.assert_not_called()
+        food_serializer.assert_not_called()
+        table_serializer.assert_not_called()
+    
+    def test_food_list_etag(self, django_assert_max_num_queries):
+        """메뉴 목록은 메뉴 버전 기반 ETag를 사용하고, 품절 변경 시 ETag가 바뀐다."""
+        # Given
+        food = FoodModelFactory(sold_out=False)
+        response = self.client.get('/api/foods/')
+        etag = response['ETag']
+        assert response.status_code == status.HTTP_200_OK
+        assert response.has_header('Last-Modified')
+        
+        # When & Then
+        self._assert_not_modified('/api/foods/', etag, django_assert_max_num_queries, 1)
+        
+        # 어드민처럼 FoodModel을 직접 저장하면 ETag가 바뀜
+        food.sold_out = True
+        food.save()
+        response = self.client.get('/api/foods/', HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response['ETag'] != etag
+        assert response.json()[0]['soldOut'] is True
+    
+    def test_food_list_etag_without_menu_version_row(self, django_assert_max_num_queries):
+        """메뉴 버전 행 없이 배포된 DB에서도 첫 조회에서 행을 만들어 ETag를 사용한다."""
+        # Given - 버전 행이 생기기 전에 만들어 둔 메뉴
+        FoodModelFactory(sold_out=False)
+        MenuVersionModel.objects.all().delete()
+        
+        # When
+        response = self.client.get('/api/foods/')
+        
+        # Then
+        assert response.status_code == status.HTTP_200_OK
+        assert MenuVersionModel.objects.exists()
+        self._assert_not_modified('/api/foods/', response['ETag'], django_assert_max_num_queries, 1)
+    
+    def test_food_list_etag_differs_by_category(self):
+        """카테고리 파라미터가 다르면 ETag도 다르다."""
+        # Given
+        FoodModelFactory(category='main')
+        
+        # When
+        all_etag = self.client.get('/api/foods/')['ETag']
+        main_etag = self.client.get('/api/foods/?category=main')['ETag']
+        
+        # Then
+        assert all_etag != main_etag
+    
+    def test_table_detail_etag(self, django_assert_max_num_queries):
+        """테이블 상세는 updated_at 기반 ETag/Last-Modified를 사용한다."""
+        # Given
+        table = TableModelFactory(name="테이블 1")
+        url = f'/api/tables/{table.id}/'
+        response = self.client.get(url)
+        etag = response['ETag']
+        assert response.status_code == status.HTTP_200_OK
+        assert response.has_header('Last-Modified')
+        
+        # When & Then
+        self._assert_not_modified(url, etag, django_assert_max_num_queries, 1)
+        
+        TableModel.objects.filter(id=table.id).update(name="테이블 2")
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()['name'] == "테이블 2"
+    
+    def test_table_detail_not_found_has_no_etag(self):
+        """존재하지 않는 테이블은 ETag 없이 404를 반환한다."""
+        # When
+        response = self.client.get(f'/api/tables/{uuid.uuid4()}/')
+        
+        # Then
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert not response.has_header('ETag')
+    
+    def test_table_orders_etag(self, django_assert_max_num_queries):
+        """테이블 주문 내역은 주문 버전이 바뀔 때만 다시 직렬화된다."""
+        from tests.factories.model_factories import MinusOrderItemModelFactory
+        # Given
+        table = TableModelFactory()
+        food = FoodModelFactory(price=10000)
+        order = OrderModelFactory(table=table)
+        OrderItemModelFactory(order=order, food=food, quantity=2, price=10000)
+        url = f'/api/tables/{table.id}/orders/'
+        response = self.client.get(url)
+        etag = response['ETag']
+        assert response.status_code == status.HTTP_200_OK
+        
+        # When & Then
+        self._assert_not_modified(url, etag, django_assert_max_num_queries, 2)
+        
+        # 환불(차감 아이템 추가)
+        MinusOrderItemModelFactory(order=order, food=food, quantity=-1, price=10000, reason='sold_out')
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()['totalSpent'] == 10000
+        refund_etag = response['ETag']
+        
+        # 새 주문
+        new_order = OrderModelFactory(table=table)
+        OrderItemModelFactory(order=new_order, food=food, quantity=1, price=10000)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=refund_etag)
+        assert response.status_code == status.HTTP_200_OK
+        reorder_etag = response['ETag']
+        
+        # 테이블 정리(세션 종료)
+        TableSessionModel.objects.filter(table=table).update(ended_at=order.order_date)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=reorder_etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()['orders'] == []
+    
+    def test_table_orders_etag_changes_with_menu(self):
+        """주문에 포함된 음식 정보가 바뀌면 ETag가 바뀐다."""
+        # Given
+        table = TableModelFactory()
+        food = FoodModelFactory(name="비빔밥", price=10000)
+        order = OrderModelFactory(table=table)
+        OrderItemModelFactory(order=order, food=food, quantity=1, price=10000)
+        url = f'/api/tables/{table.id}/orders/'
+        etag = self.client.get(url)['ETag']
+        
+        # When
+        FoodModel.objects.get(id=food.id).save()
+        
+        # Then
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
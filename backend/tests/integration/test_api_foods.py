@@ -137,6 +137,21 @@ class TestFoodAPIEndpoints(TransactionTestCase):
         assert response_data['category'] == "main"
         assert response_data['soldOut'] is False
     
+    def test_get_food_list_and_detail_with_fields(self):
+        """fields로 선택한 음식 필드만 기본 응답 순서대로 내려온다."""
+        # Given
+        food = FoodModelFactory(name="비빔밥", price=12000)
+        
+        # When
+        list_response = self.client.get('/api/foods/?fields=price,name')
+        detail_response = self.client.get(f'/api/foods/{food.id}/?fields=id,soldOut')
+        
+        # Then
+        assert list_response.status_code == status.HTTP_200_OK
+        assert list_response.json() == [{'name': "비빔밥", 'price': 12000}]
+        assert detail_response.json() == {'id': food.id, 'soldOut': False}
+        assert self.client.get('/api/foods/?fields=secret').status_code == status.HTTP_400_BAD_REQUEST
+    
     def test_get_food_detail_not_found(self):
         """존재하지 않는 음식 조회 시 404 오류를 반환한다."""
         # Given
@@ -163,4 +178,66 @@ class TestFoodAPIEndpoints(TransactionTestCase):
         assert response.status_code == status.HTTP_200_OK
         
         response_data = response.json()
-        assert response_data == []
\ No newline at end of file
+        assert response_data == []
+    
+    def test_get_food_list_matches_drf_rendering(self):
+        """미리 인코딩된 메뉴 응답은 DRF 직렬화/설정된 렌더러 결과와 바이트 단위로 같다."""
+        # Given
+        from rest_framework.settings import api_settings
+        from infrastructure.database.repositories import DjangoFoodRepository
+        from presentation.serializers.food_serializers import FoodSerializer
+        
+        FoodModelFactory(name="비빔밥", price=12000, category='main', description="매콤한   비빔밥")
+        FoodModelFactory(name="감자튀김", price=5000, category='side')
+        
+        for query, foods in [
+            ('', DjangoFoodRepository().get_all()),
+            ('?category=main', DjangoFoodRepository().get_by_category(FoodCategory.MAIN)),
+        ]:
+            # When
+            response = self.client.get(f'/api/foods/{query}')
+            
+            # Then
+            assert response.status_code == status.HTTP_200_OK
+            assert response['Content-Type'] == 'application/json'
+            renderer = api_settings.DEFAULT_RENDERER_CLASSES[0]()
+            assert response.content == renderer.render(FoodSerializer(foods, many=True).data)
+    
+    def test_get_food_list_gzip_negotiation(self):
+        """Accept-Encoding에 gzip이 있으면 미리 압축된 본문을 반환한다."""
+        # Given
+        import gzip
+        FoodModelFactory.create_batch(5)
+        plain = self.client.get('/api/foods/')
+        
+        # When
+        response = self.client.get('/api/foods/', HTTP_ACCEPT_ENCODING='br, gzip')
+        
+        # Then
+        assert response.status_code == status.HTTP_200_OK
+        assert response['Content-Encoding'] == 'gzip'
+        assert 'Accept-Encoding' in response['Vary']
+        assert gzip.decompress(response.content) == plain.content
+        assert not plain.has_header('Content-Encoding')
+        assert response['ETag'] != plain['ETag']
+    
+    def test_get_food_list_skips_serializer_until_menu_changes(self):
+        """메뉴 버전이 같으면 시리얼라이저를 다시 실행하지 않고, 바뀌면 다시 만든다."""
+        # Given
+        from unittest.mock import patch
+        from presentation.serializers.food_serializers import FoodSerializer
+        
+        food = FoodModelFactory(sold_out=False)
+        self.client.get('/api/foods/')
+        
+        # When & Then
+        with patch('presentation.api.menu_payload.FoodSerializer', wraps=FoodSerializer) as serializer:
+            response = self.client.get('/api/foods/')
+            assert serializer.call_count == 0
+            assert response.json()[0]['soldOut'] is False
+            
+            food.sold_out = True
+            food.save()
+            response = self.client.get('/api/foods/')
+            assert serializer.call_count == 1
+            assert response.json()[0]['soldOut'] is True
@@ -177,6 +177,66 @@ class TestOrderAPIEndpoints(TransactionTestCase):
         assert isinstance(response_data['orders'], list)
         assert isinstance(response_data['totalSpent'], int)
     
+    def test_get_order_history_with_sideloaded_foods(self):
+        """sideload=foods이면 음식은 foods 맵으로 한 번만 내려온다."""
+        # Given
+        from tests.factories.model_factories import OrderModelFactory, OrderItemModelFactory
+        table = TableModelFactory()
+        food = FoodModelFactory(name="비빔밥", price=12000)
+        for _ in range(3):
+            order = OrderModelFactory(table=table)
+            OrderItemModelFactory(order=order, food=food, quantity=1, price=12000)
+        
+        # When
+        response = self.client.get(f'/api/orders/history/?table_id={table.id}&sideload=foods')
+        
+        # Then
+        assert response.status_code == status.HTTP_200_OK
+        response_data = response.json()
+        assert list(response_data['foods']) == [str(food.id)]
+        assert response_data['foods'][str(food.id)]['name'] == "비빔밥"
+        for order in response_data['orders']:
+            assert order['items'] == [{'foodId': food.id, 'quantity': 1, 'price': 12000}]
+        
+        default_response = self.client.get(f'/api/orders/history/?table_id={table.id}')
+        assert 'foods' not in default_response.json()
+        assert len(response.content) < len(default_response.content)
+    
+    def test_get_order_history_with_sparse_fieldsets(self):
+        """fields/include로 선택한 필드만 기본 응답 순서대로 내려온다."""
+        # Given
+        from tests.factories.model_factories import OrderModelFactory, OrderItemModelFactory
+        table = TableModelFactory(name="A1")
+        food = FoodModelFactory(name="비빔밥", price=12000)
+        order = OrderModelFactory(table=table)
+        OrderItemModelFactory(order=order, food=food, quantity=2, price=12000)
+        url = f'/api/orders/history/?table_id={table.id}'
+        
+        # When
+        attributes_only = self.client.get(f'{url}&fields=totalAmount,id,status').json()
+        with_items = self.client.get(f'{url}&include=items&fields[food]=name').json()
+        with_table = self.client.get(f'{url}&fields=id,table&fields[table]=name').json()
+        
+        # Then
+        assert attributes_only['orders'] == [{'id': str(order.id), 'totalAmount': 24000, 'status': 'completed'}]
+        assert attributes_only['totalSpent'] == 24000
+        assert list(with_items['orders'][0]) == ['id', 'orderDate', 'items', 'totalAmount']
+        assert with_items['orders'][0]['items'] == [{'food': {'name': "비빔밥"}, 'quantity': 2, 'price': 12000}]
+        assert with_table['orders'] == [{'id': str(order.id), 'table': {'name': "A1"}}]
+    
+    def test_get_order_history_with_unknown_field(self):
+        """알 수 없는 필드나 타입을 요청하면 400을 반환한다."""
+        # When
+        unknown_field = self.client.get('/api/orders/history/?fields=id,secret')
+        unknown_type = self.client.get('/api/orders/history/?fields[user]=id')
+        unknown_include = self.client.get('/api/orders/history/?include=status')
+        
+        # Then
+        assert unknown_field.status_code == status.HTTP_400_BAD_REQUEST
+        assert unknown_field.json() == {'error': 'Unknown field: secret'}
+        assert unknown_type.status_code == status.HTTP_400_BAD_REQUEST
+        assert unknown_include.status_code == status.HTTP_400_BAD_REQUEST
+    
     def test_get_table_orders(self):
         """특정 테이블의 주문 내역 조회 API 테스트."""
         # Given
@@ -8,6 +8,7 @@ from rest_framework.test import APIClient
 from rest_framework import status
 from django.test import TransactionTestCase, override_settings
 
+from infrastructure.database.models import NotificationOutboxModel
 from tests.factories.model_factories import TableModelFactory, OrderModelFactory
 
 
@@ -67,6 +68,19 @@ class TestTableAPIEndpoints(TransactionTestCase):
         assert 'createdAt' in response_data
         assert 'updatedAt' in response_data
     
+    def test_get_table_detail_with_fields(self):
+        """fields로 선택한 테이블 필드만 내려온다."""
+        # Given
+        table = TableModelFactory(name="테이블1")
+        
+        # When
+        response = self.client.get(f'/api/tables/{table.id}/?fields=name')
+        
+        # Then
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {'name': "테이블1"}
+        assert self.client.get(f'/api/tables/{table.id}/?fields=secret').status_code == status.HTTP_400_BAD_REQUEST
+    
     def test_get_table_detail_not_found(self):
         """존재하지 않는 테이블 조회 시 404 오류를 반환한다."""
         # Given
@@ -155,6 +169,42 @@ class TestTableAPIEndpoints(TransactionTestCase):
         assert str(order2.id) in order_ids
         assert str(other_order.id) not in order_ids
     
+    def test_get_table_orders_paginated_with_cursor(self):
+        """limit/cursor로 페이지를 나누어 조회하고 totalSpent는 전체 합계를 반환한다."""
+        # Given
+        from tests.factories.model_factories import FoodModelFactory, OrderItemModelFactory
+        
+        table = TableModelFactory()
+        food = FoodModelFactory(price=10000)
+        for _ in range(5):
+            order = OrderModelFactory(table=table)
+            OrderItemModelFactory(order=order, food=food, quantity=1, price=10000)
+        OrderModelFactory(table=table, status='pre_order', pre_order_amount=30000)
+        
+        # When
+        first = self.client.get(f'/api/tables/{table.id}/orders/?limit=2').json()
+        second = self.client.get(f'/api/tables/{table.id}/orders/?limit=2&cursor={first["nextCursor"]}').json()
+        third = self.client.get(f'/api/tables/{table.id}/orders/?limit=2&cursor={second["nextCursor"]}').json()
+        
+        # Then
+        assert [len(page['orders']) for page in (first, second, third)] == [2, 2, 1]
+        assert third['nextCursor'] is None
+        order_ids = [order['id'] for page in (first, second, third) for order in page['orders']]
+        assert len(set(order_ids)) == 5
+        # 페이지 합계가 아닌 전체 집계
+        assert first['totalSpent'] == second['totalSpent'] == 50000
+    
+    def test_get_table_orders_invalid_cursor(self):
+        """잘못된 커서나 limit은 400을 반환한다."""
+        # Given
+        table = TableModelFactory()
+        
+        # When & Then
+        response = self.client.get(f'/api/tables/{table.id}/orders/?cursor=not-a-cursor')
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        response = self.client.get(f'/api/tables/{table.id}/orders/?limit=0')
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+    
     def test_get_table_orders_invalid_table_id(self):
         """존재하지 않는 테이블의 주문 내역 조회 시 빈 결과를 반환한다."""
         # Given
@@ -195,6 +245,10 @@ class TestTableAPIEndpoints(TransactionTestCase):
         response_data = response.json()
         assert 'message' in response_data
         assert 'reset' in response_data['message'].lower()
+        
+        # 리셋 후에는 테이블 주문 내역이 비어 있어야 함
+        orders_response = self.client.get(f'/api/tables/{table.id}/orders/')
+        assert orders_response.json()['orders'] == []
     
     def test_reset_orders_invalid_table_id(self):
         """존재하지 않는 테이블의 주문 리셋 시 404 오류를 반환한다."""
@@ -226,7 +280,7 @@ class TestTableAPIEndpoints(TransactionTestCase):
 
     @pytest.mark.django_db(transaction=True)
     @override_settings(DISCORD_CALL_WEBHOOK_URL="https://discord.com/api/webhooks/test")
-    @patch('infrastructure.external.discord_service.requests.post')
+    @patch('infrastructure.external.notification_client.NotificationHttpClient.post')
     def test_call_staff_success(self, mock_post):
         """테이블에서 직원 호출을 성공적으로 할 수 있다."""
         # Given
@@ -243,15 +297,18 @@ class TestTableAPIEndpoints(TransactionTestCase):
         
         response_data = response.json()
         assert 'message' in response_data
-        assert 'Staff call notification sent' in response_data['message']
+        assert 'Staff call notification queued' in response_data['message']
         assert str(table.id) in response_data['message']
         
-        # Discord 서비스 호출 확인
-        mock_post.assert_called_once()
+        # 요청 중에는 Discord를 호출하지 않고 아웃박스에 기록
+        mock_post.assert_not_called()
+        entry = NotificationOutboxModel.objects.get()
+        assert entry.kind == NotificationOutboxModel.KIND_STAFF_CALL
+        assert entry.payload == {'table_id': str(table.id), 'table_name': "테이블1", 'message': '물 한 잔 부탁드립니다', 'count': 1}
 
     @pytest.mark.django_db(transaction=True) 
     @override_settings(DISCORD_CALL_WEBHOOK_URL="https://discord.com/api/webhooks/test")
-    @patch('infrastructure.external.discord_service.requests.post')
+    @patch('infrastructure.external.notification_client.NotificationHttpClient.post')
     def test_call_staff_without_message(self, mock_post):
         """메시지 없이도 직원 호출을 할 수 있다."""
         # Given
@@ -266,10 +323,11 @@ class TestTableAPIEndpoints(TransactionTestCase):
         
         response_data = response.json()
         assert 'message' in response_data
-        assert 'Staff call notification sent' in response_data['message']
+        assert 'Staff call notification queued' in response_data['message']
         
-        # Discord 서비스 호출 확인
-        mock_post.assert_called_once()
+        # 요청 중에는 Discord를 호출하지 않고 아웃박스에 기록
+        mock_post.assert_not_called()
+        assert NotificationOutboxModel.objects.filter(kind=NotificationOutboxModel.KIND_STAFF_CALL).count() == 1
 
     @pytest.mark.django_db(transaction=True)
     def test_call_staff_table_not_found(self):
@@ -291,7 +349,7 @@ class TestTableAPIEndpoints(TransactionTestCase):
 
     @pytest.mark.django_db(transaction=True)
     @override_settings(DISCORD_CALL_WEBHOOK_URL="https://discord.com/api/webhooks/test")
-    @patch('infrastructure.external.discord_service.requests.post')
+    @patch('infrastructure.external.notification_client.NotificationHttpClient.post')
     def test_call_staff_with_empty_message(self, mock_post):
         """빈 메시지로도 직원 호출을 할 수 있다."""
         # Given
@@ -308,7 +366,33 @@ class TestTableAPIEndpoints(TransactionTestCase):
         
         response_data = response.json()
         assert 'message' in response_data
-        assert 'Staff call notification sent' in response_data['message']
+        assert 'Staff call notification queued' in response_data['message']
         
-        # Discord 서비스 호출 확인
-        mock_post.assert_called_once()
\ No newline at end of file
+        # 요청 중에는 Discord를 호출하지 않고 아웃박스에 기록
+        mock_post.assert_not_called()
+        assert NotificationOutboxModel.objects.filter(kind=NotificationOutboxModel.KIND_STAFF_CALL).count() == 1
+
+    @pytest.mark.django_db(transaction=True)
+    @override_settings(DISCORD_CALL_WEBHOOK_URL="https://discord.com/api/webhooks/test")
+    def test_call_staff_repeated_calls_are_coalesced(self):
+        """전송 대기 중에 같은 테이블에서 다시 호출하면 알림 하나에 호출 횟수가 쌓인다."""
+        # Given
+        table = TableModelFactory(name="테이블4")
+        other_table = TableModelFactory(name="테이블5")
+        
+        # When
+        responses = [
+            self.client.post(f'/api/tables/{table.id}/call-staff/', {'message': message}, format='json')
+            for message in ['', '물 주세요', '']
+        ]
+        self.client.post(f'/api/tables/{other_table.id}/call-staff/', format='json')
+        
+        # Then
+        assert [response.status_code for response in responses] == [status.HTTP_200_OK] * 3
+        assert [response.json()['callCount'] for response in responses] == [1, 2, 3]
+        
+        entries = NotificationOutboxModel.objects.filter(kind=NotificationOutboxModel.KIND_STAFF_CALL).order_by('id')
+        assert [entry.payload['table_name'] for entry in entries] == ["테이블4", "테이블5"]
+        assert entries[0].payload['count'] == 3
+        # 가장 최근의 메시지를 유지
+        assert entries[0].payload['message'] == '물 주세요'
@@ -0,0 +1,61 @@
+"""
+Benchmark comparing full (200) and conditional (304) responses.
+"""
+import statistics
+import time
+
+import pytest
+from rest_framework.test import APIClient
+
+from tests.factories.model_factories import (
+    FoodModelFactory,
+    TableModelFactory,
+    OrderModelFactory,
+    OrderItemModelFactory
+)
+
+
+@pytest.mark.slow
+@pytest.mark.database
+@pytest.mark.django_db(transaction=True)
+class TestConditionalGetBenchmark:
+    """304 응답이 전체 응답보다 빠른지 측정합니다."""
+    
+    FOOD_COUNT = 30
+    ORDER_COUNT = 20
+    
+    def _measure(self, client, url, repeat=30, **headers):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            response = client.get(url, **headers)
+            timings.append(time.perf_counter() - started)
+        return statistics.median(timings), response.status_code
+    
+    @pytest.fixture
+    def table(self):
+        table = TableModelFactory()
+        foods = FoodModelFactory.create_batch(self.FOOD_COUNT)
+        for i in range(self.ORDER_COUNT):
+            order = OrderModelFactory(table=table)
+            for food in foods[i % 5::5]:
+                OrderItemModelFactory(order=order, food=food, quantity=2, price=food.price)
+        return table
+    
+    @pytest.mark.parametrize('path', ['/api/foods/', '/api/tables/{id}/', '/api/tables/{id}/orders/'])
+    def test_not_modified_is_faster_than_full_response(self, table, path):
+        """If-None-Match가 일치하는 304 응답은 200 응답보다 빠르다."""
+        # Given
+        client = APIClient()
+        url = path.format(id=table.id)
+        etag = client.get(url)['ETag']
+        
+        # When
+        full_median, full_status = self._measure(client, url)
+        cached_median, cached_status = self._measure(client, url, HTTP_IF_NONE_MATCH=etag)
+        
+        # Then
+        print(f"\n{url}: 200 {full_median * 1000:.2f}ms / 304 {cached_median * 1000:.2f}ms")
+        assert full_status == 200
+        assert cached_status == 304
+        assert cached_median < full_median
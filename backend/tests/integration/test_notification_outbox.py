@@ -0,0 +1,535 @@
+"""
+Integration tests for the Discord notification outbox and dispatcher.
+"""
+import pytest
+from datetime import timedelta
+from unittest.mock import patch
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from domain.repositories.notification_repository import NotificationRepository
+from domain.use_cases.order_use_cases import UpdateOrderStatusUseCase
+from infrastructure.database.models import NotificationOutboxModel, OrderModel
+from infrastructure.database.repositories import DjangoNotificationRepository, DjangoOrderRepository
+from infrastructure.external.circuit_breaker import CircuitBreaker
+from infrastructure.external.notification_dispatcher import NotificationDispatcher
+from infrastructure.transaction.django_transaction_manager import DjangoTransactionManager
+from tests.factories.model_factories import (
+    FoodModelFactory,
+    OrderItemModelFactory,
+    OrderModelFactory,
+    PreOrderModelFactory
+)
+from tests.fakes.discord_webhook_server import FakeDiscordWebhookServer
+
+
+class FailingNotificationRepository(NotificationRepository):
+    def enqueue_payment_completion(self, order_id: str) -> bool:
+        raise RuntimeError("outbox unavailable")
+    
+    def enqueue_staff_call(self, table_id: str, table_name: str, message: str = '') -> None:
+        raise RuntimeError("outbox unavailable")
+
+
+@pytest.mark.integration
+@pytest.mark.database
+@pytest.mark.django_db(transaction=True)
+class TestNotificationOutbox:
+    """상태 변경과 같은 트랜잭션에서 알림이 기록되는지 검증합니다."""
+    
+    def test_payment_webhook_enqueues_without_calling_discord(self):
+        """결제 웹훅은 Discord를 호출하지 않고 아웃박스에 알림을 기록한다."""
+        # Given
+        pre_order = PreOrderModelFactory(payer_name="홍길동", pre_order_amount=20000)
+        
+        # When
+        with override_settings(PAYACTION_WEBHOOK_KEY="test-key"), \
+                patch('infrastructure.external.notification_client.NotificationHttpClient.post') as mock_post:
+            response = APIClient().post('/api/webhook/payment/', {
+                'transaction_name': "홍길동",
+                'bank_account_number': "123-456",
+                'amount': 20000,
+                'transaction_type': 'deposited',
+            }, format='json', HTTP_X_WEBHOOK_KEY="test-key")
+        
+        # Then
+        assert response.status_code == status.HTTP_200_OK
+        mock_post.assert_not_called()
+        entry = NotificationOutboxModel.objects.get()
+        assert entry.order_id == pre_order.id
+        assert entry.kind == NotificationOutboxModel.KIND_PAYMENT_COMPLETED
+        assert entry.status == NotificationOutboxModel.STATUS_PENDING
+        order = OrderModel.objects.get(id=pre_order.id)
+        assert order.status == 'completed'
+        assert order.discord_notified is False
+    
+    def test_status_change_rolls_back_when_outbox_write_fails(self):
+        """알림 기록이 실패하면 주문 상태 변경도 롤백된다."""
+        # Given
+        pre_order = PreOrderModelFactory()
+        use_case = UpdateOrderStatusUseCase(
+            DjangoOrderRepository(), FailingNotificationRepository(), DjangoTransactionManager()
+        )
+        
+        # When
+        with pytest.raises(RuntimeError):
+            use_case.execute(str(pre_order.id), 'completed')
+        
+        # Then
+        assert OrderModel.objects.get(id=pre_order.id).status == 'pre_order'
+    
+    def test_enqueue_is_idempotent(self):
+        """같은 주문의 결제 완료 알림은 한 번만 기록된다."""
+        # Given
+        order = OrderModelFactory()
+        repository = DjangoNotificationRepository()
+        
+        # When
+        first = repository.enqueue_payment_completion(str(order.id))
+        second = repository.enqueue_payment_completion(str(order.id))
+        
+        # Then
+        assert (first, second) == (True, False)
+        assert NotificationOutboxModel.objects.count() == 1
+    
+    def test_check_payment_status_enqueues_once_without_calling_discord(self):
+        """결제 상태 조회는 알림을 기록만 하고 Discord 응답을 기다리지 않는다."""
+        # Given
+        order = OrderModelFactory(status='completed')
+        OrderItemModelFactory(order=order, food=FoodModelFactory(), quantity=1, price=10000)
+        client = APIClient()
+        
+        # When
+        with patch('infrastructure.external.notification_client.NotificationHttpClient.post') as mock_post:
+            responses = [client.get(f'/api/orders/{order.id}/payment-status/') for _ in range(2)]
+        
+        # Then
+        assert all(response.status_code == status.HTTP_200_OK for response in responses)
+        assert responses[0].json()['payment_completed'] is True
+        mock_post.assert_not_called()
+        assert NotificationOutboxModel.objects.filter(order_id=order.id).count() == 1
+
+
+@pytest.mark.integration
+@pytest.mark.database
+@pytest.mark.django_db(transaction=True)
+class TestNotificationDispatcher:
+    """가짜 Discord 웹훅 서버로 디스패처의 전송/재시도 동작을 검증합니다."""
+    
+    @pytest.fixture
+    def webhook_server(self):
+        with FakeDiscordWebhookServer() as server:
+            with override_settings(DISCORD_WEBHOOK_URL=server.url):
+                yield server
+    
+    def _enqueue_completed_order(self, payer_name="홍길동"):
+        order = OrderModelFactory(status='completed', payer_name=payer_name)
+        OrderItemModelFactory(order=order, food=FoodModelFactory(name="비빔밥"), quantity=2, price=12000)
+        DjangoNotificationRepository().enqueue_payment_completion(str(order.id))
+        return order
+    
+    def _make_due(self):
+        NotificationOutboxModel.objects.update(next_attempt_at=timezone.now())
+    
+    def test_delivers_and_marks_order_notified(self, webhook_server):
+        """전송에 성공하면 알림을 완료 처리하고 주문의 discord_notified를 True로 변경한다."""
+        # Given
+        order = self._enqueue_completed_order()
+        
+        # When
+        processed = NotificationDispatcher(batch_window=0).dispatch_pending()
+        
+        # Then
+        assert processed == 1
+        assert len(webhook_server.requests) == 1
+        fields = {field['name']: field['value'] for field in webhook_server.requests[0]['embeds'][0]['fields']}
+        assert fields['결제자'] == "홍길동"
+        assert fields['결제 금액'] == "24,000원"
+        assert "비빔밥 x2" in fields['주문 메뉴']
+        
+        entry = NotificationOutboxModel.objects.get()
+        assert entry.status == NotificationOutboxModel.STATUS_SENT
+        assert entry.attempts == 1
+        assert entry.sent_at is not None
+        assert OrderModel.objects.get(id=order.id).discord_notified is True
+        
+        # 완료된 알림은 다시 보내지 않음
+        assert NotificationDispatcher(batch_window=0).dispatch_pending() == 0
+        assert len(webhook_server.requests) == 1
+    
+    def test_honors_rate_limit_retry_after(self, webhook_server):
+        """429 응답의 retry_after까지 묶음의 알림을 모두 미루고, 시도 횟수는 늘리지 않는다."""
+        # Given
+        self._enqueue_completed_order("홍길동")
+        self._enqueue_completed_order("김철수")
+        webhook_server.enqueue_response(429, {'message': "You are being rate limited.", 'retry_after': 30.0, 'global': False})
+        dispatcher = NotificationDispatcher(batch_window=0)
+        
+        # When
+        before = timezone.now()
+        dispatcher.dispatch_pending()
+        
+        # Then - 묶음 요청이 거절되어 모두 retry_after 이후로 미뤄짐
+        assert len(webhook_server.requests) == 1
+        assert len(webhook_server.requests[0]['embeds']) == 2
+        for entry in NotificationOutboxModel.objects.all():
+            assert entry.status == NotificationOutboxModel.STATUS_PENDING
+            assert entry.attempts == 0
+            assert entry.next_attempt_at >= before + timedelta(seconds=30)
+        assert dispatcher.dispatch_pending() == 0
+        
+        # When - retry_after가 지나면
+        self._make_due()
+        dispatcher.dispatch_pending()
+        
+        # Then - 미뤄진 알림은 한 요청으로 묶여 전송됨
+        assert len(webhook_server.requests) == 2
+        assert len(webhook_server.requests[1]['embeds']) == 2
+        assert NotificationOutboxModel.objects.filter(status=NotificationOutboxModel.STATUS_SENT).count() == 2
+        assert OrderModel.objects.filter(discord_notified=True).count() == 2
+    
+    def test_retries_server_errors_with_backoff_then_fails(self, webhook_server):
+        """5xx 응답은 백오프 후 재시도하고, max_attempts번 실패하면 failed로 남긴다."""
+        # Given
+        order = self._enqueue_completed_order()
+        webhook_server.enqueue_response(502, {'message': "Bad Gateway"})
+        webhook_server.enqueue_response(503, {'message': "Service Unavailable"})
+        dispatcher = NotificationDispatcher(max_attempts=2, base_backoff=10.0, batch_window=0)
+        
+        # When
+        before = timezone.now()
+        dispatcher.dispatch_pending()
+        
+        # Then - 첫 실패는 백오프 후 재시도 예정
+        entry = NotificationOutboxModel.objects.get()
+        assert entry.status == NotificationOutboxModel.STATUS_PENDING
+        assert entry.attempts == 1
+        assert entry.next_attempt_at >= before + timedelta(seconds=5)
+        assert entry.last_error.startswith("502")
+        
+        # When - 재시도에서도 실패하면
+        self._make_due()
+        dispatcher.dispatch_pending()
+        
+        # Then
+        entry.refresh_from_db()
+        assert entry.status == NotificationOutboxModel.STATUS_FAILED
+        assert entry.attempts == 2
+        assert len(webhook_server.requests) == 2
+        assert OrderModel.objects.get(id=order.id).discord_notified is False
+    
+    def test_client_error_fails_without_retry(self, webhook_server):
+        """429가 아닌 4xx 응답은 재시도하지 않는다."""
+        # Given
+        self._enqueue_completed_order()
+        webhook_server.enqueue_response(404, {'message': "Unknown Webhook", 'code': 10015})
+        
+        # When
+        NotificationDispatcher(batch_window=0).dispatch_pending()
+        
+        # Then
+        entry = NotificationOutboxModel.objects.get()
+        assert entry.status == NotificationOutboxModel.STATUS_FAILED
+        assert entry.attempts == 1
+    
+    @override_settings(DISCORD_WEBHOOK_URL="")
+    def test_missing_webhook_url_is_retried(self):
+        """웹훅 URL이 설정되지 않았으면 알림을 버리지 않고 재시도한다."""
+        # Given
+        self._enqueue_completed_order()
+        
+        # When
+        NotificationDispatcher(batch_window=0).dispatch_pending()
+        
+        # Then
+        entry = NotificationOutboxModel.objects.get()
+        assert entry.status == NotificationOutboxModel.STATUS_PENDING
+        assert entry.attempts == 1
+
+
+@pytest.mark.integration
+@pytest.mark.database
+@pytest.mark.django_db(transaction=True)
+class TestNotificationBatching:
+    """몰려 들어온 알림을 웹훅 요청 하나에 최대 10개씩 묶어 보내는지 검증합니다."""
+    
+    @pytest.fixture
+    def webhook_server(self):
+        with FakeDiscordWebhookServer() as server:
+            with override_settings(DISCORD_WEBHOOK_URL=server.url, DISCORD_CALL_WEBHOOK_URL=f'{server.url}-call'):
+                yield server
+    
+    def _enqueue_payments(self, count):
+        food = FoodModelFactory(name="비빔밥")
+        orders = []
+        for i in range(count):
+            order = OrderModelFactory(status='completed', payer_name=f"결제자{i:02d}")
+            OrderItemModelFactory(order=order, food=food, quantity=1, price=10000)
+            DjangoNotificationRepository().enqueue_payment_completion(str(order.id))
+            orders.append(order)
+        return orders
+    
+    def _payers(self, request):
+        return [
+            next(field['value'] for field in embed['fields'] if field['name'] == '결제자')
+            for embed in request['embeds']
+        ]
+    
+    def test_coalesces_burst_into_ordered_batches_per_webhook(self, webhook_server):
+        """같은 웹훅의 알림은 기록 순서대로 10개씩 묶이고, 다른 웹훅은 따로 묶인다."""
+        # Given
+        self._enqueue_payments(12)
+        repository = DjangoNotificationRepository()
+        for i in range(3):
+            repository.enqueue_staff_call(f'table-{i}', f"{i + 1}번 테이블", f"호출 {i}")
+        
+        # When
+        processed = NotificationDispatcher(batch_window=0).dispatch_pending()
+        
+        # Then
+        assert processed == 15
+        payment_requests = [
+            request for path, request in zip(webhook_server.paths, webhook_server.requests) if not path.endswith('-call')
+        ]
+        call_requests = [
+            request for path, request in zip(webhook_server.paths, webhook_server.requests) if path.endswith('-call')
+        ]
+        assert [len(request['embeds']) for request in payment_requests] == [10, 2]
+        assert self._payers(payment_requests[0]) + self._payers(payment_requests[1]) == [f"결제자{i:02d}" for i in range(12)]
+        assert all(request['username'] == "주문알리미" for request in payment_requests)
+        assert len(call_requests) == 1
+        assert call_requests[0]['username'] == "직원호출 알리미"
+        assert [embed['fields'][0]['value'] for embed in call_requests[0]['embeds']] == ["1번 테이블", "2번 테이블", "3번 테이블"]
+        assert NotificationOutboxModel.objects.filter(status=NotificationOutboxModel.STATUS_SENT).count() == 15
+        assert OrderModel.objects.filter(discord_notified=True).count() == 12
+    
+    def test_batch_respects_embed_character_limit(self, webhook_server):
+        """임베드 글자 수 합계가 6000자를 넘지 않도록 묶음을 나눈다."""
+        # Given
+        repository = DjangoNotificationRepository()
+        for i in range(4):
+            repository.enqueue_staff_call(f'table-{i}', f"{i + 1}번 테이블", "가" * 2000)
+        
+        # When
+        NotificationDispatcher(batch_window=0).dispatch_pending()
+        
+        # Then
+        assert [len(request['embeds']) for request in webhook_server.requests] == [1, 1, 1, 1]
+        
+        # When - 합계가 한도 안이면 한 번에 보냄
+        for i in range(3):
+            repository.enqueue_staff_call(f'other-table-{i}', "테이블", "나" * 900)
+        NotificationDispatcher(batch_window=0).dispatch_pending()
+        
+        # Then
+        assert [len(request['embeds']) for request in webhook_server.requests[4:]] == [3]
+    
+    def test_rejected_batch_is_retried_one_by_one(self, webhook_server):
+        """묶음이 4xx로 거절되면 하나씩 다시 보내 잘못된 알림만 실패 처리한다."""
+        # Given
+        orders = self._enqueue_payments(3)
+        webhook_server.enqueue_response(400, {'message': "Invalid Form Body", 'code': 50035})
+        webhook_server.enqueue_response(204)
+        webhook_server.enqueue_response(400, {'message': "Invalid Form Body", 'code': 50035})
+        webhook_server.enqueue_response(204)
+        
+        # When
+        NotificationDispatcher(batch_window=0).dispatch_pending()
+        
+        # Then
+        assert [len(request['embeds']) for request in webhook_server.requests] == [3, 1, 1, 1]
+        statuses = {
+            entry.order_id: (entry.status, entry.attempts)
+            for entry in NotificationOutboxModel.objects.all()
+        }
+        assert statuses[orders[0].id] == (NotificationOutboxModel.STATUS_SENT, 1)
+        assert statuses[orders[1].id] == (NotificationOutboxModel.STATUS_FAILED, 1)
+        assert statuses[orders[2].id] == (NotificationOutboxModel.STATUS_SENT, 1)
+    
+    def test_server_error_keeps_later_batches_in_order(self, webhook_server):
+        """앞 묶음이 5xx로 실패하면 같은 웹훅의 다음 묶음도 미뤄 순서를 지킨다."""
+        # Given
+        self._enqueue_payments(12)
+        webhook_server.enqueue_response(503, {'message': "Service Unavailable"})
+        dispatcher = NotificationDispatcher(batch_window=0)
+        
+        # When
+        dispatcher.dispatch_pending()
+        
+        # Then - 첫 묶음만 시도되고 알림마다 시도 횟수가 기록됨
+        assert len(webhook_server.requests) == 1
+        attempts = list(NotificationOutboxModel.objects.order_by('id').values_list('attempts', flat=True))
+        assert attempts == [1] * 10 + [0] * 2
+        
+        # When - 재시도 시각이 되면
+        NotificationOutboxModel.objects.update(next_attempt_at=timezone.now())
+        dispatcher.dispatch_pending()
+        
+        # Then
+        assert self._payers(webhook_server.requests[1]) == [f"결제자{i:02d}" for i in range(10)]
+        assert self._payers(webhook_server.requests[2]) == ["결제자10", "결제자11"]
+    
+    def test_waits_for_batch_window(self, webhook_server):
+        """가장 오래된 알림이 batch_window만큼 기다린 뒤에 한꺼번에 가져간다."""
+        # Given
+        self._enqueue_payments(3)
+        dispatcher = NotificationDispatcher(batch_window=60)
+        
+        # When & Then
+        assert dispatcher.dispatch_pending() == 0
+        assert webhook_server.requests == []
+        
+        NotificationOutboxModel.objects.update(next_attempt_at=timezone.now() - timedelta(seconds=61))
+        assert dispatcher.dispatch_pending() == 3
+        assert [len(request['embeds']) for request in webhook_server.requests] == [3]
+
+
+@pytest.mark.integration
+@pytest.mark.database
+@pytest.mark.django_db(transaction=True)
+class TestStaffCallCoalescingAndCircuitBreaker:
+    """직원호출 합치기와 웹훅 서킷 브레이커를 검증합니다."""
+    
+    @pytest.fixture
+    def webhook_server(self):
+        with FakeDiscordWebhookServer() as server:
+            with override_settings(DISCORD_WEBHOOK_URL=server.url, DISCORD_CALL_WEBHOOK_URL=server.url,
+                                   STAFF_CALL_COALESCE_SECONDS=30):
+                yield server
+    
+    def test_coalesced_calls_are_sent_as_one_alert_with_count(self, webhook_server):
+        """전송 전에 쌓인 같은 테이블의 호출은 호출 횟수를 담은 알림 하나로 전송된다."""
+        # Given
+        repository = DjangoNotificationRepository()
+        counts = [repository.enqueue_staff_call('table-1', "1번 테이블") for _ in range(3)]
+        
+        # When
+        NotificationDispatcher(batch_window=0).dispatch_pending()
+        
+        # Then
+        assert counts == [1, 2, 3]
+        assert len(webhook_server.requests) == 1
+        [embed] = webhook_server.requests[0]['embeds']
+        assert "3번 호출" in embed['description']
+        assert {'name': "호출 횟수", 'value': "3회", 'inline': True} in embed['fields']
+    
+    def test_first_call_inserts_without_locking_missing_key(self, webhook_server):
+        """첫 호출은 없는 dedup_key를 잠가 읽지 않고 바로 INSERT한다. (MySQL 갭 락 교착 방지)"""
+        # Given
+        repository = DjangoNotificationRepository()
+        
+        # When
+        with CaptureQueriesContext(connection) as queries:
+            count = repository.enqueue_staff_call('table-1', "1번 테이블")
+        
+        # Then
+        assert count == 1
+        assert not [query['sql'] for query in queries.captured_queries
+                    if query['sql'].startswith('SELECT') and '"dedup_key"' in query['sql']]
+        assert NotificationOutboxModel.objects.get().dedup_key == f'{NotificationOutboxModel.KIND_STAFF_CALL}:table-1'
+    
+    def test_calls_after_alert_wait_for_coalesce_window(self, webhook_server):
+        """알림을 보낸 뒤 간격 안에 들어온 호출은 간격이 지난 뒤 알림 하나로 전송된다."""
+        # Given - 첫 호출은 바로 전송
+        repository = DjangoNotificationRepository()
+        dispatcher = NotificationDispatcher(batch_window=0)
+        repository.enqueue_staff_call('table-1', "1번 테이블")
+        dispatcher.dispatch_pending()
+        
+        # When
+        repository.enqueue_staff_call('table-1', "1번 테이블")
+        repository.enqueue_staff_call('table-1', "1번 테이블")
+        
+        # Then - 간격이 지나기 전에는 보내지 않음
+        assert dispatcher.dispatch_pending() == 0
+        pending = NotificationOutboxModel.objects.get(status=NotificationOutboxModel.STATUS_PENDING)
+        first = NotificationOutboxModel.objects.get(status=NotificationOutboxModel.STATUS_SENT)
+        assert pending.payload['count'] == 2
+        assert pending.next_attempt_at >= first.sent_at + timedelta(seconds=30)
+        
+        # When - 간격이 지나면
+        NotificationOutboxModel.objects.filter(id=pending.id).update(next_attempt_at=timezone.now())
+        dispatcher.dispatch_pending()
+        
+        # Then
+        assert len(webhook_server.requests) == 2
+        assert "2번 호출" in webhook_server.requests[1]['embeds'][0]['description']
+    
+    def test_previous_call_is_found_by_indexed_table_id(self, webhook_server):
+        """직전 호출은 payload가 아니라 인덱스가 있는 table_id 컬럼으로 찾는다."""
+        # Given
+        repository = DjangoNotificationRepository()
+        repository.enqueue_staff_call('table-1', "1번 테이블")
+        NotificationDispatcher(batch_window=0).dispatch_pending()
+        
+        # When
+        with CaptureQueriesContext(connection) as queries:
+            repository.enqueue_staff_call('table-1', "1번 테이블")
+        
+        # Then
+        first, pending = NotificationOutboxModel.objects.order_by('id')
+        assert (first.table_id, pending.table_id) == ('table-1', 'table-1')
+        assert pending.next_attempt_at >= first.sent_at + timedelta(seconds=30)
+        lookup = [query['sql'] for query in queries.captured_queries if 'ORDER BY' in query['sql']]
+        assert lookup and all('"table_id"' in sql and 'payload' not in sql.split('WHERE')[1] for sql in lookup)
+    
+    def test_call_during_delivery_starts_new_alert(self, webhook_server):
+        """디스패처가 이미 가져간 알림에는 호출을 합치지 않는다."""
+        # Given
+        repository = DjangoNotificationRepository()
+        repository.enqueue_staff_call('table-1', "1번 테이블")
+        claimed = NotificationDispatcher(batch_window=0)._claim()
+        
+        # When
+        count = repository.enqueue_staff_call('table-1', "1번 테이블")
+        
+        # Then
+        assert count == 1
+        assert len(claimed) == 1
+        assert NotificationOutboxModel.objects.filter(kind=NotificationOutboxModel.KIND_STAFF_CALL).count() == 2
+        assert NotificationOutboxModel.objects.get(id=claimed[0].id).payload['count'] == 1
+    
+    def test_open_circuit_keeps_notifications_queued_without_calling_discord(self, webhook_server):
+        """연속 실패로 회로가 열리면 Discord를 호출하지 않고 시도 횟수도 늘리지 않는다."""
+        # Given
+        repository = DjangoNotificationRepository()
+        repository.enqueue_staff_call('table-1', "1번 테이블")
+        webhook_server.enqueue_response(503, {'message': "Service Unavailable"})
+        webhook_server.enqueue_response(503, {'message': "Service Unavailable"})
+        dispatcher = NotificationDispatcher(batch_window=0, failure_threshold=2, circuit_reset_timeout=60)
+        for _ in range(2):
+            dispatcher.dispatch_pending()
+            NotificationOutboxModel.objects.update(next_attempt_at=timezone.now())
+        
+        # When
+        dispatcher.dispatch_pending()
+        
+        # Then
+        assert len(webhook_server.requests) == 2
+        entry = NotificationOutboxModel.objects.get()
+        assert entry.status == NotificationOutboxModel.STATUS_PENDING
+        assert entry.attempts == 2
+        assert "circuit open" in entry.last_error
+        assert entry.next_attempt_at > timezone.now() + timedelta(seconds=30)
+    
+    def test_circuit_closes_after_successful_probe(self, webhook_server):
+        """reset_timeout이 지나면 시험 전송을 하고, 성공하면 다시 정상 전송한다."""
+        # Given
+        repository = DjangoNotificationRepository()
+        repository.enqueue_staff_call('table-1', "1번 테이블")
+        webhook_server.enqueue_response(503, {'message': "Service Unavailable"})
+        dispatcher = NotificationDispatcher(batch_window=0, failure_threshold=1, circuit_reset_timeout=0)
+        dispatcher.dispatch_pending()
+        NotificationOutboxModel.objects.update(next_attempt_at=timezone.now())
+        
+        # When
+        dispatcher.dispatch_pending()
+        
+        # Then
+        assert len(webhook_server.requests) == 2
+        assert NotificationOutboxModel.objects.get().status == NotificationOutboxModel.STATUS_SENT
+        assert dispatcher.circuit_breakers[webhook_server.url].state == CircuitBreaker.CLOSED
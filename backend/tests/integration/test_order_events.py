@@ -0,0 +1,326 @@
+"""
+Integration tests for the admin order board event log and its Server-Sent Events stream.
+"""
+import asyncio
+import json
+import time
+from collections import deque
+from unittest.mock import patch
+
+import pytest
+from asgiref.sync import async_to_sync, sync_to_async
+from django.core import signing
+from django.db import transaction
+from django.test import AsyncClient, override_settings
+from rest_framework.test import APIClient
+
+from infrastructure.database.models import MinusOrderItemModel, OrderEventModel
+from infrastructure.events.order_events import order_event_feed
+from presentation.api.event_stream import ORDER_EVENTS_TOKEN_SALT
+from presentation.api.views import update_order_status_use_case
+from tests.factories.model_factories import FoodModelFactory, TableModelFactory
+
+SECRET = 'test-order-events-secret'
+
+
+@pytest.fixture(autouse=True)
+def fresh_feed():
+    """테스트마다 DB가 비워지므로 프로세스 공용 피드의 이벤트 버퍼도 비웁니다."""
+    with patch.object(order_event_feed, '_buffer', deque(maxlen=order_event_feed._buffer.maxlen)), \
+            patch.object(order_event_feed, '_positions', {}), \
+            patch.object(order_event_feed, '_last_id', None), \
+            patch.object(order_event_feed, '_covered_after', None), \
+            patch.object(order_event_feed, '_gaps', {}):
+        yield
+
+
+def admin_token(secret=SECRET):
+    return signing.dumps({'user': 1}, key=secret, salt=ORDER_EVENTS_TOKEN_SALT)
+
+
+def parse_events(chunks):
+    """SSE 본문을 (id, 이벤트 이름, 데이터) 목록으로 바꿉니다. retry와 heartbeat 주석은 제외합니다."""
+    events = []
+    for block in ''.join(chunks).split('\n\n'):
+        if not block or block.startswith(':') or block.startswith('retry'):
+            continue
+        fields = dict(line.split(': ', 1) for line in block.split('\n'))
+        events.append((int(fields['id']), fields['event'], json.loads(fields['data'])))
+    return events
+
+
+async def read_stream(response):
+    return [
+        chunk.decode() if isinstance(chunk, bytes) else chunk
+        async for chunk in response.streaming_content
+    ]
+
+
+@pytest.mark.integration
+@pytest.mark.database
+@pytest.mark.django_db(transaction=True)
+class TestOrderEventLog:
+    """주문 변경이 현황판 이벤트(테이블별 주문 수/매출 변화량)로 기록되는지 검증합니다."""
+    
+    def setup_method(self):
+        self.client = APIClient()
+    
+    def _create_order(self, table, food, quantity):
+        return self.client.post(
+            '/api/orders/',
+            data=json.dumps({'table_id': str(table.id), 'items': [{'food_id': food.id, 'quantity': quantity}]}),
+            content_type='application/json'
+        )
+    
+    def _create_pre_order(self, table, food):
+        return self.client.post(
+            f'/api/orders/pre-order/{table.id}/',
+            data=json.dumps({
+                'payer_name': '홍길동', 'total_amount': food.price,
+                'items': [{'food_id': food.id, 'quantity': 1}],
+            }),
+            content_type='application/json'
+        )
+    
+    def test_created_order_is_recorded_with_revenue(self):
+        """완료 상태로 생성된 주문은 order_created 이벤트로 주문 수 +1, 매출 +총액이 기록된다."""
+        # Given
+        table = TableModelFactory(name='1번')
+        food = FoodModelFactory(price=12000, sold_out=False, category="main")
+        
+        # When
+        response = self._create_order(table, food, 2)
+        
+        # Then
+        event = OrderEventModel.objects.get()
+        assert event.kind == OrderEventModel.KIND_ORDER_CREATED
+        assert event.table_id == table.id
+        assert str(event.order_id) == response.json()['id']
+        assert event.payload['revenue'] == 24000
+        assert event.payload['orders'] == 1
+        assert event.payload['table_name'] == '1번'
+        assert event.payload['session_id'] is not None
+    
+    def test_pre_order_is_recorded_only_when_paid(self):
+        """선주문은 생성 시 기록되지 않고 결제 완료 시 payment_completed로 기록된다."""
+        # Given
+        table = TableModelFactory()
+        food = FoodModelFactory(price=15000, sold_out=False, category="main")
+        order_id = self._create_pre_order(table, food).json()['order_id']
+        assert not OrderEventModel.objects.exists()
+        
+        # When
+        update_order_status_use_case.execute(order_id, 'completed')
+        update_order_status_use_case.execute(order_id, 'completed')
+        
+        # Then - 이미 완료된 주문을 다시 완료해도 중복 기록되지 않음
+        event = OrderEventModel.objects.get()
+        assert event.kind == OrderEventModel.KIND_PAYMENT_COMPLETED
+        assert str(event.order_id) == order_id
+        assert (event.payload['revenue'], event.payload['orders']) == (15000, 1)
+    
+    def test_paid_pre_order_revenue_counts_minus_items_once(self):
+        """결제 전에 차감 아이템이 생긴 선주문은 차감 후 금액으로 기록된다."""
+        # Given - 3개짜리 선주문에서 1개를 결제 전에 환불
+        table = TableModelFactory()
+        food = FoodModelFactory(price=1000, sold_out=False, category="main")
+        response = self.client.post(
+            f'/api/orders/pre-order/{table.id}/',
+            data=json.dumps({
+                'payer_name': '홍길동', 'total_amount': 3000,
+                'items': [{'food_id': food.id, 'quantity': 3}],
+            }),
+            content_type='application/json'
+        )
+        order_id = response.json()['order_id']
+        MinusOrderItemModel.objects.create(order_id=order_id, food=food, quantity=-1, price=1000, reason='refund')
+        
+        # When
+        update_order_status_use_case.execute(order_id, 'completed')
+        
+        # Then
+        assert OrderEventModel.objects.get().payload['revenue'] == 2000
+    
+    def test_table_reset_is_recorded_as_checkout(self):
+        """테이블 주문 리셋(퇴실)은 table_checkout으로 기록되고, 열린 세션이 없으면 기록되지 않는다."""
+        # Given
+        table = TableModelFactory()
+        food = FoodModelFactory(sold_out=False, category="main")
+        self._create_order(table, food, 1)
+        
+        # When
+        self.client.delete(f'/api/tables/{table.id}/orders/reset/')
+        self.client.delete(f'/api/tables/{table.id}/orders/reset/')
+        
+        # Then
+        assert list(OrderEventModel.objects.order_by('id').values_list('kind', flat=True)) == [
+            OrderEventModel.KIND_ORDER_CREATED, OrderEventModel.KIND_TABLE_CHECKOUT,
+        ]
+
+
+@pytest.mark.integration
+@pytest.mark.database
+@pytest.mark.django_db(transaction=True)
+class TestOrderEventStream:
+    """관리자 현황판 SSE 스트림의 인증, 이어받기, 실시간 전달을 검증합니다."""
+    
+    @pytest.fixture(autouse=True)
+    def order_events_secret(self, settings):
+        settings.ORDER_EVENTS_SECRET = SECRET
+    
+    def _record(self, table, revenue=10000):
+        return OrderEventModel.record(
+            OrderEventModel.KIND_ORDER_CREATED, table.id, table_name=table.name, revenue=revenue, orders=1
+        )
+    
+    @pytest.mark.parametrize('token', ['', 'garbage', admin_token('other-secret')])
+    def test_rejects_missing_or_forged_token(self, token):
+        """어드민이 서명하지 않은 토큰은 403을 반환한다."""
+        # When
+        response = async_to_sync(AsyncClient().get)('/api/admin/order-events/', {'token': token})
+        
+        # Then
+        assert response.status_code == 403
+        assert response.json() == {'error': 'Invalid token'}
+    
+    @override_settings(ORDER_EVENTS_SECRET='')
+    def test_disabled_without_secret(self):
+        """ORDER_EVENTS_SECRET이 없으면 스트림을 열 수 없다."""
+        # When
+        response = async_to_sync(AsyncClient().get)('/api/admin/order-events/', {'token': admin_token('')})
+        
+        # Then
+        assert response.status_code == 403
+    
+    def test_rejects_invalid_last_event_id(self):
+        """숫자가 아닌 last_event_id는 400을 반환한다."""
+        # When
+        response = async_to_sync(AsyncClient().get)(
+            '/api/admin/order-events/', {'token': admin_token(), 'last_event_id': 'abc'}
+        )
+        
+        # Then
+        assert response.status_code == 400
+    
+    @override_settings(ORDER_EVENTS_HEARTBEAT_SECONDS=0.05, ORDER_EVENTS_STREAM_TIMEOUT=0.2)
+    def test_replays_events_after_last_event_id(self):
+        """last_event_id 이후의 이벤트를 id와 함께 순서대로 보내고, heartbeat 후 stream_timeout에 닫는다."""
+        # Given
+        table = TableModelFactory(name='2번')
+        first, second, third = (self._record(table, revenue) for revenue in (1000, 2000, 3000))
+        
+        async def scenario():
+            response = await AsyncClient().get(
+                '/api/admin/order-events/', {'token': admin_token(), 'last_event_id': first.id}
+            )
+            return response, await asyncio.wait_for(read_stream(response), timeout=5)
+        
+        # When
+        response, chunks = async_to_sync(scenario)()
+        
+        # Then
+        assert response['Content-Type'] == 'text/event-stream'
+        assert chunks[0] == 'retry: 3000\n\n'
+        assert ': keep-alive\n\n' in chunks
+        events = parse_events(chunks)
+        assert [(event_id, kind) for event_id, kind, _ in events] == [
+            (second.id, 'order_created'), (third.id, 'order_created'),
+        ]
+        assert events[0][2]['revenue'] == 2000
+        assert events[0][2]['table_id'] == str(table.id)
+        assert events[0][2]['table_name'] == '2번'
+    
+    @override_settings(ORDER_EVENTS_STREAM_TIMEOUT=0.2)
+    def test_last_event_id_header_takes_precedence(self):
+        """EventSource가 재연결할 때 보내는 Last-Event-ID 헤더로 이어서 받는다."""
+        # Given
+        table = TableModelFactory()
+        first, second = self._record(table), self._record(table)
+        
+        async def scenario():
+            response = await AsyncClient().get(
+                '/api/admin/order-events/', {'token': admin_token(), 'last_event_id': 0},
+                headers={'Last-Event-ID': str(first.id)}
+            )
+            return await asyncio.wait_for(read_stream(response), timeout=5)
+        
+        # When
+        events = parse_events(async_to_sync(scenario)())
+        
+        # Then
+        assert [event_id for event_id, _, _ in events] == [second.id]
+    
+    def test_new_event_is_pushed_without_waiting_for_poll(self):
+        """같은 프로세스에서 기록된 이벤트는 확인 주기를 기다리지 않고 바로 전달된다."""
+        # Given
+        table = TableModelFactory()
+        
+        async def scenario():
+            response = await AsyncClient().get('/api/admin/order-events/', {'token': admin_token()})
+            stream = response.streaming_content.__aiter__()
+            assert await stream.__anext__() == b'retry: 3000\n\n'
+            reader = asyncio.ensure_future(stream.__anext__())
+            # 첫 확인으로 버퍼가 준비될 때까지 대기
+            while order_event_feed._last_id is None:
+                await asyncio.sleep(0.01)
+            
+            started = time.monotonic()
+            event = await sync_to_async(self._record)(table, 7000)
+            chunk = (await asyncio.wait_for(reader, timeout=5)).decode()
+            await stream.aclose()
+            return event, chunk, time.monotonic() - started
+        
+        # When - DB 확인 주기를 길게 두어 notify로만 깨어나게 함
+        with patch.object(order_event_feed, 'poll_interval', 60):
+            event, chunk, elapsed = async_to_sync(scenario)()
+        
+        # Then
+        assert parse_events([chunk]) == [(event.id, 'order_created', {
+            'table_id': str(table.id), 'order_id': None, 'session_id': None, 'table_name': table.name,
+            'revenue': 7000, 'orders': 1, 'created_at': event.created_at.isoformat(),
+        })]
+        assert elapsed < 1
+    
+    def test_lower_id_committed_after_higher_id_is_still_delivered(self):
+        """작은 id(N)가 큰 id(N+1)보다 늦게 커밋되어도 두 이벤트를 모두 한 번씩 전달한다."""
+        # Given
+        table = TableModelFactory()
+        
+        def commit_higher_id_first():
+            # N, N+1을 INSERT한 뒤 N을 지워 N+1만 커밋된 상태를 만듦
+            with transaction.atomic():
+                lower = self._record(table, 1000)
+                higher = self._record(table, 2000)
+                lower_id = lower.id
+                lower.delete()
+            lower.id = lower_id
+            return lower, higher
+        
+        def commit_lower_id(lower):
+            lower.save(force_insert=True)
+        
+        async def scenario():
+            response = await AsyncClient().get('/api/admin/order-events/', {'token': admin_token()})
+            stream = response.streaming_content.__aiter__()
+            assert await stream.__anext__() == b'retry: 3000\n\n'
+            reader = asyncio.ensure_future(stream.__anext__())
+            while order_event_feed._last_id is None:
+                await asyncio.sleep(0.01)
+            
+            lower, higher = await sync_to_async(commit_higher_id_first)()
+            chunks = [(await asyncio.wait_for(reader, timeout=5)).decode()]
+            reader = asyncio.ensure_future(stream.__anext__())
+            await sync_to_async(commit_lower_id)(lower)
+            chunks.append((await asyncio.wait_for(reader, timeout=5)).decode())
+            await stream.aclose()
+            return lower, higher, chunks, await order_event_feed.events_after(lower.id)
+        
+        # When
+        with patch.object(order_event_feed, 'poll_interval', 60):
+            lower, higher, chunks, after_lower = async_to_sync(scenario)()
+        
+        # Then - 도착 순서대로 전달하고, 마지막으로 받은 N으로 재연결해도 N+1을 다시 보내지 않음
+        events = parse_events(chunks)
+        assert [(event_id, data['revenue']) for event_id, _, data in events] == [(higher.id, 2000), (lower.id, 1000)]
+        assert lower.id == higher.id - 1
+        assert after_lower == []
@@ -0,0 +1,67 @@
+"""
+Benchmark comparing DRF and fast order history serialization.
+"""
+import statistics
+import time
+
+import pytest
+from rest_framework.renderers import JSONRenderer
+
+from presentation.api.renderers import OrjsonRenderer
+from presentation.serializers.fast_order_serializers import serialize_order_history
+from presentation.serializers.order_serializers import OrderHistorySerializer
+from tests.factories.entity_factories import (
+    FoodFactory,
+    TableFactory,
+    OrderFactory,
+    OrderItemFactory,
+    MinusOrderItemFactory
+)
+
+
+@pytest.mark.slow
+class TestOrderSerializerBenchmark:
+    """500건 주문 내역에서 고속 직렬화가 DRF 시리얼라이저보다 빠른지 측정합니다."""
+    
+    ORDER_COUNT = 500
+    
+    @pytest.fixture
+    def orders(self):
+        table = TableFactory()
+        foods = FoodFactory.create_batch(20)
+        return [
+            OrderFactory(
+                table=table,
+                items=[OrderItemFactory(food=food) for food in foods[i % 20:i % 20 + 3]],
+                minus_items=[MinusOrderItemFactory(food=foods[i % 20])] if i % 10 == 0 else None,
+            )
+            for i in range(self.ORDER_COUNT)
+        ]
+    
+    def _measure(self, func, repeat=7):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - started)
+        return statistics.median(timings)
+    
+    def test_fast_serializer_is_faster(self, orders):
+        """고속 직렬화(+렌더링)가 DRF 시리얼라이저(+렌더링)보다 빠르다."""
+        # Given
+        drf_renderer = JSONRenderer()
+        orjson_renderer = OrjsonRenderer()
+        history = {'orders': orders, 'total_spent': 0}
+        
+        # When
+        drf_median = self._measure(lambda: drf_renderer.render(OrderHistorySerializer(history).data))
+        fast_median = self._measure(lambda: drf_renderer.render(serialize_order_history(orders, 0)))
+        orjson_median = self._measure(lambda: orjson_renderer.render(serialize_order_history(orders, 0)))
+        
+        # Then
+        print(
+            f"\n{self.ORDER_COUNT} orders: DRF {drf_median * 1000:.1f}ms / "
+            f"fast {fast_median * 1000:.1f}ms / fast+orjson {orjson_median * 1000:.1f}ms"
+        )
+        assert fast_median < drf_median
+        assert orjson_median <= fast_median * 1.5
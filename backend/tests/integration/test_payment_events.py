@@ -0,0 +1,159 @@
+"""
+Integration tests for the payment status Server-Sent Events stream.
+"""
+import asyncio
+import json
+import time
+from unittest.mock import patch
+
+import pytest
+from asgiref.sync import async_to_sync, sync_to_async
+from django.test import AsyncClient, override_settings
+
+from infrastructure.database.models import OrderModel
+from infrastructure.events.payment_events import payment_event_broker
+from presentation.api.views import update_order_status_use_case
+from tests.factories.model_factories import OrderItemModelFactory, OrderModelFactory, PreOrderModelFactory
+
+
+def parse_events(chunks):
+    """SSE 본문을 (이벤트 이름, 데이터) 목록으로 바꿉니다. 주석(heartbeat)은 ':'로 표시합니다."""
+    events = []
+    for block in ''.join(chunks).split('\n\n'):
+        if not block:
+            continue
+        if block.startswith(':'):
+            events.append((':', None))
+            continue
+        fields = dict(line.split(': ', 1) for line in block.split('\n'))
+        if 'event' in fields:
+            events.append((fields['event'], json.loads(fields['data'])))
+        else:
+            events.append(('retry', int(fields['retry'])))
+    return events
+
+
+async def read_stream(response):
+    return [
+        chunk.decode() if isinstance(chunk, bytes) else chunk
+        async for chunk in response.streaming_content
+    ]
+
+
+@pytest.mark.integration
+@pytest.mark.database
+@pytest.mark.django_db(transaction=True)
+class TestPaymentStatusEvents:
+    """결제 상태 SSE 스트림이 결제 완료 시 이벤트 하나를 보내고 닫히는지 검증합니다."""
+    
+    def _pre_order(self):
+        order = PreOrderModelFactory(payer_name="홍길동")
+        OrderItemModelFactory(order=order, quantity=1, price=15000)
+        return order
+    
+    def test_completed_order_gets_event_immediately(self):
+        """이미 결제가 완료된 주문은 바로 payment 이벤트를 받고 스트림이 닫힌다."""
+        # Given
+        order = OrderModelFactory(status='completed')
+        
+        async def scenario():
+            response = await AsyncClient().get(f'/api/orders/{order.id}/payment-events/')
+            return response, await read_stream(response)
+        
+        # When
+        response, chunks = async_to_sync(scenario)()
+        
+        # Then
+        assert response.status_code == 200
+        assert response['Content-Type'] == 'text/event-stream'
+        assert response['Cache-Control'] == 'no-cache'
+        assert parse_events(chunks) == [
+            ('retry', 3000),
+            ('payment', {'order_id': str(order.id), 'payment_completed': True, 'order_status': 'completed'}),
+        ]
+    
+    @pytest.mark.parametrize('order_id', ['00000000-0000-0000-0000-000000000000', 'not-a-uuid'])
+    def test_unknown_order_returns_404(self, order_id):
+        """존재하지 않는 주문은 404를 반환한다."""
+        # When
+        response = async_to_sync(AsyncClient().get)(f'/api/orders/{order_id}/payment-events/')
+        
+        # Then
+        assert response.status_code == 404
+        assert response.json() == {'error': 'Order not found'}
+    
+    def test_webhook_completion_wakes_stream_in_process(self):
+        """같은 프로세스에서 결제가 완료되면 DB 확인 주기를 기다리지 않고 바로 이벤트를 보낸다."""
+        # Given
+        order = self._pre_order()
+        
+        async def scenario():
+            response = await AsyncClient().get(f'/api/orders/{order.id}/payment-events/')
+            reader = asyncio.ensure_future(read_stream(response))
+            while str(order.id) not in payment_event_broker.waiting_order_ids:
+                await asyncio.sleep(0.01)
+            
+            started = time.monotonic()
+            await sync_to_async(update_order_status_use_case.execute)(str(order.id), 'completed')
+            chunks = await asyncio.wait_for(reader, timeout=5)
+            return chunks, time.monotonic() - started
+        
+        # When - DB 폴백이 동작하지 않도록 확인 주기를 길게 설정
+        with patch.object(payment_event_broker, 'poll_interval', 60):
+            chunks, elapsed = async_to_sync(scenario)()
+        
+        # Then
+        assert parse_events(chunks)[-1] == (
+            'payment', {'order_id': str(order.id), 'payment_completed': True, 'order_status': 'completed'}
+        )
+        assert elapsed < 1
+        assert payment_event_broker.waiting_order_ids == set()
+    
+    def test_completion_by_another_process_is_found_by_db_fallback(self):
+        """시그널 없이(다른 워커, 관리자 앱) 완료된 결제도 주기적인 DB 확인으로 전달한다."""
+        # Given
+        orders = [self._pre_order() for _ in range(3)]
+        
+        async def scenario():
+            responses = [
+                await AsyncClient().get(f'/api/orders/{order.id}/payment-events/') for order in orders
+            ]
+            readers = [asyncio.ensure_future(read_stream(response)) for response in responses]
+            while len(payment_event_broker.waiting_order_ids) < len(orders):
+                await asyncio.sleep(0.01)
+            
+            # 스트림 수와 관계없이 이벤트 루프당 DB 확인 태스크는 하나
+            assert len(payment_event_broker._pollers) == 1
+            await sync_to_async(OrderModel.objects.filter(id__in=[order.id for order in orders]).update)(
+                status='completed'
+            )
+            return await asyncio.wait_for(asyncio.gather(*readers), timeout=5)
+        
+        # When
+        with patch.object(payment_event_broker, 'poll_interval', 0.05):
+            results = async_to_sync(scenario)()
+        
+        # Then
+        for order, chunks in zip(orders, results):
+            assert parse_events(chunks)[-1] == (
+                'payment', {'order_id': str(order.id), 'payment_completed': True, 'order_status': 'completed'}
+            )
+    
+    @override_settings(PAYMENT_EVENTS_HEARTBEAT_SECONDS=0.05, PAYMENT_EVENTS_STREAM_TIMEOUT=0.2)
+    def test_sends_heartbeats_then_times_out(self):
+        """결제가 완료되지 않으면 heartbeat를 보내다가 timeout 이벤트를 보내고 닫는다."""
+        # Given
+        order = self._pre_order()
+        
+        async def scenario():
+            response = await AsyncClient().get(f'/api/orders/{order.id}/payment-events/')
+            return await asyncio.wait_for(read_stream(response), timeout=5)
+        
+        # When
+        events = parse_events(async_to_sync(scenario)())
+        
+        # Then
+        assert events[0] == ('retry', 3000)
+        assert (':', None) in events
+        assert events[-1] == ('timeout', {'order_id': str(order.id)})
+        assert payment_event_broker.waiting_order_ids == set()
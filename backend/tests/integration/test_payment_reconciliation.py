@@ -0,0 +1,132 @@
+"""
+Integration tests for deposit to pre-order reconciliation.
+"""
+import pytest
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+from django.core.management import call_command
+from django.test import override_settings
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from infrastructure.database.models import OrderModel, PaymentDepositModel, PaymentMatchModel
+from infrastructure.database.repositories import DjangoPaymentRepository
+from tests.factories.model_factories import OrderModelFactory, PreOrderModelFactory
+
+
+def post_deposit(name, amount):
+    with override_settings(PAYACTION_WEBHOOK_KEY="test-key"), \
+            patch('infrastructure.external.notification_client.NotificationHttpClient.post'):
+        return APIClient().post('/api/webhook/payment/', {
+            'transaction_name': name,
+            'bank_account_number': "123-456",
+            'amount': amount,
+            'transaction_type': 'deposited',
+        }, format='json', HTTP_X_WEBHOOK_KEY="test-key")
+
+
+@pytest.mark.integration
+@pytest.mark.database
+@pytest.mark.django_db(transaction=True)
+class TestPaymentReconciliation:
+    """입금과 선주문 매칭 기록을 검증합니다."""
+    
+    def test_exact_deposit_links_and_completes_pre_order(self):
+        """이름과 금액이 같은 입금은 매칭 기록을 남기고 주문을 완료한다."""
+        # Given
+        pre_order = PreOrderModelFactory(payer_name="홍길동", pre_order_amount=20000)
+        
+        # When
+        response = post_deposit("홍길동", 20000)
+        
+        # Then
+        assert response.status_code == status.HTTP_200_OK
+        match = PaymentMatchModel.objects.select_related('order').get()
+        assert match.order_id == pre_order.id
+        assert match.method == PaymentMatchModel.METHOD_AUTO
+        assert match.score == 100
+        assert match.order.status == 'completed'
+    
+    def test_truncated_name_is_matched_from_index(self):
+        """은행이 잘라 보낸 입금자명도 금액이 같은 선주문과 매칭한다."""
+        # Given
+        pre_order = PreOrderModelFactory(payer_name="연세대학교축제준비위원회", pre_order_amount=15000)
+        PreOrderModelFactory(payer_name="다른사람", pre_order_amount=15000)
+        
+        # When
+        post_deposit("연세대학교축제", 15000)
+        
+        # Then
+        match = PaymentMatchModel.objects.get()
+        assert match.order_id == pre_order.id
+        assert match.score == 80
+        assert OrderModel.objects.get(id=pre_order.id).status == 'completed'
+    
+    def test_unmatched_deposit_is_queued(self):
+        """후보가 없거나 애매한 입금은 미매칭 목록에 남는다."""
+        # Given
+        PreOrderModelFactory(payer_name="김민수", pre_order_amount=15000)
+        PreOrderModelFactory(payer_name="김민지", pre_order_amount=15000)
+        
+        # When
+        post_deposit("김민", 15000)
+        post_deposit("모르는사람", 9000)
+        
+        # Then
+        assert not PaymentMatchModel.objects.exists()
+        unmatched = DjangoPaymentRepository().get_unmatched_deposits()
+        assert [deposit.transaction_name for deposit in unmatched] == ["김민", "모르는사람"]
+        assert OrderModel.objects.filter(status='pre_order').count() == 2
+    
+    def test_rematch_links_deposit_that_arrived_before_pre_order(self):
+        """선주문보다 먼저 들어온 입금은 재매칭 명령으로 매칭한다."""
+        # Given
+        post_deposit("홍길동", 20000)
+        pre_order = PreOrderModelFactory(payer_name="홍길동", pre_order_amount=20000)
+        
+        # When
+        dry_run = StringIO()
+        call_command('rematch_deposits', '--dry-run', stdout=dry_run)
+        assert not PaymentMatchModel.objects.exists()
+        call_command('rematch_deposits', stdout=StringIO())
+        
+        # Then
+        assert "Would match 1 deposits" in dry_run.getvalue()
+        assert PaymentMatchModel.objects.get().order_id == pre_order.id
+        assert OrderModel.objects.get(id=pre_order.id).status == 'completed'
+    
+    def test_completed_order_is_not_linked_twice(self):
+        """이미 매칭된 주문과 입금은 다시 매칭하지 않는다."""
+        # Given
+        PreOrderModelFactory(payer_name="홍길동", pre_order_amount=20000)
+        post_deposit("홍길동", 20000)
+        OrderModelFactory(status='completed', payer_name="홍길동", pre_order_amount=20000)
+        
+        # When
+        post_deposit("홍길동", 20000)
+        call_command('rematch_deposits', stdout=StringIO())
+        
+        # Then
+        assert PaymentMatchModel.objects.count() == 1
+        assert len(DjangoPaymentRepository().get_unmatched_deposits()) == 1
+    
+    def test_unmatched_deposits_are_ordered_by_transaction_date(self):
+        """미매칭 입금은 거래 시각 순서로 돌려준다."""
+        # Given
+        now = timezone.now()
+        repository = DjangoPaymentRepository()
+        for name, minutes in (("늦은입금", 0), ("이른입금", 10)):
+            repository.record_deposit(
+                transaction_name=name, bank_account_number="123-456", amount=1000, bank_code='',
+                bank_account_id='', transaction_date=now - timedelta(minutes=minutes),
+                processing_date=now, balance=0,
+            )
+        
+        # When
+        unmatched = repository.get_unmatched_deposits()
+        
+        # Then
+        assert [deposit.transaction_name for deposit in unmatched] == ["이른입금", "늦은입금"]
+        assert PaymentDepositModel.objects.count() == 2
@@ -0,0 +1,81 @@
+"""
+Benchmark for the payment webhook pre-order lookup.
+"""
+import statistics
+import time
+import uuid
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.utils import timezone
+
+from infrastructure.database.models import OrderModel
+from infrastructure.database.repositories import DjangoOrderRepository
+from tests.factories.model_factories import TableModelFactory
+
+
+@pytest.mark.slow
+@pytest.mark.database
+@pytest.mark.django_db(transaction=True)
+class TestPreOrderLookupBenchmark:
+    """주문 수가 늘어나도 pre-order 매칭 시간이 일정한지 검증합니다."""
+    
+    SMALL_ORDER_COUNT = 1_000
+    LARGE_ORDER_COUNT = 100_000
+    
+    def _bulk_create_orders(self, table, count, offset=0):
+        now = timezone.now()
+        statuses = ['pre_order', 'completed']
+        orders = [
+            OrderModel(
+                id=uuid.uuid4(),
+                table_id=table.id,
+                payer_name=f"입금자{(offset + i) % 5000}",
+                status=statuses[i % 2],
+                pre_order_amount=10000 + ((offset + i) % 20) * 1000,
+                order_date=now - timedelta(seconds=offset + i),
+            )
+            for i in range(count)
+        ]
+        OrderModel.objects.bulk_create(orders, batch_size=5000)
+    
+    def _measure_lookup(self, repository, payer_name, amount, repeat=20):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            repository.get_latest_pre_order_by_payment_info(payer_name, amount)
+            timings.append(time.perf_counter() - started)
+        return statistics.median(timings)
+    
+    def test_lookup_uses_composite_index(self):
+        """pre-order 매칭 조회는 복합 인덱스를 사용한다."""
+        # Given
+        queryset = OrderModel.objects.filter(
+            status='pre_order', payer_name="입금자1", pre_order_amount=11000
+        ).order_by('-order_date')
+        
+        # When
+        plan = queryset.explain()
+        
+        # Then
+        if connection.vendor in ('sqlite', 'mysql'):
+            assert 'orders_pre_order_lookup_idx' in plan
+    
+    def test_lookup_time_is_constant_at_100k_orders(self):
+        """주문 수가 1k에서 100k로 늘어나도 매칭 시간이 크게 늘지 않는다."""
+        # Given
+        table = TableModelFactory()
+        repository = DjangoOrderRepository()
+        self._bulk_create_orders(table, self.SMALL_ORDER_COUNT)
+        small_median = self._measure_lookup(repository, "입금자2", 12000)
+        
+        self._bulk_create_orders(table, self.LARGE_ORDER_COUNT - self.SMALL_ORDER_COUNT, offset=self.SMALL_ORDER_COUNT)
+        assert OrderModel.objects.count() == self.LARGE_ORDER_COUNT
+        
+        # When
+        large_median = self._measure_lookup(repository, "입금자2", 12000)
+        
+        # Then
+        # 선형 스캔이라면 100배 가까이 느려지므로, 여유 있게 5배 이내인지 확인
+        assert large_median < small_median * 5
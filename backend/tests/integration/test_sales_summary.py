@@ -0,0 +1,142 @@
+"""
+Integration tests for the incrementally maintained sales summary.
+"""
+import json
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from infrastructure.database.models import (
+    MinusOrderItemModel, SalesDailySummaryModel, SalesFoodSummaryModel, SalesSummary,
+)
+from infrastructure.database.repositories import DjangoOrderRepository
+from presentation.api.views import update_order_status_use_case
+from tests.factories.model_factories import FoodModelFactory, TableModelFactory
+
+
+@pytest.mark.integration
+@pytest.mark.database
+@pytest.mark.django_db(transaction=True)
+class TestSalesSummary:
+    """주문 생성/결제 완료/삭제 시 매출 요약이 원본 주문과 같게 유지되는지 검증합니다."""
+    
+    def setup_method(self):
+        self.client = APIClient()
+    
+    def _create_order(self, table, items):
+        response = self.client.post(
+            '/api/orders/',
+            data=json.dumps({
+                'table_id': str(table.id),
+                'items': [{'food_id': food.id, 'quantity': quantity} for food, quantity in items],
+            }),
+            content_type='application/json'
+        )
+        assert response.status_code == 201
+        return response.json()['id']
+    
+    def _create_pre_order(self, table, food):
+        response = self.client.post(
+            f'/api/orders/pre-order/{table.id}/',
+            data=json.dumps({
+                'payer_name': '홍길동', 'total_amount': food.price,
+                'items': [{'food_id': food.id, 'quantity': 1}],
+            }),
+            content_type='application/json'
+        )
+        return response.json()['order_id']
+    
+    def _assert_matches_orders(self):
+        assert SalesSummary.stored() == SalesSummary.compute_from_orders()
+    
+    def test_created_orders_update_daily_and_food_rollups(self):
+        """완료 주문 생성 시 오늘 매출/주문 수와 음식별 수량/매출이 증가한다."""
+        # Given
+        table = TableModelFactory()
+        main = FoodModelFactory(price=12000, sold_out=False, category='main')
+        side = FoodModelFactory(price=3000, sold_out=False, category='side')
+        
+        # When
+        self._create_order(table, [(main, 2), (side, 1)])
+        self._create_order(table, [(side, 3)])
+        
+        # Then
+        today = SalesDailySummaryModel.objects.get(date=timezone.localdate())
+        assert (today.order_count, today.revenue) == (2, 36000)
+        assert SalesFoodSummaryModel.objects.get(food=main).quantity == 2
+        side_summary = SalesFoodSummaryModel.objects.get(food=side)
+        assert (side_summary.quantity, side_summary.order_count, side_summary.revenue) == (4, 2, 12000)
+        self._assert_matches_orders()
+    
+    def test_pre_order_counts_after_payment_and_delete_removes_it(self):
+        """선주문은 결제 완료 시 한 번만 집계되고, 완료 주문을 삭제하면 집계에서 빠진다."""
+        # Given
+        table = TableModelFactory()
+        food = FoodModelFactory(price=15000, sold_out=False, category='main')
+        order_id = self._create_pre_order(table, food)
+        assert SalesSummary.stored() == ({}, {})
+        
+        # When - 완료 처리가 중복으로 와도 한 번만 집계
+        update_order_status_use_case.execute(order_id, 'completed')
+        update_order_status_use_case.execute(order_id, 'completed')
+        
+        # Then
+        today = SalesDailySummaryModel.objects.get(date=timezone.localdate())
+        assert (today.order_count, today.revenue) == (1, 15000)
+        self._assert_matches_orders()
+        
+        # When
+        DjangoOrderRepository().delete(order_id)
+        
+        # Then
+        assert SalesSummary.stored() == ({}, {})
+        self._assert_matches_orders()
+    
+    def test_pre_order_refunded_before_payment_counts_minus_once(self):
+        """결제 전에 차감 아이템이 생긴 선주문도 결제 완료 시 차감이 한 번만 반영된다."""
+        # Given - 3개짜리 선주문에서 1개를 결제 전에 환불
+        table = TableModelFactory()
+        food = FoodModelFactory(price=1000, sold_out=False, category='main')
+        response = self.client.post(
+            f'/api/orders/pre-order/{table.id}/',
+            data=json.dumps({
+                'payer_name': '홍길동', 'total_amount': 3000,
+                'items': [{'food_id': food.id, 'quantity': 3}],
+            }),
+            content_type='application/json'
+        )
+        order_id = response.json()['order_id']
+        MinusOrderItemModel.objects.create(order_id=order_id, food=food, quantity=-1, price=1000, reason='refund')
+        
+        # When
+        update_order_status_use_case.execute(order_id, 'completed')
+        
+        # Then
+        today = SalesDailySummaryModel.objects.get(date=timezone.localdate())
+        assert (today.order_count, today.revenue) == (1, 2000)
+        assert SalesFoodSummaryModel.objects.get(food=food).quantity == 2
+        self._assert_matches_orders()
+        call_command('rebuild_sales_summary', '--verify')
+    
+    def test_rebuild_command_restores_drifted_summary(self):
+        """--verify는 어긋난 행을 알리고 실패하며, rebuild 후에는 원본 주문과 일치한다."""
+        # Given - 요약을 거치지 않고 차감 아이템을 직접 추가하고, 요약 행 하나를 망가뜨림
+        table = TableModelFactory()
+        food = FoodModelFactory(price=10000, sold_out=False, category='main')
+        order_id = self._create_order(table, [(food, 3)])
+        MinusOrderItemModel.objects.create(order_id=order_id, food=food, quantity=-1, price=10000, reason='refund')
+        SalesDailySummaryModel.objects.update(order_count=99)
+        
+        # When & Then
+        with pytest.raises(CommandError, match='differs from orders in 2 rows'):
+            call_command('rebuild_sales_summary', '--verify')
+        
+        call_command('rebuild_sales_summary')
+        call_command('rebuild_sales_summary', '--verify')
+        today = SalesDailySummaryModel.objects.get(date=timezone.localdate())
+        assert (today.order_count, today.revenue) == (1, 20000)
+        food_summary = SalesFoodSummaryModel.objects.get(food=food)
+        assert (food_summary.quantity, food_summary.order_count, food_summary.revenue) == (2, 1, 20000)
@@ -0,0 +1,93 @@
+"""
+Unit tests for the outbound circuit breaker.
+"""
+import pytest
+
+from infrastructure.external.circuit_breaker import CircuitBreaker
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.unit
+class TestCircuitBreaker:
+    """연속 실패 시 회로가 열리고, 시간이 지나면 시험 호출 하나만 허용하는지 검증합니다."""
+    
+    def test_opens_after_consecutive_failures(self):
+        """failure_threshold번 연속 실패하면 호출을 막는다."""
+        # Given
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30, clock=clock)
+        
+        # When
+        for _ in range(2):
+            breaker.record_failure()
+        
+        # Then - 아직 임계치 미만
+        assert breaker.allow_request()
+        
+        # When
+        breaker.record_failure()
+        
+        # Then
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow_request()
+        assert breaker.retry_after() == 30
+    
+    def test_success_resets_failure_count(self):
+        """중간에 성공하면 연속 실패 횟수가 초기화된다."""
+        # Given
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30, clock=FakeClock())
+        
+        # When
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        
+        # Then
+        assert breaker.state == CircuitBreaker.CLOSED
+    
+    def test_half_open_allows_single_probe(self):
+        """reset_timeout이 지나면 시험 호출 하나만 허용하고, 성공하면 닫힌다."""
+        # Given
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, clock=clock)
+        breaker.record_failure()
+        
+        # When
+        clock.now = 30
+        
+        # Then
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.allow_request()
+        assert not breaker.allow_request()
+        
+        # When
+        breaker.record_success()
+        
+        # Then
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.allow_request()
+    
+    def test_failed_probe_reopens(self):
+        """시험 호출이 실패하면 다시 reset_timeout 동안 열린다."""
+        # Given
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30, clock=clock)
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now = 31
+        assert breaker.allow_request()
+        
+        # When
+        breaker.record_failure()
+        
+        # Then
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow_request()
+        assert breaker.retry_after() == 30
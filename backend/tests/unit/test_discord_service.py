@@ -47,7 +47,7 @@ class TestDiscordNotificationService:
         assert result is False
     
     @override_settings(DISCORD_WEBHOOK_URL="https://discord.com/api/webhooks/test")
-    @patch('infrastructure.external.discord_service.requests.post')
+    @patch('infrastructure.external.notification_client.NotificationHttpClient.post')
     def test_send_payment_notification_success(self, mock_post):
         """결제 완료 알림을 성공적으로 전송한다."""
         # Given
@@ -96,7 +96,7 @@ class TestDiscordNotificationService:
         assert '25,000원' in amount_field['value']
     
     @override_settings(DISCORD_WEBHOOK_URL="https://discord.com/api/webhooks/test")
-    @patch('infrastructure.external.discord_service.requests.post')
+    @patch('infrastructure.external.notification_client.NotificationHttpClient.post')
     def test_send_payment_notification_with_minimal_data(self, mock_post):
         """최소한의 데이터로 알림을 전송할 수 있다."""
         # Given
@@ -118,7 +118,7 @@ class TestDiscordNotificationService:
         mock_post.assert_called_once()
     
     @override_settings(DISCORD_WEBHOOK_URL="https://discord.com/api/webhooks/test")
-    @patch('infrastructure.external.discord_service.requests.post')
+    @patch('infrastructure.external.notification_client.NotificationHttpClient.post')
     def test_send_payment_notification_with_none_payer_name(self, mock_post):
         """결제자 이름이 None인 경우 '알 수 없음'으로 표시한다."""
         # Given
@@ -147,7 +147,7 @@ class TestDiscordNotificationService:
         assert payer_field['value'] == '알 수 없음'
     
     @override_settings(DISCORD_WEBHOOK_URL="https://discord.com/api/webhooks/test")
-    @patch('infrastructure.external.discord_service.requests.post')
+    @patch('infrastructure.external.notification_client.NotificationHttpClient.post')
     def test_send_payment_notification_request_failure(self, mock_post):
         """Discord 요청이 실패하면 False를 반환한다."""
         # Given
@@ -169,7 +169,7 @@ class TestDiscordNotificationService:
         mock_post.assert_called_once()
     
     @override_settings(DISCORD_WEBHOOK_URL="https://discord.com/api/webhooks/test")
-    @patch('infrastructure.external.discord_service.requests.post')
+    @patch('infrastructure.external.notification_client.NotificationHttpClient.post')
     def test_send_payment_notification_request_exception(self, mock_post):
         """Discord 요청 중 예외가 발생하면 False를 반환한다."""
         # Given
@@ -189,7 +189,7 @@ class TestDiscordNotificationService:
         mock_post.assert_called_once()
     
     @override_settings(DISCORD_WEBHOOK_URL="https://discord.com/api/webhooks/test")
-    @patch('infrastructure.external.discord_service.requests.post')
+    @patch('infrastructure.external.notification_client.NotificationHttpClient.post')
     def test_send_payment_notification_includes_order_items(self, mock_post):
         """주문 아이템이 있는 경우 알림에 포함된다."""
         # Given
@@ -225,7 +225,7 @@ class TestDiscordNotificationService:
         assert table_field['value'] == '테이블5'
 
     @override_settings(DISCORD_CALL_WEBHOOK_URL="https://discord.com/api/webhooks/call-test")
-    @patch('infrastructure.external.discord_service.requests.post')
+    @patch('infrastructure.external.notification_client.NotificationHttpClient.post')
     def test_send_staff_call_notification_success(self, mock_post):
         """직원호출 알림을 성공적으로 전송한다."""
         # Given
@@ -267,7 +267,7 @@ class TestDiscordNotificationService:
         assert message_field['value'] == '물 한 잔 부탁드립니다'
 
     @override_settings(DISCORD_CALL_WEBHOOK_URL="https://discord.com/api/webhooks/call-test")
-    @patch('infrastructure.external.discord_service.requests.post')
+    @patch('infrastructure.external.notification_client.NotificationHttpClient.post')
     def test_send_staff_call_notification_without_message(self, mock_post):
         """메시지 없이 직원호출 알림을 전송할 수 있다."""
         # Given
@@ -311,7 +311,7 @@ class TestDiscordNotificationService:
         assert result is False
 
     @override_settings(DISCORD_CALL_WEBHOOK_URL="https://discord.com/api/webhooks/call-test")
-    @patch('infrastructure.external.discord_service.requests.post')
+    @patch('infrastructure.external.notification_client.NotificationHttpClient.post')
     def test_send_staff_call_notification_request_failure(self, mock_post):
         """Discord 요청이 실패하면 False를 반환한다."""
         # Given
@@ -333,7 +333,7 @@ class TestDiscordNotificationService:
         mock_post.assert_called_once()
 
     @override_settings(DISCORD_CALL_WEBHOOK_URL="https://discord.com/api/webhooks/call-test")
-    @patch('infrastructure.external.discord_service.requests.post')
+    @patch('infrastructure.external.notification_client.NotificationHttpClient.post')
     def test_send_staff_call_notification_request_exception(self, mock_post):
         """Discord 요청 중 예외가 발생하면 False를 반환한다."""
         # Given
@@ -7,6 +7,7 @@ from django.utils import timezone
 
 from domain.entities.food import Food, FoodCategory
 from domain.entities.table import Table
+from domain.entities.table_session import TableSession
 from domain.entities.order import Order, OrderItem, MinusOrderItem
 from tests.factories.entity_factories import (
     FoodFactory,
@@ -107,6 +108,34 @@ class TestTable:
         assert isinstance(table.id, str)
 
 
+@pytest.mark.unit
+class TestTableSession:
+    """Test cases for TableSession entity."""
+    
+    def test_create_table_session(self):
+        """새 테이블 세션은 진행 중 상태로 생성된다."""
+        # When
+        session = TableSession.create(table_id="table-123")
+        
+        # Then
+        assert session.id is not None
+        assert session.table_id == "table-123"
+        assert session.started_at is not None
+        assert session.ended_at is None
+        assert session.is_active is True
+    
+    def test_ended_session_is_not_active(self):
+        """퇴실 처리된 세션은 진행 중이 아니다."""
+        # Given
+        now = timezone.now()
+        
+        # When
+        session = TableSession(id="session-1", table_id="table-123", started_at=now, ended_at=now)
+        
+        # Then
+        assert session.is_active is False
+
+
 @pytest.mark.unit
 class TestOrderItem:
     """Test cases for OrderItem entity."""
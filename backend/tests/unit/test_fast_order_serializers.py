@@ -0,0 +1,106 @@
+"""
+Golden-output tests for the fast order serializers.
+"""
+import json
+from datetime import datetime
+
+import pytest
+from rest_framework.renderers import JSONRenderer
+
+from domain.entities.food import FoodCategory
+from presentation.api.renderers import OrjsonRenderer
+from presentation.serializers.fast_order_serializers import serialize_order, serialize_order_history
+from presentation.serializers.order_serializers import OrderSerializer, OrderHistorySerializer
+from tests.factories.entity_factories import (
+    FoodFactory,
+    TableFactory,
+    OrderFactory,
+    OrderItemFactory,
+    MinusOrderItemFactory
+)
+
+
+def _build_orders():
+    """Repository 결과처럼 Table/Food 엔티티를 공유하는 주문 목록을 만듭니다."""
+    table = TableFactory(name="테이블   1")
+    foods = [
+        FoodFactory(name="비빔밥", description=None, image=None),
+        FoodFactory(name="\"특제\" 소스 \\ 감자", category=FoodCategory.SIDE, sold_out=True),
+        FoodFactory(name="🍜 라면", description="줄\u2028바꿈"),
+    ]
+    orders = []
+    for i in range(6):
+        items = [OrderItemFactory(food=food, quantity=i + 1) for food in foods[: (i % 3) + 1]]
+        minus_items = [MinusOrderItemFactory(food=foods[0], quantity=-1, reason='sold_out')] if i % 2 else None
+        orders.append(OrderFactory(table=table, items=items, minus_items=minus_items))
+    # tz 정보가 없는 주문 일시와 Repository에서 계산된 총액
+    orders[0].order_date = datetime(2026, 5, 1, 12, 30, 15, 123456)
+    orders[1].effective_total_amount = 12345
+    return orders
+
+
+@pytest.mark.unit
+class TestFastOrderSerializers:
+    """고속 직렬화 결과가 기존 DRF 시리얼라이저와 바이트 단위로 같은지 검증합니다."""
+    
+    def test_order_history_is_byte_identical(self):
+        """주문 내역 JSON이 OrderHistorySerializer와 바이트 단위로 같다."""
+        # Given
+        orders = _build_orders()
+        renderer = JSONRenderer()
+        expected = renderer.render(OrderHistorySerializer({
+            'orders': orders, 'total_spent': 50000, 'next_cursor': 'abc'
+        }).data)
+        
+        # When
+        actual = renderer.render(serialize_order_history(orders, 50000, 'abc'))
+        
+        # Then
+        assert actual == expected
+    
+    def test_single_order_is_byte_identical(self):
+        """단일 주문 JSON이 OrderSerializer와 바이트 단위로 같다."""
+        # Given
+        order = _build_orders()[1]
+        renderer = JSONRenderer()
+        
+        # When & Then
+        assert renderer.render(serialize_order(order)) == renderer.render(OrderSerializer(order).data)
+    
+    def test_sideloaded_foods_are_deduplicated(self):
+        """sideload_foods이면 음식은 foods 맵에 한 번만 담기고 라인은 foodId로 참조한다."""
+        # Given
+        orders = _build_orders()
+        full = serialize_order_history(orders, 50000)
+        
+        # When
+        sideloaded = serialize_order_history(orders, 50000, sideload_foods=True)
+        
+        # Then
+        food_ids = {item.food.id for order in orders for item in order.items + (order.minus_items or [])}
+        assert set(sideloaded['foods']) == {str(food_id) for food_id in food_ids}
+        # foodId로 음식을 되살리면 기존 응답과 같다
+        for full_order, sideloaded_order in zip(full['orders'], sideloaded['orders']):
+            for key in ('items', 'minusItems'):
+                restored = [
+                    {'food': sideloaded['foods'][str(line['foodId'])],
+                     **{k: v for k, v in line.items() if k != 'foodId'}}
+                    for line in sideloaded_order[key]
+                ]
+                assert restored == full_order[key]
+        renderer = JSONRenderer()
+        assert len(renderer.render(sideloaded)) < len(renderer.render(full))
+    
+    def test_orjson_renderer_produces_same_json_values(self):
+        """OrjsonRenderer는 공백만 다르고 같은 JSON 값을 만든다."""
+        # Given
+        orders = _build_orders()
+        data = serialize_order_history(orders, 50000)
+        
+        # When
+        fast = OrjsonRenderer().render(data)
+        default = JSONRenderer().render(data)
+        
+        # Then
+        assert json.loads(fast) == json.loads(default)
+        assert b'\xe2\x80\xa8' not in fast
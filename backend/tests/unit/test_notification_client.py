@@ -0,0 +1,96 @@
+"""
+Unit tests for the pooled notification HTTP client.
+"""
+import pytest
+import requests
+from django.test import override_settings
+
+from infrastructure.external.discord_service import DiscordNotificationService
+from infrastructure.external.notification_client import NotificationHttpClient
+from tests.fakes.discord_webhook_server import FakeDiscordWebhookServer
+
+
+@pytest.mark.unit
+class TestNotificationHttpClient:
+    """keep-alive 커넥션 재사용과 지표 집계를 로컬 HTTP 서버로 검증합니다."""
+    
+    def test_reuses_connection_across_requests(self):
+        """같은 클라이언트로 여러 번 보내도 TCP 연결은 한 번만 맺는다."""
+        # Given
+        client = NotificationHttpClient(pool_size=2)
+        
+        with FakeDiscordWebhookServer() as server:
+            # When
+            responses = [client.post(server.url, json={'content': f'알림 {i}'}) for i in range(5)]
+            
+            # Then
+            assert [response.status_code for response in responses] == [204] * 5
+            assert len(server.requests) == 5
+            assert server.connection_count == 1
+        
+        metrics = client.metrics.snapshot()
+        assert metrics['requests'] == 5
+        assert metrics['errors'] == 0
+        assert metrics['connections_opened'] == 1
+        assert set(metrics['latency_ms']) == {'avg', 'p50', 'p95', 'max'}
+        client.close()
+    
+    def test_module_level_post_opens_connection_per_request(self):
+        """비교 기준: requests.post는 요청마다 새 연결을 맺는다."""
+        # Given & When
+        with FakeDiscordWebhookServer() as server:
+            for i in range(3):
+                requests.post(server.url, json={'content': f'알림 {i}'}, timeout=5)
+            
+            # Then
+            assert server.connection_count == 3
+    
+    @override_settings(
+        NOTIFICATION_HTTP_POOL_SIZE=8,
+        NOTIFICATION_HTTP_CONNECT_TIMEOUT=1.5,
+        NOTIFICATION_HTTP_READ_TIMEOUT=7.0
+    )
+    def test_pool_size_and_split_timeouts_from_settings(self):
+        """풀 크기와 연결/응답 대기 타임아웃을 설정에서 읽는다."""
+        # Given & When
+        client = NotificationHttpClient()
+        
+        # Then
+        adapter = client.session.get_adapter('https://discord.com/api/webhooks/test')
+        assert adapter._pool_maxsize == 8
+        assert client.timeout == (1.5, 7.0)
+        client.close()
+    
+    def test_network_error_is_counted(self):
+        """연결할 수 없으면 RequestException을 전달하고 오류 수에 포함한다."""
+        # Given
+        client = NotificationHttpClient(connect_timeout=0.5, read_timeout=0.5)
+        with FakeDiscordWebhookServer() as server:
+            url = server.url
+        
+        # When & Then
+        with pytest.raises(requests.exceptions.RequestException):
+            client.post(url, json={'content': '알림'})
+        assert client.metrics.snapshot()['errors'] == 1
+        client.close()
+    
+    def test_discord_service_shares_connection(self):
+        """Discord 서비스의 여러 알림이 하나의 연결을 재사용한다."""
+        # Given
+        client = NotificationHttpClient()
+        
+        with FakeDiscordWebhookServer() as server:
+            with override_settings(DISCORD_WEBHOOK_URL=server.url, DISCORD_CALL_WEBHOOK_URL=server.url):
+                service = DiscordNotificationService(client)
+                
+                # When
+                results = [
+                    service.send_payment_completion_notification("order-1", "홍길동", 10000),
+                    service.send_staff_call_notification("1번 테이블", "물 주세요"),
+                    service.send_custom_notification("공지", "마감 30분 전입니다."),
+                ]
+            
+            # Then
+            assert results == [True, True, True]
+            assert server.connection_count == 1
+        client.close()
@@ -0,0 +1,90 @@
+"""
+Unit tests for deposit to pre-order matching.
+"""
+import pytest
+from datetime import datetime, timedelta
+
+from domain.entities.payment import PaymentDeposit, PendingPreOrder
+from domain.services.payment_matching import PreOrderIndex, normalize_name
+
+NOW = datetime(2026, 10, 17, 20, 0)
+
+
+def deposit(name, amount, at=NOW):
+    return PaymentDeposit(id=1, transaction_name=name, amount=amount, transaction_date=at)
+
+
+def pre_order(order_id, name, amount, minutes_before=5):
+    return PendingPreOrder(order_id=order_id, payer_name=name, amount=amount,
+                           order_date=NOW - timedelta(minutes=minutes_before))
+
+
+@pytest.mark.unit
+class TestNormalizeName:
+    """Test cases for normalize_name."""
+    
+    def test_ignores_spacing_symbols_case_and_width(self):
+        """공백, 기호, 대소문자, 전각 문자 차이는 무시한다."""
+        assert normalize_name(" 홍 길-동 ") == "홍길동"
+        assert normalize_name("ＫＩＭ Min") == "kimmin"
+        assert normalize_name(None) == ""
+
+
+@pytest.mark.unit
+class TestPreOrderIndex:
+    """Test cases for PreOrderIndex."""
+    
+    def test_exact_match(self):
+        """이름과 금액이 같으면 정확히 매칭한다."""
+        index = PreOrderIndex([pre_order("a", "홍길동", 20000), pre_order("b", "홍길동", 30000)])
+        
+        match = index.best_match(deposit("홍 길동", 20000))
+        
+        assert match.order_id == "a"
+        assert match.reason == "exact"
+    
+    def test_exact_match_prefers_latest_order_before_deposit(self):
+        """정확히 같은 후보가 여럿이면 입금 직전에 들어온 주문을 고른다."""
+        index = PreOrderIndex([
+            pre_order("old", "홍길동", 20000, minutes_before=30),
+            pre_order("recent", "홍길동", 20000, minutes_before=2),
+            pre_order("after", "홍길동", 20000, minutes_before=-1),
+        ])
+        
+        candidates = index.candidates(deposit("홍길동", 20000))
+        
+        assert [candidate.order_id for candidate in candidates] == ["recent", "old", "after"]
+    
+    def test_truncated_name_matches(self):
+        """은행이 잘라 보낸 입금자명은 주문자명의 앞부분으로 매칭한다."""
+        index = PreOrderIndex([pre_order("a", "연세대학교축제준비위원회", 15000)])
+        
+        match = index.best_match(deposit("연세대학교축제", 15000))
+        
+        assert match.order_id == "a"
+        assert match.reason == "truncated"
+    
+    def test_ambiguous_truncated_name_is_not_auto_matched(self):
+        """잘린 이름 후보가 둘 이상이면 자동 매칭하지 않는다."""
+        index = PreOrderIndex([pre_order("a", "김민수", 15000), pre_order("b", "김민지", 15000)])
+        
+        assert index.best_match(deposit("김민", 15000)) is None
+        assert {candidate.order_id for candidate in index.candidates(deposit("김민", 15000))} == {"a", "b"}
+    
+    def test_name_only_candidate_is_not_auto_matched(self):
+        """금액이 다른 후보는 수동 확인용으로만 보여준다."""
+        index = PreOrderIndex([pre_order("a", "홍길동", 20000)])
+        
+        candidates = index.candidates(deposit("홍길동", 21000))
+        
+        assert [candidate.reason for candidate in candidates] == ["name_only"]
+        assert index.best_match(deposit("홍길동", 21000)) is None
+    
+    def test_removed_order_is_not_a_candidate(self):
+        """매칭되어 뺀 선주문은 다시 후보가 되지 않는다."""
+        index = PreOrderIndex([pre_order("a", "홍길동", 20000), pre_order("b", "홍길동", 20000)])
+        
+        index.remove("a")
+        
+        assert len(index) == 1
+        assert [candidate.order_id for candidate in index.candidates(deposit("홍길동", 20000))] == ["b"]
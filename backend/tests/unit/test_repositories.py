@@ -7,10 +7,12 @@ from django.test import TransactionTestCase
 
 from infrastructure.database.repositories import (
     DjangoFoodRepository,
+    CachedDjangoFoodRepository,
     DjangoTableRepository, 
     DjangoOrderRepository
 )
-from infrastructure.database.models import FoodModel, TableModel, OrderModel
+from domain.entities.food import FoodCategory
+from infrastructure.database.models import FoodModel, TableModel, TableSessionModel, OrderModel, OrderItemModel, MinusOrderItemModel
 from tests.factories.model_factories import (
     FoodModelFactory,
     SoldOutFoodModelFactory,
@@ -123,6 +125,68 @@ class TestDjangoFoodRepository:
         assert db_food.name == food_entity.name
 
 
+@pytest.mark.unit
+@pytest.mark.database
+@pytest.mark.django_db(transaction=True)
+class TestCachedDjangoFoodRepository:
+    """menu_version 기반 메뉴 캐시를 검증합니다."""
+    
+    def test_cache_hit_only_checks_version(self, django_assert_num_queries):
+        """버전이 그대로면 menu_version 조회 1회로 메뉴를 반환한다."""
+        # Given
+        FoodModelFactory.create_batch(3, category='main')
+        repository = CachedDjangoFoodRepository()
+        assert len(repository.get_all()) == 3
+        
+        # When & Then
+        with django_assert_num_queries(1):
+            assert len(repository.get_all()) == 3
+        with django_assert_num_queries(1):
+            assert len(repository.get_by_category(FoodCategory.MAIN)) == 3
+        with django_assert_num_queries(1):
+            assert repository.get_by_id(999999) is None
+    
+    def test_model_save_invalidates_cache(self):
+        """어드민처럼 FoodModel을 직접 저장해도 다음 조회에서 변경이 반영된다."""
+        # Given
+        food_model = FoodModelFactory(sold_out=False)
+        repository = CachedDjangoFoodRepository()
+        assert repository.get_by_id(food_model.id).sold_out is False
+        
+        # When
+        food_model.sold_out = True
+        food_model.save()
+        
+        # Then
+        assert repository.get_by_id(food_model.id).sold_out is True
+    
+    def test_delete_invalidates_cache(self):
+        """음식이 삭제되면 다음 조회에서 제외된다."""
+        # Given
+        food1 = FoodModelFactory()
+        food2 = FoodModelFactory()
+        repository = CachedDjangoFoodRepository()
+        assert len(repository.get_all()) == 2
+        
+        # When
+        FoodModel.objects.filter(id=food1.id).delete()
+        
+        # Then
+        assert [food.id for food in repository.get_all()] == [food2.id]
+    
+    def test_returned_entities_do_not_mutate_snapshot(self):
+        """반환된 엔티티를 수정해도 캐시된 스냅샷은 바뀌지 않는다."""
+        # Given
+        food_model = FoodModelFactory(price=10000)
+        repository = CachedDjangoFoodRepository()
+        
+        # When
+        repository.get_by_id(food_model.id).price = 1
+        
+        # Then
+        assert repository.get_by_id(food_model.id).price == 10000
+
+
 @pytest.mark.unit
 @pytest.mark.database
 @pytest.mark.django_db(transaction=True)
@@ -155,6 +219,20 @@ class TestDjangoTableRepository:
         assert table.id == str(table_model.id)
         assert table.name == table_model.name
     
+    def test_count_tables(self, django_assert_num_queries):
+        """테이블 행을 가져오지 않고 COUNT 한 번으로 테이블 수를 조회한다."""
+        # Given
+        TableModelFactory.create_batch(3)
+        repository = DjangoTableRepository()
+        
+        # When
+        with django_assert_num_queries(1) as captured:
+            count = repository.count()
+        
+        # Then
+        assert count == 3
+        assert 'COUNT(' in captured.captured_queries[0]['sql'].upper()
+    
     def test_create_table(self):
         """테이블을 생성할 수 있다."""
         # Given
@@ -173,6 +251,90 @@ class TestDjangoTableRepository:
         assert db_table.name == table_entity.name
 
 
+@pytest.mark.unit
+@pytest.mark.database
+@pytest.mark.django_db(transaction=True)
+class TestDjangoTableRepositorySessions:
+    """Test cases for table session handling in DjangoTableRepository."""
+    
+    def test_open_session_creates_session_once(self):
+        """현재 세션이 없으면 새로 시작하고, 있으면 기존 세션을 반환한다."""
+        # Given
+        table_model = TableModelFactory()
+        repository = DjangoTableRepository()
+        
+        # When
+        first = repository.open_session(str(table_model.id))
+        second = repository.open_session(str(table_model.id))
+        
+        # Then
+        assert first.id == second.id
+        assert first.is_active is True
+        assert TableSessionModel.objects.filter(table=table_model).count() == 1
+    
+    def test_get_current_session_without_session(self):
+        """세션이 시작되지 않은 테이블은 None을 반환한다."""
+        # Given
+        table_model = TableModelFactory()
+        repository = DjangoTableRepository()
+        
+        # When
+        session = repository.get_current_session(str(table_model.id))
+        
+        # Then
+        assert session is None
+    
+    def test_close_session_is_single_row_update(self, django_assert_num_queries):
+        """퇴실 처리는 주문 수와 관계없이 세션 한 행만 갱신하고 현황판 이벤트 하나를 기록한다."""
+        # Given
+        table_model = TableModelFactory()
+        food = FoodModelFactory(price=10000)
+        for _ in range(5):
+            order_model = OrderModelFactory(table=table_model)
+            OrderItemModelFactory(order=order_model, food=food, quantity=1, price=10000)
+        repository = DjangoTableRepository()
+        
+        # When
+        with django_assert_num_queries(2):
+            closed = repository.close_session(str(table_model.id))
+        
+        # Then
+        assert closed is True
+        assert DjangoOrderRepository().get_by_table_id(str(table_model.id)) == []
+        assert len(DjangoOrderRepository().get_all_including_hidden_by_table_id(str(table_model.id))) == 5
+    
+    def test_close_session_without_session_returns_false(self):
+        """진행 중인 세션이 없으면 False를 반환한다."""
+        # Given
+        table_model = TableModelFactory()
+        repository = DjangoTableRepository()
+        
+        # When & Then
+        assert repository.close_session(str(table_model.id)) is False
+    
+    def test_new_session_after_checkout(self):
+        """퇴실 후 새 세션의 주문만 현재 주문으로 조회된다."""
+        # Given
+        table_model = TableModelFactory()
+        food = FoodModelFactory(price=10000)
+        old_order = OrderModelFactory(table=table_model)
+        OrderItemModelFactory(order=old_order, food=food, quantity=1, price=10000)
+        table_repository = DjangoTableRepository()
+        table_repository.close_session(str(table_model.id))
+        
+        # When
+        new_session = table_repository.open_session(str(table_model.id))
+        new_order = OrderModelFactory(table=table_model)
+        OrderItemModelFactory(order=new_order, food=food, quantity=1, price=10000)
+        orders = DjangoOrderRepository().get_by_table_id(str(table_model.id))
+        
+        # Then
+        assert str(new_order.session_id) == new_session.id
+        assert [order.id for order in orders] == [str(new_order.id)]
+        assert orders[0].session_id == new_session.id
+        assert orders[0].is_visible is True
+
+
 @pytest.mark.unit
 @pytest.mark.database
 @pytest.mark.django_db(transaction=True)
@@ -451,6 +613,59 @@ class TestDjangoOrderRepository:
         assert order.items[0].quantity == 4  # 10 - (3+2+1) = 4
         assert order.total_amount == 40000  # 4 * 10,000원
     
+    def test_minus_items_deducted_once_across_duplicate_food_rows(self):
+        """같은 음식이 여러 행으로 주문되어도 차감 수량은 한 번만 빠져 아이템 합계가 SQL 총액과 같다."""
+        # Given
+        table_model = TableModelFactory()
+        food1 = FoodModelFactory(name="음식1", price=10000)
+        
+        order_model = OrderModelFactory(table=table_model, status='completed', pre_order_amount=None)
+        
+        # 같은 음식 2개씩 두 행: 총 4개
+        OrderItemModelFactory(order=order_model, food=food1, quantity=2, price=10000)
+        OrderItemModelFactory(order=order_model, food=food1, quantity=2, price=10000)
+        
+        # 1개 차감
+        from tests.factories.model_factories import MinusOrderItemModelFactory
+        MinusOrderItemModelFactory(order=order_model, food=food1, quantity=-1, price=10000, reason='refund')
+        
+        repository = DjangoOrderRepository()
+        
+        # When
+        order = repository.get_by_id(str(order_model.id))
+        
+        # Then
+        assert sorted(item.quantity for item in order.items) == [1, 2]  # 4 - 1 = 3
+        assert order.total_amount == 30000
+        assert sum(item.total_price for item in order.items) == order.total_amount
+    
+    def test_over_deducted_food_is_dropped_and_total_uses_minus_amount(self):
+        """주문 수량보다 많이 차감된 음식은 아이템에서 빠지고, 총액은 차감 금액을 그대로 뺀다."""
+        # Given
+        table_model = TableModelFactory()
+        food1 = FoodModelFactory(name="음식1", price=10000)
+        food2 = FoodModelFactory(name="음식2", price=15000)
+        
+        order_model = OrderModelFactory(table=table_model, status='completed', pre_order_amount=None)
+        
+        # Order items: 총 35,000원
+        OrderItemModelFactory(order=order_model, food=food1, quantity=2, price=10000)
+        OrderItemModelFactory(order=order_model, food=food2, quantity=1, price=15000)
+        
+        # 주문한 2개보다 많은 3개 차감: -30,000원
+        from tests.factories.model_factories import MinusOrderItemModelFactory
+        MinusOrderItemModelFactory(order=order_model, food=food1, quantity=-3, price=10000, reason='refund')
+        
+        repository = DjangoOrderRepository()
+        
+        # When
+        order = repository.get_by_id(str(order_model.id))
+        
+        # Then
+        assert [(item.food.id, item.quantity) for item in order.items] == [(food2.id, 1)]
+        assert order.total_amount == 5000  # 35,000 - 30,000
+        assert OrderModel.objects.with_totals().get(pk=order_model.pk).effective_total == order.total_amount
+    
     def test_zero_amount_orders_excluded_from_get_all(self):
         """총액이 0원인 주문은 get_all에서 제외된다."""
         # Given
@@ -563,4 +778,470 @@ class TestDjangoOrderRepository:
         orders = repository.get_all()
         
         # Then
-        assert len(orders) == 0  # pre-order라도 0원이면 제외
\ No newline at end of file
+        assert len(orders) == 0  # pre-order라도 0원이면 제외
+
+
+@pytest.mark.unit
+@pytest.mark.database
+@pytest.mark.django_db(transaction=True)
+class TestDjangoOrderRepositoryExists:
+    """exists_by_table_id가 주문/아이템 행을 가져오지 않는지 검증합니다."""
+    
+    def test_exists_by_table_id_single_exists_query(self, django_assert_num_queries):
+        """주문이 있으면 EXISTS 쿼리 한 번으로 True를 반환한다."""
+        # Given
+        table_model = TableModelFactory()
+        food = FoodModelFactory(price=10000)
+        for _ in range(3):
+            order_model = OrderModelFactory(table=table_model)
+            OrderItemModelFactory(order=order_model, food=food, quantity=1, price=10000)
+        repository = DjangoOrderRepository()
+        
+        # When
+        with django_assert_num_queries(1) as captured:
+            exists = repository.exists_by_table_id(str(table_model.id))
+        
+        # Then
+        assert exists is True
+        sql = captured.captured_queries[0]['sql']
+        # 주문 컬럼을 가져오지 않고 상수 1건만 조회
+        assert sql.upper().startswith('SELECT 1 AS')
+        assert 'LIMIT 1' in sql
+    
+    def test_exists_by_table_id_ignores_hidden_and_zero_total_orders(self):
+        """숨김 처리되었거나 0원인 주문만 있으면 False를 반환한다."""
+        from tests.factories.model_factories import MinusOrderItemModelFactory
+        # Given
+        table_model = TableModelFactory()
+        food = FoodModelFactory(price=10000)
+        hidden_order = OrderModelFactory(table=table_model, is_visible=False)
+        OrderItemModelFactory(order=hidden_order, food=food, quantity=1, price=10000)
+        zero_order = OrderModelFactory(table=table_model)
+        OrderItemModelFactory(order=zero_order, food=food, quantity=1, price=10000)
+        MinusOrderItemModelFactory(order=zero_order, food=food, quantity=-1, price=10000, reason='sold_out')
+        repository = DjangoOrderRepository()
+        
+        # When
+        exists = repository.exists_by_table_id(str(table_model.id))
+        
+        # Then
+        assert exists is False
+    
+    def test_exists_by_table_id_without_orders(self):
+        """주문이 없는 테이블은 False를 반환한다."""
+        # Given
+        table_model = TableModelFactory()
+        repository = DjangoOrderRepository()
+        
+        # When & Then
+        assert repository.exists_by_table_id(str(table_model.id)) is False
+
+
+@pytest.mark.unit
+@pytest.mark.database
+@pytest.mark.django_db(transaction=True)
+class TestDjangoOrderRepositoryPagination:
+    """(order_date, id) 키셋 페이지네이션과 total_spent 집계를 검증합니다."""
+    
+    def _create_orders(self, table_model, count, same_date=False):
+        from datetime import timedelta
+        from django.utils import timezone
+        now = timezone.now()
+        food = FoodModelFactory(price=10000)
+        for i in range(count):
+            order_date = now if same_date else now - timedelta(minutes=i)
+            order_model = OrderModelFactory(table=table_model, order_date=order_date)
+            OrderItemModelFactory(order=order_model, food=food, quantity=1, price=10000)
+    
+    def _walk(self, fetch, limit):
+        pages = []
+        after = None
+        while True:
+            page = fetch(after=after, limit=limit)
+            if not page:
+                return pages
+            pages.append(page)
+            after = (page[-1].order_date, page[-1].id)
+    
+    @pytest.mark.parametrize('same_date', [False, True])
+    def test_get_by_table_id_pages_cover_all_orders_once(self, same_date):
+        """커서를 따라가면 모든 주문이 중복/누락 없이 (order_date, id) 내림차순으로 조회된다."""
+        # Given
+        table_model = TableModelFactory()
+        self._create_orders(table_model, 7, same_date=same_date)
+        repository = DjangoOrderRepository()
+        
+        # When
+        pages = self._walk(
+            lambda after, limit: repository.get_by_table_id(str(table_model.id), after=after, limit=limit), 3
+        )
+        
+        # Then
+        assert [len(page) for page in pages] == [3, 3, 1]
+        orders = [order for page in pages for order in page]
+        assert orders == repository.get_by_table_id(str(table_model.id))
+        keys = [(order.order_date, order.id) for order in orders]
+        assert keys == sorted(keys, reverse=True)
+        assert len(set(keys)) == 7
+    
+    def test_get_all_with_cursor(self):
+        """get_all도 커서 이후의 주문만 limit개 조회한다."""
+        # Given
+        self._create_orders(TableModelFactory(), 3)
+        self._create_orders(TableModelFactory(), 2)
+        repository = DjangoOrderRepository()
+        
+        # When
+        pages = self._walk(repository.get_all, 2)
+        
+        # Then
+        assert [len(page) for page in pages] == [2, 2, 1]
+    
+    def test_get_by_table_id_excludes_pre_orders_in_database(self):
+        """include_pre_orders=False이면 pre-order가 DB에서 제외되어 페이지 크기가 유지된다."""
+        # Given
+        table_model = TableModelFactory()
+        OrderModelFactory(table=table_model, status='pre_order', pre_order_amount=30000)
+        self._create_orders(table_model, 2)
+        repository = DjangoOrderRepository()
+        
+        # When
+        orders = repository.get_by_table_id(str(table_model.id), limit=2, include_pre_orders=False)
+        
+        # Then
+        assert len(orders) == 2
+        assert all(order.status == 'completed' for order in orders)
+    
+    def test_get_total_spent_is_single_aggregate(self, django_assert_num_queries):
+        """total_spent는 pre-order/숨김/다른 테이블 주문을 제외하고 SUM 한 번으로 계산된다."""
+        # Given
+        table_model = TableModelFactory()
+        self._create_orders(table_model, 3)
+        OrderModelFactory(table=table_model, status='pre_order', pre_order_amount=30000)
+        hidden_order = OrderModelFactory(table=table_model, is_visible=False)
+        OrderItemModelFactory(order=hidden_order, food=FoodModelFactory(price=5000), quantity=1, price=5000)
+        self._create_orders(TableModelFactory(), 2)
+        repository = DjangoOrderRepository()
+        
+        # When & Then
+        with django_assert_num_queries(1):
+            table_total = repository.get_total_spent(str(table_model.id))
+        assert table_total == 30000
+        assert repository.get_total_spent() == 50000
+        assert repository.get_total_spent(str(TableModelFactory().id)) == 0
+
+
+@pytest.mark.unit
+@pytest.mark.database
+@pytest.mark.django_db(transaction=True)
+class TestDjangoOrderRepositoryQueryBudget:
+    """목록 조회의 쿼리 수가 주문 수와 무관하게 고정되는지 검증합니다."""
+    
+    # orders(+tables JOIN), order_items(+foods JOIN), minus_order_items(+foods JOIN)
+    LIST_QUERY_BUDGET = 3
+    
+    def _create_orders(self, table_model, count, is_visible=True):
+        from tests.factories.model_factories import MinusOrderItemModelFactory
+        foods = FoodModelFactory.create_batch(3, price=10000)
+        for _ in range(count):
+            order_model = OrderModelFactory(table=table_model, is_visible=is_visible)
+            for food in foods:
+                OrderItemModelFactory(order=order_model, food=food, quantity=2, price=10000)
+            MinusOrderItemModelFactory(order=order_model, food=foods[0], quantity=-1, price=10000, reason='sold_out')
+    
+    @pytest.mark.parametrize('order_count', [1, 10])
+    def test_get_all_query_budget(self, django_assert_num_queries, order_count):
+        """get_all은 주문 수와 관계없이 고정된 쿼리 수로 조회한다."""
+        # Given
+        self._create_orders(TableModelFactory(), order_count)
+        repository = DjangoOrderRepository()
+        
+        # When & Then
+        with django_assert_num_queries(self.LIST_QUERY_BUDGET):
+            orders = repository.get_all()
+        assert len(orders) == order_count
+    
+    @pytest.mark.parametrize('order_count', [1, 10])
+    def test_get_by_table_id_query_budget(self, django_assert_num_queries, order_count):
+        """get_by_table_id는 주문 수와 관계없이 고정된 쿼리 수로 조회한다."""
+        # Given
+        table_model = TableModelFactory()
+        self._create_orders(table_model, order_count)
+        repository = DjangoOrderRepository()
+        
+        # When & Then
+        with django_assert_num_queries(self.LIST_QUERY_BUDGET):
+            orders = repository.get_by_table_id(str(table_model.id))
+        assert len(orders) == order_count
+    
+    @pytest.mark.parametrize('relations, expected_queries', [
+        (frozenset(), 1),
+        (frozenset({'minus_items'}), 2),
+        (frozenset({'items'}), 3),
+    ])
+    def test_unrequested_relations_are_not_queried(self, django_assert_num_queries, relations, expected_queries):
+        """relations에 없는 관계는 prefetch하지 않고, 총액은 그대로 계산된다."""
+        # Given
+        table_model = TableModelFactory()
+        self._create_orders(table_model, 3)
+        repository = DjangoOrderRepository()
+        full_orders = repository.get_by_table_id(str(table_model.id))
+        
+        # When
+        with django_assert_num_queries(expected_queries):
+            orders = repository.get_by_table_id(str(table_model.id), relations=relations)
+        
+        # Then
+        assert [order.total_amount for order in orders] == [order.total_amount for order in full_orders]
+        for order, full_order in zip(orders, full_orders):
+            assert order.items == (full_order.items if 'items' in relations else [])
+            assert (order.minus_items or []) == (full_order.minus_items if 'minus_items' in relations else [])
+    
+    @pytest.mark.parametrize('order_count', [1, 10])
+    def test_get_all_including_hidden_query_budget(self, django_assert_num_queries, order_count):
+        """get_all_including_hidden은 주문 수와 관계없이 고정된 쿼리 수로 조회한다."""
+        # Given
+        table_model = TableModelFactory()
+        self._create_orders(table_model, order_count)
+        self._create_orders(table_model, order_count, is_visible=False)
+        repository = DjangoOrderRepository()
+        
+        # When & Then
+        with django_assert_num_queries(self.LIST_QUERY_BUDGET):
+            orders = repository.get_all_including_hidden()
+        assert len(orders) == order_count * 2
+    
+    @pytest.mark.parametrize('order_count', [1, 10])
+    def test_get_all_including_hidden_by_table_id_query_budget(self, django_assert_num_queries, order_count):
+        """get_all_including_hidden_by_table_id는 주문 수와 관계없이 고정된 쿼리 수로 조회한다."""
+        # Given
+        table_model = TableModelFactory()
+        self._create_orders(table_model, order_count)
+        self._create_orders(table_model, order_count, is_visible=False)
+        repository = DjangoOrderRepository()
+        
+        # When & Then
+        with django_assert_num_queries(self.LIST_QUERY_BUDGET):
+            orders = repository.get_all_including_hidden_by_table_id(str(table_model.id))
+        assert len(orders) == order_count * 2
+    
+    def test_food_and_table_entities_are_shared(self):
+        """같은 조회 결과 안에서 Food/Table 엔티티는 공유된다."""
+        # Given
+        table_model = TableModelFactory()
+        self._create_orders(table_model, 3)
+        repository = DjangoOrderRepository()
+        
+        # When
+        orders = repository.get_by_table_id(str(table_model.id))
+        
+        # Then
+        assert len({id(order.table) for order in orders}) == 1
+        food_entities = {}
+        for order in orders:
+            for item in order.items + (order.minus_items or []):
+                assert food_entities.setdefault(item.food.id, item.food) is item.food
+
+
+@pytest.mark.unit
+@pytest.mark.database
+@pytest.mark.django_db(transaction=True)
+class TestDjangoOrderRepositoryWriteBudget:
+    """주문 생성의 SQL 문 수가 장바구니 크기와 무관하게 고정되는지 검증합니다."""
+    
+    def _build_order(self, line_count, with_minus_items=False):
+        from tests.factories.entity_factories import MinusOrderItemFactory
+        table_model = TableModelFactory()
+        table_entity = TableFactory(id=str(table_model.id), name=table_model.name)
+        
+        items = []
+        for food_model in FoodModelFactory.create_batch(line_count, sold_out=False):
+            food_entity = FoodFactory(id=food_model.id, name=food_model.name, price=food_model.price)
+            items.append(OrderItemFactory(food=food_entity, quantity=2, price=food_model.price))
+        
+        minus_items = None
+        if with_minus_items:
+            minus_items = [
+                MinusOrderItemFactory(food=item.food, quantity=-1, price=item.price, reason='sold_out')
+                for item in items
+            ]
+        return OrderFactory(table=table_entity, items=items, minus_items=minus_items)
+    
+    def _count_statements(self, func, order):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        
+        with transaction.atomic():
+            with CaptureQueriesContext(connection) as context:
+                func(order)
+        return len(context.captured_queries)
+    
+    @pytest.mark.parametrize('method_name', ['create', 'create_with_stock_validation'])
+    def test_statement_count_independent_of_cart_size(self, method_name):
+        """장바구니 크기가 달라도 SQL 문 수는 동일하다."""
+        # Given
+        repository = DjangoOrderRepository()
+        method = getattr(repository, method_name)
+        small_order = self._build_order(1, with_minus_items=True)
+        large_order = self._build_order(10, with_minus_items=True)
+        
+        # When
+        small_count = self._count_statements(method, small_order)
+        large_count = self._count_statements(method, large_order)
+        
+        # Then
+        # 음식 조회 1 + 주문 INSERT 1 + 주문 아이템 bulk INSERT 1 + 차감 아이템 bulk INSERT 1 + 현황판 이벤트 INSERT 1
+        # + 매출 요약(일별/음식별 행 생성 1 + 증감 UPDATE 1) 4
+        assert small_count == large_count == 9
+        assert OrderItemModel.objects.filter(order_id=large_order.id).count() == 10
+        assert MinusOrderItemModel.objects.filter(order_id=large_order.id).count() == 10
+    
+    def test_create_does_not_refetch_table(self):
+        """주문 생성 시 테이블을 다시 조회하지 않는다."""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        
+        # Given
+        repository = DjangoOrderRepository()
+        order = self._build_order(3)
+        
+        # When
+        with CaptureQueriesContext(connection) as context:
+            repository.create(order)
+        
+        # Then
+        table_selects = [
+            query['sql'] for query in context.captured_queries
+            if query['sql'].startswith('SELECT') and '"tables"' in query['sql']
+        ]
+        assert table_selects == []
+        assert str(OrderModel.objects.get(id=order.id).table_id) == order.table.id
+    
+    def test_create_with_missing_food_raises(self):
+        """존재하지 않는 음식이 포함되면 ValueError가 발생하고 주문이 저장되지 않는다."""
+        # Given
+        repository = DjangoOrderRepository()
+        order = self._build_order(2)
+        order.items[1].food.id = 999999
+        
+        # When & Then
+        with pytest.raises(ValueError, match="Food with id 999999 not found"):
+            repository.create(order)
+        assert not OrderModel.objects.filter(id=order.id).exists()
+
+
+@pytest.mark.unit
+@pytest.mark.database
+@pytest.mark.django_db(transaction=True)
+class TestOrderQuerySetTotals:
+    """OrderModel.objects.with_totals()의 SQL 총액 계산을 검증합니다."""
+    
+    def test_with_totals_annotates_items_minus_and_effective_total(self):
+        """아이템 합계, 차감 합계, 실제 총액이 SQL에서 계산된다."""
+        from tests.factories.model_factories import MinusOrderItemModelFactory
+        # Given
+        food1 = FoodModelFactory(price=10000)
+        food2 = FoodModelFactory(price=15000)
+        order_model = OrderModelFactory()
+        OrderItemModelFactory(order=order_model, food=food1, quantity=2, price=10000)
+        OrderItemModelFactory(order=order_model, food=food2, quantity=1, price=15000)
+        MinusOrderItemModelFactory(order=order_model, food=food1, quantity=-1, price=10000, reason='sold_out')
+        
+        # When
+        annotated = OrderModel.objects.with_totals().get(id=order_model.id)
+        
+        # Then
+        assert annotated.items_total == 35000
+        assert annotated.minus_total == -10000
+        assert annotated.effective_total == 25000
+        assert annotated.total_amount == 25000
+    
+    def test_with_totals_uses_pre_order_amount_for_pre_orders(self):
+        """pre-order는 pre_order_amount를 실제 총액으로 사용한다."""
+        # Given
+        food = FoodModelFactory(price=10000)
+        pre_order = OrderModelFactory(status='pre_order', pre_order_amount=50000)
+        OrderItemModelFactory(order=pre_order, food=food, quantity=1, price=10000)
+        
+        # When
+        annotated = OrderModel.objects.with_totals().get(id=pre_order.id)
+        
+        # Then
+        assert annotated.items_total == 10000
+        assert annotated.effective_total == 50000
+    
+    def test_with_totals_order_without_items(self):
+        """아이템이 없는 주문의 합계는 0이다."""
+        # Given
+        order_model = OrderModelFactory()
+        
+        # When
+        annotated = OrderModel.objects.with_totals().get(id=order_model.id)
+        
+        # Then
+        assert annotated.items_total == 0
+        assert annotated.minus_total == 0
+        assert annotated.effective_total == 0
+    
+    def test_with_positive_total_filters_in_database(self, django_assert_num_queries):
+        """0원 이하 주문은 한 번의 쿼리 안에서 제외된다."""
+        from django.db.models import Sum
+        from tests.factories.model_factories import MinusOrderItemModelFactory
+        # Given
+        food = FoodModelFactory(price=10000)
+        normal_order = OrderModelFactory()
+        OrderItemModelFactory(order=normal_order, food=food, quantity=2, price=10000)
+        zero_order = OrderModelFactory()
+        OrderItemModelFactory(order=zero_order, food=food, quantity=1, price=10000)
+        MinusOrderItemModelFactory(order=zero_order, food=food, quantity=-1, price=10000, reason='sold_out')
+        
+        # When & Then
+        with django_assert_num_queries(1):
+            order_ids = list(OrderModel.objects.with_positive_total().values_list('id', flat=True))
+        assert order_ids == [normal_order.id]
+        
+        with django_assert_num_queries(1):
+            total = OrderModel.objects.with_totals().aggregate(total=Sum('effective_total'))['total']
+        assert total == 20000
+
+
+@pytest.mark.unit
+@pytest.mark.database
+@pytest.mark.django_db(transaction=True)
+class TestDjangoOrderRepositoryPreOrderLookup:
+    """get_latest_pre_order_by_payment_info 조회를 검증합니다."""
+    
+    def test_returns_latest_matching_pre_order(self):
+        """이름과 금액이 일치하는 pre-order 중 가장 최근 주문을 반환한다."""
+        from datetime import timedelta
+        from django.utils import timezone
+        # Given
+        now = timezone.now()
+        OrderModelFactory(status='pre_order', payer_name="홍길동", pre_order_amount=30000,
+                          order_date=now - timedelta(minutes=10))
+        latest = OrderModelFactory(status='pre_order', payer_name="홍길동", pre_order_amount=30000,
+                                   order_date=now, is_visible=False)
+        OrderModelFactory(status='pre_order', payer_name="홍길동", pre_order_amount=20000, order_date=now)
+        OrderModelFactory(status='completed', payer_name="홍길동", pre_order_amount=30000,
+                          order_date=now + timedelta(minutes=1))
+        repository = DjangoOrderRepository()
+        
+        # When
+        order = repository.get_latest_pre_order_by_payment_info("홍길동", 30000)
+        
+        # Then
+        assert order is not None
+        assert order.id == str(latest.id)
+        assert order.status == 'pre_order'
+    
+    def test_returns_none_when_no_match(self):
+        """일치하는 pre-order가 없으면 None을 반환한다."""
+        # Given
+        OrderModelFactory(status='pre_order', payer_name="홍길동", pre_order_amount=30000)
+        repository = DjangoOrderRepository()
+        
+        # When
+        order = repository.get_latest_pre_order_by_payment_info("김철수", 30000)
+        
+        # Then
+        assert order is None
@@ -9,6 +9,7 @@ from domain.use_cases.table_use_cases import (
     GetTableByIdUseCase,
     CreateTableUseCase
 )
+from domain.use_cases.order_use_cases import ResetOrdersByTableUseCase
 from tests.factories.entity_factories import TableFactory
 
 
@@ -101,11 +102,10 @@ class TestCreateTableUseCase:
     def test_execute_creates_and_saves_table(self, mock_create):
         """새 테이블을 생성하고 저장한다."""
         # Given
-        existing_tables = [TableFactory(), TableFactory()]  # 2개의 기존 테이블
         new_table = TableFactory(name="테이블3")
         
         mock_create.return_value = new_table
-        self.mock_repository.get_all.return_value = existing_tables
+        self.mock_repository.count.return_value = 2  # 2개의 기존 테이블
         self.mock_repository.create.return_value = new_table
         
         # When
@@ -114,19 +114,19 @@ class TestCreateTableUseCase:
         # Then
         assert result == new_table
         mock_create.assert_called_once_with(name="테이블3")
-        self.mock_repository.get_all.assert_called_once()
+        self.mock_repository.count.assert_called_once()
+        self.mock_repository.get_all.assert_not_called()
         self.mock_repository.create.assert_called_once_with(new_table)
     
     @patch('domain.entities.table.Table.create')
     def test_execute_handles_repository_creation(self, mock_create):
         """리포지토리를 통한 테이블 생성을 처리한다."""
         # Given
-        existing_tables = []  # 기존 테이블 없음
         table_to_create = TableFactory(name="테이블1")
         created_table = TableFactory(id="created-id", name="테이블1")
         
         mock_create.return_value = table_to_create
-        self.mock_repository.get_all.return_value = existing_tables
+        self.mock_repository.count.return_value = 0  # 기존 테이블 없음
         self.mock_repository.create.return_value = created_table
         
         # When
@@ -136,5 +136,27 @@ class TestCreateTableUseCase:
         assert result == created_table
         assert result.id == "created-id"
         mock_create.assert_called_once_with(name="테이블1")
-        self.mock_repository.get_all.assert_called_once()
-        self.mock_repository.create.assert_called_once_with(table_to_create)
\ No newline at end of file
+        self.mock_repository.count.assert_called_once()
+        self.mock_repository.create.assert_called_once_with(table_to_create)
+
+
+@pytest.mark.unit
+class TestResetOrdersByTableUseCase:
+    """Test cases for ResetOrdersByTableUseCase."""
+    
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 설정."""
+        self.mock_repository = Mock()
+        self.use_case = ResetOrdersByTableUseCase(self.mock_repository)
+    
+    def test_execute_closes_current_session(self):
+        """주문을 하나씩 수정하지 않고 현재 세션만 종료한다."""
+        # Given
+        self.mock_repository.close_session.return_value = True
+        
+        # When
+        result = self.use_case.execute("table-123")
+        
+        # Then
+        assert result is True
+        self.mock_repository.close_session.assert_called_once_with("table-123")
@@ -6,7 +6,7 @@ from unittest.mock import Mock, MagicMock, patch
 import uuid
 from datetime import datetime
 
-from domain.use_cases.order_use_cases import CreateOrderUseCase, CreatePreOrderUseCase
+from domain.use_cases.order_use_cases import CreateOrderUseCase, CreatePreOrderUseCase, GetPreOrderByPaymentInfoUseCase
 from domain.entities.food import Food, FoodCategory
 from domain.entities.table import Table
 from domain.entities.order import Order, OrderItem
@@ -15,7 +15,8 @@ from tests.factories.entity_factories import (
     FoodFactory,
     SoldOutFoodFactory,
     TableFactory,
-    OrderFactory
+    OrderFactory,
+    PreOrderFactory
 )
 
 
@@ -55,7 +56,7 @@ class TestCreateOrderUseCase:
         
         self.mock_table_repository.get_by_id.return_value = table
         self.mock_food_repository.get_by_ids_for_update.return_value = [food1, food2]
-        self.mock_order_repository.get_by_table_id.return_value = []
+        self.mock_order_repository.exists_by_table_id.return_value = False
         self.mock_order_repository.create.return_value = order
         
         # transaction_manager가 전달받은 함수를 실행하도록 설정
@@ -72,6 +73,11 @@ class TestCreateOrderUseCase:
         self.mock_food_repository.get_by_ids_for_update.assert_called_once_with([1, 2])
         self.mock_order_repository.create.assert_called_once()
         self.mock_transaction_manager.execute_in_transaction.assert_called_once()
+        
+        # 주문은 테이블의 현재 세션에 연결된다
+        self.mock_table_repository.open_session.assert_called_once_with(table_id)
+        created_order = self.mock_order_repository.create.call_args[0][0]
+        assert created_order.session_id == self.mock_table_repository.open_session.return_value.id
     
     def test_execute_table_not_found(self):
         """존재하지 않는 테이블 ID로 주문 시 에러가 발생한다."""
@@ -94,7 +100,7 @@ class TestCreateOrderUseCase:
         table = TableFactory(id=table_id)
         self.mock_table_repository.get_by_id.return_value = table
         self.mock_food_repository.get_by_ids_for_update.return_value = []
-        self.mock_order_repository.get_by_table_id.return_value = []
+        self.mock_order_repository.exists_by_table_id.return_value = False
         
         def execute_transaction(func):
             return func()
@@ -115,7 +121,7 @@ class TestCreateOrderUseCase:
         
         self.mock_table_repository.get_by_id.return_value = table
         self.mock_food_repository.get_by_ids_for_update.return_value = [sold_out_food]
-        self.mock_order_repository.get_by_table_id.return_value = []
+        self.mock_order_repository.exists_by_table_id.return_value = False
         
         def execute_transaction(func):
             return func()
@@ -140,7 +146,7 @@ class TestCreateOrderUseCase:
         
         self.mock_table_repository.get_by_id.return_value = table
         self.mock_food_repository.get_by_ids_for_update.return_value = [available_food, sold_out_food]
-        self.mock_order_repository.get_by_table_id.return_value = []
+        self.mock_order_repository.exists_by_table_id.return_value = False
         
         def execute_transaction(func):
             return func()
@@ -165,7 +171,7 @@ class TestCreateOrderUseCase:
         
         self.mock_table_repository.get_by_id.return_value = table
         self.mock_food_repository.get_by_ids_for_update.return_value = [food1, food2]
-        self.mock_order_repository.get_by_table_id.return_value = []
+        self.mock_order_repository.exists_by_table_id.return_value = False
         self.mock_order_repository.create.return_value = OrderFactory()
         
         created_order_entity = None
@@ -215,7 +221,7 @@ class TestCreateOrderUseCase:
         
         self.mock_table_repository.get_by_id.return_value = table
         self.mock_food_repository.get_by_ids_for_update.return_value = [food]
-        self.mock_order_repository.get_by_table_id.return_value = []
+        self.mock_order_repository.exists_by_table_id.return_value = False
         
         # 주문 생성에서 예외 발생하도록 설정
         self.mock_order_repository.create.side_effect = Exception("Database error")
@@ -241,7 +247,7 @@ class TestCreateOrderUseCase:
         self.mock_table_repository.get_by_id.return_value = table
         self.mock_food_repository.get_by_ids_for_update.return_value = [side_food]
         # 테이블에 기존 주문이 없음 (첫 주문)
-        self.mock_order_repository.get_by_table_id.return_value = []
+        self.mock_order_repository.exists_by_table_id.return_value = False
         
         def execute_transaction(func):
             return func()
@@ -268,7 +274,7 @@ class TestCreateOrderUseCase:
         self.mock_table_repository.get_by_id.return_value = table
         self.mock_food_repository.get_by_ids_for_update.return_value = [main_food, side_food]
         # 테이블에 기존 주문이 없음 (첫 주문)
-        self.mock_order_repository.get_by_table_id.return_value = []
+        self.mock_order_repository.exists_by_table_id.return_value = False
         self.mock_order_repository.create.return_value = order
         
         def execute_transaction(func):
@@ -290,13 +296,12 @@ class TestCreateOrderUseCase:
         
         table = TableFactory(id=table_id)
         side_food = FoodFactory(id=1, category=FoodCategory.SIDE, name="콜라")
-        existing_order = OrderFactory()
         order = OrderFactory()
         
         self.mock_table_repository.get_by_id.return_value = table
         self.mock_food_repository.get_by_ids_for_update.return_value = [side_food]
         # 테이블에 기존 주문이 있음 (첫 주문이 아님)
-        self.mock_order_repository.get_by_table_id.return_value = [existing_order]
+        self.mock_order_repository.exists_by_table_id.return_value = True
         self.mock_order_repository.create.return_value = order
         
         def execute_transaction(func):
@@ -309,6 +314,9 @@ class TestCreateOrderUseCase:
         # Then
         assert result == order
         self.mock_order_repository.create.assert_called_once()
+        # 기존 주문 목록을 조회하지 않고 EXISTS 확인만 수행
+        self.mock_order_repository.exists_by_table_id.assert_called_once_with(table_id)
+        self.mock_order_repository.get_by_table_id.assert_not_called()
 
 
 @pytest.mark.unit
@@ -343,7 +351,7 @@ class TestCreatePreOrderUseCase:
         self.mock_table_repository.get_by_id.return_value = table
         self.mock_food_repository.get_by_id.return_value = side_food
         # 테이블에 기존 주문이 없음 (첫 주문)
-        self.mock_order_repository.get_by_table_id.return_value = []
+        self.mock_order_repository.exists_by_table_id.return_value = False
         
         # When & Then
         with pytest.raises(ValueError, match="첫 주문에는 반드시 메인 메뉴가 하나 이상 포함되어야 합니다."):
@@ -369,7 +377,7 @@ class TestCreatePreOrderUseCase:
         # 첫 번째 호출은 메인 메뉴, 두 번째 호출은 사이드 메뉴 반환
         self.mock_food_repository.get_by_id.side_effect = [main_food, main_food, side_food]
         # 테이블에 기존 주문이 없음 (첫 주문)
-        self.mock_order_repository.get_by_table_id.return_value = []
+        self.mock_order_repository.exists_by_table_id.return_value = False
         self.mock_order_repository.create.return_value = order
         
         # When
@@ -389,13 +397,12 @@ class TestCreatePreOrderUseCase:
         
         table = TableFactory(id=table_id)
         side_food = FoodFactory(id=1, category=FoodCategory.SIDE, name="콜라")
-        existing_order = OrderFactory()
         order = OrderFactory()
         
         self.mock_table_repository.get_by_id.return_value = table
         self.mock_food_repository.get_by_id.return_value = side_food
         # 테이블에 기존 주문이 있음 (첫 주문이 아님)
-        self.mock_order_repository.get_by_table_id.return_value = [existing_order]
+        self.mock_order_repository.exists_by_table_id.return_value = True
         self.mock_order_repository.create.return_value = order
         
         # When
@@ -403,4 +410,38 @@ class TestCreatePreOrderUseCase:
         
         # Then
         assert result == order
-        self.mock_order_repository.create.assert_called_once()
\ No newline at end of file
+        self.mock_order_repository.create.assert_called_once()
+
+@pytest.mark.unit
+class TestGetPreOrderByPaymentInfoUseCase:
+    """Test cases for GetPreOrderByPaymentInfoUseCase."""
+    
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 설정."""
+        self.mock_order_repository = Mock()
+        self.use_case = GetPreOrderByPaymentInfoUseCase(self.mock_order_repository)
+    
+    def test_execute_uses_dedicated_lookup(self):
+        """전체 주문을 조회하지 않고 전용 조회 메서드를 사용한다."""
+        # Given
+        pre_order = PreOrderFactory(payer_name="홍길동", pre_order_amount=30000)
+        self.mock_order_repository.get_latest_pre_order_by_payment_info.return_value = pre_order
+        
+        # When
+        result = self.use_case.execute("홍길동", 30000)
+        
+        # Then
+        assert result == pre_order
+        self.mock_order_repository.get_latest_pre_order_by_payment_info.assert_called_once_with("홍길동", 30000)
+        self.mock_order_repository.get_all_including_hidden.assert_not_called()
+    
+    def test_execute_no_match_returns_none(self):
+        """일치하는 pre-order가 없으면 None을 반환한다."""
+        # Given
+        self.mock_order_repository.get_latest_pre_order_by_payment_info.return_value = None
+        
+        # When
+        result = self.use_case.execute("홍길동", 30000)
+        
+        # Then
+        assert result is None
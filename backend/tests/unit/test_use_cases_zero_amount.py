@@ -31,7 +31,9 @@ class TestGetOrdersByTableUseCaseZeroAmount:
         
         # Then
         assert result == [normal_order]
-        self.mock_order_repository.get_by_table_id.assert_called_once_with(table_id)
+        self.mock_order_repository.get_by_table_id.assert_called_once_with(
+            table_id, after=None, limit=None, include_pre_orders=True, relations=None
+        )
     
     def test_execute_with_empty_result(self):
         """모든 주문이 0원이어서 필터링된 경우 빈 리스트를 반환한다."""
@@ -45,4 +47,6 @@ class TestGetOrdersByTableUseCaseZeroAmount:
         
         # Then
         assert result == []
-        self.mock_order_repository.get_by_table_id.assert_called_once_with(table_id)
\ No newline at end of file
+        self.mock_order_repository.get_by_table_id.assert_called_once_with(
+            table_id, after=None, limit=None, include_pre_orders=True, relations=None
+        )
\ No newline at end of file
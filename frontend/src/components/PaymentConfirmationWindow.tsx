@@ -147,13 +147,10 @@ const PaymentConfirmationWindow: React.FC<PaymentConfirmationWindowProps> = ({
     setIsCheckingPayment(true);
     
     try {
-      // 7초 로딩 대기
-      await new Promise(resolve => setTimeout(resolve, 7000));
+      // 최대 7초 동안 결제 완료 이벤트 대기 (완료되면 바로 진행)
+      const paymentCompleted = await apiService.waitForPaymentCompletion(orderId, 7000);
       
-      // 결제 상태 확인
-      const paymentStatus = await apiService.checkPaymentStatus(orderId);
-      
-      if (paymentStatus.payment_completed) {
+      if (paymentCompleted) {
         // 결제가 완료된 경우 - 팝업 없이 바로 완료 처리
         onOrderComplete();
         window.close();
@@ -64,12 +64,10 @@ const PaymentResultPage: React.FC = () => {
     try {
       setIsLoading(true);
       
-      // Add a small delay to allow payment processing
-      await new Promise(resolve => setTimeout(resolve, 2000));
+      // Wait up to 2 seconds for the payment event (resolves as soon as the payment lands)
+      const paymentCompleted = await apiService.waitForPaymentCompletion(orderId, 2000);
       
-      const paymentStatus = await apiService.checkPaymentStatus(orderId);
-      
-      if (paymentStatus.payment_completed) {
+      if (paymentCompleted) {
         // Payment successful - redirect to table page
         navigate(`/table/${tableId}`, { 
           state: { paymentSuccess: true },
@@ -48,6 +48,23 @@ interface ApiOrder {
 interface ApiOrderHistory {
   orders: ApiOrder[];
   totalSpent: number;
+  nextCursor: string | null;
+}
+
+// sideload=foods 응답: 주문 라인은 foodId만 갖고 음식 정보는 foods 맵에 한 번만 담김
+interface SideloadedApiOrder extends Omit<ApiOrder, 'items'> {
+  items: Array<{
+    foodId: number;
+    quantity: number;
+    price: number;
+  }>;
+}
+
+interface SideloadedApiOrderHistory {
+  orders: SideloadedApiOrder[];
+  foods: Record<string, FoodItem>;
+  totalSpent: number;
+  nextCursor: string | null;
 }
 
 class ApiService {
@@ -117,20 +134,88 @@ class ApiService {
   }
 
   async getOrderHistory(tableId?: string): Promise<OrderHistory> {
-    const queryParam = tableId ? `?table_id=${tableId}` : '';
-    const apiResponse = await this.request<ApiOrderHistory>(`/orders/history/${queryParam}`);
+    const params = new URLSearchParams();
+    if (tableId) params.set('table_id', tableId);
+    const apiResponse = await this.requestAllPages('/orders/history/', params);
     return this.transformOrderHistory(apiResponse);
   }
 
   async getTableOrders(tableId: string): Promise<OrderHistory> {
-    const apiResponse = await this.request<ApiOrderHistory>(`/tables/${tableId}/orders/`);
+    const apiResponse = await this.requestAllPages(`/tables/${tableId}/orders/`, new URLSearchParams());
     return this.transformOrderHistory(apiResponse);
   }
 
+  // 커서 페이지네이션된 주문 내역을 nextCursor가 없을 때까지 이어서 조회
+  private async requestAllPages(endpoint: string, params: URLSearchParams): Promise<ApiOrderHistory> {
+    params.set('sideload', 'foods');
+    const firstPage = await this.request<SideloadedApiOrderHistory>(`${endpoint}?${params}`);
+    const orders = this.hydrateFoods(firstPage);
+    let nextCursor = firstPage.nextCursor;
+
+    while (nextCursor) {
+      params.set('cursor', nextCursor);
+      const page = await this.request<SideloadedApiOrderHistory>(`${endpoint}?${params}`);
+      orders.push(...this.hydrateFoods(page));
+      nextCursor = page.nextCursor;
+    }
+
+    return { orders, totalSpent: firstPage.totalSpent, nextCursor: null };
+  }
+
+  private hydrateFoods(page: SideloadedApiOrderHistory): ApiOrder[] {
+    return page.orders.map(order => ({
+      ...order,
+      items: order.items.map(({ foodId, quantity, price }) => ({
+        food: page.foods[String(foodId)],
+        quantity,
+        price,
+      })),
+    }));
+  }
+
   async checkPaymentStatus(orderId: string): Promise<PaymentStatusResponse> {
     return this.request<PaymentStatusResponse>(`/orders/${orderId}/payment-status/`);
   }
 
+  // 결제 완료를 SSE 스트림으로 기다립니다. 완료 이벤트를 받으면 true, timeoutMs 안에 받지 못하면
+  // 결제 상태를 한 번 조회해 그 결과를 반환합니다. (EventSource를 쓸 수 없으면 바로 조회)
+  waitForPaymentCompletion(orderId: string, timeoutMs: number): Promise<boolean> {
+    const checkOnce = () => this.checkPaymentStatus(orderId).then(status => status.payment_completed);
+    if (typeof EventSource === 'undefined') {
+      return checkOnce();
+    }
+
+    return new Promise((resolve, reject) => {
+      const source = new EventSource(`${API_BASE_URL}/orders/${orderId}/payment-events/`);
+      let settled = false;
+      const finish = (completed: boolean) => {
+        if (settled) return;
+        settled = true;
+        window.clearTimeout(timer);
+        source.close();
+        resolve(completed);
+      };
+      const timer = window.setTimeout(() => {
+        source.close();
+        checkOnce().then(finish, error => {
+          settled = true;
+          reject(error);
+        });
+      }, timeoutMs);
+
+      source.addEventListener('payment', event => {
+        const data = JSON.parse((event as MessageEvent).data) as { payment_completed: boolean };
+        finish(data.payment_completed);
+      });
+      // 스트림을 열 수 없으면(재연결 중단) 제한 시간에 한 번 조회
+      source.onerror = () => {
+        if (source.readyState === EventSource.CLOSED) {
+          source.close();
+        }
+      };
+    });
+  }
+
   async resetTableOrders(tableId: string): Promise<void> {
     return this.request<void>(`/tables/${tableId}/orders/reset/`, {
       method: 'DELETE',